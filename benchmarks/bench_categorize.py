@@ -0,0 +1,53 @@
+"""
+Measures ``Categorizer`` per transaction as the rule set grows, for substring rules (matched by
+one automaton) and regex rules (one search per rule until the first match). The cost of the
+substring rules should stay about flat from 10 to 10000 rules.
+
+Run with ``uv run python benchmarks/bench_categorize.py``.
+"""
+
+import timeit
+from datetime import date
+from decimal import Decimal
+
+from comdirect_api.domain.categorize import Categorizer, CategoryRule
+from comdirect_api.domain.models import Transaction
+
+ROUNDS = 5
+RULE_COUNTS = (10, 100, 1000, 10000)
+
+
+def _transactions(n=500):
+    return [
+        Transaction(
+            account_id="acc_1",
+            booking_date=date(2024, 1, 31),
+            amount=Decimal("-10.00"),
+            currency="EUR",
+            purpose=f"SEPA Lastschrift Kartenzahlung Filiale {i} Referenz {i * 7919}",
+            type="DIRECT_DEBIT",
+        )
+        for i in range(n)
+    ]
+
+
+def _rules(kind, n):
+    if kind == "contains":
+        return [CategoryRule(f"cat{i}", contains=[f"merchant{i:05d}"]) for i in range(n)]
+    return [CategoryRule(f"cat{i}", patterns=[rf"merchant{i:05d}\b"]) for i in range(n)]
+
+
+def main():
+    txs = _transactions()
+    print(f"{'rules':>6} {'contains':>14} {'patterns':>14}")
+    for n in RULE_COUNTS:
+        timings = []
+        for kind in ("contains", "patterns"):
+            categorizer = Categorizer(_rules(kind, n))
+            seconds = min(timeit.repeat(lambda: categorizer.categorize_batch(txs), number=1, repeat=ROUNDS))
+            timings.append(seconds / len(txs) * 1e6)
+        print(f"{n:>6} {timings[0]:>11.1f} µs {timings[1]:>11.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
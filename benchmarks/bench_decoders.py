@@ -0,0 +1,86 @@
+"""
+Compares the decode engines of ``ComdirectApiClient`` on a 500-transaction page
+(the maximum the API returns per request) and a depot with 200 positions including
+instrument master data, once decoding only and once followed by the domain mappers.
+
+Run with ``uv run python benchmarks/bench_decoders.py``.
+"""
+
+import json
+import timeit
+
+from comdirect_api.client import DECODE_ENGINES, ComdirectApiClient
+from comdirect_api.domain.mappers import map_depot_position, map_transaction
+
+ROUNDS = 20
+
+
+def _transactions(n=500):
+    return {
+        "paging": {"index": 0, "matches": n},
+        "aggregated": {"account": {"accountId": "acc_1"}},
+        "values": [
+            {
+                "reference": f"REF{i:08d}",
+                "bookingStatus": "BOOKED",
+                "bookingDate": "2024-01-31",
+                "amount": {"value": f"-{i % 500}.{i % 100:02d}", "unit": "EUR"},
+                "remitter": {"holderName": "Max Mustermann"},
+                "creditor": {"holderName": f"Shop {i % 50}", "iban": "DE12500105170648489890", "bic": "INGDDEFFXXX"},
+                "valutaDate": "2024-01-31",
+                "endToEndReference": f"E2E{i}",
+                "newTransaction": False,
+                "remittanceInfo": f"01Card payment {i}",
+                "transactionType": {"key": "DIRECT_DEBIT", "text": "Lastschrift"},
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def _positions(n=200):
+    price = {"price": {"value": "101.5", "unit": "EUR"}, "priceDateTime": "2024-01-31T17:30:00+01:00"}
+    return {
+        "paging": {"index": 0, "matches": n},
+        "aggregated": {"depot": {"depotId": "D1"}, "currentValue": {"value": "1000", "unit": "EUR"}},
+        "values": [
+            {
+                "depotId": "D1",
+                "positionId": f"P{i}",
+                "wkn": f"WKN{i:03d}",
+                "quantity": {"value": "10", "unit": "XXX"},
+                "currentPrice": price,
+                "purchasePrice": price,
+                "currentValue": {"value": "1015", "unit": "EUR"},
+                "purchaseValue": {"value": "900", "unit": "EUR"},
+                "instrument": {
+                    "instrumentId": f"I{i}",
+                    "wkn": f"WKN{i:03d}",
+                    "isin": f"DE000{i:07d}",
+                    "name": f"Fund {i}",
+                    "shortName": f"F{i}",
+                    "staticData": {"notation": "XXX", "currency": "EUR", "instrumentType": "FUND"},
+                },
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def main():
+    engines = {name: ComdirectApiClient(lambda: None, decode_engine=name) for name in DECODE_ENGINES}
+    cases = {
+        "ListResourceAccountTransaction": (json.dumps(_transactions()), lambda tx: map_transaction(tx, "acc_1")),
+        "ListResourceDepotPosition": (json.dumps(_positions()), map_depot_position),
+    }
+    print(f"{'':<32} {'engine':<10} {'decode':>11} {'+ mapping':>11}")
+    for response_type, (text, mapper) in cases.items():
+        for name, client in engines.items():
+            decode = lambda: client.deserialize(text, response_type, "application/json")  # noqa: E731
+            mapped = lambda: [mapper(item) for item in decode().values]  # noqa: E731
+            seconds = [min(timeit.repeat(fn, number=1, repeat=ROUNDS)) for fn in (decode, mapped)]
+            print(f"{response_type:<32} {name:<10} {seconds[0] * 1000:8.2f} ms {seconds[1] * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
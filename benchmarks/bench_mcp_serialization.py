@@ -0,0 +1,63 @@
+"""
+Compares the MCP result encoding of a 2000-transaction listing: the previous
+``json.dumps(default=dataclasses.asdict)`` path against the generated per-type encoders.
+
+Run with ``uv run python benchmarks/bench_mcp_serialization.py``.
+"""
+
+import dataclasses
+import json
+import timeit
+from datetime import date
+from decimal import Decimal
+
+from comdirect_api.domain.models import AccountHolder, Transaction
+from comdirect_api.domain.serialize import to_jsonable
+
+N_TRANSACTIONS = 2000
+ROUNDS = 20
+
+
+def _default(obj):
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return dataclasses.asdict(obj)
+
+
+def _transactions():
+    return [
+        Transaction(
+            account_id="acc_1",
+            booking_date=date(2023, 1 + i % 12, 1 + i % 28),
+            amount=Decimal(f"-{i % 500}.{i % 100:02d}"),
+            currency="EUR",
+            purpose=f"Card payment {i}",
+            type="DIRECT_DEBIT",
+            reference=f"REF{i:08d}",
+            booking_status="BOOKED",
+            valuta_date=date(2023, 1 + i % 12, 1 + i % 28),
+            end_to_end_reference=f"E2E{i}",
+            remitter=AccountHolder("Max Mustermann", "DE02120300000000202051", "BYLADEM1001"),
+            creditor=AccountHolder(f"Shop {i % 50}", "DE12500105170648489890", None),
+        )
+        for i in range(N_TRANSACTIONS)
+    ]
+
+
+def main():
+    payload = {"account_id": "acc_1", "count": N_TRANSACTIONS, "transactions": _transactions()}
+
+    cases = {
+        "asdict": lambda: json.dumps(payload, ensure_ascii=False, default=_default),
+        "encoders": lambda: json.dumps(to_jsonable(payload), ensure_ascii=False, default=_default),
+        "encoders (compact)": lambda: json.dumps(to_jsonable(payload, True), ensure_ascii=False, default=_default),
+    }
+    for name, fn in cases.items():
+        seconds = min(timeit.repeat(fn, number=1, repeat=ROUNDS))
+        print(f"{name:<20} {seconds * 1000:8.2f} ms  {len(fn()):>9} bytes")
+
+
+if __name__ == "__main__":
+    main()
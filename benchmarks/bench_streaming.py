@@ -0,0 +1,72 @@
+"""
+Compares buffered and streamed decoding of a 500-transaction page: time until the first
+mapped transaction, time for the whole page and peak memory (tracemalloc). The body is
+served from memory, so the numbers exclude network time, which streaming overlaps with parsing.
+
+Run with ``uv run python benchmarks/bench_streaming.py``.
+"""
+
+import io
+import json
+import time
+import tracemalloc
+
+import urllib3
+
+from bench_decoders import _transactions
+from comdirect_api.client import ComdirectApiClient
+from comdirect_api.domain.mappers import map_transaction
+from openapi_client import rest
+
+ROUNDS = 20
+RESPONSE_TYPE = "ListResourceAccountTransaction"
+
+
+def _response(data):
+    body = urllib3.HTTPResponse(
+        body=io.BytesIO(data), status=200, headers={"content-type": "application/json"}, preload_content=False
+    )
+    return rest.RESTResponse(body)
+
+
+def _buffered(client, data):
+    response = _response(data)
+    response.read()
+    page = client.response_deserialize(response_data=response, response_types_map={"200": RESPONSE_TYPE}).data
+    return (map_transaction(tx, "acc_1") for tx in page.values)
+
+
+def _streamed(client, data):
+    return (map_transaction(tx, "acc_1") for tx in client.stream_list(_response(data), RESPONSE_TYPE, {}))
+
+
+def _measure(mode, client, data):
+    first, total = [], []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        transactions = mode(client, data)
+        next(transactions)
+        first.append(time.perf_counter() - start)
+        for _ in transactions:
+            pass
+        total.append(time.perf_counter() - start)
+    tracemalloc.start()
+    for _ in mode(client, data):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(first), min(total), peak
+
+
+def main():
+    data = json.dumps(_transactions()).encode()
+    print(f"{'engine':<10} {'mode':<10} {'first item':>12} {'page':>11} {'peak memory':>13}")
+    for engine in ("pydantic", "compiled", "lazy"):
+        client = ComdirectApiClient(lambda: None, decode_engine=engine)
+        for name, mode in (("buffered", _buffered), ("streamed", _streamed)):
+            first, total, peak = _measure(mode, client, data)
+            print(f"{engine:<10} {name:<10} {first * 1000:9.2f} ms {total * 1000:8.2f} ms {peak / 1024:9.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
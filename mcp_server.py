@@ -3,18 +3,27 @@ import os
 import json
 import dataclasses
 import asyncio
-import time
 import base64
+import functools
+import itertools
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from urllib.parse import parse_qs, quote, unquote, urlparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Literal, Any, List
+from typing import Optional, Literal, Any, Callable, Dict, List
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 try:
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
-    from mcp.types import Tool, TextContent
+    from mcp.server.lowlevel.helper_types import ReadResourceContents
+    from mcp.shared.exceptions import McpError
+    from mcp.types import INVALID_PARAMS, ErrorData, Resource, Tool, TextContent
 except ImportError:
     print(
         "Error: The 'mcp' package is required. Install with 'pip install mcp'.",
@@ -23,12 +32,70 @@ except ImportError:
     sys.exit(1)
 
 from comdirect_api.client import ComdirectClient
+from comdirect_api.document_cache import DEFAULT_MAX_BYTES, DocumentCache
+from comdirect_api.domain import aggregate
+from comdirect_api.domain.serialize import encoder_for, to_jsonable
 
 server = Server("comdirect-mcp")
 
 # --------- Client Lifecycle / State ---------
 
 _client: Optional[ComdirectClient] = None  # Singleton client instance
+_login_task: Optional[asyncio.Task] = None  # The login in flight; concurrent callers await it
+_login_failures = 0
+_login_retry_at = 0.0  # monotonic time before which no new login is attempted after a failure
+_login_error: Optional[BaseException] = None
+
+# Backoff after failed logins (seconds), doubled per consecutive failure
+LOGIN_BACKOFF_BASE = 5.0
+LOGIN_BACKOFF_MAX = 300.0
+
+PUSH_TAN_TIMEOUT = int(os.environ.get("COMDIRECT_PUSH_TAN_TIMEOUT", "120"))  # seconds to approve the push TAN
+# Omit null fields of domain objects in tool results (smaller responses)
+COMPACT_OUTPUT = os.environ.get("COMDIRECT_MCP_COMPACT", "").lower() in ("1", "true", "yes")
+
+# --------- Worker Pool ---------
+
+# The ComdirectClient is synchronous; its calls run on a bounded thread pool so the stdio loop stays responsive
+# and concurrent tool calls overlap.
+MAX_WORKERS = int(os.environ.get("COMDIRECT_MCP_WORKERS", "8"))
+# Max. concurrent calls per tool; tools not listed use DEFAULT_TOOL_CONCURRENCY.
+TOOL_CONCURRENCY: Dict[str, int] = {
+    "login": 1,
+    "logout": 1,
+    "download_document": 2,
+}
+DEFAULT_TOOL_CONCURRENCY = 4
+
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="comdirect-mcp")
+_tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def _tool_slot(name: str) -> asyncio.Semaphore:
+    """Semaphore limiting the concurrent calls of one tool."""
+    sem = _tool_semaphores.get(name)
+    if sem is None:
+        sem = _tool_semaphores[name] = asyncio.Semaphore(TOOL_CONCURRENCY.get(name, DEFAULT_TOOL_CONCURRENCY))
+    return sem
+
+
+async def _run_blocking(fn: Callable, *args, **kwargs) -> Any:
+    """Runs a blocking call on the worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+async def _run_cancellable(fn: Callable[[threading.Event], Any]) -> Any:
+    """
+    Runs ``fn(cancelled)`` on the worker pool. If the tool call is cancelled, ``cancelled`` is set so that
+    long running work (e.g. paging through transactions) can stop between API calls.
+    """
+    cancelled = threading.Event()
+    try:
+        return await _run_blocking(fn, cancelled)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
 
 
 def _build_client() -> ComdirectClient:
@@ -55,9 +122,8 @@ def _build_client() -> ComdirectClient:
 
     # Minimal default TAN handlers for headless MCP environment
     def _default_push_tan():
-        sys.stderr.write("Push TAN requested. Please approve on your mobile device within 10 seconds.\n")
-        time.sleep(10)
-        return ""
+        # Only a notification; the login polls the approval status and continues as soon as it is approved.
+        sys.stderr.write(f"Push TAN requested. Please approve on your mobile device within {PUSH_TAN_TIMEOUT}s.\n")
 
     def _default_photo_tan(png_bytes):
         raise NotImplementedError("PhotoTAN is not supported in headless MCP mode.")
@@ -71,16 +137,55 @@ def _build_client() -> ComdirectClient:
         "sms_tan_cb": _default_sms_tan,
     }
 
-    return ComdirectClient(credentials=credentials, tan_handlers=tan_handlers)
+    return ComdirectClient(
+        credentials=credentials,
+        tan_handlers=tan_handlers,
+        push_tan_poll=True,
+        push_tan_timeout=PUSH_TAN_TIMEOUT,
+    )
+
 
+async def _ensure_client(force: bool = False) -> ComdirectClient:
+    """
+    Returns the authenticated client, logging in on first use (or always with ``force``).
 
-def _get_client() -> ComdirectClient:
-    """Gets or initializes the authenticated client."""
-    global _client
-    if _client is None:
-        _client = _build_client()
-        _client.login()
-    return _client
+    Only one login runs at a time: concurrent callers await the login in flight instead of starting their
+    own 2FA flow. After a failed login, further attempts are refused until the backoff has passed.
+    """
+    global _login_task
+    if _client is not None and not force:
+        return _client
+
+    task = _login_task
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        remaining = _login_retry_at - time.monotonic()
+        if remaining > 0:
+            raise RuntimeError(
+                f"Login failed ({type(_login_error).__name__}: {_login_error}), retry in {remaining:.0f}s"
+            )
+        task = _login_task = asyncio.get_running_loop().create_task(_login())
+    # Shielded, so a cancelled tool call does not abort the login the others are waiting for
+    return await asyncio.shield(task)
+
+
+async def _login() -> ComdirectClient:
+    global _client, _login_failures, _login_retry_at, _login_error
+    try:
+        client = await _run_blocking(_build_client)
+        await _run_blocking(client.login)
+    except Exception as e:
+        _login_failures += 1
+        _login_error = e
+        _login_retry_at = time.monotonic() + min(LOGIN_BACKOFF_BASE * 2 ** (_login_failures - 1), LOGIN_BACKOFF_MAX)
+        raise
+    _login_failures = 0
+    _login_retry_at = 0.0
+    _login_error = None
+    previous, _client = _client, client
+    if previous is not None:
+        # Stop the token refresh of the replaced session
+        await _run_blocking(previous.logout)
+    return client
 
 
 def _jsonable(obj: Any) -> Any:
@@ -90,7 +195,7 @@ def _jsonable(obj: Any) -> Any:
     if isinstance(obj, Decimal):
         return str(obj)
     if dataclasses.is_dataclass(obj):
-        return dataclasses.asdict(obj)
+        return encoder_for(type(obj), COMPACT_OUTPUT)(obj)
     if hasattr(obj, "model_dump"):  # pydantic v2
         return obj.model_dump()
     if hasattr(obj, "dict"):  # pydantic v1
@@ -101,10 +206,11 @@ def _jsonable(obj: Any) -> Any:
 
 def _ok(payload: Any) -> List[TextContent]:
     """Wraps success response in MCP TextContent."""
+    # Domain models are converted up front by their generated per-type encoders; _jsonable is the fallback
     return [
         TextContent(
             type="text",
-            text=json.dumps(payload, ensure_ascii=False, default=_jsonable),
+            text=json.dumps(to_jsonable(payload, COMPACT_OUTPUT), ensure_ascii=False, default=_jsonable),
         )
     ]
 
@@ -119,7 +225,7 @@ def _err(msg: str) -> List[TextContent]:
 
 @server.list_tools()
 async def list_tools() -> list[Tool]:
-    return [
+    tools = [
         Tool(
             name="login",
             description="Forces login/token refresh for the Comdirect session.",
@@ -127,7 +233,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="logout",
-            description="Logs out the current session.",
+            description="Logs out the current session and deletes the downloaded documents.",
             inputSchema={"type": "object", "properties": {}},
         ),
         Tool(
@@ -137,7 +243,10 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="list_transactions",
-            description="Lists transactions for a specific account. Supports filtering by date and state.",
+            description=(
+                "Lists transactions for a specific account. Supports filtering by date and state. "
+                "Pass next_cursor of the response as cursor to get the next page."
+            ),
             inputSchema=ListTransactionsArgs.model_json_schema(),
         ),
         Tool(
@@ -157,65 +266,111 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="download_document",
-            description="Downloads a specific document by ID. Returns base64 encoded content.",
+            description=(
+                "Downloads a specific document by ID into the local document cache. Returns the file path and a "
+                "resource URI (read in chunks with ?chunk=N); base64 content only on request."
+            ),
             inputSchema=DownloadDocumentArgs.model_json_schema(),
         ),
+        Tool(
+            name="summarize_cash_flow",
+            description=(
+                "Income, expenses and net per period (optionally per transaction type or counterparty) over the "
+                "whole transaction history of an account, computed server-side."
+            ),
+            inputSchema=SummarizeCashFlowArgs.model_json_schema(),
+        ),
+        Tool(
+            name="top_counterparties",
+            description="Counterparties with the largest turnover on an account, computed server-side.",
+            inputSchema=TopCounterpartiesArgs.model_json_schema(),
+        ),
+        Tool(
+            name="portfolio_overview",
+            description="Totals, profit/loss and largest positions across all depots (or one depot).",
+            inputSchema=PortfolioOverviewArgs.model_json_schema(),
+        ),
     ]
+    for tool in tools:
+        if tool.name in CACHE_TTLS:
+            tool.inputSchema = _with_refresh(tool.inputSchema)
+    return tools
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    arguments = dict(arguments or {})
+    refresh = bool(arguments.pop("refresh", False))
     try:
-        # Dispatcher
-        if name == "login":
-            return await login()
-        elif name == "logout":
-            return await logout()
-        elif name == "list_accounts":
-            return await list_accounts()
-        elif name == "list_transactions":
-            return await list_transactions(ListTransactionsArgs(**arguments))
-        elif name == "list_depots":
-            return await list_depots()
-        elif name == "get_depot_positions":
-            return await get_depot_positions(GetDepotPositionsArgs(**arguments))
-        elif name == "list_documents":
-            return await list_documents(ListDocumentsArgs(**arguments))
-        elif name == "download_document":
-            return await download_document(DownloadDocumentArgs(**arguments))
-        else:
-            raise ValueError(f"Unknown tool: {name}")
+        logged_in = _client is not None
+        result = await _cached_call(name, arguments, refresh)
+        if not logged_in and _client is not None and name not in ("login", "logout"):
+            # The call logged in implicitly
+            _schedule_warm_up()
+        return result
     except Exception as e:
         # Catch-all for API or Client errors
         return _err(f"Tool execution failed: {type(e).__name__}: {e}")
 
 
+async def _dispatch(name: str, arguments: dict) -> list[TextContent]:
+    if name == "login":
+        return await login()
+    elif name == "logout":
+        return await logout()
+    elif name == "list_accounts":
+        return await list_accounts()
+    elif name == "list_transactions":
+        return await list_transactions(ListTransactionsArgs(**arguments))
+    elif name == "list_depots":
+        return await list_depots()
+    elif name == "get_depot_positions":
+        return await get_depot_positions(GetDepotPositionsArgs(**arguments))
+    elif name == "list_documents":
+        return await list_documents(ListDocumentsArgs(**arguments))
+    elif name == "download_document":
+        return await download_document(DownloadDocumentArgs(**arguments))
+    elif name == "summarize_cash_flow":
+        return await summarize_cash_flow(SummarizeCashFlowArgs(**arguments))
+    elif name == "top_counterparties":
+        return await top_counterparties(TopCounterpartiesArgs(**arguments))
+    elif name == "portfolio_overview":
+        return await portfolio_overview(PortfolioOverviewArgs(**arguments))
+    else:
+        raise ValueError(f"Unknown tool: {name}")
+
+
 # --------- Implementation Handlers ---------
 
 
 async def login():
-    global _client
-    _client = _build_client()
-    _client.login()
+    _cursors.clear()
+    _responses.clear()
+    await _ensure_client(force=True)
+    _schedule_warm_up()
     return _ok({"status": "logged_in"})
 
 
 async def logout():
     global _client
+    _cursors.clear()
+    _responses.clear()
     if _client:
-        _client.logout()
+        await _run_blocking(_client.logout)
     _client = None
+    # downloaded documents are decrypted bank data, they do not outlive the session
+    await _run_blocking(_get_document_cache().clear)
     return _ok({"status": "logged_out"})
 
 
 async def list_accounts():
-    c = _get_client()
-    accounts = c.list_accounts()
+    c = await _ensure_client()
+    accounts = await _run_blocking(c.list_accounts)
     return _ok({"accounts": accounts})
 
 
 class ListTransactionsArgs(BaseModel):
-    account_id: str = Field(..., description="Comdirect accountId")
+    account_id: Optional[str] = Field(default=None, description="Comdirect accountId (required without cursor)")
     transaction_state: Optional[Literal["BOOKED", "NOTBOOKED"]] = Field(
         default="BOOKED",
         description="Comdirect transactionState. BOOKED supports paging; NOTBOOKED does not.",
@@ -233,41 +388,157 @@ class ListTransactionsArgs(BaseModel):
         default=250,
         ge=1,
         le=2000,
-        description="Hard limit to protect from huge outputs; server stops after this many items.",
+        description="Page size; the server stops after this many items and returns a next_cursor if there are more.",
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="next_cursor of a previous call; continues that listing (account and filters are taken from it).",
     )
 
 
-async def list_transactions(args: ListTransactionsArgs):
-    c = _get_client()
-    out = []
+# --------- Transaction Cursors ---------
 
-    # iter_all_transactions is a generator provided by the client wrapper
-    iterator = c.iter_all_transactions(
-        account_id=args.account_id,
-        transaction_state=args.transaction_state,
-        transaction_direction=args.transaction_direction,
-        min_booking_date=args.min_booking_date,
-        max_booking_date=args.max_booking_date,
+CURSOR_TTL = 300.0  # seconds an open listing is kept for follow-up calls
+MAX_OPEN_CURSORS = 32
+
+
+class _CursorCache:
+    """
+    Open transaction iterators of paged ``list_transactions`` calls, keyed by cursor id.
+
+    A follow-up call takes the iterator out of the cache and continues it, so the pages already fetched are
+    not requested again. Entries expire after ``ttl`` seconds; the least recently stored are dropped beyond
+    ``max_size``.
+    """
+
+    def __init__(self, ttl: float = CURSOR_TTL, max_size: int = MAX_OPEN_CURSORS):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, cursor_id: str, offset: int, iterator) -> None:
+        with self._lock:
+            self._purge()
+            self._entries[cursor_id] = (offset, iterator, time.monotonic() + self._ttl)
+            self._entries.move_to_end(cursor_id)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def take(self, cursor_id: str, offset: int):
+        """Removes and returns the iterator positioned at ``offset``, or None."""
+        with self._lock:
+            self._purge()
+            entry = self._entries.pop(cursor_id, None)
+        if entry is None or entry[0] != offset:
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for cursor_id in [k for k, (_, _, expires) in self._entries.items() if expires <= now]:
+            del self._entries[cursor_id]
+
+
+_cursors = _CursorCache()
+
+
+def _encode_cursor(query: Dict[str, Any]) -> str:
+    raw = json.dumps(query, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Dict[str, Any]:
+    try:
+        query = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        query["offset"] = int(query["offset"])
+        return query
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _open_transactions(c: ComdirectClient, query: Dict[str, Any]):
+    """Starts a transaction listing at ``query["offset"]`` (used when no open iterator is cached)."""
+    transactions = c.iter_all_transactions(
+        account_id=query["account_id"],
+        paging_first=query["offset"] if query["transaction_state"] in (None, "BOOKED") else 0,
+        transaction_state=query["transaction_state"],
+        transaction_direction=query["transaction_direction"],
+        min_booking_date=query["min_booking_date"],
+        max_booking_date=query["max_booking_date"],
     )
+    if query["transaction_state"] in (None, "BOOKED"):
+        return transactions
+    # Without server-side paging, skip what was already returned
+    return itertools.islice(transactions, query["offset"], None)
+
+
+async def list_transactions(args: ListTransactionsArgs):
+    if args.cursor:
+        query = _decode_cursor(args.cursor)
+    else:
+        if not args.account_id:
+            raise ValueError("account_id is required without cursor")
+        query = {
+            "id": uuid.uuid4().hex,
+            "account_id": args.account_id,
+            "transaction_state": args.transaction_state,
+            "transaction_direction": args.transaction_direction,
+            "min_booking_date": args.min_booking_date,
+            "max_booking_date": args.max_booking_date,
+            "offset": 0,
+        }
+
+    c = await _ensure_client()
+    iterator = _cursors.take(query["id"], query["offset"])
+
+    def collect(cancelled: threading.Event):
+        # iter_all_transactions is a generator provided by the client wrapper
+        transactions = iterator if iterator is not None else _open_transactions(c, query)
+        out = []
+        for tx in transactions:
+            if cancelled.is_set():
+                return out, None
+            out.append(tx)
+            if len(out) >= args.limit:
+                break
+        else:
+            return out, None
+        # Look ahead one item to know whether there is a next page
+        for tx in transactions:
+            return out, itertools.chain([tx], transactions)
+        return out, None
+
+    out, remaining = await _run_cancellable(collect)
 
-    for tx in iterator:
-        out.append(tx)
-        if len(out) >= args.limit:
-            break
+    next_cursor = None
+    if remaining is not None:
+        next_query = {**query, "offset": query["offset"] + len(out)}
+        _cursors.put(query["id"], next_query["offset"], remaining)
+        next_cursor = _encode_cursor(next_query)
 
     return _ok(
         {
-            "account_id": args.account_id,
+            "account_id": query["account_id"],
+            "offset": query["offset"],
             "count": len(out),
-            "truncated": len(out) >= args.limit,
+            "truncated": next_cursor is not None,
+            "next_cursor": next_cursor,
             "transactions": out,
         }
     )
 
 
 async def list_depots():
-    c = _get_client()
-    depots = c.list_depots()
+    c = await _ensure_client()
+    depots = await _run_blocking(c.list_depots)
     return _ok({"depots": depots})
 
 
@@ -276,8 +547,8 @@ class GetDepotPositionsArgs(BaseModel):
 
 
 async def get_depot_positions(args: GetDepotPositionsArgs):
-    c = _get_client()
-    balance, positions = c.get_depot_positions(args.depot_id)
+    c = await _ensure_client()
+    balance, positions = await _run_blocking(c.get_depot_positions, args.depot_id)
     return _ok({"depot_id": args.depot_id, "balance": balance, "positions": positions})
 
 
@@ -287,8 +558,8 @@ class ListDocumentsArgs(BaseModel):
 
 
 async def list_documents(args: ListDocumentsArgs):
-    c = _get_client()
-    docs = c.list_documents(paging_first=args.paging_first, paging_count=args.paging_count)
+    c = await _ensure_client()
+    docs = await _run_blocking(c.list_documents, paging_first=args.paging_first, paging_count=args.paging_count)
 
     # Transform domain models to simple dicts
     # Using direct attribute access as expected from domain.models.Document
@@ -309,20 +580,297 @@ async def list_documents(args: ListDocumentsArgs):
 class DownloadDocumentArgs(BaseModel):
     document_id: str
     mime_type: str = Field(..., description="e.g. application/pdf")
+    include_base64: bool = Field(
+        default=False,
+        description="Also return the content inline as base64 (large; prefer the path or resource URI).",
+    )
+
+
+# --------- Document Cache / Resources ---------
+
+DOCUMENT_CACHE_DIR = os.environ.get("COMDIRECT_DOCUMENT_CACHE", "~/.cache/comdirect-mcp/documents")
+DOCUMENT_CACHE_MAX_BYTES = int(os.environ.get("COMDIRECT_DOCUMENT_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+DOCUMENT_URI_PREFIX = "comdirect://documents/"
+RESOURCE_CHUNK_SIZE = 1024 * 1024  # bytes per resource read
+
+_documents: Optional[DocumentCache] = None
+
+
+def _get_document_cache() -> DocumentCache:
+    global _documents
+    if _documents is None:
+        _documents = DocumentCache(DOCUMENT_CACHE_DIR, max_bytes=DOCUMENT_CACHE_MAX_BYTES)
+    return _documents
+
+
+def _chunk_count(entry) -> int:
+    return max(-(-entry["size"] // RESOURCE_CHUNK_SIZE), 1)
+
+
+def _document_uri(document_id: str, mime_type: str) -> str:
+    return DOCUMENT_URI_PREFIX + quote(document_id, safe="") + "/" + quote(mime_type, safe="")
 
 
 async def download_document(args: DownloadDocumentArgs):
-    c = _get_client()
-    raw_bytes = c.download_document(args.document_id, args.mime_type)
-    b64_str = base64.b64encode(raw_bytes).decode("ascii")
+    cache = _get_document_cache()
+    entry = cache.get(args.document_id, args.mime_type)
+    cached = entry is not None
+    if entry is None:
+        c = await _ensure_client()
+        entry = await _run_blocking(cache.fetch, c, args.document_id, args.mime_type)
+
+    result = {
+        "document_id": args.document_id,
+        "mime_type": entry["mime_type"],
+        "size": entry["size"],
+        "sha256": entry["sha256"],
+        "path": entry["path"],
+        "resource_uri": _document_uri(args.document_id, entry["mime_type"]),
+        "chunks": _chunk_count(entry),
+        "cached": cached,
+    }
+    if args.include_base64:
+        raw_bytes = await _run_blocking(cache.read_chunk, args.document_id, 0, entry["size"], args.mime_type)
+        result["base64"] = base64.b64encode(raw_bytes).decode("ascii")
+    return _ok(result)
 
-    return _ok(
-        {
-            "document_id": args.document_id,
-            "mime_type": args.mime_type,
-            "base64": b64_str,
-        }
+
+@server.list_resources()
+async def list_resources() -> list[Resource]:
+    """Documents in the local cache."""
+    entries = await _run_blocking(_get_document_cache().entries)
+    return [
+        Resource(
+            uri=_document_uri(e["document_id"], e["mime_type"]),
+            name=e["document_id"],
+            mimeType=e["mime_type"],
+            size=e["size"],
+        )
+        for e in entries
+    ]
+
+
+@server.read_resource()
+async def read_resource(uri) -> list[ReadResourceContents]:
+    """Reads one chunk (``?chunk=N``, default 0) of a cached document."""
+    uri = str(uri)
+    if not uri.startswith(DOCUMENT_URI_PREFIX):
+        raise ValueError(f"Unknown resource: {uri}")
+    parsed = urlparse(uri)
+    document_id, _, mime_type = parsed.path.lstrip("/").partition("/")
+    document_id, mime_type = unquote(document_id), unquote(mime_type) or None
+    chunk = parse_qs(parsed.query).get("chunk", ["0"])[0]
+
+    cache = _get_document_cache()
+    entry = cache.get(document_id, mime_type)
+    if entry is None:
+        raise ValueError(f"Document '{document_id}' is not cached, call download_document first")
+    chunks = _chunk_count(entry)
+    try:
+        index = int(chunk)
+    except ValueError:
+        index = -1
+    if not 0 <= index < chunks:
+        raise McpError(ErrorData(code=INVALID_PARAMS, message=f"chunk must be in 0..{chunks - 1}, got '{chunk}'"))
+    data = await _run_blocking(
+        cache.read_chunk, document_id, index * RESOURCE_CHUNK_SIZE, RESOURCE_CHUNK_SIZE, entry["mime_type"]
     )
+    return [ReadResourceContents(content=data, mime_type=entry["mime_type"])]
+
+
+# --------- Aggregations ---------
+
+
+class _HistoryArgs(BaseModel):
+    account_id: str = Field(..., description="Comdirect accountId")
+    min_booking_date: Optional[str] = Field(default=None, description="YYYY-MM-DD (inclusive)")
+    max_booking_date: Optional[str] = Field(default=None, description="YYYY-MM-DD (inclusive)")
+
+
+class SummarizeCashFlowArgs(_HistoryArgs):
+    period: Literal["day", "week", "month", "quarter", "year"] = "month"
+    group_by: Optional[Literal["type", "counterparty"]] = Field(
+        default=None,
+        description="Additionally split each period by transaction type or counterparty name.",
+    )
+
+
+class TopCounterpartiesArgs(_HistoryArgs):
+    direction: Optional[Literal["INCOMING", "OUTGOING"]] = None
+    limit: int = Field(default=10, ge=1, le=100)
+
+
+class PortfolioOverviewArgs(BaseModel):
+    depot_id: Optional[str] = Field(default=None, description="Only this depot (default: all depots)")
+    top: int = Field(default=10, ge=0, le=100, description="Number of largest positions to list")
+
+
+def _counterparty_name(tx) -> Optional[str]:
+    holder = aggregate.counterparty(tx)
+    return holder.holder_name if holder is not None else None
+
+
+_GROUP_BY = {"type": lambda tx: tx.type, "counterparty": _counterparty_name}
+
+
+def _history(c: ComdirectClient, args: _HistoryArgs, cancelled: threading.Event):
+    """Streams the booked transactions of the account, stopping early if the tool call is cancelled."""
+    for tx in c.iter_all_transactions(
+        account_id=args.account_id,
+        min_booking_date=args.min_booking_date,
+        max_booking_date=args.max_booking_date,
+    ):
+        if cancelled.is_set():
+            return
+        yield tx
+
+
+async def summarize_cash_flow(args: SummarizeCashFlowArgs):
+    c = await _ensure_client()
+    group_by = _GROUP_BY.get(args.group_by)
+    summary = await _run_cancellable(
+        lambda cancelled: aggregate.summarize_cash_flow(_history(c, args, cancelled), args.period, group_by)
+    )
+    return _ok({"account_id": args.account_id, **summary})
+
+
+async def top_counterparties(args: TopCounterpartiesArgs):
+    c = await _ensure_client()
+    ranked = await _run_cancellable(
+        lambda cancelled: aggregate.top_counterparties(_history(c, args, cancelled), args.limit, args.direction)
+    )
+    return _ok({"account_id": args.account_id, "counterparties": ranked})
+
+
+async def portfolio_overview(args: PortfolioOverviewArgs):
+    c = await _ensure_client()
+    if args.depot_id:
+        depot_ids = [args.depot_id]
+    else:
+        depot_ids = [d.id for d in await _run_blocking(c.list_depots)]
+    depots = await asyncio.gather(*[_run_blocking(c.get_depot_positions, depot_id) for depot_id in depot_ids])
+    return _ok(aggregate.portfolio_overview(depots, top=args.top))
+
+
+# --------- Response Cache ---------
+
+# Seconds a tool result is reused for identical arguments. Pass "refresh": true to bypass the cache.
+CACHE_TTLS: Dict[str, float] = {
+    "list_accounts": 60,
+    "list_transactions": 60,
+    "list_depots": 300,
+    "get_depot_positions": 60,
+    "list_documents": 300,
+    "summarize_cash_flow": 300,
+    "top_counterparties": 300,
+    "portfolio_overview": 60,
+}
+MAX_CACHED_RESPONSES = 256
+
+# Argument models, used to normalize the cache keys (defaults filled in)
+_ARG_MODELS = {
+    "list_transactions": ListTransactionsArgs,
+    "get_depot_positions": GetDepotPositionsArgs,
+    "list_documents": ListDocumentsArgs,
+    "summarize_cash_flow": SummarizeCashFlowArgs,
+    "top_counterparties": TopCounterpartiesArgs,
+    "portfolio_overview": PortfolioOverviewArgs,
+}
+
+
+class _ResponseCache:
+    """
+    Tool results by (tool, arguments) with per-tool TTLs. ``clear`` (on login/logout) also bumps the
+    generation, so results of calls still running against the old session are not stored.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_RESPONSES):
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[List[TextContent]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, result = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result: List[TextContent], ttl: float, generation: int) -> None:
+        if generation != self.generation:
+            return
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.generation += 1
+
+
+_responses = _ResponseCache()
+_warm_up_task: Optional[asyncio.Task] = None
+
+
+def _with_refresh(schema: Dict[str, Any]) -> Dict[str, Any]:
+    schema = {**schema, "properties": dict(schema.get("properties", {}))}
+    schema["properties"]["refresh"] = {
+        "type": "boolean",
+        "default": False,
+        "description": "Bypass the server-side response cache and fetch fresh data.",
+    }
+    return schema
+
+
+def _cache_key(name: str, arguments: dict) -> Optional[str]:
+    model = _ARG_MODELS.get(name)
+    normalized = model(**arguments).model_dump() if model else arguments
+    if normalized.get("cursor"):
+        # Follow-up pages advance a server-side iterator
+        return None
+    return json.dumps([name, normalized], sort_keys=True, default=str)
+
+
+async def _cached_call(name: str, arguments: dict, refresh: bool = False) -> List[TextContent]:
+    ttl = CACHE_TTLS.get(name)
+    key = _cache_key(name, arguments) if ttl else None
+    if key is not None and not refresh:
+        cached = _responses.get(key)
+        if cached is not None:
+            return cached
+
+    generation = _responses.generation
+    async with _tool_slot(name):
+        result = await _dispatch(name, arguments)
+    if key is not None:
+        _responses.put(key, result, ttl, generation)
+    return result
+
+
+def _schedule_warm_up() -> None:
+    global _warm_up_task
+    if _warm_up_task is None or _warm_up_task.done():
+        _warm_up_task = asyncio.get_running_loop().create_task(_warm_up())
+
+
+async def _warm_up() -> None:
+    """Fills the response cache with accounts, depots and the recent transactions after login."""
+    try:
+        accounts = json.loads((await _cached_call("list_accounts", {}))[0].text)["accounts"]
+        await asyncio.gather(
+            _cached_call("list_depots", {}),
+            *[_cached_call("list_transactions", {"account_id": a["id"]}) for a in accounts],
+        )
+    except Exception as e:
+        sys.stderr.write(f"Cache warm-up failed: {type(e).__name__}: {e}\n")
 
 
 # --------- Entrypoint ---------
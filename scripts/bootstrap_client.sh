@@ -55,6 +55,21 @@ rm -rf "$DEST_DIR"
 mkdir -p "$(dirname "$DEST_DIR")"
 cp -r "$GEN_DIR/openapi_client" "$DEST_DIR"
 
+# ------------------------------------------------------------------------------
+# Compact API modules, share transports, compile decoders and make package imports lazy
+# ------------------------------------------------------------------------------
+echo "Compacting API modules ..."
+python "$ROOT/scripts/compact_apis.py" "$DEST_DIR"
+
+echo "Injecting shared transport support ..."
+python "$ROOT/scripts/inject_rest_client.py" "$DEST_DIR"
+
+echo "Compiling response decoders ..."
+python "$ROOT/scripts/compile_decoders.py" "$DEST_DIR"
+
+echo "Rewriting package imports ..."
+python "$ROOT/scripts/lazy_imports.py" "$DEST_DIR"
+
 # ------------------------------------------------------------------------------
 # Cleanup
 # ------------------------------------------------------------------------------
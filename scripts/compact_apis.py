@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Compacts the API modules of the generated client.
+
+openapi-generator emits every operation four times: ``x``, ``x_with_http_info``
+and ``x_without_preload_content`` with identical signatures and bodies, plus a
+``_x_serialize`` request builder. Each copy is decorated with ``validate_call``,
+so importing e.g. ``brokerage_api`` (5.5k lines) builds three pydantic
+validators per operation.
+
+This script reads the operations back out of the generated code and rewrites
+each ``*_api.py`` into
+  - one ``Endpoint`` table entry per operation (method, path, parameter names,
+    headers, auth and response types),
+  - one parameter signature per operation (annotations and docstring as generated),
+  - the three public methods built by ``call_styles`` around the shared request
+    builder in ``api/_endpoint.py``, validating the arguments on first call.
+
+Method names, signatures and behaviour are unchanged. Running it twice is a no-op.
+"""
+
+import ast
+import shutil
+import sys
+from pathlib import Path
+
+DEFAULT_PACKAGE = Path("src/openapi_client")
+TEMPLATE = Path(__file__).resolve().parent / "templates" / "endpoint.py"
+MARKER = "call_styles"
+STYLES = ("_with_http_info", "_without_preload_content")
+
+
+def _literal(node):
+    return ast.literal_eval(node)
+
+
+def _call_name(node):
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def parse_serialize(func: ast.FunctionDef) -> dict:
+    """Extracts the request description from a generated ``_x_serialize`` method."""
+    spec = {"path_params": {}, "query_params": {}}
+    for node in ast.walk(func):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Subscript) and isinstance(target.value, ast.Name):
+                container, key = target.value.id, _literal(target.slice)
+                if container == "_path_params":
+                    spec["path_params"][key] = node.value.id
+                elif container != "_header_params" or key not in ("Accept", "Content-Type"):
+                    raise RuntimeError(f"{func.name}: unsupported assignment to {container}[{key!r}]")
+            elif isinstance(target, ast.Name) and target.id == "_body_params":
+                spec["body"] = node.value.id
+            elif isinstance(target, ast.Name) and target.id not in ("_host", "_default_content_type"):
+                raise RuntimeError(f"{func.name}: unsupported assignment to {target.id}")
+        elif isinstance(node, ast.AnnAssign) and node.target.id == "_auth_settings":
+            spec["auth_settings"] = _literal(node.value)
+        elif isinstance(node, ast.AnnAssign) and node.target.id == "_collection_formats":
+            spec["collection_formats"] = _literal(node.value)
+        elif isinstance(node, ast.AnnAssign) and node.target.id in ("_form_params", "_files"):
+            if _literal(node.value):
+                raise RuntimeError(f"{func.name}: unsupported {node.target.id}")
+        elif _call_name(node) == "append":
+            container = node.func.value.id
+            if container != "_query_params":
+                raise RuntimeError(f"{func.name}: unsupported {container}.append")
+            name, arg = node.args[0].elts
+            spec["query_params"][_literal(name)] = arg.id
+        elif _call_name(node) == "select_header_accept":
+            spec["accept"] = _literal(node.args[0])
+        elif _call_name(node) == "select_header_content_type":
+            spec["content_types"] = _literal(node.args[0])
+        elif _call_name(node) == "param_serialize":
+            kwargs = {kw.arg: kw.value for kw in node.keywords}
+            spec["method"] = _literal(kwargs["method"])
+            spec["resource_path"] = _literal(kwargs["resource_path"])
+    return spec
+
+
+def parse_response_types(func: ast.FunctionDef) -> dict:
+    for node in func.body:
+        if isinstance(node, ast.AnnAssign) and node.target.id == "_response_types_map":
+            return _literal(node.value)
+    raise RuntimeError(f"{func.name}: no _response_types_map")
+
+
+def render_endpoint(constant: str, name: str, spec: dict, response_types: dict) -> str:
+    lines = [
+        f"{constant} = Endpoint(",
+        f'    "{name}",',
+        f'    "{spec["method"]}",',
+        f'    "{spec["resource_path"]}",',
+    ]
+    for key in (
+        "path_params",
+        "query_params",
+        "body",
+        "accept",
+        "content_types",
+        "auth_settings",
+        "collection_formats",
+    ):
+        if spec.get(key):
+            lines.append(f"    {key}={spec[key]!r},")
+    lines.append(f"    response_types={response_types!r},")
+    lines.append(")")
+    return "\n".join(lines).replace("'", '"')
+
+
+def compact(path: Path) -> bool:
+    source = path.read_text()
+    if MARKER in source:
+        return False
+    lines = source.splitlines()
+    module = ast.parse(source)
+    cls = next(node for node in module.body if isinstance(node, ast.ClassDef))
+    methods = {node.name: node for node in cls.body if isinstance(node, ast.FunctionDef)}
+
+    header = "\n".join(lines[: cls.lineno - 1]).rstrip()
+    init = methods["__init__"]
+    class_head = "\n".join(lines[cls.lineno - 1 : init.end_lineno])
+
+    endpoints, members = [], []
+    for name, func in methods.items():
+        if name.startswith("_") or name.endswith(STYLES):
+            continue
+        for suffix in STYLES:
+            if ast.dump(methods[name + suffix].args) != ast.dump(func.args):
+                raise RuntimeError(f"{name}{suffix}: signature differs from {name}")
+
+        constant = f"_{name.upper()}"
+        spec = parse_serialize(methods[f"_{name}_serialize"])
+        endpoints.append(render_endpoint(constant, name, spec, parse_response_types(func)))
+
+        # keep the generated signature and docstring, but as a body-less parameter list
+        signature = lines[func.lineno - 1 : func.body[0].end_lineno]
+        signature[0] = signature[0].replace(f"def {name}(", f"def _{name}_params(", 1)
+        members.append(
+            "\n".join(signature)
+            + "\n        return locals()\n\n"
+            + f"    {name}, {name}_with_http_info, {name}_without_preload_content = call_styles(\n"
+            + f"        {constant}, _{name}_params\n"
+            + "    )"
+        )
+
+    header = header.replace(
+        "from openapi_client.api_client import ApiClient, RequestSerialized",
+        "from openapi_client.api._endpoint import Endpoint, call_styles\n"
+        "from openapi_client.api_client import ApiClient",
+    )
+    out = [header, "", "", "\n\n".join(endpoints), "", "", class_head, ""]
+    out.append("\n\n".join(members))
+    path.write_text("\n".join(out) + "\n")
+    return True
+
+
+def main(argv):
+    package = Path(argv[1]) if len(argv) > 1 else DEFAULT_PACKAGE
+    shutil.copyfile(TEMPLATE, package / "api" / "_endpoint.py")
+    for path in sorted((package / "api").glob("*_api.py")):
+        print(f"{'Compacted' if compact(path) else 'Unchanged'}: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Compiles response decoders for the generated models.
+
+The generated client decodes a response through ApiClient.__deserialize, which
+resolves the model class by name, calls ``from_dict`` and lets pydantic walk the
+core schema of every nested model. This script emits ``openapi_client/decoders``:
+one module per model with a ``decode`` function that reads each field by its
+JSON name, checks it where the schema demands it (strict types, enum values,
+patterns, lengths) and builds the model without re-validating, and a
+``decode_lazy`` variant that leaves the nested models of a field undecoded
+until the field is read.
+
+The field rules are read from the generated models, which carry everything the
+patched spec defines (aliases, strict types, defaults, enum and pattern
+validators), so decoders and models cannot drift apart. A field shape the
+compiler does not know makes the model fall back to ``from_dict``.
+
+Run it after generating the client; it needs the package importable.
+"""
+
+import ast
+import importlib
+import inspect
+import pkgutil
+import shutil
+import sys
+import typing
+from pathlib import Path
+
+from pydantic import BaseModel
+
+DEFAULT_PACKAGE = Path("src/openapi_client")
+TEMPLATE = Path(__file__).resolve().parent / "templates" / "decoders_init.py"
+
+HEADER = '''\
+# coding: utf-8
+
+"""
+    Compiled decoder for {name}.
+
+    Generated by scripts/compile_decoders.py.
+
+    Do not edit the class manually.
+"""  # noqa: E501
+'''
+
+CHECKS = {str: "type({v}) is not str", int: "type({v}) is not int", bool: "{v} is not True and {v} is not False"}
+
+
+class Unsupported(Exception):
+    pass
+
+
+def _strict_scalar(annotation):
+    """Returns (type, min_length, max_length) of a strict str/int/bool annotation."""
+    if typing.get_origin(annotation) is not typing.Annotated:
+        raise Unsupported(f"non-strict {annotation!r}")
+    base, *metadata = typing.get_args(annotation)
+    strict, lengths = False, [None, None]
+    pending = list(metadata)
+    while pending:
+        item = pending.pop()
+        kind = type(item).__name__
+        if kind == "FieldInfo":
+            pending.extend(item.metadata)
+        elif kind == "Strict":
+            strict = item.strict
+        elif kind == "MinLen":
+            lengths[0] = item.min_length
+        elif kind == "MaxLen":
+            lengths[1] = item.max_length
+        else:
+            raise Unsupported(f"constraint {item!r}")
+    if not strict or base not in CHECKS:
+        raise Unsupported(f"non-strict {annotation!r}")
+    return base, lengths[0] or None, lengths[1]
+
+
+def _validator_checks(cls, field):
+    """Translates the generated enum/pattern field validators into (kind, literal) pairs."""
+    checks = []
+    for decorator in cls.__pydantic_decorators__.field_validators.values():
+        if field not in decorator.info.fields:
+            continue
+        if decorator.info.mode != "after":
+            raise Unsupported(f"{decorator.cls_var_name}: mode {decorator.info.mode}")
+        func = ast.parse(inspect.cleandoc("\n" + inspect.getsource(decorator.func))).body[0]
+        body = [node for node in func.body if not isinstance(node, ast.Expr)]
+        guard = ast.unparse(body[0]) if body else ""
+        if len(body) != 3 or guard != "if value is None:\n    return value":
+            raise Unsupported(f"{decorator.cls_var_name}: unknown validator")
+        test = body[1].test
+        if isinstance(test, ast.Compare) and isinstance(test.ops[0], ast.NotIn):
+            checks.append(("enum", ast.literal_eval(test.comparators[0].args[0])))
+        elif isinstance(test, ast.UnaryOp) and ast.unparse(test.operand).startswith("re.match("):
+            checks.append(("pattern", ast.literal_eval(test.operand.args[0])))
+        else:
+            raise Unsupported(f"{decorator.cls_var_name}: unknown validator")
+    return checks
+
+
+class ModelCompiler:
+    def __init__(self, cls, modules):
+        self.cls = cls
+        self.modules = modules  # model class -> module name
+        self.imports = set()
+        self.constants = []
+        self.loaders = {}  # field name -> (JSON name, body of the lazy loader)
+
+    def nested(self, model, lazy=False):
+        module = self.modules[model]
+        function = "decode_lazy" if lazy else "decode"
+        self.imports.add(f"from openapi_client.decoders.{module} import {function} as {function}_{module}")
+        return f"{function}_{module}"
+
+    def scalar_conditions(self, name, v, annotation):
+        base, min_length, max_length = _strict_scalar(annotation)
+        conditions = [CHECKS[base].format(v=v)]
+        if min_length is not None:
+            conditions.append(f"len({v}) < {min_length}")
+        if max_length is not None:
+            conditions.append(f"len({v}) > {max_length}")
+        for kind, literal in _validator_checks(self.cls, name):
+            constant = f"_{name.upper()}_{kind.upper()}"
+            if kind == "enum":
+                self.constants.append(f"{constant} = frozenset({literal!r})")
+                conditions.append(f"{v} not in {constant}")
+            else:
+                self.constants.append(f"{constant} = re.compile({literal!r})")
+                conditions.append(f"not {constant}.match({v})")
+        return conditions
+
+    def container(self, v, origin, args, lazy=False):
+        if origin is dict and args[0] is not str:
+            raise Unsupported(f"dict key {args[0]!r}")
+        element, container = args[-1], origin.__name__
+        lines = [f"if {v} is not None:", f"    if type({v}) is not {container}:", "        raise Fallback"]
+        if element is typing.Any:
+            return lines + [f"    {v} = dict({v})"]
+        if inspect.isclass(element) and issubclass(element, BaseModel):
+            decode = self.nested(element, lazy)
+            if origin is list:
+                return lines + [f"    {v} = [{decode}(item) for item in {v}]"]
+            return lines + [f"    {v} = {{key: {decode}(item) for key, item in {v}.items()}}"]
+        if typing.get_origin(element) is dict and typing.get_args(element) == (str, typing.Any):
+            check = "type(item) is not dict"
+        else:
+            base, min_length, max_length = _strict_scalar(element)
+            if min_length is not None or max_length is not None:
+                raise Unsupported("length constraint on element")
+            check = CHECKS[base].format(v="item")
+        items = f"{v}.values()" if origin is dict else v
+        return lines + [
+            f"    for item in {items}:",
+            f"        if {check}:",
+            "            raise Fallback",
+            f"    {v} = {container}({v})",
+        ]
+
+    def field(self, name, info):
+        """Returns the lines reading, checking and decoding one field into ``f_<name>``."""
+        v = f"f_{name}"
+        args = typing.get_args(info.annotation)
+        if info.is_required() or typing.get_origin(info.annotation) is not typing.Union or args[1:] != (type(None),):
+            raise Unsupported(f"{name}: {info.annotation!r}")
+        annotation, origin = args[0], typing.get_origin(args[0])
+        alias = info.alias or name
+        lines = [f'{v} = obj.get("{alias}")']
+
+        if inspect.isclass(annotation) and issubclass(annotation, BaseModel) or origin in (list, dict):
+            if info.default is not None:
+                raise Unsupported(f"{name}: default {info.default!r}")
+            if origin is None:
+                self.loaders[name] = (alias, [f"return {self.nested(annotation, lazy=True)}({v})"])
+                return lines + [f"if {v} is not None:", f"    {v} = {self.nested(annotation)}({v})"]
+            args = typing.get_args(annotation)
+            if inspect.isclass(args[-1]) and issubclass(args[-1], BaseModel):
+                # the loader gets the value only if it is not null, so it drops the guard
+                loader = [line[4:] for line in self.container(v, origin, args, lazy=True)[1:]]
+                self.loaders[name] = (alias, loader + [f"return {v}"])
+            return lines + self.container(v, origin, args)
+
+        conditions = self.scalar_conditions(name, v, annotation)
+        cond = " or ".join(conditions)
+        if info.default is None:
+            cond = f"({cond})" if len(conditions) > 1 else cond
+            return lines + [f"if {v} is not None and {cond}:", "    raise Fallback"]
+        # from_dict replaces null by the default before validation
+        return lines + [f"if {v} is None:", f"    {v} = {info.default!r}", f"elif {cond}:", "    raise Fallback"]
+
+    def compile(self):
+        name = self.cls.__name__
+        body = ["if type(obj) is not dict:", "    raise Fallback"]
+        lazy_body = list(body)
+        try:
+            fields = list(self.cls.model_fields.items())
+            for field_name, info in fields:
+                lines = self.field(field_name, info)
+                body += lines
+                if field_name not in self.loaders:
+                    lazy_body += lines
+            values = ", ".join(f'"{field_name}": f_{field_name}' for field_name, _ in fields)
+            body.append(f"return construct({name}, {{{values}}})")
+            values = ", ".join(
+                f'"{field_name}": f_{field_name}' for field_name, _ in fields if field_name not in self.loaders
+            )
+            nested = ", ".join(
+                f'"{field_name}": obj.get("{alias}")' for field_name, (alias, _) in self.loaders.items()
+            )
+            lazy_body.append(f"return construct_lazy({name}, _LAZY_FIELDS, {{{values}}}, {{{nested}}})")
+        except Unsupported as e:
+            print(f"  {name}: falling back to from_dict ({e})")
+            self.imports, self.constants, self.loaders = set(), [], {}
+            body = ["if type(obj) is not dict:", "    raise Fallback", f"return {name}.from_dict(obj)"]
+
+        imports = ["from typing import Any", ""]
+        if any("re.compile" in c for c in self.constants):
+            imports.insert(0, "import re")
+        helpers = "Fallback, construct, construct_lazy" if self.loaders else "Fallback, construct"
+        imports.append(f"from openapi_client.decoders import {helpers}")
+        imports.append(f"from openapi_client.models.{self.modules[self.cls]} import {name}")
+        parts = [HEADER.format(name=name), "\n".join(imports), ""]
+        if self.constants:
+            parts += ["\n".join(self.constants), ""]
+        parts += ["", f"def decode(obj: Any) -> {name}:"]
+        parts += [f"    {line}" for line in body]
+        if self.loaders:
+            for field_name, (_, loader) in self.loaders.items():
+                parts += ["", "", f"def _load_{field_name}(f_{field_name}: Any) -> Any:"]
+                parts += [f"    {line}" for line in loader]
+            table = ", ".join(f'"{field_name}": _load_{field_name}' for field_name in self.loaders)
+            parts += ["", "", f"_LAZY_FIELDS = {{{table}}}"]
+            parts += ["", "", f"def decode_lazy(obj: Any) -> {name}:"]
+            parts += [f"    {line}" for line in lazy_body]
+        else:
+            parts += ["", "", "decode_lazy = decode"]
+        if self.imports:
+            # imported last, as in the models, so that mutually nested schemas can import each other
+            parts += ["", ""] + sorted(self.imports)
+        return "\n".join(parts) + "\n"
+
+
+def main(argv):
+    package = Path(argv[1]) if len(argv) > 1 else DEFAULT_PACKAGE
+    sys.path.insert(0, str(package.resolve().parent))
+    models = importlib.import_module("openapi_client.models")
+    modules = {}
+    for info in pkgutil.iter_modules(models.__path__):
+        module = importlib.import_module(f"openapi_client.models.{info.name}")
+        for obj in vars(module).values():
+            if inspect.isclass(obj) and issubclass(obj, BaseModel) and obj.__module__ == module.__name__:
+                modules[obj] = info.name
+
+    target = package / "decoders"
+    shutil.rmtree(target, ignore_errors=True)
+    target.mkdir()
+    for cls, module in sorted(modules.items(), key=lambda item: item[1]):
+        (target / f"{module}.py").write_text(ModelCompiler(cls, modules).compile())
+
+    table = "\n".join(
+        f'    "{cls.__name__}": "openapi_client.decoders.{module}",'
+        for cls, module in sorted(modules.items(), key=lambda item: item[1])
+    )
+    init = TEMPLATE.read_text().rstrip() + f"\n\n\nDECODER_MODULES = {{\n{table}\n}}\n"
+    (target / "__init__.py").write_text(init)
+    print(f"Compiled {len(modules)} decoders into {target}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Lets the generated ApiClient take an existing RESTClientObject.
+
+openapi-generator's ``ApiClient.__init__`` always builds a new RESTClientObject,
+and with it a urllib3 PoolManager. Clients that share one transport (see
+``ComdirectClientPool``) would each build a pool only to replace it. This script
+adds a ``rest_client`` parameter that is used instead when given. Running it
+twice is a no-op.
+"""
+
+import sys
+from pathlib import Path
+
+DEFAULT_PACKAGE = Path("src/openapi_client")
+
+SIGNATURE = "def __init__(self, configuration=None, header_name=None, header_value=None, cookie=None) -> None:"
+PATCHED_SIGNATURE = (
+    "def __init__(\n"
+    "        self, configuration=None, header_name=None, header_value=None, cookie=None, rest_client=None\n"
+    "    ) -> None:"
+)
+ASSIGNMENT = "self.rest_client = rest.RESTClientObject(configuration)"
+PATCHED_ASSIGNMENT = (
+    "# an existing transport can be shared instead of creating a connection pool per client\n"
+    "        self.rest_client = rest_client if rest_client is not None else rest.RESTClientObject(configuration)"
+)
+
+
+def inject(path: Path) -> bool:
+    source = path.read_text()
+    if PATCHED_ASSIGNMENT in source:
+        return False
+    for old in (SIGNATURE, ASSIGNMENT):
+        if source.count(old) != 1:
+            raise RuntimeError(f"{path}: expected exactly one '{old}'")
+    path.write_text(source.replace(SIGNATURE, PATCHED_SIGNATURE).replace(ASSIGNMENT, PATCHED_ASSIGNMENT))
+    return True
+
+
+def main(argv):
+    package = Path(argv[1]) if len(argv) > 1 else DEFAULT_PACKAGE
+    path = package / "api_client.py"
+    if not path.exists():
+        raise RuntimeError(f"Package module not found: {path}")
+    print(f"{'Patched' if inject(path) else 'Unchanged'}: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Rewrites the package ``__init__`` modules of the generated client to import lazily.
+
+openapi-generator emits ``__init__`` files that eagerly import every API module
+and every model, so ``import openapi_client`` builds all pydantic classes
+(including the 5.5k-line brokerage API) even if a caller only needs one of them.
+
+This script replaces the import block of each ``__init__`` with a name -> module
+table and a PEP 562 module ``__getattr__`` that imports the defining module on
+first access. The original imports are kept under ``TYPE_CHECKING`` so type
+checkers and IDEs still see every name. Running it twice is a no-op.
+"""
+
+import ast
+import sys
+from pathlib import Path
+
+DEFAULT_PACKAGE = Path("src/openapi_client")
+INIT_FILES = ("__init__.py", "api/__init__.py", "models/__init__.py")
+MARKER = "_LAZY_IMPORTS"
+
+LAZY_TEMPLATE = """\
+import importlib as _importlib
+from typing import TYPE_CHECKING
+
+# lazily import apis/models on first attribute access (PEP 562)
+{marker} = {{
+{entries}
+}}
+
+
+def __getattr__(name):
+    module = {marker}.get(name)
+    if module is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set({marker}))
+
+
+if TYPE_CHECKING:
+{imports}
+"""
+
+
+def make_lazy(path: Path) -> bool:
+    source = path.read_text()
+    if MARKER in source:
+        return False
+
+    imports = [node for node in ast.parse(source).body if isinstance(node, ast.ImportFrom)]
+    if not imports:
+        return False
+
+    names = {}
+    for node in imports:
+        for alias in node.names:
+            if alias.asname not in (None, alias.name):
+                raise RuntimeError(f"{path}: renaming import of {alias.name} is not supported")
+            names[alias.name] = node.module
+
+    lines = source.splitlines()
+    start, end = imports[0].lineno - 1, imports[-1].end_lineno
+    while start and lines[start - 1].startswith("#") and "flake8" not in lines[start - 1]:
+        start -= 1  # keep "# import models into ..." with the imports it describes
+    block = "\n".join(f"    {line}" if line.strip() else "" for line in lines[start:end])
+    entries = "\n".join(f'    "{name}": "{module}",' for name, module in names.items())
+
+    lazy = LAZY_TEMPLATE.format(marker=MARKER, entries=entries, imports=block)
+    rest = "\n".join(lines[end:]).strip()
+    path.write_text("\n".join(lines[:start]) + "\n" + lazy + (f"\n{rest}\n" if rest else ""))
+    return True
+
+
+def main(argv):
+    package = Path(argv[1]) if len(argv) > 1 else DEFAULT_PACKAGE
+    for name in INIT_FILES:
+        path = package / name
+        if not path.exists():
+            raise RuntimeError(f"Package module not found: {path}")
+        print(f"{'Rewrote' if make_lazy(path) else 'Unchanged'}: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -1,25 +1,89 @@
+import asyncio
 import base64
 import json
 import logging
+import time
 import uuid
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
-import requests
+import urllib3
 
 from .exceptions import AuthenticationError, TanError
-from .utils import timestamp
+from .utils import request_info_header
 
 logger = logging.getLogger(__name__)
 
 
+class _Response:
+    """Minimal response view (status_code, headers, text, json()) over a urllib3 response."""
+
+    def __init__(self, resp: urllib3.HTTPResponse):
+        self.status_code = resp.status
+        self.headers = resp.headers
+        self.content = resp.data
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class _HttpSession:
+    """
+    Runs the auth requests on a urllib3 pool manager.
+
+    Passing the pool manager of the ``ApiClient`` lets the auth flow and the API calls share the same
+    keep-alive connections (and TLS sessions) to api.comdirect.de.
+    """
+
+    def __init__(self, pool_manager: Optional[urllib3.PoolManager] = None):
+        self.pool_manager = pool_manager if pool_manager is not None else urllib3.PoolManager()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[Dict[str, str]] = None,
+        json_body: Any = None,
+    ) -> _Response:
+        if data is not None:
+            resp = self.pool_manager.request(method, url, fields=data, encode_multipart=False, headers=headers)
+        elif json_body is not None:
+            headers = {"Content-Type": "application/json", **headers}
+            resp = self.pool_manager.request(method, url, body=json.dumps(json_body), headers=headers)
+        else:
+            resp = self.pool_manager.request(method, url, headers=headers)
+        return _Response(resp)
+
+    def get(self, url: str, headers: Dict[str, str]) -> _Response:
+        return self.request("GET", url, headers)
+
+    def post(self, url: str, headers: Dict[str, str], data=None, json=None) -> _Response:
+        return self.request("POST", url, headers, data=data, json_body=json)
+
+    def patch(self, url: str, headers: Dict[str, str], data=None, json=None) -> _Response:
+        return self.request("PATCH", url, headers, data=data, json_body=json)
+
+
 class Authenticator:
     """
     Handles the complicated OAuth + 2FA authentication flow for Comdirect.
     """
 
+    API_ORIGIN = "https://api.comdirect.de"
     TOKEN_URL = "https://api.comdirect.de/oauth/token"
     SESSION_URL = "https://api.comdirect.de/api/session/clients/user/v1/sessions"
 
+    # Backoff of the push-TAN status polling (seconds)
+    PUSH_POLL_INITIAL = 0.5
+    PUSH_POLL_MAX = 3.0
+    PUSH_POLL_FACTOR = 1.5
+    # The server ignores the TAN of an approved push challenge, but the header must be present
+    PUSH_TAN = "123456"
+
     def __init__(
         self,
         username: str,
@@ -29,7 +93,10 @@ class Authenticator:
         *,
         photo_tan_cb: Callable[[bytes], str],
         sms_tan_cb: Callable[[], str],
-        push_tan_cb: Callable[[], str],
+        push_tan_cb: Optional[Callable[[], Optional[str]]],
+        pool_manager: Optional[urllib3.PoolManager] = None,
+        push_tan_poll: bool = False,
+        push_tan_timeout: float = 120.0,
     ):
         self._username = username
         self._password = password
@@ -38,8 +105,12 @@ class Authenticator:
         self._photo_cb = photo_tan_cb
         self._sms_cb = sms_tan_cb
         self._push_cb = push_tan_cb
+        # Poll the push-TAN status instead of blocking in the callback, which then only notifies the user
+        self._push_poll = push_tan_poll
+        self._push_timeout = push_tan_timeout
 
-        self._session = requests.Session()
+        # Pass the ApiClient's pool manager to reuse its connections for the auth flow
+        self._session = _HttpSession(pool_manager)
 
     def authenticate(self) -> Tuple[str, Dict[str, Any]]:
         """
@@ -58,7 +129,33 @@ class Authenticator:
             logger.info("Authentication successful")
             return session_id, secondary_token
 
-        except requests.RequestException as e:
+        except urllib3.exceptions.HTTPError as e:
+            logger.error(f"Network error during authentication: {e}")
+            raise AuthenticationError(f"Network error: {str(e)}") from e
+
+    async def authenticate_async(self) -> Tuple[str, Dict[str, Any]]:
+        """
+        Async variant of ``authenticate``. The HTTP requests run in worker threads and waiting for the
+        push-TAN approval does not block the event loop.
+        """
+        logger.info("Starting authentication flow")
+        try:
+            token = await asyncio.to_thread(self._primary_token)
+            session_id = await asyncio.to_thread(self._create_session, token)
+            headers, auth_info = await asyncio.to_thread(self._start_validation, token, session_id)
+            if self._polls_push_tan(auth_info):
+                self._notify_push_tan()
+                await self._wait_for_push_tan_async(headers, auth_info)
+                tan = self.PUSH_TAN
+            else:
+                tan = await asyncio.to_thread(self._resolve_tan, auth_info)
+            await asyncio.to_thread(self._confirm_tan, headers, session_id, auth_info, tan)
+            secondary_token = await asyncio.to_thread(self._secondary_token, token)
+
+            logger.info("Authentication successful")
+            return session_id, secondary_token
+
+        except urllib3.exceptions.HTTPError as e:
             logger.error(f"Network error during authentication: {e}")
             raise AuthenticationError(f"Network error: {str(e)}") from e
 
@@ -102,6 +199,19 @@ class Authenticator:
 
     def _validate_session(self, token: str, session_id: str) -> None:
         """Step 3: Trigger 2FA challenge and validate session."""
+        headers, auth_info = self._start_validation(token, session_id)
+
+        if self._polls_push_tan(auth_info):
+            self._notify_push_tan()
+            self._wait_for_push_tan(headers, auth_info)
+            tan = self.PUSH_TAN
+        else:
+            tan = self._resolve_tan(auth_info)
+
+        self._confirm_tan(headers, session_id, auth_info, tan)
+
+    def _start_validation(self, token: str, session_id: str) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Triggers the 2FA challenge. Returns the request headers and the challenge info."""
         logger.debug("Validating session (2FA challenge)")
 
         request_info_header = self._build_request_info_header(session_id)
@@ -132,11 +242,12 @@ class Authenticator:
 
         auth_info = json.loads(challenge_header)
         logger.info("Received 2FA challenge of type: %s", auth_info.get("typ"))
+        return headers, auth_info
 
-        tan = self._resolve_tan(auth_info)
-
-        # Confirm 2FA
+    def _confirm_tan(self, headers: Dict[str, str], session_id: str, auth_info: Dict[str, Any], tan: str) -> None:
+        """Activates the session with the TAN of the challenge."""
         logger.debug("Submitting TAN")
+        headers = dict(headers)
         headers["x-once-authentication-info"] = json.dumps({"id": auth_info["id"]})
         headers["x-once-authentication"] = tan
 
@@ -172,6 +283,88 @@ class Authenticator:
         self._handle_error(response, "Secondary OAuth failed")
         return response.json()
 
+    def refresh(self, refresh_token: str) -> Dict[str, Any]:
+        """
+        Exchanges a refresh token for a new access token without a 2FA challenge.
+
+        Returns:
+            Token response dict (access_token, refresh_token, expires_in, ...)
+        """
+        logger.debug("Refreshing access token")
+        payload = {
+            "client_id": self._client_id,
+            "client_secret": self._client_secret,
+            "grant_type": "refresh_token",
+            "refresh_token": refresh_token,
+        }
+
+        try:
+            response = self._session.post(
+                self.TOKEN_URL,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": "application/x-www-form-urlencoded",
+                },
+                data=payload,
+            )
+        except urllib3.exceptions.HTTPError as e:
+            logger.error(f"Network error during token refresh: {e}")
+            raise AuthenticationError(f"Network error: {str(e)}") from e
+
+        self._handle_error(response, "Token refresh failed")
+        return response.json()
+
+    def _polls_push_tan(self, info: Dict[str, Any]) -> bool:
+        return self._push_poll and info.get("typ") == "P_TAN_PUSH"
+
+    def _notify_push_tan(self) -> None:
+        logger.info("Waiting for push-TAN approval (up to %.0fs)", self._push_timeout)
+        if self._push_cb is not None:
+            try:
+                self._push_cb()
+            except Exception as e:
+                logger.error(f"Error in TAN callback: {e}")
+                raise TanError(f"TAN callback failed: {str(e)}") from e
+
+    def _push_tan_approved(self, headers: Dict[str, str], info: Dict[str, Any]) -> bool:
+        """Polls the status of the push challenge once. Raises TanError if it was declined or expired."""
+        href = info.get("link", {}).get("href")
+        if not href:
+            raise TanError("Push-TAN challenge has no status link to poll")
+        url = href if href.startswith("http") else f"{self.API_ORIGIN}{href}"
+        response = self._session.get(url, headers=headers)
+        self._handle_error(response, "Push-TAN status request failed")
+
+        status = response.json().get("status")
+        if status == "AUTHENTICATED":
+            return True
+        if status == "PENDING":
+            return False
+        raise TanError(f"Push-TAN was not approved: {status}")
+
+    def _wait_for_push_tan(self, headers: Dict[str, str], info: Dict[str, Any]) -> None:
+        """Polls with backoff until the push-TAN is approved or ``push_tan_timeout`` has passed."""
+        deadline = time.monotonic() + self._push_timeout
+        delay = self.PUSH_POLL_INITIAL
+        while not self._push_tan_approved(headers, info):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TanError(f"Push-TAN not approved within {self._push_timeout:.0f}s")
+            time.sleep(min(delay, remaining))
+            delay = min(delay * self.PUSH_POLL_FACTOR, self.PUSH_POLL_MAX)
+        logger.info("Push-TAN approved")
+
+    async def _wait_for_push_tan_async(self, headers: Dict[str, str], info: Dict[str, Any]) -> None:
+        deadline = time.monotonic() + self._push_timeout
+        delay = self.PUSH_POLL_INITIAL
+        while not await asyncio.to_thread(self._push_tan_approved, headers, info):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TanError(f"Push-TAN not approved within {self._push_timeout:.0f}s")
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * self.PUSH_POLL_FACTOR, self.PUSH_POLL_MAX)
+        logger.info("Push-TAN approved")
+
     def _resolve_tan(self, info: Dict[str, Any]) -> str:
         """Dispatches the TAN challenge to the correct callback."""
         typ = info.get("typ")
@@ -192,7 +385,7 @@ class Authenticator:
 
     def _handle_error(
         self,
-        response: requests.Response,
+        response: _Response,
         msg: str,
         expected_codes: list[int] = None,
     ):
@@ -223,11 +416,4 @@ class Authenticator:
 
     @staticmethod
     def _build_request_info_header(session_id: str) -> str:
-        return json.dumps(
-            {
-                "clientRequestId": {
-                    "sessionId": session_id,
-                    "requestId": timestamp(),
-                }
-            }
-        )
+        return request_info_header(session_id)
@@ -0,0 +1,249 @@
+"""
+``comdirect-export``: streams transactions to NDJSON or CSV with bounded memory.
+
+Transactions are written as they arrive from ``ComdirectClient.iter_all_transactions``;
+no account history is ever materialized as a list.
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from .client import ComdirectClient
+from .domain.models import Transaction
+from .export import TRANSACTION_COLUMNS
+from .utils import is_valid_tan
+
+FIELDNAMES = [name for name, _, _ in TRANSACTION_COLUMNS]
+
+# Upper bound of transactions buffered between fetch workers and the writer.
+_QUEUE_SIZE = 1000
+_DONE = object()
+
+
+def transaction_row(tx: Transaction) -> Dict[str, Any]:
+    """Flattens a Transaction into a JSON/CSV friendly dict (same columns as the Parquet export)."""
+    row = {}
+    for name, _, getter in TRANSACTION_COLUMNS:
+        value = getter(tx)
+        if isinstance(value, date):
+            value = value.isoformat()
+        elif isinstance(value, Decimal):
+            value = str(value)
+        row[name] = value
+    return row
+
+
+class _NdjsonWriter:
+    def __init__(self, out: TextIO):
+        self._out = out
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._out.write(json.dumps(row, ensure_ascii=False))
+        self._out.write("\n")
+
+
+class _CsvWriter:
+    def __init__(self, out: TextIO):
+        self._writer = csv.DictWriter(out, fieldnames=FIELDNAMES)
+        self._writer.writeheader()
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._writer.writerow(row)
+
+
+def _iter_parallel(client: ComdirectClient, account_ids: List[str], workers: int, **filters) -> Iterator[Transaction]:
+    """
+    Fetches several accounts concurrently and yields their transactions through a bounded queue,
+    so fast producers block instead of piling up pages in memory.
+    """
+    q: "queue.Queue[Any]" = queue.Queue(maxsize=_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def produce(account_id):
+        if stop.is_set():
+            # the consumer is gone, do not start fetching another account
+            return
+        try:
+            for tx in client.iter_all_transactions(account_id=account_id, **filters):
+                if stop.is_set():
+                    return
+                q.put(tx)
+        except Exception as e:
+            q.put(e)
+        finally:
+            q.put(_DONE)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="comdirect-export") as pool:
+        futures = [pool.submit(produce, account_id) for account_id in account_ids]
+        try:
+            pending = len(account_ids)
+            while pending:
+                item = q.get()
+                if item is _DONE:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            # Unblock producers waiting on a full queue until the running ones have returned.
+            while not all(future.done() for future in futures):
+                try:
+                    q.get(timeout=0.05)
+                except queue.Empty:
+                    pass
+
+
+def export_transactions(
+    client: ComdirectClient,
+    account_ids: List[str],
+    out: TextIO,
+    fmt: str = "ndjson",
+    since: Optional[str] = None,
+    workers: int = 1,
+    flush_every: int = 1000,
+) -> int:
+    """
+    Streams all booked transactions of ``account_ids`` to ``out``.
+    Returns the number of transactions written.
+    """
+    writer = _CsvWriter(out) if fmt == "csv" else _NdjsonWriter(out)
+    filters = {"min_booking_date": since}
+
+    if workers > 1 and len(account_ids) > 1:
+        transactions = _iter_parallel(client, account_ids, min(workers, len(account_ids)), **filters)
+    else:
+        transactions = (
+            tx for account_id in account_ids for tx in client.iter_all_transactions(account_id=account_id, **filters)
+        )
+
+    count = 0
+    for tx in transactions:
+        writer.write(transaction_row(tx))
+        count += 1
+        if count % flush_every == 0:
+            out.flush()
+    out.flush()
+    return count
+
+
+def _prompt(msg: str) -> str:
+    # stdout may carry the export, so all interaction happens on stderr.
+    sys.stderr.write(msg)
+    sys.stderr.flush()
+    return sys.stdin.readline().strip()
+
+
+def _photo_tan_cb(png_bytes: bytes) -> str:
+    from PIL import Image
+
+    Image.open(io.BytesIO(png_bytes)).show()
+    tan = _prompt("Enter Photo-TAN: ")
+    if not is_valid_tan(tan):
+        raise ValueError("Invalid Photo-TAN")
+    return tan
+
+
+def _sms_tan_cb() -> str:
+    tan = _prompt("Enter SMS-TAN: ")
+    if not is_valid_tan(tan):
+        raise ValueError("Invalid SMS-TAN")
+    return tan
+
+
+def _push_tan_cb() -> None:
+    # The login polls the approval status, so this only tells the user what to do.
+    sys.stderr.write("Please approve the push-TAN in the comdirect app.\n")
+    sys.stderr.flush()
+
+
+def _credentials_from_env() -> Dict[str, str]:
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except ImportError:
+        pass
+
+    keys = ["username", "password", "client_id", "client_secret"]
+    missing = [f"COMDIRECT_{k.upper()}" for k in keys if f"COMDIRECT_{k.upper()}" not in os.environ]
+    if missing:
+        raise SystemExit(f"Missing environment variables: {', '.join(missing)}")
+    return {k: os.environ[f"COMDIRECT_{k.upper()}"] for k in keys}
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError("must be >= 1")
+    return n
+
+
+def _iso_date(value: str) -> str:
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD") from e
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="comdirect-export",
+        description="Stream comdirect transactions to NDJSON or CSV.",
+    )
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson", help="output format")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--since", type=_iso_date, help="only transactions booked on or after YYYY-MM-DD")
+    parser.add_argument("--accounts", help="comma separated account ids (default: all accounts)")
+    parser.add_argument("--workers", type=_positive_int, default=1, help="accounts fetched in parallel")
+    parser.add_argument("--flush-every", type=_positive_int, default=1000, help="flush output every N rows")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    client = ComdirectClient(
+        _credentials_from_env(),
+        {"photo_tan_cb": _photo_tan_cb, "sms_tan_cb": _sms_tan_cb, "push_tan_cb": _push_tan_cb},
+        push_tan_poll=True,
+    )
+    client.login()
+    try:
+        if args.accounts:
+            account_ids = [a.strip() for a in args.accounts.split(",") if a.strip()]
+        else:
+            account_ids = [a.id for a in client.list_accounts()]
+
+        if args.output == "-":
+            count = export_transactions(
+                client, account_ids, sys.stdout, args.format, args.since, args.workers, args.flush_every
+            )
+        else:
+            with open(args.output, "w", newline="", encoding="utf-8") as out:
+                count = export_transactions(
+                    client, account_ids, out, args.format, args.since, args.workers, args.flush_every
+                )
+        sys.stderr.write(f"Exported {count} transactions from {len(account_ids)} account(s).\n")
+    finally:
+        client.logout()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
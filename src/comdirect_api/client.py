@@ -1,12 +1,23 @@
+import importlib
 import json
-from openapi_client import ApiClient, Configuration
-from openapi_client.api.banking_api import BankingApi
-from openapi_client.api.brokerage_api import BrokerageApi
-from openapi_client.api.messages_api import MessagesApi
+import logging
+import re
+import time
+import typing
+from typing import Optional
+
+from openapi_client import ApiClient, Configuration, rest
+from openapi_client.decoders import decoder_for
 from openapi_client.exceptions import ApiException
 
 from .auth import Authenticator
-from .utils import timestamp
+from .connections import ConnectionManager, record_activity
+from .exceptions import AuthenticationError
+from .session_store import SessionStore
+from .state import SessionState
+from .streaming import iter_list_values
+from .tokens import TokenManager
+from .utils import request_info_header
 from .domain.models import (
     Account,
     Transaction,
@@ -24,15 +35,112 @@ from .domain.mappers import (
     map_document,
 )
 
+logger = logging.getLogger(__name__)
+
+DECODE_ENGINES = ("pydantic", "compiled", "lazy")
+_JSON_CONTENT_TYPE = re.compile(r"^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)", re.IGNORECASE)
+_CHARSET = re.compile(r"charset=([a-zA-Z\-\d]+)[\s;]?")
+# Read size when streaming a response body; small enough that the first items are parsed early
+STREAM_CHUNK_SIZE = 8192
+# Most a stream abandoned by the caller reads to keep its connection; a longer rest closes it instead
+STREAM_DRAIN_LIMIT = 1024 * 1024
+
+
+def _close(response) -> None:
+    response.close()
+    response.release_conn()
+
+
+def _discard_rest(response, chunks) -> None:
+    """Reads up to STREAM_DRAIN_LIMIT more bytes of an abandoned stream, or closes its connection."""
+    remaining = STREAM_DRAIN_LIMIT
+    try:
+        for chunk in chunks:
+            remaining -= len(chunk)
+            if remaining < 0:
+                break
+        else:
+            return
+    except Exception:
+        logger.debug("Failed to read the rest of an abandoned stream", exc_info=True)
+    _close(response)
+
 
 class ComdirectApiClient(ApiClient):
     """
     Subclass of generated ApiClient to inject the dynamic x-http-request-info header.
     """
 
-    def __init__(self, session_id_provider, *args, **kwargs):
+    def __init__(
+        self,
+        session_id_provider,
+        *args,
+        token_refresher=None,
+        session_state=None,
+        decode_engine="pydantic",
+        **kwargs,
+    ):
+        if decode_engine not in DECODE_ENGINES:
+            raise ValueError(f"Unknown decode engine '{decode_engine}', expected one of {', '.join(DECODE_ENGINES)}")
         super().__init__(*args, **kwargs)
         self._session_id_provider = session_id_provider
+        # Called with the rejected token on HTTP 401 to obtain a fresh one; the request is then retried once.
+        self._token_refresher = token_refresher
+        # If given, session id and access token are read from one consistent SessionState snapshot.
+        self._session_state = session_state
+        # Monotonic time of the last API request, used by the keep-alive manager
+        self.last_request_at = None
+        # "compiled" decodes JSON responses with the generated decoders in openapi_client.decoders,
+        # "lazy" like "compiled", but nested models are only decoded when they are first read,
+        # "pydantic" with the generic from_dict/model_validate path of the generated ApiClient.
+        self.decode_engine = decode_engine
+
+    def deserialize(self, response_text, response_type, content_type):
+        if self.decode_engine != "pydantic" and response_text and _JSON_CONTENT_TYPE.match(content_type or ""):
+            decoder = decoder_for(response_type, lazy=self.decode_engine == "lazy")
+            if decoder is not None:
+                return decoder(json.loads(response_text))
+        return super().deserialize(response_text, response_type, content_type)
+
+    def stream_list(self, response_data, response_type, fields):
+        """
+        Yields the decoded elements of a ListResource response while its body is still arriving.
+
+        The other members (paging, aggregated) are stored in ``fields`` as parsed JSON once the
+        iterator is exhausted. Error responses raise ApiException, as in response_deserialize.
+        """
+        if not 200 <= response_data.status <= 299:
+            response_data.read()
+            self.response_deserialize(response_data=response_data, response_types_map={})
+        model = getattr(importlib.import_module("openapi_client.models"), response_type)
+        item = typing.get_args(typing.get_args(model.model_fields["values"].annotation)[0])[0]
+        decode = None
+        if self.decode_engine != "pydantic":
+            decode = decoder_for(item.__name__, lazy=self.decode_engine == "lazy")
+        decode = decode or item.from_dict
+
+        match = _CHARSET.search(response_data.headers.get("content-type") or "")
+        chunks = response_data.response.stream(STREAM_CHUNK_SIZE)
+        try:
+            for value in iter_list_values(chunks, fields, match.group(1) if match else "utf-8"):
+                yield decode(value)
+            values = fields.pop("values", None)
+            if values is not None:
+                # not an array; leave it to the model to reject (or accept) it
+                yield from model.from_dict({"values": values}).values or ()
+        except GeneratorExit:
+            # the caller stopped early; read what is left so the connection goes back to the pool
+            _discard_rest(response_data.response, chunks)
+            raise
+        except BaseException:
+            # the body is only partly read, the connection cannot be reused
+            _close(response_data.response)
+            raise
+
+    def _credentials(self):
+        if self._session_state is not None:
+            return self._session_state.credentials
+        return self._session_id_provider(), self.configuration.access_token
 
     def call_api(
         self,
@@ -46,26 +154,22 @@ class ComdirectApiClient(ApiClient):
         if header_params is None:
             header_params = {}
 
+        session_id, access_token = self._credentials()
+
         # 1. Inject Authorization header if access_token is configured
-        if self.configuration.access_token and "Authorization" not in header_params:
-            header_params["Authorization"] = f"Bearer {self.configuration.access_token}"
+        inject_auth = "Authorization" not in header_params
+        if access_token and inject_auth:
+            header_params["Authorization"] = f"Bearer {access_token}"
 
         # 2. Inject x-http-request-info header if session exists
-        session_id = self._session_id_provider()
         if session_id:
-            request_info = {
-                "clientRequestId": {
-                    "sessionId": session_id,
-                    "requestId": timestamp(),
-                }
-            }
-            header_params["x-http-request-info"] = json.dumps(request_info)
+            header_params["x-http-request-info"] = request_info_header(session_id)
 
         # 3. Ensure Content-Type is valid for Comdirect (sometimes they are picky)
         if "Content-Type" not in header_params:
             header_params["Content-Type"] = "application/json"
 
-        return super().call_api(
+        response = super().call_api(
             method,
             url,
             header_params=header_params,
@@ -73,33 +177,216 @@ class ComdirectApiClient(ApiClient):
             post_params=post_params,
             _request_timeout=_request_timeout,
         )
+        self.last_request_at = time.monotonic()
+        # The pool may be shared with other clients; their keep-alive managers must see this request too
+        record_activity(self.rest_client.pool_manager)
+
+        # 4. Expired token: refresh once and retry transparently
+        if response.status == 401 and inject_auth and self._token_refresher is not None:
+            new_token = self._token_refresher(access_token)
+            if new_token:
+                response.read()  # release the connection back to the pool
+                header_params["Authorization"] = f"Bearer {new_token}"
+                response = super().call_api(
+                    method,
+                    url,
+                    header_params=header_params,
+                    body=body,
+                    post_params=post_params,
+                    _request_timeout=_request_timeout,
+                )
+
+        return response
 
 
 class ComdirectClient:
-    def __init__(self, credentials, tan_handlers):
-        self._auth = Authenticator(**credentials, **tan_handlers)
-        self._session_id = None
+    def __init__(
+        self,
+        credentials,
+        tan_handlers,
+        auto_refresh: bool = True,
+        refresh_margin: float = 60,
+        session_store: Optional[SessionStore] = None,
+        rest_client: Optional[rest.RESTClientObject] = None,
+        warm_connections: int = 0,
+        keepalive_idle: Optional[float] = None,
+        push_tan_poll: bool = False,
+        push_tan_timeout: float = 120.0,
+        decode_engine: str = "compiled",
+        stream_lists: bool = False,
+    ):
+        # Session id and access token, swapped atomically; safe to share the client across threads
+        self._state = SessionState()
+        self._auto_refresh = auto_refresh
+        self._refresh_margin = refresh_margin
+        # Optional encrypted cache to resume the session after a restart without 2FA
+        self._session_store = session_store
+        # Connections opened right after login, and the idle time after which they are recycled
+        self._warm_connections = warm_connections
+        self._keepalive_idle = keepalive_idle
+        # Parse transaction and position lists while the response body is still arriving
+        self._stream_lists = stream_lists
 
         # Initialize OpenAPI client with default configuration
         config = Configuration(host="https://api.comdirect.de/api")
         # We use a lambda to provide the current session_id dynamically to the ApiClient
-        self._api_client = ComdirectApiClient(session_id_provider=lambda: self._session_id, configuration=config)
+        self._api_client = ComdirectApiClient(
+            session_id_provider=lambda: self._state.session_id,
+            configuration=config,
+            token_refresher=self._refresh_on_unauthorized,
+            session_state=self._state,
+            decode_engine=decode_engine,
+            # Share an existing connection pool instead of creating one for this client
+            rest_client=rest_client,
+        )
+        # The auth flow runs on the same connection pool, so the login already warms up the API connections.
+        # With push_tan_poll the login completes as soon as the push-TAN is approved in the app.
+        self._auth = Authenticator(
+            **credentials,
+            **tan_handlers,
+            pool_manager=self._api_client.rest_client.pool_manager,
+            push_tan_poll=push_tan_poll,
+            push_tan_timeout=push_tan_timeout,
+        )
+        self._connections = ConnectionManager(
+            self._api_client.rest_client.pool_manager,
+            last_activity=lambda: self._api_client.last_request_at,
+            max_idle=keepalive_idle or 50.0,
+        )
+        self._tokens = TokenManager(
+            refresh_fn=self._auth.refresh,
+            on_update=self._set_access_token,
+            refresh_margin=refresh_margin,
+        )
+
+        # Generated API classes are imported and instantiated on first use, see the properties below
+        self._apis = {}
+
+    @property
+    def _session_id(self):
+        return self._state.session_id
 
-        # Instantiate generated API classes once
-        self._banking = BankingApi(self._api_client)
-        self._brokerage = BrokerageApi(self._api_client)
-        self._messages = MessagesApi(self._api_client)
+    def _api(self, name: str):
+        api = self._apis.get(name)
+        if api is None:
+            module = importlib.import_module(f"openapi_client.api.{name}_api")
+            api = self._apis[name] = getattr(module, f"{name.capitalize()}Api")(self._api_client)
+        return api
+
+    @property
+    def _banking(self):
+        return self._api("banking")
+
+    @property
+    def _brokerage(self):
+        return self._api("brokerage")
+
+    @property
+    def _messages(self):
+        return self._api("messages")
 
     def login(self):
-        # 1. Authenticate (keep existing flow)
-        session_id, auth_result = self._auth.authenticate()
+        """
+        Logs in (or resumes a cached session). Thread-safe: concurrent callers do not start additional
+        2FA flows but wait for the login in progress and share its session.
+        """
+        generation = self._state.generation
+        with self._state.login_lock:
+            if self._state.generation != generation and self._state.is_authenticated:
+                # Another thread logged in while we were waiting.
+                return
+
+            # 1. Resume a cached session if possible, otherwise authenticate (keep existing flow)
+            if not self._restore_session():
+                session_id, auth_result = self._auth.authenticate()
+
+                # 2. Swap in session and token together, then track the tokens for refreshing
+                self._state.set(session_id, auth_result["access_token"])
+                self._tokens.set_tokens(auth_result)
+
+            # 3. Keep the access token alive without another 2FA challenge
+            if self._auto_refresh:
+                self._tokens.start()
+
+        # 4. Open the connections for the first requests now, and keep them fresh while idle
+        if self._warm_connections:
+            self._connections.warm_up(self._warm_connections)
+        if self._keepalive_idle:
+            self._connections.start()
+
+    def _restore_session(self) -> bool:
+        """
+        Takes over the session from the session store. Tokens close to expiry are refreshed first.
+        Returns False if a full login is required.
+        """
+        if self._session_store is None:
+            return False
+        cached = self._session_store.load()
+        if cached is None:
+            return False
+
+        expires_in = None
+        if cached.get("expires_at") is not None:
+            expires_in = cached["expires_at"] - time.time()
+
+        self._state.set(cached["session_id"], cached["access_token"])
+        self._tokens.set_tokens(
+            {
+                "access_token": cached["access_token"],
+                "refresh_token": cached.get("refresh_token"),
+                "expires_in": max(expires_in, 0.001) if expires_in is not None else None,
+            }
+        )
+
+        if expires_in is not None and expires_in <= self._refresh_margin:
+            try:
+                self._tokens.refresh()
+            except AuthenticationError as e:
+                logger.info(f"Cached session could not be refreshed, full login required: {e}")
+                self._tokens.clear()
+                self._state.clear()
+                self._session_store.clear()
+                return False
+
+        logger.info("Resumed cached session")
+        return True
 
-        # 2. Store session and token
-        self._session_id = session_id
-        access_token = auth_result["access_token"]
+    def _persist_session(self):
+        session_id = self._state.session_id
+        if self._session_store is None or not session_id or not self._tokens.access_token:
+            return
+        expires_in = self._tokens.expires_in
+        self._session_store.save(
+            session_id=session_id,
+            access_token=self._tokens.access_token,
+            refresh_token=self._tokens.refresh_token,
+            expires_at=time.time() + expires_in if expires_in is not None else None,
+        )
 
-        # 3. Inject the token into the existing API client configuration
+    def refresh_token(self) -> None:
+        """
+        Renews the access token using the refresh token of the current session.
+        """
+        self._tokens.refresh()
+
+    def connection_stats(self) -> dict:
+        """
+        Returns statistics of the connection pool to the API host (open/idle connections, requests, idle time).
+        """
+        return self._connections.stats()
+
+    def _set_access_token(self, access_token):
+        self._state.update_token(access_token)
         self._api_client.configuration.access_token = access_token
+        self._persist_session()
+
+    def _refresh_on_unauthorized(self, stale_token):
+        if not self._tokens.can_refresh():
+            return None
+        try:
+            return self._tokens.refresh(stale_token)
+        except AuthenticationError:
+            return None
 
     def list_accounts(self) -> list[Account]:
         """
@@ -155,7 +442,7 @@ class ComdirectClient:
         Note: The API only supports paging for 'BOOKED' transactions.
         """
         if transaction_state not in (None, "BOOKED"):
-            res = self._get_account_transactions_page(
+            page = self._iter_account_transactions_page(
                 account_id=account_id,
                 with_account=with_account,
                 paging_first=paging_first,
@@ -164,12 +451,12 @@ class ComdirectClient:
                 min_booking_date=min_booking_date,
                 max_booking_date=max_booking_date,
             )
-            yield from [map_transaction(tx, account_id) for tx in res.values]
+            yield from (map_transaction(tx, account_id) for tx in page)
             return
 
         offset = paging_first or 0
         while True:
-            res = self._get_account_transactions_page(
+            page = self._iter_account_transactions_page(
                 account_id=account_id,
                 with_account=with_account,
                 paging_first=offset,
@@ -178,12 +465,40 @@ class ComdirectClient:
                 min_booking_date=min_booking_date,
                 max_booking_date=max_booking_date,
             )
-            if not res.values:
+            count = 0
+            for tx in page:
+                count += 1
+                yield map_transaction(tx, account_id)
+            if not count:
                 break
-            yield from [map_transaction(tx, account_id) for tx in res.values]
-            offset += len(res.values)
+            offset += count
+
+    def _iter_account_transactions_page(self, **params):
+        """
+        Iterates over the transactions of one page; with stream_lists they are decoded while the page arrives.
+        """
+        if self._stream_lists:
+            response_data = self._request_account_transactions_page(**params)
+            return self._api_client.stream_list(response_data, "ListResourceAccountTransaction", {})
+        return iter(self._get_account_transactions_page(**params).values or ())
+
+    def _get_account_transactions_page(self, **params):
+        try:
+            response_data = self._request_account_transactions_page(**params)
+            response_data.read()
+            return self._api_client.response_deserialize(
+                response_data=response_data,
+                response_types_map={
+                    "200": "ListResourceAccountTransaction",
+                    "404": None,
+                    "422": None,
+                    "500": None,
+                },
+            ).data
+        except ApiException as e:
+            raise e
 
-    def _get_account_transactions_page(
+    def _request_account_transactions_page(
         self,
         account_id: str,
         with_account: bool,
@@ -207,41 +522,28 @@ class ComdirectClient:
             query_params.append(("min-bookingDate", min_booking_date))
         if max_booking_date:
             query_params.append(("max-bookingDate", max_booking_date))
-        try:
-            # manual call because the generated banking client omits booking-date params.
-            method, url, header_params, body, post_params = self._api_client.param_serialize(
-                method="GET",
-                resource_path="/banking/v1/accounts/{accountId}/transactions",
-                path_params={"accountId": account_id},
-                query_params=query_params,
-                header_params={
-                    "Accept": self._api_client.select_header_accept(["application/json"]),
-                },
-                body=None,
-                post_params=[],
-                files=None,
-                auth_settings=[],
-                collection_formats={},
-            )
-            response_data = self._api_client.call_api(
-                method,
-                url,
-                header_params=header_params,
-                body=body,
-                post_params=post_params,
-            )
-            response_data.read()
-            return self._api_client.response_deserialize(
-                response_data=response_data,
-                response_types_map={
-                    "200": "ListResourceAccountTransaction",
-                    "404": None,
-                    "422": None,
-                    "500": None,
-                },
-            ).data
-        except ApiException as e:
-            raise e
+        # manual call because the generated banking client omits booking-date params.
+        method, url, header_params, body, post_params = self._api_client.param_serialize(
+            method="GET",
+            resource_path="/banking/v1/accounts/{accountId}/transactions",
+            path_params={"accountId": account_id},
+            query_params=query_params,
+            header_params={
+                "Accept": self._api_client.select_header_accept(["application/json"]),
+            },
+            body=None,
+            post_params=[],
+            files=None,
+            auth_settings=[],
+            collection_formats={},
+        )
+        return self._api_client.call_api(
+            method,
+            url,
+            header_params=header_params,
+            body=body,
+            post_params=post_params,
+        )
 
     def list_depots(self) -> list[Depot]:
         """
@@ -258,6 +560,14 @@ class ComdirectClient:
         Returns (DepotBalance, List[DepotPosition]).
         """
         try:
+            if self._stream_lists:
+                response_data = rest.RESTResponse(
+                    self._brokerage.brokerage_v3_get_depot_positions_without_preload_content(depot_id)
+                )
+                fields = {}
+                values = self._api_client.stream_list(response_data, "ListResourceDepotPosition", fields)
+                positions = [map_depot_position(p) for p in values]
+                return map_depot_balance(fields.get("aggregated")), positions
             res = self._brokerage.brokerage_v3_get_depot_positions(depot_id)
             balance = map_depot_balance(res.aggregated)
             positions = [map_depot_position(p) for p in res.values]
@@ -296,5 +606,9 @@ class ComdirectClient:
 
     def logout(self):
         # We just clear local state.
-        self._session_id = None
+        self._connections.stop()
+        self._tokens.clear()
+        if self._session_store is not None:
+            self._session_store.clear()
+        self._state.clear()
         self._api_client.configuration.access_token = None
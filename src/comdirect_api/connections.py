@@ -0,0 +1,167 @@
+import logging
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional
+
+import urllib3
+
+logger = logging.getLogger(__name__)
+
+API_ORIGIN = "https://api.comdirect.de"
+
+
+class _PoolActivity:
+    """Request and recycle times of one pool manager, shared by every client and manager using it."""
+
+    def __init__(self):
+        self.last_request_at: Optional[float] = None
+        self.recycled_at: Optional[float] = None
+        self.lock = threading.Lock()
+
+
+_activity: "weakref.WeakKeyDictionary[urllib3.PoolManager, _PoolActivity]" = weakref.WeakKeyDictionary()
+_activity_lock = threading.Lock()
+
+
+def _activity_of(pool_manager) -> _PoolActivity:
+    activity = _activity.get(pool_manager)
+    if activity is None:
+        with _activity_lock:
+            activity = _activity.setdefault(pool_manager, _PoolActivity())
+    return activity
+
+
+def record_activity(pool_manager) -> None:
+    """Marks a request on ``pool_manager``, so no ConnectionManager of that pool recycles it as idle."""
+    _activity_of(pool_manager).last_request_at = time.monotonic()
+
+
+class ConnectionManager:
+    """
+    Pre-warms and maintains the keep-alive connections to the API host.
+
+    ``warm_up`` opens connections (TCP + TLS) ahead of the first request. With ``start()`` a daemon thread
+    watches for idle periods: once no request was made for ``max_idle`` seconds, the pooled connections are
+    closed before the server silently drops them, and the pool is warmed up again.
+
+    Several clients may share one pool manager (see ``ComdirectClientPool``). Requests recorded with
+    ``record_activity`` and recycles count for all managers of the pool, so an idle client does not
+    close the connections of busy ones, and a pool is recycled once per idle period.
+    """
+
+    def __init__(
+        self,
+        pool_manager: urllib3.PoolManager,
+        last_activity: Callable[[], Optional[float]],
+        url: str = API_ORIGIN,
+        max_idle: float = 50.0,
+        check_interval: Optional[float] = None,
+    ):
+        self._pool_manager = pool_manager
+        self._last_activity = last_activity
+        self._url = url
+        self._max_idle = max_idle
+        self._check_interval = check_interval if check_interval is not None else max(max_idle / 4, 1.0)
+        self._warm_target = 0
+        self._activity = _activity_of(pool_manager)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def _pool(self):
+        return self._pool_manager.connection_from_url(self._url)
+
+    def warm_up(self, n: int) -> int:
+        """
+        Makes sure up to ``n`` connections to the API host are open (bounded by the pool size).
+        Returns the number of newly opened connections.
+        """
+        self._warm_target = max(self._warm_target, n)
+        pool = self._pool
+        n = min(n, pool.pool.maxsize) if pool.pool is not None else 0
+        conns = []
+        opened = 0
+        try:
+            for _ in range(n):
+                conn = pool._get_conn()
+                conns.append(conn)
+                if getattr(conn, "sock", None) is None:
+                    conn.connect()
+                    opened += 1
+        except Exception as e:
+            logger.warning(f"Connection warm-up failed: {e}")
+        finally:
+            for conn in conns:
+                pool._put_conn(conn)
+        logger.debug("Warmed up %d connection(s) to %s", opened, self._url)
+        return opened
+
+    def recycle_idle(self) -> int:
+        """Closes all idle pooled connections. Returns how many were closed."""
+        pool = self._pool
+        closed = 0
+        if pool.pool is not None:
+            # Closed where they sit in the queue, under its mutex, so concurrent requests neither see an
+            # empty pool nor race with the refill. urllib3 reconnects them on their next use.
+            with pool.pool.mutex:
+                for conn in pool.pool.queue:
+                    if conn is not None and getattr(conn, "sock", None) is not None:
+                        conn.close()
+                        closed += 1
+        self._activity.recycled_at = time.monotonic()
+        return closed
+
+    def idle_for(self) -> Optional[float]:
+        """Seconds since the last request on the pool, or since the last recycle if that was later."""
+        activity = self._activity
+        marks = [m for m in (self._last_activity(), activity.last_request_at, activity.recycled_at) if m is not None]
+        if not marks:
+            return None
+        return time.monotonic() - max(marks)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool statistics of the API host."""
+        pool = self._pool
+        conns = list(pool.pool.queue) if pool.pool is not None else []
+        return {
+            "host": pool.host,
+            "maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+            "idle_connected": sum(1 for c in conns if c is not None and getattr(c, "sock", None) is not None),
+            "idle_slots": len(conns),
+            "connections_created": pool.num_connections,
+            "requests": pool.num_requests,
+            "idle_seconds": self.idle_for(),
+        }
+
+    # --- Keep-alive thread ---
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="comdirect-keepalive", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._check_interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Keep-alive check failed")
+
+    def check(self) -> None:
+        """Recycles and re-warms the pool if it was idle for ``max_idle`` seconds."""
+        with self._activity.lock:
+            # checked under the lock: another manager of the same pool may just have recycled it
+            idle = self.idle_for()
+            if idle is None or idle < self._max_idle:
+                return
+            closed = self.recycle_idle()
+        logger.debug("Recycled %d idle connection(s) after %.0fs", closed, idle)
+        if self._warm_target:
+            self.warm_up(self._warm_target)
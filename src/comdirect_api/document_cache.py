@@ -0,0 +1,173 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def _key(document_id: str, mime_type: str) -> str:
+    # mime types contain no spaces, so the key splits unambiguously
+    return f"{mime_type} {document_id}"
+
+
+class DocumentCache:
+    """
+    Content-addressed on-disk cache of downloaded postbox documents.
+
+    Document contents are stored once per SHA-256 digest under ``objects/``; ``index.json`` maps each
+    document id and mime type to its digest and size. Repeated downloads of the same document are served from
+    disk without calling the API, and callers can hand out file paths or read the content in chunks instead
+    of holding whole documents in memory.
+
+    The cache holds at most ``max_bytes`` of content and ``max_entries`` documents (None for no limit); the
+    least recently used documents are evicted beyond that. ``clear`` deletes everything, e.g. on logout.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        max_entries: Optional[int] = None,
+    ):
+        self._dir = os.path.expanduser(os.fspath(directory))
+        self._index_path = os.path.join(self._dir, "index.json")
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(self._dir, "objects"), exist_ok=True)
+        # least recently used first
+        self._index = self._load_index()
+
+    def _load_index(self) -> "OrderedDict[str, Dict[str, Any]]":
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return OrderedDict()
+        except ValueError:
+            logger.warning("Ignoring unreadable document cache index %s", self._index_path)
+            return OrderedDict()
+        index = OrderedDict()
+        for key, entry in entries.items():
+            # indexes written before the mime type was part of the key use the document id as key
+            entry.setdefault("document_id", key)
+            index[_key(entry["document_id"], entry["mime_type"])] = entry
+        return index
+
+    def path_for(self, sha256: str) -> str:
+        return os.path.join(self._dir, "objects", sha256[:2], sha256)
+
+    def get(self, document_id: str, mime_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cache entry (document_id, sha256, mime_type, size, path) of a document in ``mime_type``,
+        or in the most recently used one if it is None. Returns None if it is not cached.
+        """
+        with self._lock:
+            if mime_type is not None:
+                key = _key(document_id, mime_type)
+            else:
+                key = next((k for k in reversed(self._index) if self._index[k]["document_id"] == document_id), None)
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            self._index.move_to_end(key)
+        path = self.path_for(entry["sha256"])
+        if not os.path.exists(path):
+            return None
+        return {**entry, "path": path}
+
+    def __contains__(self, document_id: str) -> bool:
+        return self.get(document_id) is not None
+
+    def entries(self) -> list:
+        with self._lock:
+            entries = list(self._index.values())
+        entries = [{**e, "path": self.path_for(e["sha256"])} for e in entries]
+        return [e for e in entries if os.path.exists(e["path"])]
+
+    def put(self, document_id: str, mime_type: str, data: bytes) -> Dict[str, Any]:
+        """
+        Stores the content of a document and returns its cache entry. The least recently used documents
+        beyond the limits are evicted.
+        """
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self.path_for(sha256)
+        entry = {"document_id": document_id, "sha256": sha256, "mime_type": mime_type, "size": len(data)}
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._write_atomic(path, data)
+            key = _key(document_id, mime_type)
+            self._index.pop(key, None)
+            self._index[key] = entry
+            self._evict()
+            self._write_atomic(self._index_path, json.dumps(self._index).encode())
+        return {**entry, "path": path}
+
+    def fetch(self, client, document_id: str, mime_type: str) -> Dict[str, Any]:
+        """Returns the cache entry of a document, downloading it with ``client`` if it is not cached yet."""
+        entry = self.get(document_id, mime_type)
+        if entry is None:
+            entry = self.put(document_id, mime_type, client.download_document(document_id, mime_type))
+        return entry
+
+    def read_chunk(self, document_id: str, offset: int, size: int, mime_type: Optional[str] = None) -> bytes:
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        entry = self.get(document_id, mime_type)
+        try:
+            if entry is None:
+                raise FileNotFoundError
+            with open(entry["path"], "rb") as f:
+                f.seek(offset)
+                return f.read(size)
+        except FileNotFoundError:
+            raise KeyError(f"Document '{document_id}' is not cached") from None
+
+    def clear(self) -> None:
+        """Deletes every cached document."""
+        with self._lock:
+            self._index.clear()
+            shutil.rmtree(os.path.join(self._dir, "objects"), ignore_errors=True)
+            os.makedirs(os.path.join(self._dir, "objects"), exist_ok=True)
+            self._write_atomic(self._index_path, b"{}")
+
+    def _evict(self) -> None:
+        sizes = {}
+        for entry in self._index.values():
+            sizes[entry["sha256"]] = entry["size"]
+        total = sum(sizes.values())
+        # the entry just stored is kept even if it alone exceeds the limits
+        while len(self._index) > 1 and (
+            (self._max_bytes is not None and total > self._max_bytes)
+            or (self._max_entries is not None and len(self._index) > self._max_entries)
+        ):
+            _, entry = self._index.popitem(last=False)
+            sha256 = entry["sha256"]
+            if any(e["sha256"] == sha256 for e in self._index.values()):
+                continue  # the content is still referenced by another document
+            total -= sizes.pop(sha256)
+            try:
+                os.remove(self.path_for(sha256))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,173 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .models import AccountHolder, DepotBalance, DepotPosition, Transaction
+
+PERIODS = ("day", "week", "month", "quarter", "year")
+
+
+def counterparty(tx: Transaction) -> Optional[AccountHolder]:
+    """
+    Returns the other side of a booking: the creditor for outgoing and the remitter for incoming payments,
+    falling back to whichever holder is present.
+    """
+    preferred = (tx.creditor, tx.remitter) if tx.amount < 0 else (tx.remitter, tx.creditor)
+    for holder in (*preferred, tx.debtor):
+        if holder is not None and (holder.iban or holder.holder_name):
+            return holder
+    return None
+
+
+def period_key(d: date, period: str = "month") -> str:
+    """Formats ``d`` as its period: 2023-01-31, 2023-W05, 2023-01, 2023-Q1 or 2023."""
+    if period == "month":
+        return f"{d.year:04d}-{d.month:02d}"
+    if period == "day":
+        return d.isoformat()
+    if period == "week":
+        year, week, _ = d.isocalendar()
+        return f"{year:04d}-W{week:02d}"
+    if period == "quarter":
+        return f"{d.year:04d}-Q{(d.month - 1) // 3 + 1}"
+    if period == "year":
+        return f"{d.year:04d}"
+    raise ValueError(f"Unknown period '{period}', expected one of {', '.join(PERIODS)}")
+
+
+def summarize_cash_flow(
+    transactions: Iterable[Transaction],
+    period: str = "month",
+    group_by: Optional[Callable[[Transaction], Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """
+    Sums income and expenses per period (and per ``group_by`` key, e.g. transaction type or category)
+    in a single pass over ``transactions``; nothing but the running totals is kept in memory.
+    """
+    period_key(date(2000, 1, 1), period)  # validate before consuming the iterable
+    buckets: Dict[Tuple[str, Optional[str]], List] = defaultdict(lambda: [Decimal(0), Decimal(0), 0])
+    for tx in transactions:
+        if tx.booking_date is None:
+            continue
+        key = (period_key(tx.booking_date, period), group_by(tx) if group_by else None)
+        bucket = buckets[key]
+        if tx.amount > 0:
+            bucket[0] += tx.amount
+        else:
+            bucket[1] += tx.amount
+        bucket[2] += 1
+
+    rows = []
+    total_income, total_expenses, total_count = Decimal(0), Decimal(0), 0
+    for (key, group), (income, expenses, count) in sorted(
+        buckets.items(), key=lambda item: (item[0][0], item[0][1] or "")
+    ):
+        row = {"period": key}
+        if group_by is not None:
+            row["group"] = group
+        row.update({"income": income, "expenses": expenses, "net": income + expenses, "count": count})
+        rows.append(row)
+        total_income += income
+        total_expenses += expenses
+        total_count += count
+
+    return {
+        "period": period,
+        "rows": rows,
+        "total": {
+            "income": total_income,
+            "expenses": total_expenses,
+            "net": total_income + total_expenses,
+            "count": total_count,
+        },
+    }
+
+
+def top_counterparties(
+    transactions: Iterable[Transaction],
+    limit: int = 10,
+    direction: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Returns the ``limit`` counterparties with the largest absolute turnover. Counterparties are identified by
+    IBAN, or by name if there is none. ``direction`` ("INCOMING"/"OUTGOING") restricts to one side.
+    """
+    totals: Dict[str, Dict[str, Any]] = {}
+    for tx in transactions:
+        if direction == "INCOMING" and tx.amount <= 0 or direction == "OUTGOING" and tx.amount >= 0:
+            continue
+        holder = counterparty(tx)
+        if holder is None:
+            continue
+        iban = holder.iban.replace(" ", "").upper() if holder.iban else None
+        key = iban or holder.holder_name.strip().lower()
+        entry = totals.get(key)
+        if entry is None:
+            entry = totals[key] = {"name": holder.holder_name, "iban": iban, "total": Decimal(0), "count": 0}
+        elif entry["name"] is None:
+            entry["name"] = holder.holder_name
+        entry["total"] += tx.amount
+        entry["count"] += 1
+
+    ranked = sorted(totals.values(), key=lambda e: abs(e["total"]), reverse=True)
+    return ranked[:limit]
+
+
+def portfolio_overview(
+    depots: Iterable[Tuple[DepotBalance, List[DepotPosition]]],
+    top: int = 10,
+) -> Dict[str, Any]:
+    """
+    Combines the balances and positions of one or more depots: totals per currency, per depot summaries
+    and the ``top`` positions by current value with their weight in the portfolio.
+    """
+    totals: Dict[str, Dict[str, Decimal]] = {}
+    summaries = []
+    positions: List[DepotPosition] = []
+    for balance, depot_positions in depots:
+        t = totals.setdefault(
+            balance.current_value_currency,
+            {"current_value": Decimal(0), "purchase_value": Decimal(0), "prev_day_value": Decimal(0)},
+        )
+        t["current_value"] += balance.current_value
+        t["purchase_value"] += balance.purchase_value
+        t["prev_day_value"] += balance.prev_day_value
+        summaries.append(
+            {
+                "depot_id": balance.depot_id,
+                "current_value": balance.current_value,
+                "currency": balance.current_value_currency,
+                "profit_loss_purchase_abs": balance.profit_loss_purchase_abs,
+                "profit_loss_prev_day_abs": balance.profit_loss_prev_day_abs,
+                "positions": len(depot_positions),
+            }
+        )
+        positions.extend(depot_positions)
+
+    for t in totals.values():
+        t["profit_loss_purchase_abs"] = t["current_value"] - t["purchase_value"]
+        t["profit_loss_prev_day_abs"] = t["current_value"] - t["prev_day_value"]
+
+    top_positions = []
+    for p in sorted(positions, key=lambda p: p.current_value, reverse=True)[:top]:
+        total_value = totals.get(p.current_value_currency, {}).get("current_value")
+        weight = round(p.current_value / total_value * 100, 2) if total_value else None
+        top_positions.append(
+            {
+                "depot_id": p.depot_id,
+                "wkn": p.wkn,
+                "instrument_name": p.instrument_name,
+                "current_value": p.current_value,
+                "currency": p.current_value_currency,
+                "weight_percent": weight,
+                "profit_loss_purchase_abs": p.profit_loss_purchase_abs,
+            }
+        )
+
+    return {
+        "totals": totals,
+        "depots": summaries,
+        "position_count": len(positions),
+        "top_positions": top_positions,
+    }
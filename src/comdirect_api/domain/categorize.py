@@ -0,0 +1,185 @@
+"""
+Rule based transaction categorization.
+
+Substring rules (and patterns without regex syntax) are compiled into one Aho-Corasick automaton,
+IBAN and creditor-id rules into hash lookups, so matching a transaction costs about the same no
+matter how many of these rules there are. Only real regex patterns are tried one rule at a time,
+and only those listed before the best match found so far. When several rules match, the one listed
+first wins.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .models import Transaction
+
+_HOLDERS = ("remitter", "creditor", "debtor")
+_REGEX_SYNTAX = frozenset(".^$*+?{}[]\\|()")
+
+
+@dataclass(frozen=True)
+class CategoryRule:
+    """
+    Assigns ``category`` if any of the matchers hits.
+
+    ``patterns`` are case-insensitive regexes and ``contains`` case-insensitive substrings, both matched
+    against the purpose and counterparty names.
+    ``ibans`` and ``creditor_ids`` are exact matches on the counterparty IBANs and the direct debit creditor id.
+    """
+
+    category: str
+    patterns: Sequence[str] = ()
+    contains: Sequence[str] = ()
+    ibans: Sequence[str] = ()
+    creditor_ids: Sequence[str] = ()
+    name: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return self.name or self.category
+
+
+def _normalize_iban(iban: str) -> str:
+    return iban.replace(" ", "").upper()
+
+
+class _Automaton:
+    """Aho-Corasick automaton over lowercased literals, reporting the lowest rule index that occurs."""
+
+    def __init__(self, literals: Iterable[tuple]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._best: List[Optional[int]] = [None]  # lowest rule index ending in this state
+        for literal, idx in literals:
+            state = 0
+            for char in literal:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._best.append(None)
+                state = nxt
+            if self._best[state] is None or idx < self._best[state]:
+                self._best[state] = idx
+
+        # Breadth-first failure links; each state also reports what its failure state reports.
+        self._fail = [0] * len(self._goto)
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, nxt in self._goto[state].items():
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                inherited = self._best[self._fail[nxt]]
+                if inherited is not None and (self._best[nxt] is None or inherited < self._best[nxt]):
+                    self._best[nxt] = inherited
+                queue.append(nxt)
+
+    def first_rule(self, text: str) -> Optional[int]:
+        goto, fail, best_at = self._goto, self._fail, self._best
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            idx = best_at[state]
+            if idx is not None and (best is None or idx < best):
+                best = idx
+                if best == 0:
+                    break
+        return best
+
+
+def _haystack(tx: Transaction) -> str:
+    parts = [tx.purpose or ""]
+    for attr in _HOLDERS:
+        holder = getattr(tx, attr)
+        if holder is not None and holder.holder_name:
+            parts.append(holder.holder_name)
+    return "\n".join(parts)
+
+
+class Categorizer:
+    """
+    Compiled set of ``CategoryRule``s.
+
+    ``hit_counts`` records how often each rule (by ``CategoryRule.label``) decided a category.
+    """
+
+    def __init__(self, rules: Iterable[CategoryRule], default: Optional[str] = None):
+        self._rules: List[CategoryRule] = list(rules)
+        self._default = default
+        self._by_iban: Dict[str, int] = {}
+        self._by_creditor_id: Dict[str, int] = {}
+        self.hit_counts: Counter = Counter()
+
+        literals = []
+        # (rule index, regex) in priority order, for patterns that need the regex engine
+        self._regexes: List[tuple] = []
+        for idx, rule in enumerate(self._rules):
+            for iban in rule.ibans:
+                self._by_iban.setdefault(_normalize_iban(iban), idx)
+            for creditor_id in rule.creditor_ids:
+                self._by_creditor_id.setdefault(creditor_id, idx)
+            patterns = []
+            for text in rule.contains:
+                literals.append((text.lower(), idx))
+            for pattern in rule.patterns:
+                if _REGEX_SYNTAX.isdisjoint(pattern):
+                    literals.append((pattern.lower(), idx))
+                else:
+                    patterns.append(pattern)
+            if patterns:
+                self._regexes.append((idx, re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)))
+
+        self._literals = _Automaton(literals) if literals else None
+
+    def _match(self, tx: Transaction) -> Optional[int]:
+        best = None
+
+        if self._by_creditor_id and tx.direct_debit_creditor_id:
+            best = self._by_creditor_id.get(tx.direct_debit_creditor_id)
+
+        if self._by_iban:
+            for attr in _HOLDERS:
+                holder = getattr(tx, attr)
+                if holder is not None and holder.iban:
+                    idx = self._by_iban.get(_normalize_iban(holder.iban))
+                    if idx is not None and (best is None or idx < best):
+                        best = idx
+
+        if best == 0 or (self._literals is None and not self._regexes):
+            return best
+        haystack = _haystack(tx)
+        if self._literals is not None:
+            idx = self._literals.first_rule(haystack.lower())
+            if idx is not None and (best is None or idx < best):
+                best = idx
+        for idx, regex in self._regexes:
+            if best is not None and idx >= best:
+                break
+            if regex.search(haystack):
+                best = idx
+                break
+
+        return best
+
+    def categorize(self, tx: Transaction) -> Optional[str]:
+        """Returns the category of the highest priority matching rule, or the default."""
+        idx = self._match(tx)
+        if idx is None:
+            return self._default
+        rule = self._rules[idx]
+        self.hit_counts[rule.label] += 1
+        return rule.category
+
+    def categorize_batch(self, transactions: Iterable[Transaction]) -> List[Optional[str]]:
+        """Categorizes transactions in a single pass, preserving their order."""
+        return [self.categorize(tx) for tx in transactions]
+
+    def reset_stats(self) -> None:
+        self.hit_counts.clear()
@@ -0,0 +1,90 @@
+import dataclasses
+import typing
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, Tuple
+
+# Per (class, compact) generated encoder functions
+_ENCODERS: Dict[Tuple[type, bool], Callable[[Any], Dict[str, Any]]] = {}
+
+
+def _unwrap_optional(tp):
+    if typing.get_origin(tp) is typing.Union:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
+
+
+def _value_expr(tp, var: str, namespace: Dict[str, Any], compact: bool) -> str:
+    """Python expression converting the (non-None) value ``var`` of type ``tp`` to a JSON-compatible value."""
+    tp = _unwrap_optional(tp)
+    if isinstance(tp, type):
+        if issubclass(tp, Decimal):
+            return f"str({var})"
+        if issubclass(tp, date):
+            return f"{var}.isoformat()"
+        if dataclasses.is_dataclass(tp):
+            name = f"_enc_{tp.__name__}"
+            namespace[name] = encoder_for(tp, compact)
+            return f"{name}({var})"
+    return var
+
+
+def _build_encoder(cls: type, compact: bool) -> Callable[[Any], Dict[str, Any]]:
+    hints = typing.get_type_hints(cls)
+    namespace: Dict[str, Any] = {}
+    lines = ["def encode(o):"]
+    if compact:
+        lines.append("    d = {}")
+    for field in dataclasses.fields(cls):
+        expr = _value_expr(hints.get(field.name, Any), "v", namespace, compact)
+        lines.append(f"    v = o.{field.name}")
+        if compact:
+            lines.append(f"    if v is not None: d[{field.name!r}] = {expr}")
+        elif expr == "v":
+            lines.append(f"    f_{field.name} = v")
+        else:
+            lines.append(f"    f_{field.name} = None if v is None else {expr}")
+    if compact:
+        lines.append("    return d")
+    else:
+        items = ", ".join(f"{f.name!r}: f_{f.name}" for f in dataclasses.fields(cls))
+        lines.append(f"    return {{{items}}}")
+    exec("\n".join(lines), namespace)
+    encode = namespace["encode"]
+    encode.__qualname__ = f"encode_{cls.__name__}"
+    return encode
+
+
+def encoder_for(cls: type, compact: bool = False) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Returns a function that converts an instance of the dataclass ``cls`` to a JSON-compatible dict.
+
+    Unlike ``dataclasses.asdict`` there is no recursive deep copy: the function is generated once per class
+    from its type hints and reads the fields directly. Decimals become strings, dates ISO strings and nested
+    dataclasses dicts. With ``compact`` fields that are None are omitted.
+    """
+    key = (cls, compact)
+    encoder = _ENCODERS.get(key)
+    if encoder is None:
+        encoder = _ENCODERS[key] = _build_encoder(cls, compact)
+    return encoder
+
+
+def to_jsonable(obj: Any, compact: bool = False) -> Any:
+    """
+    Converts domain models (also inside dicts, lists and tuples) to JSON-compatible values.
+    Other values are returned unchanged.
+    """
+    cls = type(obj)
+    encoder = _ENCODERS.get((cls, compact))
+    if encoder is not None:
+        return encoder(obj)
+    if cls is list or cls is tuple:
+        return [to_jsonable(v, compact) for v in obj]
+    if cls is dict:
+        return {k: to_jsonable(v, compact) for k, v in obj.items()}
+    if dataclasses.is_dataclass(cls):
+        return encoder_for(cls, compact)(obj)
+    return obj
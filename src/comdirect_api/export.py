@@ -0,0 +1,203 @@
+"""
+Columnar export of domain models to Apache Arrow / Parquet.
+
+``pyarrow`` is an optional dependency (``pip install comdirect_api_wrapper[arrow]``).
+It is only imported when one of the export functions is called.
+"""
+
+from decimal import ROUND_HALF_EVEN, Context, Decimal, InvalidOperation
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+from .domain.models import AccountHolder, DepotPosition, Document, Transaction
+
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_COMPRESSION = "zstd"
+
+# Amounts and quantities are exported as fixed-point decimals.
+# 38 digits with 9 fractional digits covers both fund share quantities and cent amounts.
+# The API returns decimals as strings of any length; more fractional digits are rounded half to even.
+_DECIMAL_PRECISION = 38
+_DECIMAL_SCALE = 9
+_DECIMAL_QUANTUM = Decimal(1).scaleb(-_DECIMAL_SCALE)
+_DECIMAL_CONTEXT = Context(prec=_DECIMAL_PRECISION, rounding=ROUND_HALF_EVEN, traps=[InvalidOperation])
+
+
+def _holder_field(holder_attr: str, field: str) -> Callable[[Transaction], Any]:
+    def getter(tx: Transaction):
+        holder: AccountHolder = getattr(tx, holder_attr)
+        return getattr(holder, field) if holder is not None else None
+
+    return getter
+
+
+def _attr(name: str) -> Callable[[Any], Any]:
+    return lambda obj: getattr(obj, name)
+
+
+# (column name, arrow type name, getter) - the order defines the fixed file schema.
+TRANSACTION_COLUMNS = [
+    ("account_id", "string", _attr("account_id")),
+    ("booking_date", "date", _attr("booking_date")),
+    ("valuta_date", "date", _attr("valuta_date")),
+    ("amount", "decimal", _attr("amount")),
+    ("currency", "string", _attr("currency")),
+    ("type", "string", _attr("type")),
+    ("purpose", "string", _attr("purpose")),
+    ("reference", "string", _attr("reference")),
+    ("booking_status", "string", _attr("booking_status")),
+    ("direct_debit_creditor_id", "string", _attr("direct_debit_creditor_id")),
+    ("direct_debit_mandate_id", "string", _attr("direct_debit_mandate_id")),
+    ("end_to_end_reference", "string", _attr("end_to_end_reference")),
+    ("new_transaction", "bool", _attr("new_transaction")),
+    ("remitter_name", "string", _holder_field("remitter", "holder_name")),
+    ("remitter_iban", "string", _holder_field("remitter", "iban")),
+    ("remitter_bic", "string", _holder_field("remitter", "bic")),
+    ("debtor_name", "string", _holder_field("debtor", "holder_name")),
+    ("debtor_iban", "string", _holder_field("debtor", "iban")),
+    ("debtor_bic", "string", _holder_field("debtor", "bic")),
+    ("creditor_name", "string", _holder_field("creditor", "holder_name")),
+    ("creditor_iban", "string", _holder_field("creditor", "iban")),
+    ("creditor_bic", "string", _holder_field("creditor", "bic")),
+]
+
+DEPOT_POSITION_COLUMNS = [
+    ("depot_id", "string", _attr("depot_id")),
+    ("position_id", "string", _attr("position_id")),
+    ("wkn", "string", _attr("wkn")),
+    ("instrument_name", "string", _attr("instrument_name")),
+    ("quantity", "decimal", _attr("quantity")),
+    ("quantity_unit", "string", _attr("quantity_unit")),
+    ("current_value", "decimal", _attr("current_value")),
+    ("current_value_currency", "string", _attr("current_value_currency")),
+    ("purchase_value", "decimal", _attr("purchase_value")),
+    ("purchase_value_currency", "string", _attr("purchase_value_currency")),
+    ("profit_loss_purchase_abs", "decimal", _attr("profit_loss_purchase_abs")),
+    ("profit_loss_purchase_rel", "string", _attr("profit_loss_purchase_rel")),
+    ("profit_loss_prev_day_abs", "decimal", _attr("profit_loss_prev_day_abs")),
+    ("profit_loss_prev_day_rel", "string", _attr("profit_loss_prev_day_rel")),
+]
+
+DOCUMENT_COLUMNS = [
+    ("id", "string", _attr("id")),
+    ("name", "string", _attr("name")),
+    ("date_creation", "string", _attr("date_creation")),
+    ("mime_type", "string", _attr("mime_type")),
+    ("advertisement", "bool", _attr("advertisement")),
+]
+
+
+def _fixed_point(column: str, getter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def get(obj):
+        value = getter(obj)
+        if value is None:
+            return None
+        value = Decimal(value)
+        if value.is_finite():
+            try:
+                return value.quantize(_DECIMAL_QUANTUM, context=_DECIMAL_CONTEXT)
+            except InvalidOperation:
+                pass
+        raise ValueError(f"{column} value {value} does not fit decimal({_DECIMAL_PRECISION}, {_DECIMAL_SCALE})")
+
+    return get
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Arrow/Parquet export requires 'pyarrow'. Install with 'pip install comdirect_api_wrapper[arrow]'."
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def build_schema(columns):
+    """Builds the fixed ``pyarrow.Schema`` for a column specification."""
+    pa, _ = _require_pyarrow()
+    types = {
+        "string": pa.string(),
+        "date": pa.date32(),
+        "bool": pa.bool_(),
+        "decimal": pa.decimal128(_DECIMAL_PRECISION, _DECIMAL_SCALE),
+    }
+    return pa.schema([pa.field(name, types[type_name]) for name, type_name, _ in columns])
+
+
+def iter_record_batches(records: Iterable[Any], columns, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Any]:
+    """
+    Converts a stream of domain objects into ``pyarrow.RecordBatch`` chunks of at most ``batch_size`` rows.
+    Only one batch is held in memory at a time.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    pa, _ = _require_pyarrow()
+    schema = build_schema(columns)
+    getters = [_fixed_point(name, getter) if type_name == "decimal" else getter for name, type_name, getter in columns]
+
+    it = iter(records)
+    while True:
+        chunk = list(islice(it, batch_size))
+        if not chunk:
+            return
+        arrays = [pa.array([getter(rec) for rec in chunk], type=field.type) for getter, field in zip(getters, schema)]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def write_parquet(
+    records: Iterable[Any],
+    path,
+    columns,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> int:
+    """
+    Streams ``records`` into a Parquet file with the schema given by ``columns``.
+    Each record batch becomes one row group. Returns the number of rows written.
+    """
+    _, pq = _require_pyarrow()
+    rows = 0
+    with pq.ParquetWriter(path, build_schema(columns), compression=compression) as writer:
+        for batch in iter_record_batches(records, columns, batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def write_transactions_parquet(
+    transactions: Iterable[Transaction],
+    path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> int:
+    """
+    Writes transactions (e.g. from ``ComdirectClient.iter_all_transactions``) to a Parquet file.
+    Counterparties are flattened into ``remitter_*``, ``debtor_*`` and ``creditor_*`` columns.
+    """
+    return write_parquet(transactions, path, TRANSACTION_COLUMNS, batch_size, compression)
+
+
+def write_depot_positions_parquet(
+    positions: Iterable[DepotPosition],
+    path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> int:
+    """
+    Writes depot positions (e.g. from ``ComdirectClient.get_depot_positions``) to a Parquet file.
+    """
+    return write_parquet(positions, path, DEPOT_POSITION_COLUMNS, batch_size, compression)
+
+
+def write_documents_parquet(
+    documents: Iterable[Document],
+    path,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = DEFAULT_COMPRESSION,
+) -> int:
+    """
+    Writes postbox document metadata (e.g. from ``ComdirectClient.list_documents``) to a Parquet file.
+    """
+    return write_parquet(documents, path, DOCUMENT_COLUMNS, batch_size, compression)
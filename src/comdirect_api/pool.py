@@ -0,0 +1,158 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from openapi_client import Configuration, rest
+
+from .client import ComdirectClient
+
+logger = logging.getLogger(__name__)
+
+API_HOST = "https://api.comdirect.de/api"
+
+# ComdirectClient arguments that hold state of a single tenant; sharing them would mix up sessions
+_TENANT_ARGS = ("session_store",)
+
+
+class _Tenant:
+    __slots__ = ("client", "last_used")
+
+    def __init__(self, client: ComdirectClient):
+        self.client = client
+        self.last_used = time.monotonic()
+
+
+class ComdirectClientPool:
+    """
+    Hands out one ``ComdirectClient`` per tenant (customer) on top of a single shared transport.
+
+    Credentials, session and tokens stay isolated per tenant, while all clients share one urllib3 pool
+    for both the auth flow and the API calls. Tenants are
+    evicted least-recently-used once ``max_tenants`` is exceeded, and after ``idle_timeout`` seconds
+    without use. Evicted clients are logged out.
+
+    ``client_kwargs`` are passed to every client; per-tenant arguments such as ``session_store`` are
+    given to ``get`` instead.
+    """
+
+    def __init__(
+        self,
+        max_tenants: int = 100,
+        idle_timeout: Optional[float] = None,
+        connection_pool_maxsize: int = 10,
+        client_factory: Callable[..., ComdirectClient] = ComdirectClient,
+        **client_kwargs: Any,
+    ):
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be >= 1")
+        for name in _TENANT_ARGS:
+            if name in client_kwargs:
+                raise ValueError(f"'{name}' is per tenant, pass it to get() instead")
+        if "rest_client" in client_kwargs:
+            raise ValueError("'rest_client' is provided by the pool")
+        self._max_tenants = max_tenants
+        self._idle_timeout = idle_timeout
+        self._client_factory = client_factory
+        self._client_kwargs = client_kwargs
+
+        config = Configuration(host=API_HOST)
+        config.connection_pool_maxsize = connection_pool_maxsize
+        self._rest_client = rest.RESTClientObject(config)
+
+        self._tenants: "OrderedDict[str, _Tenant]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return tenant_id in self._tenants
+
+    def get(
+        self,
+        tenant_id: str,
+        credentials: Optional[Dict[str, str]] = None,
+        tan_handlers: Optional[Dict[str, Callable]] = None,
+        **client_kwargs: Any,
+    ) -> ComdirectClient:
+        """
+        Returns the client of ``tenant_id``, creating it from ``credentials``, ``tan_handlers`` and
+        ``client_kwargs`` (e.g. the tenant's ``session_store``) if it is not pooled yet. ``client_kwargs``
+        override the ones given to the pool. The client is not logged in automatically.
+        """
+        evicted = []
+        with self._lock:
+            evicted.extend(self._pop_idle())
+            tenant = self._tenants.get(tenant_id)
+            if tenant is None:
+                if credentials is None or tan_handlers is None:
+                    raise KeyError(f"Unknown tenant '{tenant_id}' and no credentials given")
+                client = self._client_factory(
+                    credentials,
+                    tan_handlers,
+                    rest_client=self._rest_client,
+                    **{**self._client_kwargs, **client_kwargs},
+                )
+                tenant = self._tenants[tenant_id] = _Tenant(client)
+                while len(self._tenants) > self._max_tenants:
+                    evicted.append(self._tenants.popitem(last=False))
+            else:
+                self._tenants.move_to_end(tenant_id)
+            tenant.last_used = time.monotonic()
+
+        # Logging out happens outside the lock, it may involve I/O.
+        for evicted_id, evicted_tenant in evicted:
+            self._close_tenant(evicted_id, evicted_tenant)
+        return tenant.client
+
+    def remove(self, tenant_id: str) -> None:
+        with self._lock:
+            tenant = self._tenants.pop(tenant_id, None)
+        if tenant is not None:
+            self._close_tenant(tenant_id, tenant)
+
+    def evict_idle(self) -> int:
+        """Logs out and drops all tenants idle for longer than ``idle_timeout``. Returns how many."""
+        with self._lock:
+            evicted = self._pop_idle()
+        for tenant_id, tenant in evicted:
+            self._close_tenant(tenant_id, tenant)
+        return len(evicted)
+
+    def close(self) -> None:
+        """Logs out all tenants and closes the shared connections."""
+        with self._lock:
+            evicted = list(self._tenants.items())
+            self._tenants.clear()
+        for tenant_id, tenant in evicted:
+            self._close_tenant(tenant_id, tenant)
+        self._rest_client.pool_manager.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _pop_idle(self):
+        if self._idle_timeout is None:
+            return []
+        deadline = time.monotonic() - self._idle_timeout
+        evicted = []
+        # Least recently used tenants come first; stop at the first one that is still active.
+        while self._tenants:
+            tenant_id, tenant = next(iter(self._tenants.items()))
+            if tenant.last_used > deadline:
+                break
+            evicted.append(self._tenants.popitem(last=False))
+        return evicted
+
+    @staticmethod
+    def _close_tenant(tenant_id: str, tenant: _Tenant) -> None:
+        logger.debug("Evicting tenant %s", tenant_id)
+        try:
+            tenant.client.logout()
+        except Exception as e:
+            logger.warning(f"Logout of tenant {tenant_id} failed: {e}")
@@ -0,0 +1,147 @@
+"""
+In-memory inverted index over transaction texts and counterparties.
+
+Indexes ``purpose`` plus names and IBANs of remitter, creditor and debtor,
+so "all payments to X" does not need a linear scan over every transaction.
+"""
+
+import re
+from bisect import bisect_left
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+from .domain.models import Transaction
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_HOLDERS = ("remitter", "creditor", "debtor")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercased word tokens of ``text``."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _transaction_tokens(tx: Transaction) -> Set[str]:
+    tokens = set(tokenize(tx.purpose))
+    for attr in _HOLDERS:
+        holder = getattr(tx, attr)
+        if holder is None:
+            continue
+        tokens.update(tokenize(holder.holder_name))
+        if holder.iban:
+            # IBANs are often printed in groups of four, index them as one token.
+            tokens.add(holder.iban.replace(" ", "").lower())
+    return tokens
+
+
+class TransactionIndex:
+    """
+    Inverted index mapping tokens to transactions.
+
+    Queries are whitespace separated terms that must all match (AND). A term ending in ``*`` matches
+    every token with that prefix, e.g. ``"amaz* DE8937*"``.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        self._docs: List[Transaction] = []
+        self._postings: Dict[str, Set[int]] = {}
+        # Sorted vocabulary for prefix lookups via bisect; tokens added since the last lookup are
+        # merged in by that lookup, so adding stays O(1) per token.
+        self._vocabulary: List[str] = []
+        self._new_tokens: List[str] = []
+        self.add_all(transactions)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, tx: Transaction) -> None:
+        doc_id = len(self._docs)
+        self._docs.append(tx)
+        for token in _transaction_tokens(tx):
+            posting = self._postings.get(token)
+            if posting is None:
+                self._postings[token] = {doc_id}
+                self._new_tokens.append(token)
+            else:
+                posting.add(doc_id)
+
+    def add_all(self, transactions: Iterable[Transaction]) -> int:
+        count = 0
+        for tx in transactions:
+            self.add(tx)
+            count += 1
+        return count
+
+    def indexed(self, transactions: Iterable[Transaction]) -> Iterator[Transaction]:
+        """Passes a transaction stream through while indexing it, e.g. around ``iter_all_transactions``."""
+        for tx in transactions:
+            self.add(tx)
+            yield tx
+
+    def _prefix_matches(self, prefix: str) -> Set[int]:
+        if self._new_tokens:
+            # Timsort merges the sorted vocabulary and the sorted new tokens in linear time.
+            self._new_tokens.sort()
+            self._vocabulary += self._new_tokens
+            self._vocabulary.sort()
+            self._new_tokens = []
+        result: Set[int] = set()
+        i = bisect_left(self._vocabulary, prefix)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(prefix):
+            result |= self._postings[self._vocabulary[i]]
+            i += 1
+        return result
+
+    def _term_matches(self, term: str) -> Set[int]:
+        if term.endswith("*"):
+            return self._prefix_matches(term[:-1])
+        return self._postings.get(term, set())
+
+    def search(
+        self,
+        query: str = "",
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        min_booking_date: Optional[date] = None,
+        max_booking_date: Optional[date] = None,
+        limit: Optional[int] = None,
+    ) -> List[Transaction]:
+        """
+        Returns transactions matching all query terms and filters, newest booking first.
+        An empty query only applies the amount and date filters.
+        """
+        terms = []
+        for part in query.split():
+            tokens = tokenize(part.rstrip("*"))
+            if tokens and part.endswith("*"):
+                tokens[-1] += "*"
+            terms.extend(tokens)
+        if terms:
+            # Intersect smallest posting sets first.
+            matches = sorted((self._term_matches(t) for t in terms), key=len)
+            candidates = set(matches[0])
+            for m in matches[1:]:
+                if not candidates:
+                    break
+                candidates &= m
+        else:
+            candidates = range(len(self._docs))
+
+        results = []
+        for doc_id in candidates:
+            tx = self._docs[doc_id]
+            if min_amount is not None and tx.amount < min_amount:
+                continue
+            if max_amount is not None and tx.amount > max_amount:
+                continue
+            if min_booking_date is not None and tx.booking_date < min_booking_date:
+                continue
+            if max_booking_date is not None and tx.booking_date > max_booking_date:
+                continue
+            results.append(tx)
+
+        results.sort(key=lambda tx: tx.booking_date, reverse=True)
+        return results[:limit] if limit is not None else results
@@ -0,0 +1,96 @@
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """
+    Encrypted on-disk cache of a session (session id, access and refresh token).
+
+    Lets a restarted process resume the session instead of running the full 2FA flow again.
+    The file is encrypted with Fernet using a user supplied key (see ``generate_key``) and written with
+    owner-only permissions. Requires the optional ``cryptography`` package
+    (``pip install comdirect_api_wrapper[session-cache]``).
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], key: Union[str, bytes]):
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError as e:
+            raise ImportError(
+                "SessionStore requires 'cryptography'. "
+                "Install with 'pip install comdirect_api_wrapper[session-cache]'."
+            ) from e
+
+        self._path = os.path.expanduser(os.fspath(path))
+        self._fernet = Fernet(key)
+
+    @staticmethod
+    def generate_key() -> bytes:
+        from cryptography.fernet import Fernet
+
+        return Fernet.generate_key()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached session or None if there is none or it cannot be decrypted.
+        ``expires_at`` is a unix timestamp.
+        """
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self._path, "rb") as f:
+                blob = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            data = json.loads(self._fernet.decrypt(blob))
+        except (InvalidToken, ValueError):
+            logger.warning("Ignoring unreadable session cache %s", self._path)
+            return None
+
+        if not data.get("session_id") or not data.get("access_token"):
+            return None
+        return data
+
+    def save(
+        self,
+        session_id: str,
+        access_token: str,
+        refresh_token: Optional[str],
+        expires_at: Optional[float],
+    ) -> None:
+        payload = json.dumps(
+            {
+                "session_id": session_id,
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "expires_at": expires_at,
+                "saved_at": time.time(),
+            }
+        ).encode()
+        blob = self._fernet.encrypt(payload)
+
+        # Write atomically so a crash never leaves a truncated cache behind.
+        directory = os.path.dirname(os.path.abspath(self._path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".comdirect-session-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def clear(self) -> None:
+        try:
+            os.remove(self._path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,61 @@
+import threading
+from typing import NamedTuple, Optional
+
+
+class Credentials(NamedTuple):
+    session_id: Optional[str]
+    access_token: Optional[str]
+
+
+_EMPTY = Credentials(None, None)
+
+
+class SessionState:
+    """
+    Thread-safe holder of the session id and access token.
+
+    Both values live in one immutable ``Credentials`` tuple that is swapped as a whole, so readers
+    never see the session id of one login paired with the token of another. ``login_lock`` serializes
+    logins so that only one thread runs the 2FA flow while the others wait for its result.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._credentials = _EMPTY
+        self._generation = 0
+        self.login_lock = threading.Lock()
+
+    @property
+    def credentials(self) -> Credentials:
+        # A single attribute read is atomic, no lock needed for readers.
+        return self._credentials
+
+    @property
+    def session_id(self) -> Optional[str]:
+        return self._credentials.session_id
+
+    @property
+    def access_token(self) -> Optional[str]:
+        return self._credentials.access_token
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every new session (``set``/``clear``)."""
+        return self._generation
+
+    @property
+    def is_authenticated(self) -> bool:
+        return self._credentials.access_token is not None
+
+    def set(self, session_id: Optional[str], access_token: Optional[str]) -> None:
+        with self._lock:
+            self._credentials = Credentials(session_id, access_token)
+            self._generation += 1
+
+    def update_token(self, access_token: Optional[str]) -> None:
+        """Swaps the access token while keeping the session id."""
+        with self._lock:
+            self._credentials = self._credentials._replace(access_token=access_token)
+
+    def clear(self) -> None:
+        self.set(None, None)
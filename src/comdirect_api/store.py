@@ -0,0 +1,342 @@
+"""
+Local SQLite store for domain transactions.
+
+Lets past transactions be queried offline instead of paginating through the rate-limited API again.
+Amounts are stored as exact decimal strings; filters and totals use whole cents kept alongside.
+"""
+
+import json
+import sqlite3
+from datetime import date
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_EVEN, Decimal
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .domain.aggregate import counterparty
+from .domain.models import AccountHolder, Transaction
+
+DEFAULT_BATCH_SIZE = 1000
+
+_HOLDERS = ("remitter", "debtor", "creditor")
+
+_COLUMNS = [
+    "account_id",
+    "booking_date",
+    "valuta_date",
+    "amount",
+    "amount_cents",
+    "currency",
+    "type",
+    "purpose",
+    "reference",
+    "booking_status",
+    "direct_debit_creditor_id",
+    "direct_debit_mandate_id",
+    "end_to_end_reference",
+    "new_transaction",
+    "remitter_name",
+    "remitter_iban",
+    "remitter_bic",
+    "debtor_name",
+    "debtor_iban",
+    "debtor_bic",
+    "creditor_name",
+    "creditor_iban",
+    "creditor_bic",
+    "counterparty_name",
+    "counterparty_iban",
+    "dedupe_key",
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    account_id TEXT NOT NULL,
+    booking_date TEXT NOT NULL,
+    valuta_date TEXT,
+    amount TEXT NOT NULL,
+    amount_cents INTEGER NOT NULL,
+    currency TEXT NOT NULL,
+    type TEXT,
+    purpose TEXT,
+    reference TEXT,
+    booking_status TEXT,
+    direct_debit_creditor_id TEXT,
+    direct_debit_mandate_id TEXT,
+    end_to_end_reference TEXT,
+    new_transaction INTEGER NOT NULL DEFAULT 0,
+    remitter_name TEXT,
+    remitter_iban TEXT,
+    remitter_bic TEXT,
+    debtor_name TEXT,
+    debtor_iban TEXT,
+    debtor_bic TEXT,
+    creditor_name TEXT,
+    creditor_iban TEXT,
+    creditor_bic TEXT,
+    counterparty_name TEXT,
+    counterparty_iban TEXT,
+    dedupe_key TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_transactions_dedupe_key ON transactions (account_id, dedupe_key);
+CREATE INDEX IF NOT EXISTS ix_transactions_account_date ON transactions (account_id, booking_date);
+CREATE INDEX IF NOT EXISTS ix_transactions_amount ON transactions (amount_cents);
+CREATE INDEX IF NOT EXISTS ix_transactions_counterparty_iban ON transactions (counterparty_iban);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5(
+    purpose, content='transactions', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN
+    INSERT INTO transactions_fts (rowid, purpose) VALUES (new.id, new.purpose);
+END;
+CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN
+    INSERT INTO transactions_fts (transactions_fts, rowid, purpose) VALUES ('delete', old.id, old.purpose);
+END;
+"""
+
+
+def _cents(amount: Decimal, rounding: str = ROUND_HALF_EVEN) -> int:
+    return int((amount * 100).to_integral_value(rounding))
+
+
+def _dedupe_key(tx: Transaction, occurrences: Dict[str, int]) -> str:
+    if tx.reference:
+        return tx.reference
+    # without a reference, the same transaction from an overlapping sync is recognized by its content;
+    # identical ones (e.g. two equal card payments on one day) are told apart by their occurrence
+    cp = counterparty(tx)
+    content = json.dumps(
+        [
+            tx.booking_date.isoformat(),
+            _cents(tx.amount),
+            tx.purpose,
+            tx.end_to_end_reference,
+            cp.holder_name if cp else None,
+            cp.iban if cp else None,
+        ]
+    )
+    occurrence = occurrences.get(content, 0)
+    occurrences[content] = occurrence + 1
+    return f"{content}#{occurrence}"
+
+
+def _match_expression(words: List[str]) -> str:
+    """Quotes every word so FTS5 takes none of it for query syntax; the words are ANDed."""
+    return " ".join('"' + word.replace('"', '""') + '"' for word in words)
+
+
+def _like_pattern(word: str) -> str:
+    return "%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _to_row(tx: Transaction, dedupe_key: str) -> tuple:
+    holders = []
+    for attr in _HOLDERS:
+        h = getattr(tx, attr)
+        holders.extend((h.holder_name, h.iban, h.bic) if h else (None, None, None))
+    cp = counterparty(tx)
+    return (
+        tx.account_id,
+        tx.booking_date.isoformat(),
+        tx.valuta_date.isoformat() if tx.valuta_date else None,
+        str(tx.amount),
+        _cents(tx.amount),
+        tx.currency,
+        tx.type,
+        tx.purpose,
+        tx.reference,
+        tx.booking_status,
+        tx.direct_debit_creditor_id,
+        tx.direct_debit_mandate_id,
+        tx.end_to_end_reference,
+        int(tx.new_transaction),
+        *holders,
+        cp.holder_name if cp else None,
+        cp.iban if cp else None,
+        dedupe_key,
+    )
+
+
+def _holder(name, iban, bic) -> Optional[AccountHolder]:
+    if name is None and iban is None and bic is None:
+        return None
+    return AccountHolder(holder_name=name, iban=iban, bic=bic)
+
+
+def _from_row(row: sqlite3.Row) -> Transaction:
+    return Transaction(
+        account_id=row["account_id"],
+        booking_date=date.fromisoformat(row["booking_date"]),
+        amount=Decimal(row["amount"]),
+        currency=row["currency"],
+        purpose=row["purpose"],
+        type=row["type"],
+        reference=row["reference"],
+        booking_status=row["booking_status"],
+        valuta_date=date.fromisoformat(row["valuta_date"]) if row["valuta_date"] else None,
+        direct_debit_creditor_id=row["direct_debit_creditor_id"],
+        direct_debit_mandate_id=row["direct_debit_mandate_id"],
+        end_to_end_reference=row["end_to_end_reference"],
+        new_transaction=bool(row["new_transaction"]),
+        remitter=_holder(row["remitter_name"], row["remitter_iban"], row["remitter_bic"]),
+        debtor=_holder(row["debtor_name"], row["debtor_iban"], row["debtor_bic"]),
+        creditor=_holder(row["creditor_name"], row["creditor_iban"], row["creditor_bic"]),
+    )
+
+
+class TransactionStore:
+    """
+    SQLite-backed transaction store.
+
+    Transactions are deduplicated per account on their ``reference``, so overlapping syncs are safe. Ones
+    without a reference are deduplicated on booking date, amount, purpose, end-to-end reference and
+    counterparty, numbering identical ones in the order they are added; overlapping syncs are safe as long
+    as every ``add_transactions`` call has all of them of a day, which ``sync`` does. Not yet booked
+    transactions are not stored: they have no reference and may still change until they are booked.
+    ``purpose`` is indexed with FTS5 when the SQLite build supports it, otherwise text search uses ``LIKE``.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self._has_fts = True
+        except sqlite3.OperationalError:
+            self._has_fts = False
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add_transactions(self, transactions: Iterable[Transaction], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Bulk inserts transactions, committing once per batch. Already stored and not yet booked ones
+        are skipped. Returns the number of newly inserted rows.
+        """
+        occurrences: Dict[str, int] = {}
+        sql = "INSERT OR IGNORE INTO transactions ({}) VALUES ({})".format(
+            ", ".join(_COLUMNS), ", ".join("?" * len(_COLUMNS))
+        )
+        inserted = 0
+        it = iter(transactions)
+        while True:
+            chunk = list(islice(it, batch_size))
+            if not chunk:
+                return inserted
+            with self._conn:
+                rows = [_to_row(tx, _dedupe_key(tx, occurrences)) for tx in chunk if tx.booking_status != "NOTBOOKED"]
+                inserted += self._conn.executemany(sql, rows).rowcount
+
+    def sync(self, client, account_id: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        Fetches booked transactions from the API, starting at the latest stored booking date of the account.
+        Returns the number of newly inserted rows.
+        """
+        latest = self.latest_booking_date(account_id)
+        transactions = client.iter_all_transactions(
+            account_id=account_id,
+            min_booking_date=latest.isoformat() if latest else None,
+        )
+        return self.add_transactions(transactions, batch_size)
+
+    def latest_booking_date(self, account_id: str) -> Optional[date]:
+        row = self._conn.execute(
+            "SELECT MAX(booking_date) FROM transactions WHERE account_id = ?", (account_id,)
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row[0] else None
+
+    def count(self, account_id: Optional[str] = None) -> int:
+        if account_id is None:
+            return self._conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        return self._conn.execute("SELECT COUNT(*) FROM transactions WHERE account_id = ?", (account_id,)).fetchone()[
+            0
+        ]
+
+    def iter_query(
+        self,
+        account_id: Optional[str] = None,
+        min_booking_date: Optional[date] = None,
+        max_booking_date: Optional[date] = None,
+        min_amount: Optional[Decimal] = None,
+        max_amount: Optional[Decimal] = None,
+        counterparty_iban: Optional[str] = None,
+        text: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Transaction]:
+        """
+        Yields stored transactions matching all given filters, newest first.
+        ``text`` matches transactions whose ``purpose`` contains all of its words (as whole words with
+        FTS5, as substrings otherwise); it is taken literally, not as query syntax.
+        """
+        where, params = [], []
+        if account_id is not None:
+            where.append("t.account_id = ?")
+            params.append(account_id)
+        if min_booking_date is not None:
+            where.append("t.booking_date >= ?")
+            params.append(min_booking_date.isoformat())
+        if max_booking_date is not None:
+            where.append("t.booking_date <= ?")
+            params.append(max_booking_date.isoformat())
+        if min_amount is not None:
+            where.append("t.amount_cents >= ?")
+            params.append(_cents(min_amount, ROUND_CEILING))
+        if max_amount is not None:
+            where.append("t.amount_cents <= ?")
+            params.append(_cents(max_amount, ROUND_FLOOR))
+        if counterparty_iban is not None:
+            where.append("t.counterparty_iban = ?")
+            params.append(counterparty_iban)
+        words = text.split() if text else []
+        if words and self._has_fts:
+            where.append("t.id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ?)")
+            params.append(_match_expression(words))
+        else:
+            for word in words:
+                where.append("t.purpose LIKE ? ESCAPE '\\'")
+                params.append(_like_pattern(word))
+
+        sql = "SELECT * FROM transactions t"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY t.booking_date DESC, t.id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        for row in self._conn.execute(sql, params):
+            yield _from_row(row)
+
+    def query(self, **filters) -> List[Transaction]:
+        """Like ``iter_query`` but returns a list."""
+        return list(self.iter_query(**filters))
+
+    def monthly_totals(self, account_id: Optional[str] = None) -> List[Tuple[str, Decimal, Decimal]]:
+        """
+        Returns ``(YYYY-MM, income, expenses)`` per month, computed inside SQLite in whole cents.
+        """
+        sql = (
+            "SELECT substr(booking_date, 1, 7) AS month,"
+            " SUM(CASE WHEN amount_cents > 0 THEN amount_cents ELSE 0 END),"
+            " SUM(CASE WHEN amount_cents < 0 THEN amount_cents ELSE 0 END)"
+            " FROM transactions"
+        )
+        params = []
+        if account_id is not None:
+            sql += " WHERE account_id = ?"
+            params.append(account_id)
+        sql += " GROUP BY month ORDER BY month"
+        return [
+            (month, Decimal(income).scaleb(-2), Decimal(expenses).scaleb(-2))
+            for month, income, expenses in self._conn.execute(sql, params)
+        ]
@@ -0,0 +1,107 @@
+"""
+Incremental parsing of ListResource responses.
+
+A ListResource body is a single JSON object whose ``values`` array holds the page. ``iter_list_values``
+parses it from the body chunks as they arrive and yields every element of ``values`` as soon as it is
+complete, so the first item of a page is available before the page has been downloaded. The other
+members (``paging``, ``aggregated``) are collected as parsed JSON. Only the element being parsed and
+the unparsed rest of the last chunk are kept in memory.
+"""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """Text buffer over the decoded chunks with just enough JSON tokenizing for the outer structure."""
+
+    def __init__(self, chunks: Iterable[bytes], encoding: str):
+        self._chunks = iter(chunks)
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Drops the consumed text and appends the next chunk; False at the end of the body."""
+        if self.eof:
+            return False
+        chunk = next(self._chunks, None)
+        self.eof = chunk is None
+        text = self._text.decode(chunk or b"", final=self.eof)
+        self.buffer = self.buffer[self.pos :] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character, or "" at the end of the body."""
+        while True:
+            buffer, pos = self.buffer, self.pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Parses the next JSON value, reading further chunks until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # a number or literal at the end of the buffer may continue in the next chunk
+            if end < len(self.buffer) or self.buffer[self.pos] in '{["' or not self.fill():
+                self.pos = end
+                return value
+
+
+def iter_list_values(chunks: Iterable[bytes], fields: Dict[str, Any], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Yields the elements of the ``values`` array of a JSON object read from ``chunks``.
+
+    The other members of the object are stored in ``fields``; all of them are there once the
+    iterator is exhausted. A ``values`` member that is not an array is stored in ``fields`` as well.
+    Raises json.JSONDecodeError for a malformed body.
+    """
+    reader = _Reader(chunks, encoding)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", reader.buffer, reader.pos)
+            reader.expect(":")
+            if key == "values" and reader.peek() == "[":
+                reader.pos += 1
+                if reader.peek() == "]":
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.expect(",]") == "]":
+                            break
+            else:
+                fields[key] = reader.value()
+            if reader.expect(",}") == "}":
+                break
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
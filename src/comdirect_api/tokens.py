@@ -0,0 +1,125 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import AuthenticationError
+
+logger = logging.getLogger(__name__)
+
+
+class TokenManager:
+    """
+    Keeps the OAuth tokens of a session and renews the access token with the refresh_token grant.
+
+    With ``start()`` a daemon timer refreshes the token ``refresh_margin`` seconds before it expires,
+    so long running processes never fall back to a full login (and a new TAN challenge).
+    Token updates are serialized by an internal lock, so concurrent callers never refresh twice.
+    """
+
+    RETRY_DELAY = 10
+
+    def __init__(
+        self,
+        refresh_fn: Callable[[str], Dict[str, Any]],
+        on_update: Optional[Callable[[str], None]] = None,
+        refresh_margin: float = 60,
+    ):
+        self._refresh_fn = refresh_fn
+        self._on_update = on_update
+        self._refresh_margin = refresh_margin
+
+        self.access_token: Optional[str] = None
+        self.refresh_token: Optional[str] = None
+        self.expires_at: Optional[float] = None
+
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._running = False
+
+    def set_tokens(self, token_response: Dict[str, Any]) -> None:
+        """Takes over the tokens of an OAuth token response."""
+        with self._lock:
+            self.access_token = token_response["access_token"]
+            # The server may omit the refresh token on refresh; keep the previous one then.
+            self.refresh_token = token_response.get("refresh_token") or self.refresh_token
+            expires_in = token_response.get("expires_in")
+            self.expires_at = time.monotonic() + float(expires_in) if expires_in else None
+            if self._on_update:
+                self._on_update(self.access_token)
+
+    def clear(self) -> None:
+        self.stop()
+        with self._lock:
+            self.access_token = None
+            self.refresh_token = None
+            self.expires_at = None
+
+    @property
+    def expires_in(self) -> Optional[float]:
+        """Seconds until the access token expires (negative if already expired)."""
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.monotonic()
+
+    def can_refresh(self) -> bool:
+        return self.refresh_token is not None
+
+    def refresh(self, stale_token: Optional[str] = None) -> str:
+        """
+        Refreshes the access token now and returns the new one.
+
+        If ``stale_token`` is given and another thread already replaced it, the current token is
+        returned without a second refresh (single-flight).
+        """
+        with self._lock:
+            if stale_token is not None and self.access_token and self.access_token != stale_token:
+                return self.access_token
+            if not self.refresh_token:
+                raise AuthenticationError("No refresh token available, a full login is required")
+            self.set_tokens(self._refresh_fn(self.refresh_token))
+            logger.info("Access token refreshed")
+            return self.access_token
+
+    # --- Background refresh ---
+
+    def start(self) -> None:
+        """Starts proactive background refreshing."""
+        self._running = True
+        self._schedule()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._running = False
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def _schedule(self, delay: Optional[float] = None) -> None:
+        with self._lock:
+            if not self._running:
+                return
+            if delay is None:
+                if self.expires_in is None or not self.can_refresh():
+                    return
+                delay = max(self.expires_in - self._refresh_margin, 0)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _on_timer(self) -> None:
+        if not self._running:
+            return
+        try:
+            self.refresh()
+        except Exception as e:
+            remaining = self.expires_in
+            if remaining is not None and remaining <= 0:
+                logger.error(f"Background token refresh failed, token expired: {e}")
+                return
+            logger.warning(f"Background token refresh failed, retrying in {self.RETRY_DELAY}s: {e}")
+            self._schedule(self.RETRY_DELAY)
+            return
+        self._schedule()
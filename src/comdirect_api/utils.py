@@ -1,11 +1,60 @@
 import datetime
+import functools
 import io
+import json
+import threading
+import time
 
 
 def timestamp() -> str:
     return datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%d%H%M%S%f")
 
 
+class RequestIdGenerator:
+    """
+    Generates request ids in the ``timestamp()`` format (UTC, YYYYmmddHHMMSSffffff).
+
+    Ids are strictly increasing and unique within the process, also across threads: if two requests fall
+    into the same microsecond, the later one is moved to the next microsecond. The date part is only
+    formatted once per second.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last = 0
+        self._second = None
+        self._prefix = ""
+
+    def __call__(self) -> str:
+        now = time.time_ns() // 1000
+        with self._lock:
+            if now <= self._last:
+                now = self._last + 1
+            self._last = now
+            second, micros = divmod(now, 1_000_000)
+            if second != self._second:
+                self._second = second
+                self._prefix = time.strftime("%Y%m%d%H%M%S", time.gmtime(second))
+            prefix = self._prefix
+        return f"{prefix}{micros:06d}"
+
+
+next_request_id = RequestIdGenerator()
+
+
+@functools.lru_cache(maxsize=256)
+def _request_info_prefix(session_id: str) -> str:
+    return '{"clientRequestId": {"sessionId": ' + json.dumps(session_id) + ', "requestId": "'
+
+
+def request_info_header(session_id: str) -> str:
+    """
+    Value of the x-http-request-info header; same output as json.dumps of the header dict, but built from
+    a cached per-session template.
+    """
+    return _request_info_prefix(session_id) + next_request_id() + '"}}'
+
+
 def is_valid_tan(tan: str) -> bool:
     return isinstance(tan, str) and len(tan) == 6 and tan.isdigit()
 
@@ -90,88 +90,180 @@ __all__ = [
     "VisaCardImage",
 ]
 
-# import apis into sdk package
-from openapi_client.api.banking_api import BankingApi as BankingApi
-from openapi_client.api.brokerage_api import BrokerageApi as BrokerageApi
-from openapi_client.api.messages_api import MessagesApi as MessagesApi
-from openapi_client.api.reports_api import ReportsApi as ReportsApi
-from openapi_client.api.session_api import SessionApi as SessionApi
-
-# import ApiClient
-from openapi_client.api_response import ApiResponse as ApiResponse
-from openapi_client.api_client import ApiClient as ApiClient
-from openapi_client.configuration import Configuration as Configuration
-from openapi_client.exceptions import OpenApiException as OpenApiException
-from openapi_client.exceptions import ApiTypeError as ApiTypeError
-from openapi_client.exceptions import ApiValueError as ApiValueError
-from openapi_client.exceptions import ApiKeyError as ApiKeyError
-from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
-from openapi_client.exceptions import ApiException as ApiException
-
-# import models into sdk package
-from openapi_client.models.account import Account as Account
-from openapi_client.models.account_balance import AccountBalance as AccountBalance
-from openapi_client.models.account_information import AccountInformation as AccountInformation
-from openapi_client.models.account_transaction import AccountTransaction as AccountTransaction
-from openapi_client.models.amount_value import AmountValue as AmountValue
-from openapi_client.models.balance import Balance as Balance
-from openapi_client.models.business_message import BusinessMessage as BusinessMessage
-from openapi_client.models.card import Card as Card
-from openapi_client.models.card_balance import CardBalance as CardBalance
-from openapi_client.models.cost_entry import CostEntry as CostEntry
-from openapi_client.models.cost_group import CostGroup as CostGroup
-from openapi_client.models.cost_indication_ex_ante import CostIndicationExAnte as CostIndicationExAnte
-from openapi_client.models.depot import Depot as Depot
-from openapi_client.models.depot_aggregation import DepotAggregation as DepotAggregation
-from openapi_client.models.depot_position import DepotPosition as DepotPosition
-from openapi_client.models.depot_transaction import DepotTransaction as DepotTransaction
-from openapi_client.models.derivative_data import DerivativeData as DerivativeData
-from openapi_client.models.dimensions import Dimensions as Dimensions
-from openapi_client.models.document import Document as Document
-from openapi_client.models.document_metadata import DocumentMetadata as DocumentMetadata
-from openapi_client.models.enum_text import EnumText as EnumText
-from openapi_client.models.execution import Execution as Execution
-from openapi_client.models.fx_rate_eur import FXRateEUR as FXRateEUR
-from openapi_client.models.fixed_term_savings import FixedTermSavings as FixedTermSavings
-from openapi_client.models.fund_distribution import FundDistribution as FundDistribution
-from openapi_client.models.inducement import Inducement as Inducement
-from openapi_client.models.installment_loan import InstallmentLoan as InstallmentLoan
-from openapi_client.models.installment_loan_balance import InstallmentLoanBalance as InstallmentLoanBalance
-from openapi_client.models.instrument import Instrument as Instrument
-from openapi_client.models.list_resource_account_balance import (
-    ListResourceAccountBalance as ListResourceAccountBalance,
-)
-from openapi_client.models.list_resource_account_transaction import (
-    ListResourceAccountTransaction as ListResourceAccountTransaction,
-)
-from openapi_client.models.list_resource_cost_indication_ex_ante import (
-    ListResourceCostIndicationExAnte as ListResourceCostIndicationExAnte,
-)
-from openapi_client.models.list_resource_depot import ListResourceDepot as ListResourceDepot
-from openapi_client.models.list_resource_depot_position import ListResourceDepotPosition as ListResourceDepotPosition
-from openapi_client.models.list_resource_depot_transaction import (
-    ListResourceDepotTransaction as ListResourceDepotTransaction,
-)
-from openapi_client.models.list_resource_dimensions import ListResourceDimensions as ListResourceDimensions
-from openapi_client.models.list_resource_document import ListResourceDocument as ListResourceDocument
-from openapi_client.models.list_resource_instrument import ListResourceInstrument as ListResourceInstrument
-from openapi_client.models.list_resource_order import ListResourceOrder as ListResourceOrder
-from openapi_client.models.list_resource_product_balance import (
-    ListResourceProductBalance as ListResourceProductBalance,
-)
-from openapi_client.models.order import Order as Order
-from openapi_client.models.order_type import OrderType as OrderType
-from openapi_client.models.paging_info import PagingInfo as PagingInfo
-from openapi_client.models.price import Price as Price
-from openapi_client.models.product_balance import ProductBalance as ProductBalance
-from openapi_client.models.quote import Quote as Quote
-from openapi_client.models.rating import Rating as Rating
-from openapi_client.models.session import Session as Session
-from openapi_client.models.standard_error_response import StandardErrorResponse as StandardErrorResponse
-from openapi_client.models.static_data import StaticData as StaticData
-from openapi_client.models.total_cost_block import TotalCostBlock as TotalCostBlock
-from openapi_client.models.total_cost_entry import TotalCostEntry as TotalCostEntry
-from openapi_client.models.total_holding_cost_block import TotalHoldingCostBlock as TotalHoldingCostBlock
-from openapi_client.models.total_holding_cost_entry import TotalHoldingCostEntry as TotalHoldingCostEntry
-from openapi_client.models.venue import Venue as Venue
-from openapi_client.models.visa_card_image import VisaCardImage as VisaCardImage
+import importlib as _importlib
+from typing import TYPE_CHECKING
+
+# lazily import apis/models on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "BankingApi": "openapi_client.api.banking_api",
+    "BrokerageApi": "openapi_client.api.brokerage_api",
+    "MessagesApi": "openapi_client.api.messages_api",
+    "ReportsApi": "openapi_client.api.reports_api",
+    "SessionApi": "openapi_client.api.session_api",
+    "ApiResponse": "openapi_client.api_response",
+    "ApiClient": "openapi_client.api_client",
+    "Configuration": "openapi_client.configuration",
+    "OpenApiException": "openapi_client.exceptions",
+    "ApiTypeError": "openapi_client.exceptions",
+    "ApiValueError": "openapi_client.exceptions",
+    "ApiKeyError": "openapi_client.exceptions",
+    "ApiAttributeError": "openapi_client.exceptions",
+    "ApiException": "openapi_client.exceptions",
+    "Account": "openapi_client.models.account",
+    "AccountBalance": "openapi_client.models.account_balance",
+    "AccountInformation": "openapi_client.models.account_information",
+    "AccountTransaction": "openapi_client.models.account_transaction",
+    "AmountValue": "openapi_client.models.amount_value",
+    "Balance": "openapi_client.models.balance",
+    "BusinessMessage": "openapi_client.models.business_message",
+    "Card": "openapi_client.models.card",
+    "CardBalance": "openapi_client.models.card_balance",
+    "CostEntry": "openapi_client.models.cost_entry",
+    "CostGroup": "openapi_client.models.cost_group",
+    "CostIndicationExAnte": "openapi_client.models.cost_indication_ex_ante",
+    "Depot": "openapi_client.models.depot",
+    "DepotAggregation": "openapi_client.models.depot_aggregation",
+    "DepotPosition": "openapi_client.models.depot_position",
+    "DepotTransaction": "openapi_client.models.depot_transaction",
+    "DerivativeData": "openapi_client.models.derivative_data",
+    "Dimensions": "openapi_client.models.dimensions",
+    "Document": "openapi_client.models.document",
+    "DocumentMetadata": "openapi_client.models.document_metadata",
+    "EnumText": "openapi_client.models.enum_text",
+    "Execution": "openapi_client.models.execution",
+    "FXRateEUR": "openapi_client.models.fx_rate_eur",
+    "FixedTermSavings": "openapi_client.models.fixed_term_savings",
+    "FundDistribution": "openapi_client.models.fund_distribution",
+    "Inducement": "openapi_client.models.inducement",
+    "InstallmentLoan": "openapi_client.models.installment_loan",
+    "InstallmentLoanBalance": "openapi_client.models.installment_loan_balance",
+    "Instrument": "openapi_client.models.instrument",
+    "ListResourceAccountBalance": "openapi_client.models.list_resource_account_balance",
+    "ListResourceAccountTransaction": "openapi_client.models.list_resource_account_transaction",
+    "ListResourceCostIndicationExAnte": "openapi_client.models.list_resource_cost_indication_ex_ante",
+    "ListResourceDepot": "openapi_client.models.list_resource_depot",
+    "ListResourceDepotPosition": "openapi_client.models.list_resource_depot_position",
+    "ListResourceDepotTransaction": "openapi_client.models.list_resource_depot_transaction",
+    "ListResourceDimensions": "openapi_client.models.list_resource_dimensions",
+    "ListResourceDocument": "openapi_client.models.list_resource_document",
+    "ListResourceInstrument": "openapi_client.models.list_resource_instrument",
+    "ListResourceOrder": "openapi_client.models.list_resource_order",
+    "ListResourceProductBalance": "openapi_client.models.list_resource_product_balance",
+    "Order": "openapi_client.models.order",
+    "OrderType": "openapi_client.models.order_type",
+    "PagingInfo": "openapi_client.models.paging_info",
+    "Price": "openapi_client.models.price",
+    "ProductBalance": "openapi_client.models.product_balance",
+    "Quote": "openapi_client.models.quote",
+    "Rating": "openapi_client.models.rating",
+    "Session": "openapi_client.models.session",
+    "StandardErrorResponse": "openapi_client.models.standard_error_response",
+    "StaticData": "openapi_client.models.static_data",
+    "TotalCostBlock": "openapi_client.models.total_cost_block",
+    "TotalCostEntry": "openapi_client.models.total_cost_entry",
+    "TotalHoldingCostBlock": "openapi_client.models.total_holding_cost_block",
+    "TotalHoldingCostEntry": "openapi_client.models.total_holding_cost_entry",
+    "Venue": "openapi_client.models.venue",
+    "VisaCardImage": "openapi_client.models.visa_card_image",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from openapi_client.api.banking_api import BankingApi as BankingApi
+    from openapi_client.api.brokerage_api import BrokerageApi as BrokerageApi
+    from openapi_client.api.messages_api import MessagesApi as MessagesApi
+    from openapi_client.api.reports_api import ReportsApi as ReportsApi
+    from openapi_client.api.session_api import SessionApi as SessionApi
+
+    # import ApiClient
+    from openapi_client.api_response import ApiResponse as ApiResponse
+    from openapi_client.api_client import ApiClient as ApiClient
+    from openapi_client.configuration import Configuration as Configuration
+    from openapi_client.exceptions import OpenApiException as OpenApiException
+    from openapi_client.exceptions import ApiTypeError as ApiTypeError
+    from openapi_client.exceptions import ApiValueError as ApiValueError
+    from openapi_client.exceptions import ApiKeyError as ApiKeyError
+    from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
+    from openapi_client.exceptions import ApiException as ApiException
+
+    # import models into sdk package
+    from openapi_client.models.account import Account as Account
+    from openapi_client.models.account_balance import AccountBalance as AccountBalance
+    from openapi_client.models.account_information import AccountInformation as AccountInformation
+    from openapi_client.models.account_transaction import AccountTransaction as AccountTransaction
+    from openapi_client.models.amount_value import AmountValue as AmountValue
+    from openapi_client.models.balance import Balance as Balance
+    from openapi_client.models.business_message import BusinessMessage as BusinessMessage
+    from openapi_client.models.card import Card as Card
+    from openapi_client.models.card_balance import CardBalance as CardBalance
+    from openapi_client.models.cost_entry import CostEntry as CostEntry
+    from openapi_client.models.cost_group import CostGroup as CostGroup
+    from openapi_client.models.cost_indication_ex_ante import CostIndicationExAnte as CostIndicationExAnte
+    from openapi_client.models.depot import Depot as Depot
+    from openapi_client.models.depot_aggregation import DepotAggregation as DepotAggregation
+    from openapi_client.models.depot_position import DepotPosition as DepotPosition
+    from openapi_client.models.depot_transaction import DepotTransaction as DepotTransaction
+    from openapi_client.models.derivative_data import DerivativeData as DerivativeData
+    from openapi_client.models.dimensions import Dimensions as Dimensions
+    from openapi_client.models.document import Document as Document
+    from openapi_client.models.document_metadata import DocumentMetadata as DocumentMetadata
+    from openapi_client.models.enum_text import EnumText as EnumText
+    from openapi_client.models.execution import Execution as Execution
+    from openapi_client.models.fx_rate_eur import FXRateEUR as FXRateEUR
+    from openapi_client.models.fixed_term_savings import FixedTermSavings as FixedTermSavings
+    from openapi_client.models.fund_distribution import FundDistribution as FundDistribution
+    from openapi_client.models.inducement import Inducement as Inducement
+    from openapi_client.models.installment_loan import InstallmentLoan as InstallmentLoan
+    from openapi_client.models.installment_loan_balance import InstallmentLoanBalance as InstallmentLoanBalance
+    from openapi_client.models.instrument import Instrument as Instrument
+    from openapi_client.models.list_resource_account_balance import (
+        ListResourceAccountBalance as ListResourceAccountBalance,
+    )
+    from openapi_client.models.list_resource_account_transaction import (
+        ListResourceAccountTransaction as ListResourceAccountTransaction,
+    )
+    from openapi_client.models.list_resource_cost_indication_ex_ante import (
+        ListResourceCostIndicationExAnte as ListResourceCostIndicationExAnte,
+    )
+    from openapi_client.models.list_resource_depot import ListResourceDepot as ListResourceDepot
+    from openapi_client.models.list_resource_depot_position import ListResourceDepotPosition as ListResourceDepotPosition
+    from openapi_client.models.list_resource_depot_transaction import (
+        ListResourceDepotTransaction as ListResourceDepotTransaction,
+    )
+    from openapi_client.models.list_resource_dimensions import ListResourceDimensions as ListResourceDimensions
+    from openapi_client.models.list_resource_document import ListResourceDocument as ListResourceDocument
+    from openapi_client.models.list_resource_instrument import ListResourceInstrument as ListResourceInstrument
+    from openapi_client.models.list_resource_order import ListResourceOrder as ListResourceOrder
+    from openapi_client.models.list_resource_product_balance import (
+        ListResourceProductBalance as ListResourceProductBalance,
+    )
+    from openapi_client.models.order import Order as Order
+    from openapi_client.models.order_type import OrderType as OrderType
+    from openapi_client.models.paging_info import PagingInfo as PagingInfo
+    from openapi_client.models.price import Price as Price
+    from openapi_client.models.product_balance import ProductBalance as ProductBalance
+    from openapi_client.models.quote import Quote as Quote
+    from openapi_client.models.rating import Rating as Rating
+    from openapi_client.models.session import Session as Session
+    from openapi_client.models.standard_error_response import StandardErrorResponse as StandardErrorResponse
+    from openapi_client.models.static_data import StaticData as StaticData
+    from openapi_client.models.total_cost_block import TotalCostBlock as TotalCostBlock
+    from openapi_client.models.total_cost_entry import TotalCostEntry as TotalCostEntry
+    from openapi_client.models.total_holding_cost_block import TotalHoldingCostBlock as TotalHoldingCostBlock
+    from openapi_client.models.total_holding_cost_entry import TotalHoldingCostEntry as TotalHoldingCostEntry
+    from openapi_client.models.venue import Venue as Venue
+    from openapi_client.models.visa_card_image import VisaCardImage as VisaCardImage
@@ -1,8 +1,35 @@
 # flake8: noqa
 
-# import apis into api package
-from openapi_client.api.banking_api import BankingApi
-from openapi_client.api.brokerage_api import BrokerageApi
-from openapi_client.api.messages_api import MessagesApi
-from openapi_client.api.reports_api import ReportsApi
-from openapi_client.api.session_api import SessionApi
+import importlib as _importlib
+from typing import TYPE_CHECKING
+
+# lazily import apis/models on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "BankingApi": "openapi_client.api.banking_api",
+    "BrokerageApi": "openapi_client.api.brokerage_api",
+    "MessagesApi": "openapi_client.api.messages_api",
+    "ReportsApi": "openapi_client.api.reports_api",
+    "SessionApi": "openapi_client.api.session_api",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from openapi_client.api.banking_api import BankingApi
+    from openapi_client.api.brokerage_api import BrokerageApi
+    from openapi_client.api.messages_api import MessagesApi
+    from openapi_client.api.reports_api import ReportsApi
+    from openapi_client.api.session_api import SessionApi
@@ -0,0 +1,155 @@
+# coding: utf-8
+
+"""
+Shared request builder for the generated API classes.
+
+Copied into the generated package by scripts/compact_apis.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from pydantic import validate_call
+
+from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.rest import RESTResponse
+
+
+class Endpoint:
+    """Static description of one operation: everything the request builder needs besides the arguments."""
+
+    __slots__ = (
+        "name",
+        "method",
+        "resource_path",
+        "path_params",
+        "query_params",
+        "body",
+        "accept",
+        "content_types",
+        "auth_settings",
+        "collection_formats",
+        "response_types",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        resource_path: str,
+        *,
+        path_params: Optional[Dict[str, str]] = None,
+        query_params: Optional[Dict[str, str]] = None,
+        body: Optional[str] = None,
+        accept: Sequence[str] = (),
+        content_types: Sequence[str] = (),
+        auth_settings: Sequence[str] = (),
+        collection_formats: Optional[Dict[str, str]] = None,
+        response_types: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.resource_path = resource_path
+        # wire name -> argument name
+        self.path_params = path_params or {}
+        self.query_params = query_params or {}
+        self.body = body
+        self.accept = list(accept)
+        self.content_types = list(content_types)
+        self.auth_settings = list(auth_settings)
+        self.collection_formats = collection_formats or {}
+        self.response_types = response_types or {}
+
+    def serialize(self, api_client: ApiClient, params: Dict[str, Any]) -> RequestSerialized:
+        _path_params: Dict[str, str] = {}
+        for name, arg in self.path_params.items():
+            if params[arg] is not None:
+                _path_params[name] = params[arg]
+        _query_params: List[Tuple[str, str]] = []
+        for name, arg in self.query_params.items():
+            if params[arg] is not None:
+                _query_params.append((name, params[arg]))
+        _header_params: Dict[str, Optional[str]] = params["_headers"] or {}
+
+        if self.accept and "Accept" not in _header_params:
+            _header_params["Accept"] = api_client.select_header_accept(self.accept)
+
+        if self.content_types:
+            if params["_content_type"]:
+                _header_params["Content-Type"] = params["_content_type"]
+            else:
+                _default_content_type = api_client.select_header_content_type(self.content_types)
+                if _default_content_type is not None:
+                    _header_params["Content-Type"] = _default_content_type
+
+        return api_client.param_serialize(
+            method=self.method,
+            resource_path=self.resource_path,
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=params[self.body] if self.body else None,
+            post_params=[],
+            files={},
+            auth_settings=list(self.auth_settings),
+            collection_formats=dict(self.collection_formats),
+            _host=None,
+            _request_auth=params["_request_auth"],
+        )
+
+    def call(self, api_client: ApiClient, params: Dict[str, Any]) -> RESTResponse:
+        _param = self.serialize(api_client, params)
+        return api_client.call_api(*_param, _request_timeout=params["_request_timeout"])
+
+
+class _Validated:
+    """Applies ``validate_call`` to a parameter signature on its first call instead of at import time."""
+
+    __slots__ = ("func", "validated")
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.validated = None
+
+    def __call__(self, *args, **kwargs) -> Dict[str, Any]:
+        if self.validated is None:
+            self.validated = validate_call(self.func)
+        return self.validated(*args, **kwargs)
+
+
+def call_styles(endpoint: Endpoint, signature):
+    """
+    Builds the three public methods of an operation from its parameter signature, a function whose body
+    returns ``locals()``: ``<name>`` returns the deserialized data, ``<name>_with_http_info`` the
+    ``ApiResponse`` and ``<name>_without_preload_content`` the unread urllib3 response.
+    """
+    params = _Validated(signature)
+
+    def with_http_info(self, *args, **kwargs):
+        response_data = endpoint.call(self.api_client, params(self, *args, **kwargs))
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=endpoint.response_types,
+        )
+
+    def data(self, *args, **kwargs):
+        return with_http_info(self, *args, **kwargs).data
+
+    def without_preload_content(self, *args, **kwargs):
+        return endpoint.call(self.api_client, params(self, *args, **kwargs)).response
+
+    methods = []
+    for suffix, func in (
+        ("", data),
+        ("_with_http_info", with_http_info),
+        ("_without_preload_content", without_preload_content),
+    ):
+        func.__name__ = endpoint.name + suffix
+        func.__qualname__ = signature.__qualname__.rsplit(".", 1)[0] + "." + func.__name__
+        func.__doc__ = signature.__doc__
+        func.__module__ = signature.__module__
+        func.__wrapped__ = signature
+        methods.append(func)
+    return tuple(methods)
@@ -1,14 +1,14 @@
 # coding: utf-8
 
 """
-    comdirect REST API
+comdirect REST API
 
-    Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
+Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
 
-    The version of the OpenAPI document: 20.04
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
+The version of the OpenAPI document: 20.04
+Generated by OpenAPI Generator (https://openapi-generator.tech)
 
-    Do not edit the class manually.
+Do not edit the class manually.
 """  # noqa: E501
 
 import warnings
@@ -23,10 +23,46 @@ from openapi_client.models.account_balance import AccountBalance
 from openapi_client.models.list_resource_account_balance import ListResourceAccountBalance
 from openapi_client.models.list_resource_account_transaction import ListResourceAccountTransaction
 
-from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api._endpoint import Endpoint, call_styles
+from openapi_client.api_client import ApiClient
 from openapi_client.api_response import ApiResponse
 from openapi_client.rest import RESTResponseType
 
+_BANKING_V1_GET_ACCOUNT_TRANSACTIONS = Endpoint(
+    "banking_v1_get_account_transactions",
+    "GET",
+    "/banking/v1/accounts/{accountId}/transactions",
+    path_params={"accountId": "account_id"},
+    query_params={
+        "transactionState": "transaction_state",
+        "transactionDirection": "transaction_direction",
+        "paging-first": "paging_first",
+        "with-attr": "with_attr",
+    },
+    accept=["application/json"],
+    response_types={"200": "ListResourceAccountTransaction", "404": None, "422": None, "500": None},
+)
+
+_BANKING_V2_GET_ACCOUNT_BALANCE = Endpoint(
+    "banking_v2_get_account_balance",
+    "GET",
+    "/banking/v2/accounts/{accountId}/balances",
+    path_params={"accountId": "account_id"},
+    query_params={"without-attr": "without_attr"},
+    accept=["application/json"],
+    response_types={"200": "AccountBalance", "404": None, "422": None, "500": None},
+)
+
+_BANKING_V2_GET_ACCOUNT_BALANCES = Endpoint(
+    "banking_v2_get_account_balances",
+    "GET",
+    "/banking/clients/{user}/v2/accounts/balances",
+    path_params={"user": "user"},
+    query_params={"without-attr": "without_attr"},
+    accept=["application/json"],
+    response_types={"200": "ListResourceAccountBalance", "404": None, "422": None, "500": None},
+)
+
 
 class BankingApi:
     """NOTE: This class is auto generated by OpenAPI Generator
@@ -40,8 +76,7 @@ class BankingApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
-    def banking_v1_get_account_transactions(
+    def _banking_v1_get_account_transactions_params(
         self,
         account_id: Annotated[StrictStr, Field(description="Account identifier (UUID) ")],
         transaction_state: Annotated[
@@ -104,280 +139,15 @@ class BankingApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._banking_v1_get_account_transactions_serialize(
-            account_id=account_id,
-            transaction_state=transaction_state,
-            transaction_direction=transaction_direction,
-            paging_first=paging_first,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceAccountTransaction",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def banking_v1_get_account_transactions_with_http_info(
-        self,
-        account_id: Annotated[StrictStr, Field(description="Account identifier (UUID) ")],
-        transaction_state: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Filters for AccountTransactions. Will return all AccountTransactions (BOTH), or return all booked AccountTransactions (BOOKED), or all not booked AccountTransactions (NOTBOOKED)."
-            ),
-        ] = None,
-        transaction_direction: Annotated[
-            Optional[StrictStr], Field(description="Filters for CREDIT, DEBIT or CREDIT_AND_DEBIT")
-        ] = None,
-        paging_first: Annotated[Optional[StrictInt], Field(description="Index of the first transaction.")] = None,
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Enforce to load the master data of an attribute. Currently supported attributes: account"
-            ),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceAccountTransaction]:
-        """Requests and returns a list of transactions for the given account
-
-
-        :param account_id: Account identifier (UUID)  (required)
-        :type account_id: str
-        :param transaction_state: Filters for AccountTransactions. Will return all AccountTransactions (BOTH), or return all booked AccountTransactions (BOOKED), or all not booked AccountTransactions (NOTBOOKED).
-        :type transaction_state: str
-        :param transaction_direction: Filters for CREDIT, DEBIT or CREDIT_AND_DEBIT
-        :type transaction_direction: str
-        :param paging_first: Index of the first transaction.
-        :type paging_first: int
-        :param with_attr: Enforce to load the master data of an attribute. Currently supported attributes: account
-        :type with_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._banking_v1_get_account_transactions_serialize(
-            account_id=account_id,
-            transaction_state=transaction_state,
-            transaction_direction=transaction_direction,
-            paging_first=paging_first,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceAccountTransaction",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def banking_v1_get_account_transactions_without_preload_content(
-        self,
-        account_id: Annotated[StrictStr, Field(description="Account identifier (UUID) ")],
-        transaction_state: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Filters for AccountTransactions. Will return all AccountTransactions (BOTH), or return all booked AccountTransactions (BOOKED), or all not booked AccountTransactions (NOTBOOKED)."
-            ),
-        ] = None,
-        transaction_direction: Annotated[
-            Optional[StrictStr], Field(description="Filters for CREDIT, DEBIT or CREDIT_AND_DEBIT")
-        ] = None,
-        paging_first: Annotated[Optional[StrictInt], Field(description="Index of the first transaction.")] = None,
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Enforce to load the master data of an attribute. Currently supported attributes: account"
-            ),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Requests and returns a list of transactions for the given account
-
-
-        :param account_id: Account identifier (UUID)  (required)
-        :type account_id: str
-        :param transaction_state: Filters for AccountTransactions. Will return all AccountTransactions (BOTH), or return all booked AccountTransactions (BOOKED), or all not booked AccountTransactions (NOTBOOKED).
-        :type transaction_state: str
-        :param transaction_direction: Filters for CREDIT, DEBIT or CREDIT_AND_DEBIT
-        :type transaction_direction: str
-        :param paging_first: Index of the first transaction.
-        :type paging_first: int
-        :param with_attr: Enforce to load the master data of an attribute. Currently supported attributes: account
-        :type with_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._banking_v1_get_account_transactions_serialize(
-            account_id=account_id,
-            transaction_state=transaction_state,
-            transaction_direction=transaction_direction,
-            paging_first=paging_first,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceAccountTransaction",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
+    (
+        banking_v1_get_account_transactions,
+        banking_v1_get_account_transactions_with_http_info,
+        banking_v1_get_account_transactions_without_preload_content,
+    ) = call_styles(_BANKING_V1_GET_ACCOUNT_TRANSACTIONS, _banking_v1_get_account_transactions_params)
 
-    def _banking_v1_get_account_transactions_serialize(
-        self,
-        account_id,
-        transaction_state,
-        transaction_direction,
-        paging_first,
-        with_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if account_id is not None:
-            _path_params["accountId"] = account_id
-        # process the query parameters
-        if transaction_state is not None:
-
-            _query_params.append(("transactionState", transaction_state))
-
-        if transaction_direction is not None:
-
-            _query_params.append(("transactionDirection", transaction_direction))
-
-        if paging_first is not None:
-
-            _query_params.append(("paging-first", paging_first))
-
-        if with_attr is not None:
-
-            _query_params.append(("with-attr", with_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/banking/v1/accounts/{accountId}/transactions",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def banking_v2_get_account_balance(
+    def _banking_v2_get_account_balance_params(
         self,
         account_id: Annotated[StrictStr, Field(description="Account identifier (UUID)")],
         without_attr: Annotated[
@@ -421,218 +191,15 @@ class BankingApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._banking_v2_get_account_balance_serialize(
-            account_id=account_id,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AccountBalance",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def banking_v2_get_account_balance_with_http_info(
-        self,
-        account_id: Annotated[StrictStr, Field(description="Account identifier (UUID)")],
-        without_attr: Annotated[
-            Optional[StrictStr], Field(description="Suppresses the master data of the account")
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[AccountBalance]:
-        """Request for account information, including cash balance and buying power
-
-
-        :param account_id: Account identifier (UUID) (required)
-        :type account_id: str
-        :param without_attr: Suppresses the master data of the account
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._banking_v2_get_account_balance_serialize(
-            account_id=account_id,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
+    (
+        banking_v2_get_account_balance,
+        banking_v2_get_account_balance_with_http_info,
+        banking_v2_get_account_balance_without_preload_content,
+    ) = call_styles(_BANKING_V2_GET_ACCOUNT_BALANCE, _banking_v2_get_account_balance_params)
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AccountBalance",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def banking_v2_get_account_balance_without_preload_content(
-        self,
-        account_id: Annotated[StrictStr, Field(description="Account identifier (UUID)")],
-        without_attr: Annotated[
-            Optional[StrictStr], Field(description="Suppresses the master data of the account")
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for account information, including cash balance and buying power
-
-
-        :param account_id: Account identifier (UUID) (required)
-        :type account_id: str
-        :param without_attr: Suppresses the master data of the account
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._banking_v2_get_account_balance_serialize(
-            account_id=account_id,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "AccountBalance",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _banking_v2_get_account_balance_serialize(
-        self,
-        account_id,
-        without_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if account_id is not None:
-            _path_params["accountId"] = account_id
-        # process the query parameters
-        if without_attr is not None:
-
-            _query_params.append(("without-attr", without_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/banking/v2/accounts/{accountId}/balances",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def banking_v2_get_account_balances(
+    def _banking_v2_get_account_balances_params(
         self,
         user: Annotated[
             StrictStr, Field(description="Can be either the customer identification number (UUID) or 'user'")
@@ -678,216 +245,10 @@ class BankingApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._banking_v2_get_account_balances_serialize(
-            user=user,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceAccountBalance",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def banking_v2_get_account_balances_with_http_info(
-        self,
-        user: Annotated[
-            StrictStr, Field(description="Can be either the customer identification number (UUID) or 'user'")
-        ],
-        without_attr: Annotated[
-            Optional[StrictStr], Field(description="Suppresses the master data of the accounts")
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceAccountBalance]:
-        """Request for account information, including cash balance and buying power, for all accounts
-
-
-        :param user: Can be either the customer identification number (UUID) or 'user' (required)
-        :type user: str
-        :param without_attr: Suppresses the master data of the accounts
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._banking_v2_get_account_balances_serialize(
-            user=user,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceAccountBalance",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def banking_v2_get_account_balances_without_preload_content(
-        self,
-        user: Annotated[
-            StrictStr, Field(description="Can be either the customer identification number (UUID) or 'user'")
-        ],
-        without_attr: Annotated[
-            Optional[StrictStr], Field(description="Suppresses the master data of the accounts")
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for account information, including cash balance and buying power, for all accounts
-
-
-        :param user: Can be either the customer identification number (UUID) or 'user' (required)
-        :type user: str
-        :param without_attr: Suppresses the master data of the accounts
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._banking_v2_get_account_balances_serialize(
-            user=user,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceAccountBalance",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _banking_v2_get_account_balances_serialize(
-        self,
-        user,
-        without_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if user is not None:
-            _path_params["user"] = user
-        # process the query parameters
-        if without_attr is not None:
-
-            _query_params.append(("without-attr", without_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/banking/clients/{user}/v2/accounts/balances",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
+    (
+        banking_v2_get_account_balances,
+        banking_v2_get_account_balances_with_http_info,
+        banking_v2_get_account_balances_without_preload_content,
+    ) = call_styles(_BANKING_V2_GET_ACCOUNT_BALANCES, _banking_v2_get_account_balances_params)
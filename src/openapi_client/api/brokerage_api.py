@@ -1,14 +1,14 @@
 # coding: utf-8
 
 """
-    comdirect REST API
+comdirect REST API
 
-    Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
+Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
 
-    The version of the OpenAPI document: 20.04
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
+The version of the OpenAPI document: 20.04
+Generated by OpenAPI Generator (https://openapi-generator.tech)
 
-    Do not edit the class manually.
+Do not edit the class manually.
 """  # noqa: E501
 
 import warnings
@@ -30,10 +30,256 @@ from openapi_client.models.list_resource_order import ListResourceOrder
 from openapi_client.models.order import Order
 from openapi_client.models.quote import Quote
 
-from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api._endpoint import Endpoint, call_styles
+from openapi_client.api_client import ApiClient
 from openapi_client.api_response import ApiResponse
 from openapi_client.rest import RESTResponseType
 
+_BROKERAGE_V1_GET_INSTRUMENT = Endpoint(
+    "brokerage_v1_get_instrument",
+    "GET",
+    "/brokerage/v1/instruments/{instrumentId}",
+    path_params={"instrumentId": "instrument_id"},
+    query_params={"with-attr": "with_attr", "without-attr": "without_attr"},
+    accept=["application/json"],
+    collection_formats={"with-attr": "multi", "without-attr": "multi"},
+    response_types={"200": "ListResourceInstrument", "404": None, "422": None, "500": None},
+)
+
+_BROKERAGE_V3_DELETE_ORDER = Endpoint(
+    "brokerage_v3_delete_order",
+    "DELETE",
+    "/brokerage/v3/orders/{orderId}",
+    path_params={"orderId": "order_id"},
+    accept=["application/json"],
+    response_types={"200": "Order", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_GET_DEPOT_POSITION = Endpoint(
+    "brokerage_v3_get_depot_position",
+    "GET",
+    "/brokerage/v3/depots/{depotId}/positions/{positionId}",
+    path_params={"depotId": "depot_id", "positionId": "position_id"},
+    query_params={"with-attr": "with_attr"},
+    accept=["application/json"],
+    response_types={"200": "DepotPosition", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_GET_DEPOT_POSITIONS = Endpoint(
+    "brokerage_v3_get_depot_positions",
+    "GET",
+    "/brokerage/v3/depots/{depotId}/positions",
+    path_params={"depotId": "depot_id"},
+    query_params={"instrumentId": "instrument_id", "without-attr": "without_attr", "with-attr": "with_attr"},
+    accept=["application/json"],
+    collection_formats={"without-attr": "multi"},
+    response_types={"200": "ListResourceDepotPosition", "404": None, "422": None, "500": None, "503": None},
+)
+
+_BROKERAGE_V3_GET_DEPOT_TRANSACTIONS = Endpoint(
+    "brokerage_v3_get_depot_transactions",
+    "GET",
+    "/brokerage/v3/depots/{depotId}/transactions",
+    path_params={"depotId": "depot_id"},
+    query_params={
+        "isin": "isin",
+        "wkn": "wkn",
+        "instrumentId": "instrument_id",
+        "min-bookingDate": "min_booking_date",
+    },
+    accept=["application/json"],
+    response_types={
+        "200": "ListResourceDepotTransaction",
+        "404": None,
+        "422": "StandardErrorResponse",
+        "500": None,
+        "503": None,
+    },
+)
+
+_BROKERAGE_V3_GET_DEPOTS = Endpoint(
+    "brokerage_v3_get_depots",
+    "GET",
+    "/brokerage/clients/{userId}/v3/depots",
+    path_params={"userId": "user_id"},
+    accept=["application/json"],
+    response_types={"200": "ListResourceDepot", "404": None, "422": "StandardErrorResponse", "500": None},
+)
+
+_BROKERAGE_V3_GET_ORDER = Endpoint(
+    "brokerage_v3_get_order",
+    "GET",
+    "/brokerage/v3/orders/{orderId}",
+    path_params={"orderId": "order_id"},
+    query_params={"without-attr": "without_attr"},
+    accept=["application/json"],
+    response_types={"200": "Order", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_GET_ORDER_COST_INDICATION_EX_ANTE = Endpoint(
+    "brokerage_v3_get_order_cost_indication_ex_ante",
+    "POST",
+    "/brokerage/v3/orders/{orderId}/costindicationexante",
+    path_params={"orderId": "order_id"},
+    body="order",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={
+        "201": "ListResourceCostIndicationExAnte",
+        "404": None,
+        "422": "StandardErrorResponse",
+        "500": None,
+    },
+)
+
+_BROKERAGE_V3_GET_ORDER_DIMENSIONS = Endpoint(
+    "brokerage_v3_get_order_dimensions",
+    "GET",
+    "/brokerage/v3/orders/dimensions",
+    query_params={
+        "instrumentId": "instrument_id",
+        "isin": "isin",
+        "wkn": "wkn",
+        "custodyType": "custody_type",
+        "venueId": "venue_id",
+        "orderType": "order_type",
+        "side": "side",
+        "country": "country",
+        "type": "type",
+    },
+    accept=["application/json"],
+    response_types={
+        "200": "ListResourceDimensions",
+        "404": None,
+        "422": "StandardErrorResponse",
+        "500": None,
+        "503": None,
+    },
+)
+
+_BROKERAGE_V3_GET_ORDERS = Endpoint(
+    "brokerage_v3_get_orders",
+    "GET",
+    "/brokerage/depots/{depotId}/v3/orders",
+    path_params={"depotId": "depot_id"},
+    query_params={
+        "with-attr": "with_attr",
+        "without-attr": "without_attr",
+        "instrumentId": "instrument_id",
+        "isin": "isin",
+        "wkn": "wkn",
+        "orderStatus": "order_status",
+        "venueId": "venue_id",
+        "orderType": "order_type",
+        "min-creationTimeStamp": "min_creation_time_stamp",
+        "max-creationTimeStamp": "max_creation_time_stamp",
+        "side": "side",
+    },
+    accept=["application/json"],
+    response_types={"200": "ListResourceOrder", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_GET_ORDERS_COST_INDICATION_EX_ANTE = Endpoint(
+    "brokerage_v3_get_orders_cost_indication_ex_ante",
+    "POST",
+    "/brokerage/v3/orders/costindicationexante",
+    body="order",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"201": "ListResourceCostIndicationExAnte", "422": "StandardErrorResponse", "500": None},
+)
+
+_BROKERAGE_V3_PATCH_ORDER = Endpoint(
+    "brokerage_v3_patch_order",
+    "PATCH",
+    "/brokerage/v3/orders/{orderId}",
+    path_params={"orderId": "order_id"},
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"200": "Order", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_PATCH_QUOTE_TICKET = Endpoint(
+    "brokerage_v3_patch_quote_ticket",
+    "PATCH",
+    "/brokerage/v3/quoteticket/{ticketId}",
+    path_params={"ticketId": "ticket_id"},
+    response_types={"404": None, "422": None, "500": None},
+)
+
+_BROKERAGE_V3_POST_ORDER = Endpoint(
+    "brokerage_v3_post_order",
+    "POST",
+    "/brokerage/v3/orders",
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"201": "Order", "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_POST_ORDER_PREVALIDATION = Endpoint(
+    "brokerage_v3_post_order_prevalidation",
+    "POST",
+    "/brokerage/v3/orders/{orderId}/prevalidation",
+    path_params={"orderId": "order_id"},
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"200": "Order", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_POST_ORDER_VALIDATION = Endpoint(
+    "brokerage_v3_post_order_validation",
+    "POST",
+    "/brokerage/v3/orders/{orderId}/validation",
+    path_params={"orderId": "order_id"},
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"201": "Order", "404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_POST_ORDERS_PREVALIDATION = Endpoint(
+    "brokerage_v3_post_orders_prevalidation",
+    "POST",
+    "/brokerage/v3/orders/prevalidation",
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"200": "Order", "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_POST_ORDERS_VALIDATION = Endpoint(
+    "brokerage_v3_post_orders_validation",
+    "POST",
+    "/brokerage/v3/orders/validation",
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"201": "Order", "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_BROKERAGE_V3_POST_QUOTE_REQUEST = Endpoint(
+    "brokerage_v3_post_quote_request",
+    "POST",
+    "/brokerage/v3/quotes",
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"200": "Quote", "404": None, "422": None, "500": None},
+)
+
+_BROKERAGE_V3_POST_QUOTE_TICKET = Endpoint(
+    "brokerage_v3_post_quote_ticket",
+    "POST",
+    "/brokerage/v3/quoteticket",
+    body="order",
+    accept=["application/json"],
+    content_types=["application/json"],
+    response_types={"200": "Order", "404": None, "422": None, "500": None},
+)
+
 
 class BrokerageApi:
     """NOTE: This class is auto generated by OpenAPI Generator
@@ -47,8 +293,7 @@ class BrokerageApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
-    def brokerage_v1_get_instrument(
+    def _brokerage_v1_get_instrument_params(
         self,
         instrument_id: Annotated[
             StrictStr,
@@ -100,245 +345,15 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v1_get_instrument_serialize(
-            instrument_id=instrument_id,
-            with_attr=with_attr,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceInstrument",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v1_get_instrument_with_http_info(
-        self,
-        instrument_id: Annotated[
-            StrictStr,
-            Field(
-                description="Instrument identification - can be either the WKN, the ISIN or the symbol of the instrument"
-            ),
-        ],
-        with_attr: Annotated[
-            Optional[List[StrictStr]], Field(description="Enables attribute: orderDimensions")
-        ] = None,
-        without_attr: Annotated[Optional[List[StrictStr]], Field(description="Disables attribute: staticData")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceInstrument]:
-        """Request for an instrument's information
-
-
-        :param instrument_id: Instrument identification - can be either the WKN, the ISIN or the symbol of the instrument (required)
-        :type instrument_id: str
-        :param with_attr: Enables attribute: orderDimensions
-        :type with_attr: List[str]
-        :param without_attr: Disables attribute: staticData
-        :type without_attr: List[str]
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v1_get_instrument_serialize(
-            instrument_id=instrument_id,
-            with_attr=with_attr,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceInstrument",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v1_get_instrument_without_preload_content(
-        self,
-        instrument_id: Annotated[
-            StrictStr,
-            Field(
-                description="Instrument identification - can be either the WKN, the ISIN or the symbol of the instrument"
-            ),
-        ],
-        with_attr: Annotated[
-            Optional[List[StrictStr]], Field(description="Enables attribute: orderDimensions")
-        ] = None,
-        without_attr: Annotated[Optional[List[StrictStr]], Field(description="Disables attribute: staticData")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for an instrument's information
-
-
-        :param instrument_id: Instrument identification - can be either the WKN, the ISIN or the symbol of the instrument (required)
-        :type instrument_id: str
-        :param with_attr: Enables attribute: orderDimensions
-        :type with_attr: List[str]
-        :param without_attr: Disables attribute: staticData
-        :type without_attr: List[str]
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v1_get_instrument_serialize(
-            instrument_id=instrument_id,
-            with_attr=with_attr,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceInstrument",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v1_get_instrument_serialize(
-        self,
-        instrument_id,
-        with_attr,
-        without_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
+    (
+        brokerage_v1_get_instrument,
+        brokerage_v1_get_instrument_with_http_info,
+        brokerage_v1_get_instrument_without_preload_content,
+    ) = call_styles(_BROKERAGE_V1_GET_INSTRUMENT, _brokerage_v1_get_instrument_params)
 
-        _collection_formats: Dict[str, str] = {
-            "with-attr": "multi",
-            "without-attr": "multi",
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if instrument_id is not None:
-            _path_params["instrumentId"] = instrument_id
-        # process the query parameters
-        if with_attr is not None:
-
-            _query_params.append(("with-attr", with_attr))
-
-        if without_attr is not None:
-
-            _query_params.append(("without-attr", without_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/v1/instruments/{instrumentId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_delete_order(
+    def _brokerage_v3_delete_order_params(
         self,
         order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
         _request_timeout: Union[
@@ -377,33 +392,24 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_delete_order_serialize(
-            order_id=order_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
+    (
+        brokerage_v3_delete_order,
+        brokerage_v3_delete_order_with_http_info,
+        brokerage_v3_delete_order_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_DELETE_ORDER, _brokerage_v3_delete_order_params)
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_delete_order_with_http_info(
+    def _brokerage_v3_get_depot_position_params(
         self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
+        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
+        position_id: Annotated[
+            StrictStr, Field(description="Position identification number in securities account (as UUID)")
+        ],
+        with_attr: Annotated[
+            Optional[StrictStr],
+            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
+        ] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -413,12 +419,16 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Order cancellation.
+    ) -> DepotPosition:
+        """Request for retrieving a single position of specific depot.
 
 
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
+        :param depot_id: Reference to securities account number (as UUID). (required)
+        :type depot_id: str
+        :param position_id: Position identification number in securities account (as UUID) (required)
+        :type position_id: str
+        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
+        :type with_attr: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -440,33 +450,31 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_delete_order_serialize(
-            order_id=order_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
+    (
+        brokerage_v3_get_depot_position,
+        brokerage_v3_get_depot_position_with_http_info,
+        brokerage_v3_get_depot_position_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_GET_DEPOT_POSITION, _brokerage_v3_get_depot_position_params)
 
-    @validate_call
-    def brokerage_v3_delete_order_without_preload_content(
+    def _brokerage_v3_get_depot_positions_params(
         self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
+        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
+        instrument_id: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument."
+            ),
+        ] = None,
+        without_attr: Annotated[
+            Optional[List[StrictStr]],
+            Field(description="Disables attributes for this request. Allowed attributes: depot, positions"),
+        ] = None,
+        with_attr: Annotated[
+            Optional[StrictStr],
+            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
+        ] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -476,12 +484,18 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Order cancellation.
+    ) -> ListResourceDepotPosition:
+        """Request for securities positions, optionally including only the total balance with securities account information
 
 
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
+        :param depot_id: Reference to securities account number (as UUID). (required)
+        :type depot_id: str
+        :param instrument_id: Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument.
+        :type instrument_id: str
+        :param without_attr: Disables attributes for this request. Allowed attributes: depot, positions
+        :type without_attr: List[str]
+        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
+        :type with_attr: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -503,85 +517,27 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_delete_order_serialize(
-            order_id=order_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_delete_order_serialize(
-        self,
-        order_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if order_id is not None:
-            _path_params["orderId"] = order_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
+    (
+        brokerage_v3_get_depot_positions,
+        brokerage_v3_get_depot_positions_with_http_info,
+        brokerage_v3_get_depot_positions_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_GET_DEPOT_POSITIONS, _brokerage_v3_get_depot_positions_params)
 
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="DELETE",
-            resource_path="/brokerage/v3/orders/{orderId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depot_position(
+    def _brokerage_v3_get_depot_transactions_params(
         self,
         depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        position_id: Annotated[
-            StrictStr, Field(description="Position identification number in securities account (as UUID)")
-        ],
-        with_attr: Annotated[
+        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
+        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
+        instrument_id: Annotated[
+            Optional[StrictStr], Field(description="Instrument id (UUID), unique identification of an instrument.")
+        ] = None,
+        min_booking_date: Annotated[
             Optional[StrictStr],
-            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
+            Field(
+                description="Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d"
+            ),
         ] = None,
         _request_timeout: Union[
             None,
@@ -592,16 +548,20 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> DepotPosition:
-        """Request for retrieving a single position of specific depot.
+    ) -> ListResourceDepotTransaction:
+        """Depot transactions.
 
 
         :param depot_id: Reference to securities account number (as UUID). (required)
         :type depot_id: str
-        :param position_id: Position identification number in securities account (as UUID) (required)
-        :type position_id: str
-        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
-        :type with_attr: str
+        :param isin: ISIN
+        :type isin: str
+        :param wkn: WKN
+        :type wkn: str
+        :param instrument_id: Instrument id (UUID), unique identification of an instrument.
+        :type instrument_id: str
+        :param min_booking_date: Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d
+        :type min_booking_date: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -623,42 +583,20 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_get_depot_position_serialize(
-            depot_id=depot_id,
-            position_id=position_id,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DepotPosition",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    (
+        brokerage_v3_get_depot_transactions,
+        brokerage_v3_get_depot_transactions_with_http_info,
+        brokerage_v3_get_depot_transactions_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_GET_DEPOT_TRANSACTIONS, _brokerage_v3_get_depot_transactions_params)
 
-    @validate_call
-    def brokerage_v3_get_depot_position_with_http_info(
+    def _brokerage_v3_get_depots_params(
         self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        position_id: Annotated[
-            StrictStr, Field(description="Position identification number in securities account (as UUID)")
+        user_id: Annotated[
+            StrictStr,
+            Field(description="UUID of the user to search depots for, or the string 'user' to use the logged in user"),
         ],
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
-        ] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -668,16 +606,12 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[DepotPosition]:
-        """Request for retrieving a single position of specific depot.
+    ) -> ListResourceDepot:
+        """Request for a list of the master data for the securities accounts of the registered user
 
 
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param position_id: Position identification number in securities account (as UUID) (required)
-        :type position_id: str
-        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
-        :type with_attr: str
+        :param user_id: UUID of the user to search depots for, or the string 'user' to use the logged in user (required)
+        :type user_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -699,3711 +633,18 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_get_depot_position_serialize(
-            depot_id=depot_id,
-            position_id=position_id,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DepotPosition",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
+    (
+        brokerage_v3_get_depots,
+        brokerage_v3_get_depots_with_http_info,
+        brokerage_v3_get_depots_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_GET_DEPOTS, _brokerage_v3_get_depots_params)
 
-    @validate_call
-    def brokerage_v3_get_depot_position_without_preload_content(
+    def _brokerage_v3_get_order_params(
         self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        position_id: Annotated[
-            StrictStr, Field(description="Position identification number in securities account (as UUID)")
-        ],
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for retrieving a single position of specific depot.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param position_id: Position identification number in securities account (as UUID) (required)
-        :type position_id: str
-        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
-        :type with_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_position_serialize(
-            depot_id=depot_id,
-            position_id=position_id,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "DepotPosition",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_depot_position_serialize(
-        self,
-        depot_id,
-        position_id,
-        with_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if depot_id is not None:
-            _path_params["depotId"] = depot_id
-        if position_id is not None:
-            _path_params["positionId"] = position_id
-        # process the query parameters
-        if with_attr is not None:
-
-            _query_params.append(("with-attr", with_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/v3/depots/{depotId}/positions/{positionId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depot_positions(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument."
-            ),
-        ] = None,
-        without_attr: Annotated[
-            Optional[List[StrictStr]],
-            Field(description="Disables attributes for this request. Allowed attributes: depot, positions"),
-        ] = None,
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceDepotPosition:
-        """Request for securities positions, optionally including only the total balance with securities account information
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param instrument_id: Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument.
-        :type instrument_id: str
-        :param without_attr: Disables attributes for this request. Allowed attributes: depot, positions
-        :type without_attr: List[str]
-        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
-        :type with_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_positions_serialize(
-            depot_id=depot_id,
-            instrument_id=instrument_id,
-            without_attr=without_attr,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepotPosition",
-            "404": None,
-            "422": None,
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_depot_positions_with_http_info(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument."
-            ),
-        ] = None,
-        without_attr: Annotated[
-            Optional[List[StrictStr]],
-            Field(description="Disables attributes for this request. Allowed attributes: depot, positions"),
-        ] = None,
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceDepotPosition]:
-        """Request for securities positions, optionally including only the total balance with securities account information
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param instrument_id: Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument.
-        :type instrument_id: str
-        :param without_attr: Disables attributes for this request. Allowed attributes: depot, positions
-        :type without_attr: List[str]
-        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
-        :type with_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_positions_serialize(
-            depot_id=depot_id,
-            instrument_id=instrument_id,
-            without_attr=without_attr,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepotPosition",
-            "404": None,
-            "422": None,
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depot_positions_without_preload_content(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument."
-            ),
-        ] = None,
-        without_attr: Annotated[
-            Optional[List[StrictStr]],
-            Field(description="Disables attributes for this request. Allowed attributes: depot, positions"),
-        ] = None,
-        with_attr: Annotated[
-            Optional[StrictStr],
-            Field(description="Enables additional attributes for this request. Allowed attributes: instrument"),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for securities positions, optionally including only the total balance with securities account information
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param instrument_id: Instrument identification - can either be the WKN, the ISIN or the UUID of the instrument.
-        :type instrument_id: str
-        :param without_attr: Disables attributes for this request. Allowed attributes: depot, positions
-        :type without_attr: List[str]
-        :param with_attr: Enables additional attributes for this request. Allowed attributes: instrument
-        :type with_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_positions_serialize(
-            depot_id=depot_id,
-            instrument_id=instrument_id,
-            without_attr=without_attr,
-            with_attr=with_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepotPosition",
-            "404": None,
-            "422": None,
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_depot_positions_serialize(
-        self,
-        depot_id,
-        instrument_id,
-        without_attr,
-        with_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {
-            "without-attr": "multi",
-        }
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if depot_id is not None:
-            _path_params["depotId"] = depot_id
-        # process the query parameters
-        if instrument_id is not None:
-
-            _query_params.append(("instrumentId", instrument_id))
-
-        if without_attr is not None:
-
-            _query_params.append(("without-attr", without_attr))
-
-        if with_attr is not None:
-
-            _query_params.append(("with-attr", with_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/v3/depots/{depotId}/positions",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depot_transactions(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        instrument_id: Annotated[
-            Optional[StrictStr], Field(description="Instrument id (UUID), unique identification of an instrument.")
-        ] = None,
-        min_booking_date: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d"
-            ),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceDepotTransaction:
-        """Depot transactions.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument.
-        :type instrument_id: str
-        :param min_booking_date: Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d
-        :type min_booking_date: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_transactions_serialize(
-            depot_id=depot_id,
-            isin=isin,
-            wkn=wkn,
-            instrument_id=instrument_id,
-            min_booking_date=min_booking_date,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepotTransaction",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_depot_transactions_with_http_info(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        instrument_id: Annotated[
-            Optional[StrictStr], Field(description="Instrument id (UUID), unique identification of an instrument.")
-        ] = None,
-        min_booking_date: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d"
-            ),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceDepotTransaction]:
-        """Depot transactions.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument.
-        :type instrument_id: str
-        :param min_booking_date: Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d
-        :type min_booking_date: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_transactions_serialize(
-            depot_id=depot_id,
-            isin=isin,
-            wkn=wkn,
-            instrument_id=instrument_id,
-            min_booking_date=min_booking_date,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepotTransaction",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depot_transactions_without_preload_content(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        instrument_id: Annotated[
-            Optional[StrictStr], Field(description="Instrument id (UUID), unique identification of an instrument.")
-        ] = None,
-        min_booking_date: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d"
-            ),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Depot transactions.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument.
-        :type instrument_id: str
-        :param min_booking_date: Earliest booking date of the transaction. Format: YYYY-MM-DD or as negative offset from the current date e.g. -10d
-        :type min_booking_date: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depot_transactions_serialize(
-            depot_id=depot_id,
-            isin=isin,
-            wkn=wkn,
-            instrument_id=instrument_id,
-            min_booking_date=min_booking_date,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepotTransaction",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_depot_transactions_serialize(
-        self,
-        depot_id,
-        isin,
-        wkn,
-        instrument_id,
-        min_booking_date,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if depot_id is not None:
-            _path_params["depotId"] = depot_id
-        # process the query parameters
-        if isin is not None:
-
-            _query_params.append(("isin", isin))
-
-        if wkn is not None:
-
-            _query_params.append(("wkn", wkn))
-
-        if instrument_id is not None:
-
-            _query_params.append(("instrumentId", instrument_id))
-
-        if min_booking_date is not None:
-
-            _query_params.append(("min-bookingDate", min_booking_date))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/v3/depots/{depotId}/transactions",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depots(
-        self,
-        user_id: Annotated[
-            StrictStr,
-            Field(description="UUID of the user to search depots for, or the string 'user' to use the logged in user"),
-        ],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceDepot:
-        """Request for a list of the master data for the securities accounts of the registered user
-
-
-        :param user_id: UUID of the user to search depots for, or the string 'user' to use the logged in user (required)
-        :type user_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depots_serialize(
-            user_id=user_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepot",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_depots_with_http_info(
-        self,
-        user_id: Annotated[
-            StrictStr,
-            Field(description="UUID of the user to search depots for, or the string 'user' to use the logged in user"),
-        ],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceDepot]:
-        """Request for a list of the master data for the securities accounts of the registered user
-
-
-        :param user_id: UUID of the user to search depots for, or the string 'user' to use the logged in user (required)
-        :type user_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depots_serialize(
-            user_id=user_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepot",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_depots_without_preload_content(
-        self,
-        user_id: Annotated[
-            StrictStr,
-            Field(description="UUID of the user to search depots for, or the string 'user' to use the logged in user"),
-        ],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for a list of the master data for the securities accounts of the registered user
-
-
-        :param user_id: UUID of the user to search depots for, or the string 'user' to use the logged in user (required)
-        :type user_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_depots_serialize(
-            user_id=user_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDepot",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_depots_serialize(
-        self,
-        user_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if user_id is not None:
-            _path_params["userId"] = user_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/clients/{userId}/v3/depots",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_order(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Unique orderId (UUID).")],
-        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Order:
-        """Delivers an order for the given orderId.
-
-
-        :param order_id: Unique orderId (UUID). (required)
-        :type order_id: str
-        :param without_attr: Disables attribute: executions.
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_serialize(
-            order_id=order_id,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_order_with_http_info(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Unique orderId (UUID).")],
-        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Delivers an order for the given orderId.
-
-
-        :param order_id: Unique orderId (UUID). (required)
-        :type order_id: str
-        :param without_attr: Disables attribute: executions.
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_serialize(
-            order_id=order_id,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_order_without_preload_content(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Unique orderId (UUID).")],
-        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Delivers an order for the given orderId.
-
-
-        :param order_id: Unique orderId (UUID). (required)
-        :type order_id: str
-        :param without_attr: Disables attribute: executions.
-        :type without_attr: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_serialize(
-            order_id=order_id,
-            without_attr=without_attr,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_order_serialize(
-        self,
-        order_id,
-        without_attr,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if order_id is not None:
-            _path_params["orderId"] = order_id
-        # process the query parameters
-        if without_attr is not None:
-
-            _query_params.append(("without-attr", without_attr))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/v3/orders/{orderId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_order_cost_indication_ex_ante(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceCostIndicationExAnte:
-        """Generation of the ex-ante cost indication on the basis of the order data.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param order: The Order for which the cost indication is to be calculated (required)
-        :type order: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_cost_indication_ex_ante_serialize(
-            order_id=order_id,
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "ListResourceCostIndicationExAnte",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_order_cost_indication_ex_ante_with_http_info(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceCostIndicationExAnte]:
-        """Generation of the ex-ante cost indication on the basis of the order data.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param order: The Order for which the cost indication is to be calculated (required)
-        :type order: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_cost_indication_ex_ante_serialize(
-            order_id=order_id,
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "ListResourceCostIndicationExAnte",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_order_cost_indication_ex_ante_without_preload_content(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Generation of the ex-ante cost indication on the basis of the order data.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param order: The Order for which the cost indication is to be calculated (required)
-        :type order: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_cost_indication_ex_ante_serialize(
-            order_id=order_id,
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "ListResourceCostIndicationExAnte",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_order_cost_indication_ex_ante_serialize(
-        self,
-        order_id,
-        order,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if order_id is not None:
-            _path_params["orderId"] = order_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if order is not None:
-            _body_params = order
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders/{orderId}/costindicationexante",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_order_dimensions(
-        self,
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
-            ),
-        ] = None,
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        custody_type: Annotated[Optional[StrictStr], Field(description="The custody type.")] = None,
-        venue_id: Annotated[
-            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
-        ] = None,
-        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
-        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types.")] = None,
-        country: Annotated[Optional[StrictStr], Field(description="Country of venue in ISO 3166-2.")] = None,
-        type: Annotated[Optional[StrictStr], Field(description="Type of venue.")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceDimensions:
-        """Request for the trading venue and order options for a particular instrument
-
-
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
-        :type instrument_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param custody_type: The custody type.
-        :type custody_type: str
-        :param venue_id: Venue id (UUID), unique identification of a venue.
-        :type venue_id: str
-        :param order_type: The order type.
-        :type order_type: str
-        :param side: Possible transaction types.
-        :type side: str
-        :param country: Country of venue in ISO 3166-2.
-        :type country: str
-        :param type: Type of venue.
-        :type type: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_dimensions_serialize(
-            instrument_id=instrument_id,
-            isin=isin,
-            wkn=wkn,
-            custody_type=custody_type,
-            venue_id=venue_id,
-            order_type=order_type,
-            side=side,
-            country=country,
-            type=type,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDimensions",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_order_dimensions_with_http_info(
-        self,
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
-            ),
-        ] = None,
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        custody_type: Annotated[Optional[StrictStr], Field(description="The custody type.")] = None,
-        venue_id: Annotated[
-            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
-        ] = None,
-        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
-        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types.")] = None,
-        country: Annotated[Optional[StrictStr], Field(description="Country of venue in ISO 3166-2.")] = None,
-        type: Annotated[Optional[StrictStr], Field(description="Type of venue.")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceDimensions]:
-        """Request for the trading venue and order options for a particular instrument
-
-
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
-        :type instrument_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param custody_type: The custody type.
-        :type custody_type: str
-        :param venue_id: Venue id (UUID), unique identification of a venue.
-        :type venue_id: str
-        :param order_type: The order type.
-        :type order_type: str
-        :param side: Possible transaction types.
-        :type side: str
-        :param country: Country of venue in ISO 3166-2.
-        :type country: str
-        :param type: Type of venue.
-        :type type: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_dimensions_serialize(
-            instrument_id=instrument_id,
-            isin=isin,
-            wkn=wkn,
-            custody_type=custody_type,
-            venue_id=venue_id,
-            order_type=order_type,
-            side=side,
-            country=country,
-            type=type,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDimensions",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_order_dimensions_without_preload_content(
-        self,
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
-            ),
-        ] = None,
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        custody_type: Annotated[Optional[StrictStr], Field(description="The custody type.")] = None,
-        venue_id: Annotated[
-            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
-        ] = None,
-        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
-        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types.")] = None,
-        country: Annotated[Optional[StrictStr], Field(description="Country of venue in ISO 3166-2.")] = None,
-        type: Annotated[Optional[StrictStr], Field(description="Type of venue.")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Request for the trading venue and order options for a particular instrument
-
-
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
-        :type instrument_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param custody_type: The custody type.
-        :type custody_type: str
-        :param venue_id: Venue id (UUID), unique identification of a venue.
-        :type venue_id: str
-        :param order_type: The order type.
-        :type order_type: str
-        :param side: Possible transaction types.
-        :type side: str
-        :param country: Country of venue in ISO 3166-2.
-        :type country: str
-        :param type: Type of venue.
-        :type type: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_order_dimensions_serialize(
-            instrument_id=instrument_id,
-            isin=isin,
-            wkn=wkn,
-            custody_type=custody_type,
-            venue_id=venue_id,
-            order_type=order_type,
-            side=side,
-            country=country,
-            type=type,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDimensions",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_order_dimensions_serialize(
-        self,
-        instrument_id,
-        isin,
-        wkn,
-        custody_type,
-        venue_id,
-        order_type,
-        side,
-        country,
-        type,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        if instrument_id is not None:
-
-            _query_params.append(("instrumentId", instrument_id))
-
-        if isin is not None:
-
-            _query_params.append(("isin", isin))
-
-        if wkn is not None:
-
-            _query_params.append(("wkn", wkn))
-
-        if custody_type is not None:
-
-            _query_params.append(("custodyType", custody_type))
-
-        if venue_id is not None:
-
-            _query_params.append(("venueId", venue_id))
-
-        if order_type is not None:
-
-            _query_params.append(("orderType", order_type))
-
-        if side is not None:
-
-            _query_params.append(("side", side))
-
-        if country is not None:
-
-            _query_params.append(("country", country))
-
-        if type is not None:
-
-            _query_params.append(("type", type))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/v3/orders/dimensions",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_orders(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        with_attr: Annotated[Optional[StrictStr], Field(description="enables attribute: instrument.")] = None,
-        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
-            ),
-        ] = None,
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        order_status: Annotated[Optional[StrictStr], Field(description="Status of the order.")] = None,
-        venue_id: Annotated[
-            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
-        ] = None,
-        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
-        min_creation_time_stamp: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
-            ),
-        ] = None,
-        max_creation_time_stamp: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
-            ),
-        ] = None,
-        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceOrder:
-        """Delivers a list of all orders for the given depotId.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param with_attr: enables attribute: instrument.
-        :type with_attr: str
-        :param without_attr: Disables attribute: executions.
-        :type without_attr: str
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
-        :type instrument_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param order_status: Status of the order.
-        :type order_status: str
-        :param venue_id: Venue id (UUID), unique identification of a venue.
-        :type venue_id: str
-        :param order_type: The order type.
-        :type order_type: str
-        :param min_creation_time_stamp: Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
-        :type min_creation_time_stamp: str
-        :param max_creation_time_stamp: Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
-        :type max_creation_time_stamp: str
-        :param side: Possible transaction types
-        :type side: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_orders_serialize(
-            depot_id=depot_id,
-            with_attr=with_attr,
-            without_attr=without_attr,
-            instrument_id=instrument_id,
-            isin=isin,
-            wkn=wkn,
-            order_status=order_status,
-            venue_id=venue_id,
-            order_type=order_type,
-            min_creation_time_stamp=min_creation_time_stamp,
-            max_creation_time_stamp=max_creation_time_stamp,
-            side=side,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceOrder",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_orders_with_http_info(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        with_attr: Annotated[Optional[StrictStr], Field(description="enables attribute: instrument.")] = None,
-        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
-            ),
-        ] = None,
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        order_status: Annotated[Optional[StrictStr], Field(description="Status of the order.")] = None,
-        venue_id: Annotated[
-            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
-        ] = None,
-        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
-        min_creation_time_stamp: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
-            ),
-        ] = None,
-        max_creation_time_stamp: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
-            ),
-        ] = None,
-        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceOrder]:
-        """Delivers a list of all orders for the given depotId.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param with_attr: enables attribute: instrument.
-        :type with_attr: str
-        :param without_attr: Disables attribute: executions.
-        :type without_attr: str
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
-        :type instrument_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param order_status: Status of the order.
-        :type order_status: str
-        :param venue_id: Venue id (UUID), unique identification of a venue.
-        :type venue_id: str
-        :param order_type: The order type.
-        :type order_type: str
-        :param min_creation_time_stamp: Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
-        :type min_creation_time_stamp: str
-        :param max_creation_time_stamp: Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
-        :type max_creation_time_stamp: str
-        :param side: Possible transaction types
-        :type side: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_orders_serialize(
-            depot_id=depot_id,
-            with_attr=with_attr,
-            without_attr=without_attr,
-            instrument_id=instrument_id,
-            isin=isin,
-            wkn=wkn,
-            order_status=order_status,
-            venue_id=venue_id,
-            order_type=order_type,
-            min_creation_time_stamp=min_creation_time_stamp,
-            max_creation_time_stamp=max_creation_time_stamp,
-            side=side,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceOrder",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_orders_without_preload_content(
-        self,
-        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
-        with_attr: Annotated[Optional[StrictStr], Field(description="enables attribute: instrument.")] = None,
-        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
-        instrument_id: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
-            ),
-        ] = None,
-        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
-        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
-        order_status: Annotated[Optional[StrictStr], Field(description="Status of the order.")] = None,
-        venue_id: Annotated[
-            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
-        ] = None,
-        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
-        min_creation_time_stamp: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
-            ),
-        ] = None,
-        max_creation_time_stamp: Annotated[
-            Optional[StrictStr],
-            Field(
-                description="Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
-            ),
-        ] = None,
-        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types")] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Delivers a list of all orders for the given depotId.
-
-
-        :param depot_id: Reference to securities account number (as UUID). (required)
-        :type depot_id: str
-        :param with_attr: enables attribute: instrument.
-        :type with_attr: str
-        :param without_attr: Disables attribute: executions.
-        :type without_attr: str
-        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
-        :type instrument_id: str
-        :param isin: ISIN
-        :type isin: str
-        :param wkn: WKN
-        :type wkn: str
-        :param order_status: Status of the order.
-        :type order_status: str
-        :param venue_id: Venue id (UUID), unique identification of a venue.
-        :type venue_id: str
-        :param order_type: The order type.
-        :type order_type: str
-        :param min_creation_time_stamp: Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
-        :type min_creation_time_stamp: str
-        :param max_creation_time_stamp: Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
-        :type max_creation_time_stamp: str
-        :param side: Possible transaction types
-        :type side: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_orders_serialize(
-            depot_id=depot_id,
-            with_attr=with_attr,
-            without_attr=without_attr,
-            instrument_id=instrument_id,
-            isin=isin,
-            wkn=wkn,
-            order_status=order_status,
-            venue_id=venue_id,
-            order_type=order_type,
-            min_creation_time_stamp=min_creation_time_stamp,
-            max_creation_time_stamp=max_creation_time_stamp,
-            side=side,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceOrder",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_orders_serialize(
-        self,
-        depot_id,
-        with_attr,
-        without_attr,
-        instrument_id,
-        isin,
-        wkn,
-        order_status,
-        venue_id,
-        order_type,
-        min_creation_time_stamp,
-        max_creation_time_stamp,
-        side,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if depot_id is not None:
-            _path_params["depotId"] = depot_id
-        # process the query parameters
-        if with_attr is not None:
-
-            _query_params.append(("with-attr", with_attr))
-
-        if without_attr is not None:
-
-            _query_params.append(("without-attr", without_attr))
-
-        if instrument_id is not None:
-
-            _query_params.append(("instrumentId", instrument_id))
-
-        if isin is not None:
-
-            _query_params.append(("isin", isin))
-
-        if wkn is not None:
-
-            _query_params.append(("wkn", wkn))
-
-        if order_status is not None:
-
-            _query_params.append(("orderStatus", order_status))
-
-        if venue_id is not None:
-
-            _query_params.append(("venueId", venue_id))
-
-        if order_type is not None:
-
-            _query_params.append(("orderType", order_type))
-
-        if min_creation_time_stamp is not None:
-
-            _query_params.append(("min-creationTimeStamp", min_creation_time_stamp))
-
-        if max_creation_time_stamp is not None:
-
-            _query_params.append(("max-creationTimeStamp", max_creation_time_stamp))
-
-        if side is not None:
-
-            _query_params.append(("side", side))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/brokerage/depots/{depotId}/v3/orders",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_get_orders_cost_indication_ex_ante(
-        self,
-        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ListResourceCostIndicationExAnte:
-        """Generation of the ex-ante cost indication on the basis of the order data.
-
-
-        :param order: The Order for which the cost indication is to be calculated (required)
-        :type order: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_orders_cost_indication_ex_ante_serialize(
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "ListResourceCostIndicationExAnte",
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_get_orders_cost_indication_ex_ante_with_http_info(
-        self,
-        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceCostIndicationExAnte]:
-        """Generation of the ex-ante cost indication on the basis of the order data.
-
-
-        :param order: The Order for which the cost indication is to be calculated (required)
-        :type order: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_orders_cost_indication_ex_ante_serialize(
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "ListResourceCostIndicationExAnte",
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_get_orders_cost_indication_ex_ante_without_preload_content(
-        self,
-        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Generation of the ex-ante cost indication on the basis of the order data.
-
-
-        :param order: The Order for which the cost indication is to be calculated (required)
-        :type order: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_get_orders_cost_indication_ex_ante_serialize(
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "ListResourceCostIndicationExAnte",
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_get_orders_cost_indication_ex_ante_serialize(
-        self,
-        order,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if order is not None:
-            _body_params = order
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders/costindicationexante",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_patch_order(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[Order] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Order:
-        """Order modification.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_patch_order_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_patch_order_with_http_info(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[Order] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Order modification.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_patch_order_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_patch_order_without_preload_content(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[Order] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Order modification.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_patch_order_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_patch_order_serialize(
-        self,
-        order_id,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if order_id is not None:
-            _path_params["orderId"] = order_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/brokerage/v3/orders/{orderId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_patch_quote_ticket(
-        self,
-        ticket_id: Annotated[StrictStr, Field(description="Reference to the quote ticket (as UUID).")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> None:
-        """Initiate a TAN-Challange
-
-
-        :param ticket_id: Reference to the quote ticket (as UUID). (required)
-        :type ticket_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_patch_quote_ticket_serialize(
-            ticket_id=ticket_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_patch_quote_ticket_with_http_info(
-        self,
-        ticket_id: Annotated[StrictStr, Field(description="Reference to the quote ticket (as UUID).")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[None]:
-        """Initiate a TAN-Challange
-
-
-        :param ticket_id: Reference to the quote ticket (as UUID). (required)
-        :type ticket_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_patch_quote_ticket_serialize(
-            ticket_id=ticket_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_patch_quote_ticket_without_preload_content(
-        self,
-        ticket_id: Annotated[StrictStr, Field(description="Reference to the quote ticket (as UUID).")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Initiate a TAN-Challange
-
-
-        :param ticket_id: Reference to the quote ticket (as UUID). (required)
-        :type ticket_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_patch_quote_ticket_serialize(
-            ticket_id=ticket_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_patch_quote_ticket_serialize(
-        self,
-        ticket_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if ticket_id is not None:
-            _path_params["ticketId"] = ticket_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/brokerage/v3/quoteticket/{ticketId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_post_order(
-        self,
-        body: Optional[Order] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Order:
-        """Order entry.
-
-
-        :param body:
-        :type body: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_post_order_with_http_info(
-        self,
-        body: Optional[Order] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Order entry.
-
-
-        :param body:
-        :type body: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_post_order_without_preload_content(
-        self,
-        body: Optional[Order] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Order entry.
-
-
-        :param body:
-        :type body: Order
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_post_order_serialize(
-        self,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_post_order_prevalidation(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Order:
-        """Prevalidation of an order modfication
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_prevalidation_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_post_order_prevalidation_with_http_info(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Prevalidation of an order modfication
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_prevalidation_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_post_order_prevalidation_without_preload_content(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Prevalidation of an order modfication
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_prevalidation_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_post_order_prevalidation_serialize(
-        self,
-        order_id,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if order_id is not None:
-            _path_params["orderId"] = order_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders/{orderId}/prevalidation",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_post_order_validation(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[StrictStr] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Order:
-        """Validation of an order modification or order cancellation and triggering of a TAN Challenge in a non-usage case of a Session-TAN.
-
-
-        :param order_id: Reference to order identifier (as UUID). (required)
-        :type order_id: str
-        :param body:
-        :type body: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._brokerage_v3_post_order_validation_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def brokerage_v3_post_order_validation_with_http_info(
-        self,
-        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[StrictStr] = None,
+        order_id: Annotated[StrictStr, Field(description="Unique orderId (UUID).")],
+        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -4413,14 +654,14 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Validation of an order modification or order cancellation and triggering of a TAN Challenge in a non-usage case of a Session-TAN.
+    ) -> Order:
+        """Delivers an order for the given orderId.
 
 
-        :param order_id: Reference to order identifier (as UUID). (required)
+        :param order_id: Unique orderId (UUID). (required)
         :type order_id: str
-        :param body:
-        :type body: str
+        :param without_attr: Disables attribute: executions.
+        :type without_attr: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -4442,35 +683,16 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_order_validation_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
+    brokerage_v3_get_order, brokerage_v3_get_order_with_http_info, brokerage_v3_get_order_without_preload_content = (
+        call_styles(_BROKERAGE_V3_GET_ORDER, _brokerage_v3_get_order_params)
+    )
 
-    @validate_call
-    def brokerage_v3_post_order_validation_without_preload_content(
+    def _brokerage_v3_get_order_cost_indication_ex_ante_params(
         self,
         order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
-        body: Optional[StrictStr] = None,
+        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -4480,14 +702,14 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Validation of an order modification or order cancellation and triggering of a TAN Challenge in a non-usage case of a Session-TAN.
+    ) -> ListResourceCostIndicationExAnte:
+        """Generation of the ex-ante cost indication on the basis of the order data.
 
 
         :param order_id: Reference to order identifier (as UUID). (required)
         :type order_id: str
-        :param body:
-        :type body: str
+        :param order: The Order for which the cost indication is to be calculated (required)
+        :type order: Order
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -4509,91 +731,34 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_order_validation_serialize(
-            order_id=order_id,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_post_order_validation_serialize(
-        self,
-        order_id,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if order_id is not None:
-            _path_params["orderId"] = order_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders/{orderId}/validation",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
+    (
+        brokerage_v3_get_order_cost_indication_ex_ante,
+        brokerage_v3_get_order_cost_indication_ex_ante_with_http_info,
+        brokerage_v3_get_order_cost_indication_ex_ante_without_preload_content,
+    ) = call_styles(
+        _BROKERAGE_V3_GET_ORDER_COST_INDICATION_EX_ANTE, _brokerage_v3_get_order_cost_indication_ex_ante_params
+    )
 
-    @validate_call
-    def brokerage_v3_post_orders_prevalidation(
+    def _brokerage_v3_get_order_dimensions_params(
         self,
-        body: Optional[Order] = None,
+        instrument_id: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
+            ),
+        ] = None,
+        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
+        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
+        custody_type: Annotated[Optional[StrictStr], Field(description="The custody type.")] = None,
+        venue_id: Annotated[
+            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
+        ] = None,
+        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
+        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types.")] = None,
+        country: Annotated[Optional[StrictStr], Field(description="Country of venue in ISO 3166-2.")] = None,
+        type: Annotated[Optional[StrictStr], Field(description="Type of venue.")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -4603,12 +768,28 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Order:
-        """Prevalidation of the order
+    ) -> ListResourceDimensions:
+        """Request for the trading venue and order options for a particular instrument
 
 
-        :param body:
-        :type body: Order
+        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
+        :type instrument_id: str
+        :param isin: ISIN
+        :type isin: str
+        :param wkn: WKN
+        :type wkn: str
+        :param custody_type: The custody type.
+        :type custody_type: str
+        :param venue_id: Venue id (UUID), unique identification of a venue.
+        :type venue_id: str
+        :param order_type: The order type.
+        :type order_type: str
+        :param side: Possible transaction types.
+        :type side: str
+        :param country: Country of venue in ISO 3166-2.
+        :type country: str
+        :param type: Type of venue.
+        :type type: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -4630,32 +811,45 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_orders_prevalidation_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    (
+        brokerage_v3_get_order_dimensions,
+        brokerage_v3_get_order_dimensions_with_http_info,
+        brokerage_v3_get_order_dimensions_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_GET_ORDER_DIMENSIONS, _brokerage_v3_get_order_dimensions_params)
 
-    @validate_call
-    def brokerage_v3_post_orders_prevalidation_with_http_info(
+    def _brokerage_v3_get_orders_params(
         self,
-        body: Optional[Order] = None,
+        depot_id: Annotated[StrictStr, Field(description="Reference to securities account number (as UUID).")],
+        with_attr: Annotated[Optional[StrictStr], Field(description="enables attribute: instrument.")] = None,
+        without_attr: Annotated[Optional[StrictStr], Field(description="Disables attribute: executions.")] = None,
+        instrument_id: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Instrument id (UUID), unique identification of an instrument (security, derivative, etc.)."
+            ),
+        ] = None,
+        isin: Annotated[Optional[StrictStr], Field(description="ISIN")] = None,
+        wkn: Annotated[Optional[StrictStr], Field(description="WKN")] = None,
+        order_status: Annotated[Optional[StrictStr], Field(description="Status of the order.")] = None,
+        venue_id: Annotated[
+            Optional[StrictStr], Field(description="Venue id (UUID), unique identification of a venue.")
+        ] = None,
+        order_type: Annotated[Optional[StrictStr], Field(description="The order type.")] = None,
+        min_creation_time_stamp: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
+            ),
+        ] = None,
+        max_creation_time_stamp: Annotated[
+            Optional[StrictStr],
+            Field(
+                description="Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz."
+            ),
+        ] = None,
+        side: Annotated[Optional[StrictStr], Field(description="Possible transaction types")] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -4665,12 +859,34 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Prevalidation of the order
+    ) -> ListResourceOrder:
+        """Delivers a list of all orders for the given depotId.
 
 
-        :param body:
-        :type body: Order
+        :param depot_id: Reference to securities account number (as UUID). (required)
+        :type depot_id: str
+        :param with_attr: enables attribute: instrument.
+        :type with_attr: str
+        :param without_attr: Disables attribute: executions.
+        :type without_attr: str
+        :param instrument_id: Instrument id (UUID), unique identification of an instrument (security, derivative, etc.).
+        :type instrument_id: str
+        :param isin: ISIN
+        :type isin: str
+        :param wkn: WKN
+        :type wkn: str
+        :param order_status: Status of the order.
+        :type order_status: str
+        :param venue_id: Venue id (UUID), unique identification of a venue.
+        :type venue_id: str
+        :param order_type: The order type.
+        :type order_type: str
+        :param min_creation_time_stamp: Minimum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
+        :type min_creation_time_stamp: str
+        :param max_creation_time_stamp: Maximum value of order's creation timestamp in UTC with the following format: YYYY-MM-DDThh:mm:ss,ffffff+zz.
+        :type max_creation_time_stamp: str
+        :param side: Possible transaction types
+        :type side: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -4692,32 +908,17 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_orders_prevalidation_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
+    (
+        brokerage_v3_get_orders,
+        brokerage_v3_get_orders_with_http_info,
+        brokerage_v3_get_orders_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_GET_ORDERS, _brokerage_v3_get_orders_params)
 
-    @validate_call
-    def brokerage_v3_post_orders_prevalidation_without_preload_content(
+    def _brokerage_v3_get_orders_cost_indication_ex_ante_params(
         self,
-        body: Optional[Order] = None,
+        order: Annotated[Order, Field(description="The Order for which the cost indication is to be calculated")],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -4727,12 +928,12 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Prevalidation of the order
+    ) -> ListResourceCostIndicationExAnte:
+        """Generation of the ex-ante cost indication on the basis of the order data.
 
 
-        :param body:
-        :type body: Order
+        :param order: The Order for which the cost indication is to be calculated (required)
+        :type order: Order
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -4754,85 +955,19 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_orders_prevalidation_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
+    (
+        brokerage_v3_get_orders_cost_indication_ex_ante,
+        brokerage_v3_get_orders_cost_indication_ex_ante_with_http_info,
+        brokerage_v3_get_orders_cost_indication_ex_ante_without_preload_content,
+    ) = call_styles(
+        _BROKERAGE_V3_GET_ORDERS_COST_INDICATION_EX_ANTE, _brokerage_v3_get_orders_cost_indication_ex_ante_params
+    )
 
-    def _brokerage_v3_post_orders_prevalidation_serialize(
-        self,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders/prevalidation",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_post_orders_validation(
+    def _brokerage_v3_patch_order_params(
         self,
+        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
         body: Optional[Order] = None,
         _request_timeout: Union[
             None,
@@ -4844,9 +979,11 @@ class BrokerageApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> Order:
-        """Validation of an order entry and triggering of a TAN-Challenge in a non-usage case of a Session-TAN.
+        """Order modification.
 
 
+        :param order_id: Reference to order identifier (as UUID). (required)
+        :type order_id: str
         :param body:
         :type body: Order
         :param _request_timeout: timeout setting for this request. If one
@@ -4870,32 +1007,17 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_orders_validation_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    (
+        brokerage_v3_patch_order,
+        brokerage_v3_patch_order_with_http_info,
+        brokerage_v3_patch_order_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_PATCH_ORDER, _brokerage_v3_patch_order_params)
 
-    @validate_call
-    def brokerage_v3_post_orders_validation_with_http_info(
+    def _brokerage_v3_patch_quote_ticket_params(
         self,
-        body: Optional[Order] = None,
+        ticket_id: Annotated[StrictStr, Field(description="Reference to the quote ticket (as UUID).")],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -4905,12 +1027,12 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Validation of an order entry and triggering of a TAN-Challenge in a non-usage case of a Session-TAN.
+    ) -> None:
+        """Initiate a TAN-Challange
 
 
-        :param body:
-        :type body: Order
+        :param ticket_id: Reference to the quote ticket (as UUID). (required)
+        :type ticket_id: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -4932,30 +1054,15 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_orders_validation_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
+    (
+        brokerage_v3_patch_quote_ticket,
+        brokerage_v3_patch_quote_ticket_with_http_info,
+        brokerage_v3_patch_quote_ticket_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_PATCH_QUOTE_TICKET, _brokerage_v3_patch_quote_ticket_params)
 
-    @validate_call
-    def brokerage_v3_post_orders_validation_without_preload_content(
+    def _brokerage_v3_post_order_params(
         self,
         body: Optional[Order] = None,
         _request_timeout: Union[
@@ -4967,8 +1074,8 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Validation of an order entry and triggering of a TAN-Challenge in a non-usage case of a Session-TAN.
+    ) -> Order:
+        """Order entry.
 
 
         :param body:
@@ -4994,86 +1101,18 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_orders_validation_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "201": "Order",
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_post_orders_validation_serialize(
-        self,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/orders/validation",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
+    (
+        brokerage_v3_post_order,
+        brokerage_v3_post_order_with_http_info,
+        brokerage_v3_post_order_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_ORDER, _brokerage_v3_post_order_params)
 
-    @validate_call
-    def brokerage_v3_post_quote_request(
+    def _brokerage_v3_post_order_prevalidation_params(
         self,
-        body: Optional[Quote] = None,
+        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
+        body: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -5083,12 +1122,14 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Quote:
-        """Sends a quote request to a venue
+    ) -> Order:
+        """Prevalidation of an order modfication
 
 
+        :param order_id: Reference to order identifier (as UUID). (required)
+        :type order_id: str
         :param body:
-        :type body: Quote
+        :type body: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -5110,32 +1151,18 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_quote_request_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Quote",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    (
+        brokerage_v3_post_order_prevalidation,
+        brokerage_v3_post_order_prevalidation_with_http_info,
+        brokerage_v3_post_order_prevalidation_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_ORDER_PREVALIDATION, _brokerage_v3_post_order_prevalidation_params)
 
-    @validate_call
-    def brokerage_v3_post_quote_request_with_http_info(
+    def _brokerage_v3_post_order_validation_params(
         self,
-        body: Optional[Quote] = None,
+        order_id: Annotated[StrictStr, Field(description="Reference to order identifier (as UUID).")],
+        body: Optional[StrictStr] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -5145,12 +1172,14 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Quote]:
-        """Sends a quote request to a venue
+    ) -> Order:
+        """Validation of an order modification or order cancellation and triggering of a TAN Challenge in a non-usage case of a Session-TAN.
 
 
+        :param order_id: Reference to order identifier (as UUID). (required)
+        :type order_id: str
         :param body:
-        :type body: Quote
+        :type body: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -5172,32 +1201,17 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_quote_request_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
+    (
+        brokerage_v3_post_order_validation,
+        brokerage_v3_post_order_validation_with_http_info,
+        brokerage_v3_post_order_validation_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_ORDER_VALIDATION, _brokerage_v3_post_order_validation_params)
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Quote",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def brokerage_v3_post_quote_request_without_preload_content(
+    def _brokerage_v3_post_orders_prevalidation_params(
         self,
-        body: Optional[Quote] = None,
+        body: Optional[Order] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -5207,12 +1221,12 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Sends a quote request to a venue
+    ) -> Order:
+        """Prevalidation of the order
 
 
         :param body:
-        :type body: Quote
+        :type body: Order
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -5234,86 +1248,17 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_quote_request_serialize(
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Quote",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_post_quote_request_serialize(
-        self,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
+    (
+        brokerage_v3_post_orders_prevalidation,
+        brokerage_v3_post_orders_prevalidation_with_http_info,
+        brokerage_v3_post_orders_prevalidation_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_ORDERS_PREVALIDATION, _brokerage_v3_post_orders_prevalidation_params)
 
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/quotes",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def brokerage_v3_post_quote_ticket(
+    def _brokerage_v3_post_orders_validation_params(
         self,
-        order: Annotated[Order, Field(description="The order for which a ticket will be acquired")],
+        body: Optional[Order] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -5324,11 +1269,11 @@ class BrokerageApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> Order:
-        """Initiates a TAN-Challenge
+        """Validation of an order entry and triggering of a TAN-Challenge in a non-usage case of a Session-TAN.
 
 
-        :param order: The order for which a ticket will be acquired (required)
-        :type order: Order
+        :param body:
+        :type body: Order
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -5350,32 +1295,17 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_quote_ticket_serialize(
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    (
+        brokerage_v3_post_orders_validation,
+        brokerage_v3_post_orders_validation_with_http_info,
+        brokerage_v3_post_orders_validation_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_ORDERS_VALIDATION, _brokerage_v3_post_orders_validation_params)
 
-    @validate_call
-    def brokerage_v3_post_quote_ticket_with_http_info(
+    def _brokerage_v3_post_quote_request_params(
         self,
-        order: Annotated[Order, Field(description="The order for which a ticket will be acquired")],
+        body: Optional[Quote] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -5385,12 +1315,12 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Order]:
-        """Initiates a TAN-Challenge
+    ) -> Quote:
+        """Sends a quote request to a venue
 
 
-        :param order: The order for which a ticket will be acquired (required)
-        :type order: Order
+        :param body:
+        :type body: Quote
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -5412,30 +1342,15 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_quote_ticket_serialize(
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
+    (
+        brokerage_v3_post_quote_request,
+        brokerage_v3_post_quote_request_with_http_info,
+        brokerage_v3_post_quote_request_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_QUOTE_REQUEST, _brokerage_v3_post_quote_request_params)
 
-    @validate_call
-    def brokerage_v3_post_quote_ticket_without_preload_content(
+    def _brokerage_v3_post_quote_ticket_params(
         self,
         order: Annotated[Order, Field(description="The order for which a ticket will be acquired")],
         _request_timeout: Union[
@@ -5447,7 +1362,7 @@ class BrokerageApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
+    ) -> Order:
         """Initiates a TAN-Challenge
 
 
@@ -5474,78 +1389,10 @@ class BrokerageApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._brokerage_v3_post_quote_ticket_serialize(
-            order=order,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Order",
-            "404": None,
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _brokerage_v3_post_quote_ticket_serialize(
-        self,
-        order,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if order is not None:
-            _body_params = order
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/brokerage/v3/quoteticket",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
+    (
+        brokerage_v3_post_quote_ticket,
+        brokerage_v3_post_quote_ticket_with_http_info,
+        brokerage_v3_post_quote_ticket_without_preload_content,
+    ) = call_styles(_BROKERAGE_V3_POST_QUOTE_TICKET, _brokerage_v3_post_quote_ticket_params)
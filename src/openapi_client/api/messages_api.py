@@ -1,14 +1,14 @@
 # coding: utf-8
 
 """
-    comdirect REST API
+comdirect REST API
 
-    Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
+Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
 
-    The version of the OpenAPI document: 20.04
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
+The version of the OpenAPI document: 20.04
+Generated by OpenAPI Generator (https://openapi-generator.tech)
 
-    Do not edit the class manually.
+Do not edit the class manually.
 """  # noqa: E501
 
 import warnings
@@ -21,10 +21,39 @@ from typing import Optional
 from typing_extensions import Annotated
 from openapi_client.models.list_resource_document import ListResourceDocument
 
-from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api._endpoint import Endpoint, call_styles
+from openapi_client.api_client import ApiClient
 from openapi_client.api_response import ApiResponse
 from openapi_client.rest import RESTResponseType
 
+_MESSAGES_V2_GET_DOCUMENT = Endpoint(
+    "messages_v2_get_document",
+    "GET",
+    "/messages/v2/documents/{documentId}",
+    path_params={"documentId": "document_id"},
+    accept=["text/html", "application/pdf"],
+    response_types={"404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
+_MESSAGES_V2_GET_DOCUMENTS = Endpoint(
+    "messages_v2_get_documents",
+    "GET",
+    "/messages/clients/{user}/v2/documents",
+    path_params={"user": "user"},
+    query_params={"paging-first": "paging_first", "paging-count": "paging_count"},
+    accept=["application/json"],
+    response_types={"200": "ListResourceDocument", "404": None, "422": "StandardErrorResponse", "500": None},
+)
+
+_MESSAGES_V2_GET_PREDOCUMENT = Endpoint(
+    "messages_v2_get_predocument",
+    "GET",
+    "/messages/v2/documents/{documentId}/predocument",
+    path_params={"documentId": "document_id"},
+    accept=["text/html", "application/pdf"],
+    response_types={"404": None, "422": "StandardErrorResponse", "500": None, "503": None},
+)
+
 
 class MessagesApi:
     """NOTE: This class is auto generated by OpenAPI Generator
@@ -38,8 +67,7 @@ class MessagesApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
-    def messages_v2_get_document(
+    def _messages_v2_get_document_params(
         self,
         document_id: Annotated[StrictStr, Field(description="The unique ID of the document.")],
         _request_timeout: Union[
@@ -78,200 +106,15 @@ class MessagesApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._messages_v2_get_document_serialize(
-            document_id=document_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    (
+        messages_v2_get_document,
+        messages_v2_get_document_with_http_info,
+        messages_v2_get_document_without_preload_content,
+    ) = call_styles(_MESSAGES_V2_GET_DOCUMENT, _messages_v2_get_document_params)
 
-    @validate_call
-    def messages_v2_get_document_with_http_info(
-        self,
-        document_id: Annotated[StrictStr, Field(description="The unique ID of the document.")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[None]:
-        """Delivers a document for the given UUID.
-
-
-        :param document_id: The unique ID of the document. (required)
-        :type document_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._messages_v2_get_document_serialize(
-            document_id=document_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def messages_v2_get_document_without_preload_content(
-        self,
-        document_id: Annotated[StrictStr, Field(description="The unique ID of the document.")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Delivers a document for the given UUID.
-
-
-        :param document_id: The unique ID of the document. (required)
-        :type document_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._messages_v2_get_document_serialize(
-            document_id=document_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _messages_v2_get_document_serialize(
-        self,
-        document_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if document_id is not None:
-            _path_params["documentId"] = document_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["text/html", "application/pdf"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/messages/v2/documents/{documentId}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def messages_v2_get_documents(
+    def _messages_v2_get_documents_params(
         self,
         user: Annotated[StrictStr, Field(description='The literal "user" or the unique ID of the client.')],
         paging_first: Annotated[
@@ -321,238 +164,15 @@ class MessagesApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._messages_v2_get_documents_serialize(
-            user=user,
-            paging_first=paging_first,
-            paging_count=paging_count,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDocument",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def messages_v2_get_documents_with_http_info(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the unique ID of the client.')],
-        paging_first: Annotated[
-            Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Index of the returning results.")
-        ] = None,
-        paging_count: Annotated[
-            Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]],
-            Field(description="The maximum number of results that will be returned."),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ListResourceDocument]:
-        """Delivers a list of documents for the customer.
-
-
-        :param user: The literal \"user\" or the unique ID of the client. (required)
-        :type user: str
-        :param paging_first: Index of the returning results.
-        :type paging_first: int
-        :param paging_count: The maximum number of results that will be returned.
-        :type paging_count: int
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._messages_v2_get_documents_serialize(
-            user=user,
-            paging_first=paging_first,
-            paging_count=paging_count,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDocument",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def messages_v2_get_documents_without_preload_content(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the unique ID of the client.')],
-        paging_first: Annotated[
-            Optional[Annotated[int, Field(strict=True, ge=0)]], Field(description="Index of the returning results.")
-        ] = None,
-        paging_count: Annotated[
-            Optional[Annotated[int, Field(le=1000, strict=True, ge=1)]],
-            Field(description="The maximum number of results that will be returned."),
-        ] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Delivers a list of documents for the customer.
-
-
-        :param user: The literal \"user\" or the unique ID of the client. (required)
-        :type user: str
-        :param paging_first: Index of the returning results.
-        :type paging_first: int
-        :param paging_count: The maximum number of results that will be returned.
-        :type paging_count: int
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._messages_v2_get_documents_serialize(
-            user=user,
-            paging_first=paging_first,
-            paging_count=paging_count,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "ListResourceDocument",
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
+    (
+        messages_v2_get_documents,
+        messages_v2_get_documents_with_http_info,
+        messages_v2_get_documents_without_preload_content,
+    ) = call_styles(_MESSAGES_V2_GET_DOCUMENTS, _messages_v2_get_documents_params)
 
-    def _messages_v2_get_documents_serialize(
-        self,
-        user,
-        paging_first,
-        paging_count,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if user is not None:
-            _path_params["user"] = user
-        # process the query parameters
-        if paging_first is not None:
-
-            _query_params.append(("paging-first", paging_first))
-
-        if paging_count is not None:
-
-            _query_params.append(("paging-count", paging_count))
-
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/messages/clients/{user}/v2/documents",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def messages_v2_get_predocument(
+    def _messages_v2_get_predocument_params(
         self,
         document_id: Annotated[StrictStr, Field(description="The unique ID of the document.")],
         _request_timeout: Union[
@@ -591,194 +211,10 @@ class MessagesApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._messages_v2_get_predocument_serialize(
-            document_id=document_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def messages_v2_get_predocument_with_http_info(
-        self,
-        document_id: Annotated[StrictStr, Field(description="The unique ID of the document.")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[None]:
-        """Delivers a predocument for the given UUID.
-
-
-        :param document_id: The unique ID of the document. (required)
-        :type document_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._messages_v2_get_predocument_serialize(
-            document_id=document_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def messages_v2_get_predocument_without_preload_content(
-        self,
-        document_id: Annotated[StrictStr, Field(description="The unique ID of the document.")],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Delivers a predocument for the given UUID.
-
-
-        :param document_id: The unique ID of the document. (required)
-        :type document_id: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._messages_v2_get_predocument_serialize(
-            document_id=document_id,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "404": None,
-            "422": "StandardErrorResponse",
-            "500": None,
-            "503": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _messages_v2_get_predocument_serialize(
-        self,
-        document_id,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if document_id is not None:
-            _path_params["documentId"] = document_id
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["text/html", "application/pdf"])
-
-        # authentication setting
-        _auth_settings: List[str] = []
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/messages/v2/documents/{documentId}/predocument",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
+    (
+        messages_v2_get_predocument,
+        messages_v2_get_predocument_with_http_info,
+        messages_v2_get_predocument_without_preload_content,
+    ) = call_styles(_MESSAGES_V2_GET_PREDOCUMENT, _messages_v2_get_predocument_params)
@@ -1,14 +1,14 @@
 # coding: utf-8
 
 """
-    comdirect REST API
+comdirect REST API
 
-    Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
+Please have a look at the interfaces of comdirect REST API below. Note: Currently it is not possible to request an access token via swagger UI tools because of comdirect's proprietary authorization flow. The shown error message is due to that circumstance.
 
-    The version of the OpenAPI document: 20.04
-    Generated by OpenAPI Generator (https://openapi-generator.tech)
+The version of the OpenAPI document: 20.04
+Generated by OpenAPI Generator (https://openapi-generator.tech)
 
-    Do not edit the class manually.
+Do not edit the class manually.
 """  # noqa: E501
 
 import warnings
@@ -21,10 +21,44 @@ from typing import List, Optional
 from typing_extensions import Annotated
 from openapi_client.models.session import Session
 
-from openapi_client.api_client import ApiClient, RequestSerialized
+from openapi_client.api._endpoint import Endpoint, call_styles
+from openapi_client.api_client import ApiClient
 from openapi_client.api_response import ApiResponse
 from openapi_client.rest import RESTResponseType
 
+_SESSION_V1_GET_SESSION = Endpoint(
+    "session_v1_get_session",
+    "GET",
+    "/session/clients/{user}/v1/sessions",
+    path_params={"user": "user"},
+    accept=["application/json"],
+    auth_settings=["ResourceOwnerPasswordCredentials"],
+    response_types={"200": "List[Session]", "500": None},
+)
+
+_SESSION_V1_PATCH_SESSION = Endpoint(
+    "session_v1_patch_session",
+    "PATCH",
+    "/session/clients/{user}/v1/sessions/{session}",
+    path_params={"user": "user", "session": "session"},
+    body="body",
+    accept=["application/json"],
+    auth_settings=["ResourceOwnerPasswordCredentials"],
+    response_types={"200": "Session", "422": None, "500": None},
+)
+
+_SESSION_V1_POST_SESSION_VALIDATION = Endpoint(
+    "session_v1_post_session_validation",
+    "POST",
+    "/session/clients/{user}/v1/sessions/{session}/validate",
+    path_params={"user": "user", "session": "session"},
+    body="body",
+    accept=["application/json"],
+    content_types=["application/json"],
+    auth_settings=["ResourceOwnerPasswordCredentials"],
+    response_types={"200": "Session", "422": None, "500": None},
+)
+
 
 class SessionApi:
     """NOTE: This class is auto generated by OpenAPI Generator
@@ -38,8 +72,7 @@ class SessionApi:
             api_client = ApiClient.get_default()
         self.api_client = api_client
 
-    @validate_call
-    def session_v1_get_session(
+    def _session_v1_get_session_params(
         self,
         user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
         _request_timeout: Union[
@@ -78,194 +111,13 @@ class SessionApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._session_v1_get_session_serialize(
-            user=user,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Session]",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
+    session_v1_get_session, session_v1_get_session_with_http_info, session_v1_get_session_without_preload_content = (
+        call_styles(_SESSION_V1_GET_SESSION, _session_v1_get_session_params)
+    )
 
-    @validate_call
-    def session_v1_get_session_with_http_info(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[Session]]:
-        """Returns the current Session-Objects for the specified client, can handle the literal \"user\" for the currently logged in client.
-
-
-        :param user: The literal \"user\" or the UUID of the client. (required)
-        :type user: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._session_v1_get_session_serialize(
-            user=user,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Session]",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def session_v1_get_session_without_preload_content(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Returns the current Session-Objects for the specified client, can handle the literal \"user\" for the currently logged in client.
-
-
-        :param user: The literal \"user\" or the UUID of the client. (required)
-        :type user: str
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._session_v1_get_session_serialize(
-            user=user,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "List[Session]",
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _session_v1_get_session_serialize(
-        self,
-        user,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if user is not None:
-            _path_params["user"] = user
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = ["ResourceOwnerPasswordCredentials"]
-
-        return self.api_client.param_serialize(
-            method="GET",
-            resource_path="/session/clients/{user}/v1/sessions",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def session_v1_patch_session(
+    def _session_v1_patch_session_params(
         self,
         user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
         session: Annotated[StrictStr, Field(description="Reference to the session (UUID)")],
@@ -310,221 +162,15 @@ class SessionApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._session_v1_patch_session_serialize(
-            user=user,
-            session=session,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Session",
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def session_v1_patch_session_with_http_info(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
-        session: Annotated[StrictStr, Field(description="Reference to the session (UUID)")],
-        body: Optional[Session] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Session]:
-        """Writes updates to a session
-
-
-        :param user: The literal \"user\" or the UUID of the client. (required)
-        :type user: str
-        :param session: Reference to the session (UUID) (required)
-        :type session: str
-        :param body:
-        :type body: Session
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._session_v1_patch_session_serialize(
-            user=user,
-            session=session,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
+    (
+        session_v1_patch_session,
+        session_v1_patch_session_with_http_info,
+        session_v1_patch_session_without_preload_content,
+    ) = call_styles(_SESSION_V1_PATCH_SESSION, _session_v1_patch_session_params)
 
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Session",
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def session_v1_patch_session_without_preload_content(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
-        session: Annotated[StrictStr, Field(description="Reference to the session (UUID)")],
-        body: Optional[Session] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Writes updates to a session
-
-
-        :param user: The literal \"user\" or the UUID of the client. (required)
-        :type user: str
-        :param session: Reference to the session (UUID) (required)
-        :type session: str
-        :param body:
-        :type body: Session
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._session_v1_patch_session_serialize(
-            user=user,
-            session=session,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Session",
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _session_v1_patch_session_serialize(
-        self,
-        user,
-        session,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if user is not None:
-            _path_params["user"] = user
-        if session is not None:
-            _path_params["session"] = session
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # authentication setting
-        _auth_settings: List[str] = ["ResourceOwnerPasswordCredentials"]
-
-        return self.api_client.param_serialize(
-            method="PATCH",
-            resource_path="/session/clients/{user}/v1/sessions/{session}",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
-
-    @validate_call
-    def session_v1_post_session_validation(
+    def _session_v1_post_session_validation_params(
         self,
         user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
         session: Annotated[StrictStr, Field(description="Reference to the session (UUID)")],
@@ -569,223 +215,10 @@ class SessionApi:
         :type _host_index: int, optional
         :return: Returns the result object.
         """  # noqa: E501
+        return locals()
 
-        _param = self._session_v1_post_session_validation_serialize(
-            user=user,
-            session=session,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Session",
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        ).data
-
-    @validate_call
-    def session_v1_post_session_validation_with_http_info(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
-        session: Annotated[StrictStr, Field(description="Reference to the session (UUID)")],
-        body: Optional[Session] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Session]:
-        """Validates the input and checks if the client is able to update the current session. An activated session TAN cannot be deactivated in the current session. It is necessary to provide a TAN when patching the activation of the session TAN.
-
-
-        :param user: The literal \"user\" or the UUID of the client. (required)
-        :type user: str
-        :param session: Reference to the session (UUID) (required)
-        :type session: str
-        :param body:
-        :type body: Session
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._session_v1_post_session_validation_serialize(
-            user=user,
-            session=session,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Session",
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        response_data.read()
-        return self.api_client.response_deserialize(
-            response_data=response_data,
-            response_types_map=_response_types_map,
-        )
-
-    @validate_call
-    def session_v1_post_session_validation_without_preload_content(
-        self,
-        user: Annotated[StrictStr, Field(description='The literal "user" or the UUID of the client.')],
-        session: Annotated[StrictStr, Field(description="Reference to the session (UUID)")],
-        body: Optional[Session] = None,
-        _request_timeout: Union[
-            None,
-            Annotated[StrictFloat, Field(gt=0)],
-            Tuple[Annotated[StrictFloat, Field(gt=0)], Annotated[StrictFloat, Field(gt=0)]],
-        ] = None,
-        _request_auth: Optional[Dict[StrictStr, Any]] = None,
-        _content_type: Optional[StrictStr] = None,
-        _headers: Optional[Dict[StrictStr, Any]] = None,
-        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RESTResponseType:
-        """Validates the input and checks if the client is able to update the current session. An activated session TAN cannot be deactivated in the current session. It is necessary to provide a TAN when patching the activation of the session TAN.
-
-
-        :param user: The literal \"user\" or the UUID of the client. (required)
-        :type user: str
-        :param session: Reference to the session (UUID) (required)
-        :type session: str
-        :param body:
-        :type body: Session
-        :param _request_timeout: timeout setting for this request. If one
-                                 number provided, it will be total request
-                                 timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
-        :type _request_timeout: int, tuple(int, int), optional
-        :param _request_auth: set to override the auth_settings for an a single
-                              request; this effectively ignores the
-                              authentication in the spec for a single request.
-        :type _request_auth: dict, optional
-        :param _content_type: force content-type for the request.
-        :type _content_type: str, Optional
-        :param _headers: set to override the headers for a single
-                         request; this effectively ignores the headers
-                         in the spec for a single request.
-        :type _headers: dict, optional
-        :param _host_index: set to override the host_index for a single
-                            request; this effectively ignores the host_index
-                            in the spec for a single request.
-        :type _host_index: int, optional
-        :return: Returns the result object.
-        """  # noqa: E501
-
-        _param = self._session_v1_post_session_validation_serialize(
-            user=user,
-            session=session,
-            body=body,
-            _request_auth=_request_auth,
-            _content_type=_content_type,
-            _headers=_headers,
-            _host_index=_host_index,
-        )
-
-        _response_types_map: Dict[str, Optional[str]] = {
-            "200": "Session",
-            "422": None,
-            "500": None,
-        }
-        response_data = self.api_client.call_api(*_param, _request_timeout=_request_timeout)
-        return response_data.response
-
-    def _session_v1_post_session_validation_serialize(
-        self,
-        user,
-        session,
-        body,
-        _request_auth,
-        _content_type,
-        _headers,
-        _host_index,
-    ) -> RequestSerialized:
-
-        _host = None
-
-        _collection_formats: Dict[str, str] = {}
-
-        _path_params: Dict[str, str] = {}
-        _query_params: List[Tuple[str, str]] = []
-        _header_params: Dict[str, Optional[str]] = _headers or {}
-        _form_params: List[Tuple[str, str]] = []
-        _files: Dict[str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]] = {}
-        _body_params: Optional[bytes] = None
-
-        # process the path parameters
-        if user is not None:
-            _path_params["user"] = user
-        if session is not None:
-            _path_params["session"] = session
-        # process the query parameters
-        # process the header parameters
-        # process the form parameters
-        # process the body parameter
-        if body is not None:
-            _body_params = body
-
-        # set the HTTP header `Accept`
-        if "Accept" not in _header_params:
-            _header_params["Accept"] = self.api_client.select_header_accept(["application/json"])
-
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params["Content-Type"] = _content_type
-        else:
-            _default_content_type = self.api_client.select_header_content_type(["application/json"])
-            if _default_content_type is not None:
-                _header_params["Content-Type"] = _default_content_type
-
-        # authentication setting
-        _auth_settings: List[str] = ["ResourceOwnerPasswordCredentials"]
-
-        return self.api_client.param_serialize(
-            method="POST",
-            resource_path="/session/clients/{user}/v1/sessions/{session}/validate",
-            path_params=_path_params,
-            query_params=_query_params,
-            header_params=_header_params,
-            body=_body_params,
-            post_params=_form_params,
-            files=_files,
-            auth_settings=_auth_settings,
-            collection_formats=_collection_formats,
-            _host=_host,
-            _request_auth=_request_auth,
-        )
+    (
+        session_v1_post_session_validation,
+        session_v1_post_session_validation_with_http_info,
+        session_v1_post_session_validation_without_preload_content,
+    ) = call_styles(_SESSION_V1_POST_SESSION_VALIDATION, _session_v1_post_session_validation_params)
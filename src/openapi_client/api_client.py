@@ -74,13 +74,16 @@ class ApiClient:
     }
     _pool = None
 
-    def __init__(self, configuration=None, header_name=None, header_value=None, cookie=None) -> None:
+    def __init__(
+        self, configuration=None, header_name=None, header_value=None, cookie=None, rest_client=None
+    ) -> None:
         # use default configuration if none is provided
         if configuration is None:
             configuration = Configuration.get_default()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        # an existing transport can be shared instead of creating a connection pool per client
+        self.rest_client = rest_client if rest_client is not None else rest.RESTClientObject(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -0,0 +1,255 @@
+# coding: utf-8
+
+"""
+Schema-compiled response decoders.
+
+One module per model, generated by scripts/compile_decoders.py. Each ``decode`` turns parsed JSON
+into the model with straight-line field checks and raises ``Fallback`` for anything it does not
+accept; ``decoder_for`` then re-decodes with ``from_dict`` so errors are the ones pydantic raises.
+
+``decode_lazy`` checks the scalar fields the same way but keeps nested objects as the parsed JSON
+until they are read; see ``LazyModel``.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+import functools
+import importlib
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel
+
+_object_setattr = object.__setattr__
+_lazy_classes: Dict[type, type] = {}
+
+
+class Fallback(Exception):
+    """Raised by a compiled decoder for input that has to go through pydantic validation."""
+
+
+def construct(cls, values: Dict[str, Any]):
+    """Builds a model from already checked field values, like ``model_validate`` with every field set."""
+    obj = cls.__new__(cls)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", set(values))
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+class LazyModel:
+    """
+    Base of the lazy variants of the generated models.
+
+    A lazy instance holds the scalar fields in ``__dict__`` and the parsed JSON of its nested fields
+    in ``__pydantic_private__``. Reading a nested field decodes it (lazily again) and caches it in
+    ``__dict__``; whole-model operations (dump, compare, repr, pickle) first decode the remaining
+    fields of the whole tree. Invalid nested data raises the ValidationError of the owning model
+    when the field is read, not when the response is decoded.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        materialize(self)
+        materialize(other)
+        model = getattr(type(other), "__lazy_model__", type(other))
+        return type(self).__lazy_model__ is model and self.__dict__ == other.__dict__
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self.__pydantic_private__.pop(name, None)
+        super().__setattr__(name, value)
+
+    def __reduce_ex__(self, protocol):
+        materialize(self)
+        return construct, (type(self).__lazy_model__, dict(self.__dict__))
+
+
+def _materializing(name):
+    def method(self, *args, **kwargs):
+        materialize(self)
+        return getattr(super(LazyModel, self), name)(*args, **kwargs)
+
+    method.__name__ = name
+    return method
+
+
+for _name in ("model_dump", "model_dump_json", "__iter__", "__repr_args__", "__getstate__"):
+    setattr(LazyModel, _name, _materializing(_name))
+del _name
+
+
+class _LazyField:
+    """
+    Decodes a pending field of a lazy model on first read.
+
+    A non-data descriptor, so it is only consulted while the field is missing from ``__dict__``;
+    once decoded, reads are plain attribute lookups.
+    """
+
+    __slots__ = ("name", "load")
+
+    def __init__(self, name: str, load: Callable[[Any], Any]):
+        self.name = name
+        self.load = load
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        name = self.name
+        try:
+            raw = obj.__pydantic_private__[name]
+        except KeyError:
+            # another thread decoded it after this lookup missed it in __dict__
+            return obj.__dict__[name]
+        try:
+            value = self.load(raw)
+        except Fallback:
+            model = cls.__lazy_model__
+            value = getattr(model.from_dict({model.model_fields[name].alias or name: raw}), name)
+        # stored before it leaves the pending fields, so a concurrent read always finds one of them
+        obj.__dict__[name] = value
+        obj.__pydantic_private__.pop(name, None)
+        return value
+
+
+def materialize(value: Any) -> Any:
+    """Decodes every pending nested field of a lazily decoded model tree in place and returns it."""
+    if isinstance(value, LazyModel):
+        pending, values = value.__pydantic_private__, value.__dict__
+        for name in list(pending):
+            if name in values:
+                pending.pop(name, None)
+            else:
+                getattr(value, name)
+        # pending fields are added to __dict__ as they are read; dumps and repr follow the declared order
+        values = {name: values[name] for name in type(value).__lazy_model__.model_fields}
+        _object_setattr(value, "__dict__", values)
+        items = values.values()
+    elif isinstance(value, BaseModel):
+        items = value.__dict__.values()
+    elif isinstance(value, dict):
+        items = value.values()
+    elif isinstance(value, list):
+        items = value
+    else:
+        return value
+    for item in items:
+        materialize(item)
+    return value
+
+
+def _lazy_class(cls, loaders: Dict[str, Callable[[Any], Any]]):
+    lazy = type(cls.__name__, (LazyModel, cls), {"__module__": cls.__module__, "__lazy_model__": cls})
+    for name, load in loaders.items():
+        # set after class creation, pydantic would take them for field overrides
+        setattr(lazy, name, _LazyField(name, load))
+    return lazy
+
+
+def construct_lazy(cls, loaders: Dict[str, Callable[[Any], Any]], values: Dict[str, Any], nested: Dict[str, Any]):
+    """Like ``construct``, but the nested fields are decoded by ``loaders`` when they are first read."""
+    fields_set = set(values)
+    fields_set.update(nested)
+    pending = {}
+    for name, value in nested.items():
+        if value is None:
+            values[name] = None
+        else:
+            pending[name] = value
+    lazy = cls
+    if not pending:
+        values = {name: values[name] for name in cls.model_fields}
+    else:
+        lazy = _lazy_classes.get(cls)
+        if lazy is None:
+            lazy = _lazy_classes[cls] = _lazy_class(cls, loaders)
+    obj = lazy.__new__(lazy)
+    _object_setattr(obj, "__dict__", values)
+    _object_setattr(obj, "__pydantic_fields_set__", fields_set)
+    _object_setattr(obj, "__pydantic_extra__", None)
+    _object_setattr(obj, "__pydantic_private__", pending if pending else None)
+    return obj
+
+
+@functools.lru_cache(maxsize=None)
+def decoder_for(klass: str, lazy: bool = False) -> Optional[Callable[[Any], Any]]:
+    """Returns the compiled (or lazy) decoder for a model name, or None if there is none."""
+    module = DECODER_MODULES.get(klass)  # noqa: F821 - the table is appended by the generator
+    if module is None:
+        return None
+    module = importlib.import_module(module)
+    decode = module.decode_lazy if lazy else module.decode
+    model = getattr(importlib.import_module("openapi_client.models"), klass)
+
+    def run(data: Any) -> Any:
+        if data is None:
+            return None
+        try:
+            return decode(data)
+        except Fallback:
+            return model.from_dict(data)
+
+    return run
+
+
+DECODER_MODULES = {
+    "Account": "openapi_client.decoders.account",
+    "AccountBalance": "openapi_client.decoders.account_balance",
+    "AccountInformation": "openapi_client.decoders.account_information",
+    "AccountTransaction": "openapi_client.decoders.account_transaction",
+    "AmountValue": "openapi_client.decoders.amount_value",
+    "Balance": "openapi_client.decoders.balance",
+    "BusinessMessage": "openapi_client.decoders.business_message",
+    "Card": "openapi_client.decoders.card",
+    "CardBalance": "openapi_client.decoders.card_balance",
+    "CostEntry": "openapi_client.decoders.cost_entry",
+    "CostGroup": "openapi_client.decoders.cost_group",
+    "CostIndicationExAnte": "openapi_client.decoders.cost_indication_ex_ante",
+    "Depot": "openapi_client.decoders.depot",
+    "DepotAggregation": "openapi_client.decoders.depot_aggregation",
+    "DepotPosition": "openapi_client.decoders.depot_position",
+    "DepotTransaction": "openapi_client.decoders.depot_transaction",
+    "DerivativeData": "openapi_client.decoders.derivative_data",
+    "Dimensions": "openapi_client.decoders.dimensions",
+    "Document": "openapi_client.decoders.document",
+    "DocumentMetadata": "openapi_client.decoders.document_metadata",
+    "EnumText": "openapi_client.decoders.enum_text",
+    "Execution": "openapi_client.decoders.execution",
+    "FixedTermSavings": "openapi_client.decoders.fixed_term_savings",
+    "FundDistribution": "openapi_client.decoders.fund_distribution",
+    "FXRateEUR": "openapi_client.decoders.fx_rate_eur",
+    "Inducement": "openapi_client.decoders.inducement",
+    "InstallmentLoan": "openapi_client.decoders.installment_loan",
+    "InstallmentLoanBalance": "openapi_client.decoders.installment_loan_balance",
+    "Instrument": "openapi_client.decoders.instrument",
+    "ListResourceAccountBalance": "openapi_client.decoders.list_resource_account_balance",
+    "ListResourceAccountTransaction": "openapi_client.decoders.list_resource_account_transaction",
+    "ListResourceCostIndicationExAnte": "openapi_client.decoders.list_resource_cost_indication_ex_ante",
+    "ListResourceDepot": "openapi_client.decoders.list_resource_depot",
+    "ListResourceDepotPosition": "openapi_client.decoders.list_resource_depot_position",
+    "ListResourceDepotTransaction": "openapi_client.decoders.list_resource_depot_transaction",
+    "ListResourceDimensions": "openapi_client.decoders.list_resource_dimensions",
+    "ListResourceDocument": "openapi_client.decoders.list_resource_document",
+    "ListResourceInstrument": "openapi_client.decoders.list_resource_instrument",
+    "ListResourceOrder": "openapi_client.decoders.list_resource_order",
+    "ListResourceProductBalance": "openapi_client.decoders.list_resource_product_balance",
+    "Order": "openapi_client.decoders.order",
+    "OrderType": "openapi_client.decoders.order_type",
+    "PagingInfo": "openapi_client.decoders.paging_info",
+    "Price": "openapi_client.decoders.price",
+    "ProductBalance": "openapi_client.decoders.product_balance",
+    "Quote": "openapi_client.decoders.quote",
+    "Rating": "openapi_client.decoders.rating",
+    "Session": "openapi_client.decoders.session",
+    "StandardErrorResponse": "openapi_client.decoders.standard_error_response",
+    "StaticData": "openapi_client.decoders.static_data",
+    "TotalCostBlock": "openapi_client.decoders.total_cost_block",
+    "TotalCostEntry": "openapi_client.decoders.total_cost_entry",
+    "TotalHoldingCostBlock": "openapi_client.decoders.total_holding_cost_block",
+    "TotalHoldingCostEntry": "openapi_client.decoders.total_holding_cost_entry",
+    "Venue": "openapi_client.decoders.venue",
+    "VisaCardImage": "openapi_client.decoders.visa_card_image",
+}
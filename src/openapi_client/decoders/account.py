@@ -0,0 +1,101 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Account.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.account import Account
+
+
+def decode(obj: Any) -> Account:
+    if type(obj) is not dict:
+        raise Fallback
+    f_account_id = obj.get("accountId")
+    if f_account_id is not None and type(f_account_id) is not str:
+        raise Fallback
+    f_account_display_id = obj.get("accountDisplayId")
+    if f_account_display_id is not None and type(f_account_display_id) is not str:
+        raise Fallback
+    f_currency = obj.get("currency")
+    if f_currency is not None and type(f_currency) is not str:
+        raise Fallback
+    f_client_id = obj.get("clientId")
+    if f_client_id is not None and type(f_client_id) is not str:
+        raise Fallback
+    f_account_type = obj.get("accountType")
+    if f_account_type is not None:
+        f_account_type = decode_enum_text(f_account_type)
+    f_iban = obj.get("iban")
+    if f_iban is not None and type(f_iban) is not str:
+        raise Fallback
+    f_credit_limit = obj.get("creditLimit")
+    if f_credit_limit is not None:
+        f_credit_limit = decode_amount_value(f_credit_limit)
+    return construct(
+        Account,
+        {
+            "account_id": f_account_id,
+            "account_display_id": f_account_display_id,
+            "currency": f_currency,
+            "client_id": f_client_id,
+            "account_type": f_account_type,
+            "iban": f_iban,
+            "credit_limit": f_credit_limit,
+        },
+    )
+
+
+def _load_account_type(f_account_type: Any) -> Any:
+    return decode_lazy_enum_text(f_account_type)
+
+
+def _load_credit_limit(f_credit_limit: Any) -> Any:
+    return decode_lazy_amount_value(f_credit_limit)
+
+
+_LAZY_FIELDS = {"account_type": _load_account_type, "credit_limit": _load_credit_limit}
+
+
+def decode_lazy(obj: Any) -> Account:
+    if type(obj) is not dict:
+        raise Fallback
+    f_account_id = obj.get("accountId")
+    if f_account_id is not None and type(f_account_id) is not str:
+        raise Fallback
+    f_account_display_id = obj.get("accountDisplayId")
+    if f_account_display_id is not None and type(f_account_display_id) is not str:
+        raise Fallback
+    f_currency = obj.get("currency")
+    if f_currency is not None and type(f_currency) is not str:
+        raise Fallback
+    f_client_id = obj.get("clientId")
+    if f_client_id is not None and type(f_client_id) is not str:
+        raise Fallback
+    f_iban = obj.get("iban")
+    if f_iban is not None and type(f_iban) is not str:
+        raise Fallback
+    return construct_lazy(
+        Account,
+        _LAZY_FIELDS,
+        {
+            "account_id": f_account_id,
+            "account_display_id": f_account_display_id,
+            "currency": f_currency,
+            "client_id": f_client_id,
+            "iban": f_iban,
+        },
+        {"account_type": obj.get("accountType"), "credit_limit": obj.get("creditLimit")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.enum_text import decode as decode_enum_text
+from openapi_client.decoders.enum_text import decode_lazy as decode_lazy_enum_text
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+"""
+Compiled decoder for AccountBalance.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.account_balance import AccountBalance
+
+
+def decode(obj: Any) -> AccountBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_account = obj.get("account")
+    if f_account is not None:
+        f_account = decode_account(f_account)
+    f_account_id = obj.get("accountId")
+    if f_account_id is not None and type(f_account_id) is not str:
+        raise Fallback
+    f_balance = obj.get("balance")
+    if f_balance is not None:
+        f_balance = decode_amount_value(f_balance)
+    f_balance_eur = obj.get("balanceEUR")
+    if f_balance_eur is not None:
+        f_balance_eur = decode_amount_value(f_balance_eur)
+    f_available_cash_amount = obj.get("availableCashAmount")
+    if f_available_cash_amount is not None:
+        f_available_cash_amount = decode_amount_value(f_available_cash_amount)
+    f_available_cash_amount_eur = obj.get("availableCashAmountEUR")
+    if f_available_cash_amount_eur is not None:
+        f_available_cash_amount_eur = decode_amount_value(f_available_cash_amount_eur)
+    return construct(
+        AccountBalance,
+        {
+            "account": f_account,
+            "account_id": f_account_id,
+            "balance": f_balance,
+            "balance_eur": f_balance_eur,
+            "available_cash_amount": f_available_cash_amount,
+            "available_cash_amount_eur": f_available_cash_amount_eur,
+        },
+    )
+
+
+def _load_account(f_account: Any) -> Any:
+    return decode_lazy_account(f_account)
+
+
+def _load_balance(f_balance: Any) -> Any:
+    return decode_lazy_amount_value(f_balance)
+
+
+def _load_balance_eur(f_balance_eur: Any) -> Any:
+    return decode_lazy_amount_value(f_balance_eur)
+
+
+def _load_available_cash_amount(f_available_cash_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_available_cash_amount)
+
+
+def _load_available_cash_amount_eur(f_available_cash_amount_eur: Any) -> Any:
+    return decode_lazy_amount_value(f_available_cash_amount_eur)
+
+
+_LAZY_FIELDS = {
+    "account": _load_account,
+    "balance": _load_balance,
+    "balance_eur": _load_balance_eur,
+    "available_cash_amount": _load_available_cash_amount,
+    "available_cash_amount_eur": _load_available_cash_amount_eur,
+}
+
+
+def decode_lazy(obj: Any) -> AccountBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_account_id = obj.get("accountId")
+    if f_account_id is not None and type(f_account_id) is not str:
+        raise Fallback
+    return construct_lazy(
+        AccountBalance,
+        _LAZY_FIELDS,
+        {"account_id": f_account_id},
+        {
+            "account": obj.get("account"),
+            "balance": obj.get("balance"),
+            "balance_eur": obj.get("balanceEUR"),
+            "available_cash_amount": obj.get("availableCashAmount"),
+            "available_cash_amount_eur": obj.get("availableCashAmountEUR"),
+        },
+    )
+
+
+from openapi_client.decoders.account import decode as decode_account
+from openapi_client.decoders.account import decode_lazy as decode_lazy_account
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
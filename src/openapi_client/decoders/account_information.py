@@ -0,0 +1,32 @@
+# coding: utf-8
+
+"""
+Compiled decoder for AccountInformation.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.account_information import AccountInformation
+
+
+def decode(obj: Any) -> AccountInformation:
+    if type(obj) is not dict:
+        raise Fallback
+    f_holder_name = obj.get("holderName")
+    if f_holder_name is not None and type(f_holder_name) is not str:
+        raise Fallback
+    f_iban = obj.get("iban")
+    if f_iban is not None and type(f_iban) is not str:
+        raise Fallback
+    f_bic = obj.get("bic")
+    if f_bic is not None and type(f_bic) is not str:
+        raise Fallback
+    return construct(AccountInformation, {"holder_name": f_holder_name, "iban": f_iban, "bic": f_bic})
+
+
+decode_lazy = decode
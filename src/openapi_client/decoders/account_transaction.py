@@ -0,0 +1,187 @@
+# coding: utf-8
+
+"""
+Compiled decoder for AccountTransaction.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+import re
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.account_transaction import AccountTransaction
+
+_BOOKING_STATUS_ENUM = frozenset(["BOOKED", "NOTBOOKED"])
+_BOOKING_DATE_PATTERN = re.compile("^\\d{4}-\\d{2}-\\d{2}$")
+
+
+def decode(obj: Any) -> AccountTransaction:
+    if type(obj) is not dict:
+        raise Fallback
+    f_reference = obj.get("reference")
+    if f_reference is not None and type(f_reference) is not str:
+        raise Fallback
+    f_booking_status = obj.get("bookingStatus")
+    if f_booking_status is not None and (
+        type(f_booking_status) is not str or f_booking_status not in _BOOKING_STATUS_ENUM
+    ):
+        raise Fallback
+    f_booking_date = obj.get("bookingDate")
+    if f_booking_date is not None and (
+        type(f_booking_date) is not str or not _BOOKING_DATE_PATTERN.match(f_booking_date)
+    ):
+        raise Fallback
+    f_amount = obj.get("amount")
+    if f_amount is not None:
+        f_amount = decode_amount_value(f_amount)
+    f_remitter = obj.get("remitter")
+    if f_remitter is not None:
+        f_remitter = decode_account_information(f_remitter)
+    f_deptor = obj.get("deptor")
+    if f_deptor is not None:
+        f_deptor = decode_account_information(f_deptor)
+    f_creditor = obj.get("creditor")
+    if f_creditor is not None:
+        f_creditor = decode_account_information(f_creditor)
+    f_valuta_date = obj.get("valutaDate")
+    if f_valuta_date is not None and type(f_valuta_date) is not str:
+        raise Fallback
+    f_direct_debit_creditor_id = obj.get("directDebitCreditorId")
+    if f_direct_debit_creditor_id is not None and type(f_direct_debit_creditor_id) is not str:
+        raise Fallback
+    f_direct_debit_mandate_id = obj.get("directDebitMandateId")
+    if f_direct_debit_mandate_id is not None and type(f_direct_debit_mandate_id) is not str:
+        raise Fallback
+    f_end_to_end_reference = obj.get("endToEndReference")
+    if f_end_to_end_reference is not None and type(f_end_to_end_reference) is not str:
+        raise Fallback
+    f_new_transaction = obj.get("newTransaction")
+    if f_new_transaction is None:
+        f_new_transaction = False
+    elif f_new_transaction is not True and f_new_transaction is not False:
+        raise Fallback
+    f_remittance_info = obj.get("remittanceInfo")
+    if f_remittance_info is not None and type(f_remittance_info) is not str:
+        raise Fallback
+    f_transaction_type = obj.get("transactionType")
+    if f_transaction_type is not None:
+        f_transaction_type = decode_enum_text(f_transaction_type)
+    return construct(
+        AccountTransaction,
+        {
+            "reference": f_reference,
+            "booking_status": f_booking_status,
+            "booking_date": f_booking_date,
+            "amount": f_amount,
+            "remitter": f_remitter,
+            "deptor": f_deptor,
+            "creditor": f_creditor,
+            "valuta_date": f_valuta_date,
+            "direct_debit_creditor_id": f_direct_debit_creditor_id,
+            "direct_debit_mandate_id": f_direct_debit_mandate_id,
+            "end_to_end_reference": f_end_to_end_reference,
+            "new_transaction": f_new_transaction,
+            "remittance_info": f_remittance_info,
+            "transaction_type": f_transaction_type,
+        },
+    )
+
+
+def _load_amount(f_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_amount)
+
+
+def _load_remitter(f_remitter: Any) -> Any:
+    return decode_lazy_account_information(f_remitter)
+
+
+def _load_deptor(f_deptor: Any) -> Any:
+    return decode_lazy_account_information(f_deptor)
+
+
+def _load_creditor(f_creditor: Any) -> Any:
+    return decode_lazy_account_information(f_creditor)
+
+
+def _load_transaction_type(f_transaction_type: Any) -> Any:
+    return decode_lazy_enum_text(f_transaction_type)
+
+
+_LAZY_FIELDS = {
+    "amount": _load_amount,
+    "remitter": _load_remitter,
+    "deptor": _load_deptor,
+    "creditor": _load_creditor,
+    "transaction_type": _load_transaction_type,
+}
+
+
+def decode_lazy(obj: Any) -> AccountTransaction:
+    if type(obj) is not dict:
+        raise Fallback
+    f_reference = obj.get("reference")
+    if f_reference is not None and type(f_reference) is not str:
+        raise Fallback
+    f_booking_status = obj.get("bookingStatus")
+    if f_booking_status is not None and (
+        type(f_booking_status) is not str or f_booking_status not in _BOOKING_STATUS_ENUM
+    ):
+        raise Fallback
+    f_booking_date = obj.get("bookingDate")
+    if f_booking_date is not None and (
+        type(f_booking_date) is not str or not _BOOKING_DATE_PATTERN.match(f_booking_date)
+    ):
+        raise Fallback
+    f_valuta_date = obj.get("valutaDate")
+    if f_valuta_date is not None and type(f_valuta_date) is not str:
+        raise Fallback
+    f_direct_debit_creditor_id = obj.get("directDebitCreditorId")
+    if f_direct_debit_creditor_id is not None and type(f_direct_debit_creditor_id) is not str:
+        raise Fallback
+    f_direct_debit_mandate_id = obj.get("directDebitMandateId")
+    if f_direct_debit_mandate_id is not None and type(f_direct_debit_mandate_id) is not str:
+        raise Fallback
+    f_end_to_end_reference = obj.get("endToEndReference")
+    if f_end_to_end_reference is not None and type(f_end_to_end_reference) is not str:
+        raise Fallback
+    f_new_transaction = obj.get("newTransaction")
+    if f_new_transaction is None:
+        f_new_transaction = False
+    elif f_new_transaction is not True and f_new_transaction is not False:
+        raise Fallback
+    f_remittance_info = obj.get("remittanceInfo")
+    if f_remittance_info is not None and type(f_remittance_info) is not str:
+        raise Fallback
+    return construct_lazy(
+        AccountTransaction,
+        _LAZY_FIELDS,
+        {
+            "reference": f_reference,
+            "booking_status": f_booking_status,
+            "booking_date": f_booking_date,
+            "valuta_date": f_valuta_date,
+            "direct_debit_creditor_id": f_direct_debit_creditor_id,
+            "direct_debit_mandate_id": f_direct_debit_mandate_id,
+            "end_to_end_reference": f_end_to_end_reference,
+            "new_transaction": f_new_transaction,
+            "remittance_info": f_remittance_info,
+        },
+        {
+            "amount": obj.get("amount"),
+            "remitter": obj.get("remitter"),
+            "deptor": obj.get("deptor"),
+            "creditor": obj.get("creditor"),
+            "transaction_type": obj.get("transactionType"),
+        },
+    )
+
+
+from openapi_client.decoders.account_information import decode as decode_account_information
+from openapi_client.decoders.account_information import decode_lazy as decode_lazy_account_information
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.enum_text import decode as decode_enum_text
+from openapi_client.decoders.enum_text import decode_lazy as decode_lazy_enum_text
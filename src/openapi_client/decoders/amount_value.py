@@ -0,0 +1,29 @@
+# coding: utf-8
+
+"""
+Compiled decoder for AmountValue.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.amount_value import AmountValue
+
+
+def decode(obj: Any) -> AmountValue:
+    if type(obj) is not dict:
+        raise Fallback
+    f_value = obj.get("value")
+    if f_value is not None and type(f_value) is not str:
+        raise Fallback
+    f_unit = obj.get("unit")
+    if f_unit is not None and (type(f_unit) is not str or len(f_unit) < 3 or len(f_unit) > 3):
+        raise Fallback
+    return construct(AmountValue, {"value": f_value, "unit": f_unit})
+
+
+decode_lazy = decode
@@ -0,0 +1,102 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Balance.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.balance import Balance
+
+
+def decode(obj: Any) -> Balance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_account_balance = obj.get("accountBalance")
+    if f_account_balance is not None:
+        f_account_balance = decode_account_balance(f_account_balance)
+    f_card_balance = obj.get("cardBalance")
+    if f_card_balance is not None:
+        f_card_balance = decode_card_balance(f_card_balance)
+    f_depot_aggregation = obj.get("depotAggregation")
+    if f_depot_aggregation is not None:
+        f_depot_aggregation = decode_depot_aggregation(f_depot_aggregation)
+    f_fixed_term_savings = obj.get("fixedTermSavings")
+    if f_fixed_term_savings is not None:
+        f_fixed_term_savings = decode_fixed_term_savings(f_fixed_term_savings)
+    f_installment_loan_balance = obj.get("installmentLoanBalance")
+    if f_installment_loan_balance is not None:
+        f_installment_loan_balance = decode_installment_loan_balance(f_installment_loan_balance)
+    return construct(
+        Balance,
+        {
+            "account_balance": f_account_balance,
+            "card_balance": f_card_balance,
+            "depot_aggregation": f_depot_aggregation,
+            "fixed_term_savings": f_fixed_term_savings,
+            "installment_loan_balance": f_installment_loan_balance,
+        },
+    )
+
+
+def _load_account_balance(f_account_balance: Any) -> Any:
+    return decode_lazy_account_balance(f_account_balance)
+
+
+def _load_card_balance(f_card_balance: Any) -> Any:
+    return decode_lazy_card_balance(f_card_balance)
+
+
+def _load_depot_aggregation(f_depot_aggregation: Any) -> Any:
+    return decode_lazy_depot_aggregation(f_depot_aggregation)
+
+
+def _load_fixed_term_savings(f_fixed_term_savings: Any) -> Any:
+    return decode_lazy_fixed_term_savings(f_fixed_term_savings)
+
+
+def _load_installment_loan_balance(f_installment_loan_balance: Any) -> Any:
+    return decode_lazy_installment_loan_balance(f_installment_loan_balance)
+
+
+_LAZY_FIELDS = {
+    "account_balance": _load_account_balance,
+    "card_balance": _load_card_balance,
+    "depot_aggregation": _load_depot_aggregation,
+    "fixed_term_savings": _load_fixed_term_savings,
+    "installment_loan_balance": _load_installment_loan_balance,
+}
+
+
+def decode_lazy(obj: Any) -> Balance:
+    if type(obj) is not dict:
+        raise Fallback
+    return construct_lazy(
+        Balance,
+        _LAZY_FIELDS,
+        {},
+        {
+            "account_balance": obj.get("accountBalance"),
+            "card_balance": obj.get("cardBalance"),
+            "depot_aggregation": obj.get("depotAggregation"),
+            "fixed_term_savings": obj.get("fixedTermSavings"),
+            "installment_loan_balance": obj.get("installmentLoanBalance"),
+        },
+    )
+
+
+from openapi_client.decoders.account_balance import decode as decode_account_balance
+from openapi_client.decoders.account_balance import decode_lazy as decode_lazy_account_balance
+from openapi_client.decoders.card_balance import decode as decode_card_balance
+from openapi_client.decoders.card_balance import decode_lazy as decode_lazy_card_balance
+from openapi_client.decoders.depot_aggregation import decode as decode_depot_aggregation
+from openapi_client.decoders.depot_aggregation import decode_lazy as decode_lazy_depot_aggregation
+from openapi_client.decoders.fixed_term_savings import decode as decode_fixed_term_savings
+from openapi_client.decoders.fixed_term_savings import decode_lazy as decode_lazy_fixed_term_savings
+from openapi_client.decoders.installment_loan_balance import decode as decode_installment_loan_balance
+from openapi_client.decoders.installment_loan_balance import decode_lazy as decode_lazy_installment_loan_balance
@@ -0,0 +1,54 @@
+# coding: utf-8
+
+"""
+Compiled decoder for BusinessMessage.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.business_message import BusinessMessage
+
+_KEY_ENUM = frozenset(["request.object.invalid", "request.query.invalid"])
+_SEVERITY_ENUM = frozenset(["ERROR", "INFO", "WARN"])
+
+
+def decode(obj: Any) -> BusinessMessage:
+    if type(obj) is not dict:
+        raise Fallback
+    f_key = obj.get("key")
+    if f_key is not None and (type(f_key) is not str or f_key not in _KEY_ENUM):
+        raise Fallback
+    f_severity = obj.get("severity")
+    if f_severity is not None and (type(f_severity) is not str or f_severity not in _SEVERITY_ENUM):
+        raise Fallback
+    f_message = obj.get("message")
+    if f_message is not None and type(f_message) is not str:
+        raise Fallback
+    f_origin = obj.get("origin")
+    if f_origin is not None:
+        if type(f_origin) is not list:
+            raise Fallback
+        for item in f_origin:
+            if type(item) is not str:
+                raise Fallback
+        f_origin = list(f_origin)
+    f_args = obj.get("args")
+    if f_args is not None:
+        if type(f_args) is not list:
+            raise Fallback
+        for item in f_args:
+            if type(item) is not dict:
+                raise Fallback
+        f_args = list(f_args)
+    return construct(
+        BusinessMessage,
+        {"key": f_key, "severity": f_severity, "message": f_message, "origin": f_origin, "args": f_args},
+    )
+
+
+decode_lazy = decode
@@ -0,0 +1,145 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Card.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.card import Card
+
+_STATUS_ENUM = frozenset(["ACTIVE", "INACTIVE", "IN_CHANGE", "UNKNOWN"])
+
+
+def decode(obj: Any) -> Card:
+    if type(obj) is not dict:
+        raise Fallback
+    f_card_id = obj.get("cardId")
+    if f_card_id is not None and type(f_card_id) is not str:
+        raise Fallback
+    f_card_type = obj.get("cardType")
+    if f_card_type is not None:
+        f_card_type = decode_enum_text(f_card_type)
+    f_client_id = obj.get("clientId")
+    if f_client_id is not None and type(f_client_id) is not str:
+        raise Fallback
+    f_participant_id = obj.get("participantId")
+    if f_participant_id is not None and type(f_participant_id) is not str:
+        raise Fallback
+    f_holder_name = obj.get("holderName")
+    if f_holder_name is not None and type(f_holder_name) is not str:
+        raise Fallback
+    f_settlement_account_id = obj.get("settlementAccountId")
+    if f_settlement_account_id is not None and type(f_settlement_account_id) is not str:
+        raise Fallback
+    f_card_display_id = obj.get("cardDisplayId")
+    if f_card_display_id is not None and type(f_card_display_id) is not str:
+        raise Fallback
+    f_card_validity = obj.get("cardValidity")
+    if f_card_validity is not None and type(f_card_validity) is not str:
+        raise Fallback
+    f_card_image = obj.get("cardImage")
+    if f_card_image is not None:
+        f_card_image = decode_visa_card_image(f_card_image)
+    f_primary_account_number_suffix = obj.get("primaryAccountNumberSuffix")
+    if f_primary_account_number_suffix is not None and type(f_primary_account_number_suffix) is not str:
+        raise Fallback
+    f_card_limit = obj.get("cardLimit")
+    if f_card_limit is not None:
+        f_card_limit = decode_amount_value(f_card_limit)
+    f_status = obj.get("status")
+    if f_status is not None and (type(f_status) is not str or f_status not in _STATUS_ENUM):
+        raise Fallback
+    return construct(
+        Card,
+        {
+            "card_id": f_card_id,
+            "card_type": f_card_type,
+            "client_id": f_client_id,
+            "participant_id": f_participant_id,
+            "holder_name": f_holder_name,
+            "settlement_account_id": f_settlement_account_id,
+            "card_display_id": f_card_display_id,
+            "card_validity": f_card_validity,
+            "card_image": f_card_image,
+            "primary_account_number_suffix": f_primary_account_number_suffix,
+            "card_limit": f_card_limit,
+            "status": f_status,
+        },
+    )
+
+
+def _load_card_type(f_card_type: Any) -> Any:
+    return decode_lazy_enum_text(f_card_type)
+
+
+def _load_card_image(f_card_image: Any) -> Any:
+    return decode_lazy_visa_card_image(f_card_image)
+
+
+def _load_card_limit(f_card_limit: Any) -> Any:
+    return decode_lazy_amount_value(f_card_limit)
+
+
+_LAZY_FIELDS = {"card_type": _load_card_type, "card_image": _load_card_image, "card_limit": _load_card_limit}
+
+
+def decode_lazy(obj: Any) -> Card:
+    if type(obj) is not dict:
+        raise Fallback
+    f_card_id = obj.get("cardId")
+    if f_card_id is not None and type(f_card_id) is not str:
+        raise Fallback
+    f_client_id = obj.get("clientId")
+    if f_client_id is not None and type(f_client_id) is not str:
+        raise Fallback
+    f_participant_id = obj.get("participantId")
+    if f_participant_id is not None and type(f_participant_id) is not str:
+        raise Fallback
+    f_holder_name = obj.get("holderName")
+    if f_holder_name is not None and type(f_holder_name) is not str:
+        raise Fallback
+    f_settlement_account_id = obj.get("settlementAccountId")
+    if f_settlement_account_id is not None and type(f_settlement_account_id) is not str:
+        raise Fallback
+    f_card_display_id = obj.get("cardDisplayId")
+    if f_card_display_id is not None and type(f_card_display_id) is not str:
+        raise Fallback
+    f_card_validity = obj.get("cardValidity")
+    if f_card_validity is not None and type(f_card_validity) is not str:
+        raise Fallback
+    f_primary_account_number_suffix = obj.get("primaryAccountNumberSuffix")
+    if f_primary_account_number_suffix is not None and type(f_primary_account_number_suffix) is not str:
+        raise Fallback
+    f_status = obj.get("status")
+    if f_status is not None and (type(f_status) is not str or f_status not in _STATUS_ENUM):
+        raise Fallback
+    return construct_lazy(
+        Card,
+        _LAZY_FIELDS,
+        {
+            "card_id": f_card_id,
+            "client_id": f_client_id,
+            "participant_id": f_participant_id,
+            "holder_name": f_holder_name,
+            "settlement_account_id": f_settlement_account_id,
+            "card_display_id": f_card_display_id,
+            "card_validity": f_card_validity,
+            "primary_account_number_suffix": f_primary_account_number_suffix,
+            "status": f_status,
+        },
+        {"card_type": obj.get("cardType"), "card_image": obj.get("cardImage"), "card_limit": obj.get("cardLimit")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.enum_text import decode as decode_enum_text
+from openapi_client.decoders.enum_text import decode_lazy as decode_lazy_enum_text
+from openapi_client.decoders.visa_card_image import decode as decode_visa_card_image
+from openapi_client.decoders.visa_card_image import decode_lazy as decode_lazy_visa_card_image
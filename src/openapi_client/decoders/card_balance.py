@@ -0,0 +1,74 @@
+# coding: utf-8
+
+"""
+Compiled decoder for CardBalance.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.card_balance import CardBalance
+
+
+def decode(obj: Any) -> CardBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_card_id = obj.get("cardId")
+    if f_card_id is not None and type(f_card_id) is not str:
+        raise Fallback
+    f_card = obj.get("card")
+    if f_card is not None:
+        f_card = decode_card(f_card)
+    f_balance = obj.get("balance")
+    if f_balance is not None:
+        f_balance = decode_amount_value(f_balance)
+    f_available_cash_amount = obj.get("availableCashAmount")
+    if f_available_cash_amount is not None:
+        f_available_cash_amount = decode_amount_value(f_available_cash_amount)
+    return construct(
+        CardBalance,
+        {"card_id": f_card_id, "card": f_card, "balance": f_balance, "available_cash_amount": f_available_cash_amount},
+    )
+
+
+def _load_card(f_card: Any) -> Any:
+    return decode_lazy_card(f_card)
+
+
+def _load_balance(f_balance: Any) -> Any:
+    return decode_lazy_amount_value(f_balance)
+
+
+def _load_available_cash_amount(f_available_cash_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_available_cash_amount)
+
+
+_LAZY_FIELDS = {"card": _load_card, "balance": _load_balance, "available_cash_amount": _load_available_cash_amount}
+
+
+def decode_lazy(obj: Any) -> CardBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_card_id = obj.get("cardId")
+    if f_card_id is not None and type(f_card_id) is not str:
+        raise Fallback
+    return construct_lazy(
+        CardBalance,
+        _LAZY_FIELDS,
+        {"card_id": f_card_id},
+        {
+            "card": obj.get("card"),
+            "balance": obj.get("balance"),
+            "available_cash_amount": obj.get("availableCashAmount"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.card import decode as decode_card
+from openapi_client.decoders.card import decode_lazy as decode_lazy_card
@@ -0,0 +1,92 @@
+# coding: utf-8
+
+"""
+Compiled decoder for CostEntry.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.cost_entry import CostEntry
+
+_TYPE_ENUM = frozenset(["E", "F", "P"])
+
+
+def decode(obj: Any) -> CostEntry:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or f_type not in _TYPE_ENUM):
+        raise Fallback
+    f_label = obj.get("label")
+    if f_label is not None and type(f_label) is not str:
+        raise Fallback
+    f_amount = obj.get("amount")
+    if f_amount is not None:
+        f_amount = decode_amount_value(f_amount)
+    f_amount_reporting_currency = obj.get("amountReportingCurrency")
+    if f_amount_reporting_currency is not None:
+        f_amount_reporting_currency = decode_amount_value(f_amount_reporting_currency)
+    f_inducement = obj.get("inducement")
+    if f_inducement is not None:
+        f_inducement = decode_inducement(f_inducement)
+    return construct(
+        CostEntry,
+        {
+            "type": f_type,
+            "label": f_label,
+            "amount": f_amount,
+            "amount_reporting_currency": f_amount_reporting_currency,
+            "inducement": f_inducement,
+        },
+    )
+
+
+def _load_amount(f_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_amount)
+
+
+def _load_amount_reporting_currency(f_amount_reporting_currency: Any) -> Any:
+    return decode_lazy_amount_value(f_amount_reporting_currency)
+
+
+def _load_inducement(f_inducement: Any) -> Any:
+    return decode_lazy_inducement(f_inducement)
+
+
+_LAZY_FIELDS = {
+    "amount": _load_amount,
+    "amount_reporting_currency": _load_amount_reporting_currency,
+    "inducement": _load_inducement,
+}
+
+
+def decode_lazy(obj: Any) -> CostEntry:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or f_type not in _TYPE_ENUM):
+        raise Fallback
+    f_label = obj.get("label")
+    if f_label is not None and type(f_label) is not str:
+        raise Fallback
+    return construct_lazy(
+        CostEntry,
+        _LAZY_FIELDS,
+        {"type": f_type, "label": f_label},
+        {
+            "amount": obj.get("amount"),
+            "amount_reporting_currency": obj.get("amountReportingCurrency"),
+            "inducement": obj.get("inducement"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.inducement import decode as decode_inducement
+from openapi_client.decoders.inducement import decode_lazy as decode_lazy_inducement
@@ -0,0 +1,89 @@
+# coding: utf-8
+
+"""
+Compiled decoder for CostGroup.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.cost_group import CostGroup
+
+_TYPE_ENUM = frozenset(["K", "H", "V"])
+
+
+def decode(obj: Any) -> CostGroup:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or f_type not in _TYPE_ENUM):
+        raise Fallback
+    f_label = obj.get("label")
+    if f_label is not None and type(f_label) is not str:
+        raise Fallback
+    f_sum = obj.get("sum")
+    if f_sum is not None:
+        f_sum = decode_amount_value(f_sum)
+    f_sum_reporting_currency = obj.get("sumReportingCurrency")
+    if f_sum_reporting_currency is not None:
+        f_sum_reporting_currency = decode_amount_value(f_sum_reporting_currency)
+    f_costs = obj.get("costs")
+    if f_costs is not None:
+        if type(f_costs) is not list:
+            raise Fallback
+        f_costs = [decode_cost_entry(item) for item in f_costs]
+    return construct(
+        CostGroup,
+        {
+            "type": f_type,
+            "label": f_label,
+            "sum": f_sum,
+            "sum_reporting_currency": f_sum_reporting_currency,
+            "costs": f_costs,
+        },
+    )
+
+
+def _load_sum(f_sum: Any) -> Any:
+    return decode_lazy_amount_value(f_sum)
+
+
+def _load_sum_reporting_currency(f_sum_reporting_currency: Any) -> Any:
+    return decode_lazy_amount_value(f_sum_reporting_currency)
+
+
+def _load_costs(f_costs: Any) -> Any:
+    if type(f_costs) is not list:
+        raise Fallback
+    f_costs = [decode_lazy_cost_entry(item) for item in f_costs]
+    return f_costs
+
+
+_LAZY_FIELDS = {"sum": _load_sum, "sum_reporting_currency": _load_sum_reporting_currency, "costs": _load_costs}
+
+
+def decode_lazy(obj: Any) -> CostGroup:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or f_type not in _TYPE_ENUM):
+        raise Fallback
+    f_label = obj.get("label")
+    if f_label is not None and type(f_label) is not str:
+        raise Fallback
+    return construct_lazy(
+        CostGroup,
+        _LAZY_FIELDS,
+        {"type": f_type, "label": f_label},
+        {"sum": obj.get("sum"), "sum_reporting_currency": obj.get("sumReportingCurrency"), "costs": obj.get("costs")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.cost_entry import decode as decode_cost_entry
+from openapi_client.decoders.cost_entry import decode_lazy as decode_lazy_cost_entry
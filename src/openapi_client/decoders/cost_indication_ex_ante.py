@@ -0,0 +1,273 @@
+# coding: utf-8
+
+"""
+Compiled decoder for CostIndicationExAnte.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.cost_indication_ex_ante import CostIndicationExAnte
+
+_SIDE_ENUM = frozenset(["BUY", "SELL"])
+
+
+def decode(obj: Any) -> CostIndicationExAnte:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_calculation_successful = obj.get("calculationSuccessful")
+    if f_calculation_successful is None:
+        f_calculation_successful = False
+    elif f_calculation_successful is not True and f_calculation_successful is not False:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and type(f_name) is not str:
+        raise Fallback
+    f_wkn = obj.get("wkn")
+    if f_wkn is not None and type(f_wkn) is not str:
+        raise Fallback
+    f_side = obj.get("side")
+    if f_side is not None and (type(f_side) is not str or f_side not in _SIDE_ENUM):
+        raise Fallback
+    f_quantity = obj.get("quantity")
+    if f_quantity is not None:
+        f_quantity = decode_amount_value(f_quantity)
+    f_limit = obj.get("limit")
+    if f_limit is not None:
+        f_limit = decode_amount_value(f_limit)
+    f_expected_value = obj.get("expectedValue")
+    if f_expected_value is not None:
+        f_expected_value = decode_amount_value(f_expected_value)
+    f_venue_name = obj.get("venueName")
+    if f_venue_name is not None and type(f_venue_name) is not str:
+        raise Fallback
+    f_settlement_currency = obj.get("settlementCurrency")
+    if f_settlement_currency is not None and type(f_settlement_currency) is not str:
+        raise Fallback
+    f_trading_currency = obj.get("tradingCurrency")
+    if f_trading_currency is not None and type(f_trading_currency) is not str:
+        raise Fallback
+    f_reporting_currency = obj.get("reportingCurrency")
+    if f_reporting_currency is not None and type(f_reporting_currency) is not str:
+        raise Fallback
+    f_fx_rate = obj.get("fxRate")
+    if f_fx_rate is not None:
+        f_fx_rate = decode_fx_rate_eur(f_fx_rate)
+    f_expected_settlement_costs = obj.get("expectedSettlementCosts")
+    if f_expected_settlement_costs is not None:
+        f_expected_settlement_costs = decode_amount_value(f_expected_settlement_costs)
+    f_purchase_costs = obj.get("purchaseCosts")
+    if f_purchase_costs is not None:
+        f_purchase_costs = decode_cost_group(f_purchase_costs)
+    f_holding_costs = obj.get("holdingCosts")
+    if f_holding_costs is not None:
+        f_holding_costs = decode_cost_group(f_holding_costs)
+    f_sales_costs = obj.get("salesCosts")
+    if f_sales_costs is not None:
+        f_sales_costs = decode_cost_group(f_sales_costs)
+    f_holding_period = obj.get("holdingPeriod")
+    if f_holding_period is not None and type(f_holding_period) is not str:
+        raise Fallback
+    f_total_costs_abs = obj.get("totalCostsAbs")
+    if f_total_costs_abs is not None:
+        f_total_costs_abs = decode_amount_value(f_total_costs_abs)
+    f_total_costs_rel = obj.get("totalCostsRel")
+    if f_total_costs_rel is not None and type(f_total_costs_rel) is not str:
+        raise Fallback
+    f_total_costs_detail = obj.get("totalCostsDetail")
+    if f_total_costs_detail is not None:
+        f_total_costs_detail = decode_total_cost_block(f_total_costs_detail)
+    f_total_holding_costs = obj.get("totalHoldingCosts")
+    if f_total_holding_costs is not None:
+        f_total_holding_costs = decode_total_holding_cost_block(f_total_holding_costs)
+    f_link_costs = obj.get("linkCosts")
+    if f_link_costs is not None and type(f_link_costs) is not str:
+        raise Fallback
+    f_link_kid = obj.get("linkKid")
+    if f_link_kid is not None and type(f_link_kid) is not str:
+        raise Fallback
+    return construct(
+        CostIndicationExAnte,
+        {
+            "depot_id": f_depot_id,
+            "calculation_successful": f_calculation_successful,
+            "name": f_name,
+            "wkn": f_wkn,
+            "side": f_side,
+            "quantity": f_quantity,
+            "limit": f_limit,
+            "expected_value": f_expected_value,
+            "venue_name": f_venue_name,
+            "settlement_currency": f_settlement_currency,
+            "trading_currency": f_trading_currency,
+            "reporting_currency": f_reporting_currency,
+            "fx_rate": f_fx_rate,
+            "expected_settlement_costs": f_expected_settlement_costs,
+            "purchase_costs": f_purchase_costs,
+            "holding_costs": f_holding_costs,
+            "sales_costs": f_sales_costs,
+            "holding_period": f_holding_period,
+            "total_costs_abs": f_total_costs_abs,
+            "total_costs_rel": f_total_costs_rel,
+            "total_costs_detail": f_total_costs_detail,
+            "total_holding_costs": f_total_holding_costs,
+            "link_costs": f_link_costs,
+            "link_kid": f_link_kid,
+        },
+    )
+
+
+def _load_quantity(f_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_quantity)
+
+
+def _load_limit(f_limit: Any) -> Any:
+    return decode_lazy_amount_value(f_limit)
+
+
+def _load_expected_value(f_expected_value: Any) -> Any:
+    return decode_lazy_amount_value(f_expected_value)
+
+
+def _load_fx_rate(f_fx_rate: Any) -> Any:
+    return decode_lazy_fx_rate_eur(f_fx_rate)
+
+
+def _load_expected_settlement_costs(f_expected_settlement_costs: Any) -> Any:
+    return decode_lazy_amount_value(f_expected_settlement_costs)
+
+
+def _load_purchase_costs(f_purchase_costs: Any) -> Any:
+    return decode_lazy_cost_group(f_purchase_costs)
+
+
+def _load_holding_costs(f_holding_costs: Any) -> Any:
+    return decode_lazy_cost_group(f_holding_costs)
+
+
+def _load_sales_costs(f_sales_costs: Any) -> Any:
+    return decode_lazy_cost_group(f_sales_costs)
+
+
+def _load_total_costs_abs(f_total_costs_abs: Any) -> Any:
+    return decode_lazy_amount_value(f_total_costs_abs)
+
+
+def _load_total_costs_detail(f_total_costs_detail: Any) -> Any:
+    return decode_lazy_total_cost_block(f_total_costs_detail)
+
+
+def _load_total_holding_costs(f_total_holding_costs: Any) -> Any:
+    return decode_lazy_total_holding_cost_block(f_total_holding_costs)
+
+
+_LAZY_FIELDS = {
+    "quantity": _load_quantity,
+    "limit": _load_limit,
+    "expected_value": _load_expected_value,
+    "fx_rate": _load_fx_rate,
+    "expected_settlement_costs": _load_expected_settlement_costs,
+    "purchase_costs": _load_purchase_costs,
+    "holding_costs": _load_holding_costs,
+    "sales_costs": _load_sales_costs,
+    "total_costs_abs": _load_total_costs_abs,
+    "total_costs_detail": _load_total_costs_detail,
+    "total_holding_costs": _load_total_holding_costs,
+}
+
+
+def decode_lazy(obj: Any) -> CostIndicationExAnte:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_calculation_successful = obj.get("calculationSuccessful")
+    if f_calculation_successful is None:
+        f_calculation_successful = False
+    elif f_calculation_successful is not True and f_calculation_successful is not False:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and type(f_name) is not str:
+        raise Fallback
+    f_wkn = obj.get("wkn")
+    if f_wkn is not None and type(f_wkn) is not str:
+        raise Fallback
+    f_side = obj.get("side")
+    if f_side is not None and (type(f_side) is not str or f_side not in _SIDE_ENUM):
+        raise Fallback
+    f_venue_name = obj.get("venueName")
+    if f_venue_name is not None and type(f_venue_name) is not str:
+        raise Fallback
+    f_settlement_currency = obj.get("settlementCurrency")
+    if f_settlement_currency is not None and type(f_settlement_currency) is not str:
+        raise Fallback
+    f_trading_currency = obj.get("tradingCurrency")
+    if f_trading_currency is not None and type(f_trading_currency) is not str:
+        raise Fallback
+    f_reporting_currency = obj.get("reportingCurrency")
+    if f_reporting_currency is not None and type(f_reporting_currency) is not str:
+        raise Fallback
+    f_holding_period = obj.get("holdingPeriod")
+    if f_holding_period is not None and type(f_holding_period) is not str:
+        raise Fallback
+    f_total_costs_rel = obj.get("totalCostsRel")
+    if f_total_costs_rel is not None and type(f_total_costs_rel) is not str:
+        raise Fallback
+    f_link_costs = obj.get("linkCosts")
+    if f_link_costs is not None and type(f_link_costs) is not str:
+        raise Fallback
+    f_link_kid = obj.get("linkKid")
+    if f_link_kid is not None and type(f_link_kid) is not str:
+        raise Fallback
+    return construct_lazy(
+        CostIndicationExAnte,
+        _LAZY_FIELDS,
+        {
+            "depot_id": f_depot_id,
+            "calculation_successful": f_calculation_successful,
+            "name": f_name,
+            "wkn": f_wkn,
+            "side": f_side,
+            "venue_name": f_venue_name,
+            "settlement_currency": f_settlement_currency,
+            "trading_currency": f_trading_currency,
+            "reporting_currency": f_reporting_currency,
+            "holding_period": f_holding_period,
+            "total_costs_rel": f_total_costs_rel,
+            "link_costs": f_link_costs,
+            "link_kid": f_link_kid,
+        },
+        {
+            "quantity": obj.get("quantity"),
+            "limit": obj.get("limit"),
+            "expected_value": obj.get("expectedValue"),
+            "fx_rate": obj.get("fxRate"),
+            "expected_settlement_costs": obj.get("expectedSettlementCosts"),
+            "purchase_costs": obj.get("purchaseCosts"),
+            "holding_costs": obj.get("holdingCosts"),
+            "sales_costs": obj.get("salesCosts"),
+            "total_costs_abs": obj.get("totalCostsAbs"),
+            "total_costs_detail": obj.get("totalCostsDetail"),
+            "total_holding_costs": obj.get("totalHoldingCosts"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.cost_group import decode as decode_cost_group
+from openapi_client.decoders.cost_group import decode_lazy as decode_lazy_cost_group
+from openapi_client.decoders.fx_rate_eur import decode as decode_fx_rate_eur
+from openapi_client.decoders.fx_rate_eur import decode_lazy as decode_lazy_fx_rate_eur
+from openapi_client.decoders.total_cost_block import decode as decode_total_cost_block
+from openapi_client.decoders.total_cost_block import decode_lazy as decode_lazy_total_cost_block
+from openapi_client.decoders.total_holding_cost_block import decode as decode_total_holding_cost_block
+from openapi_client.decoders.total_holding_cost_block import decode_lazy as decode_lazy_total_holding_cost_block
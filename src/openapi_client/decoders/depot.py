@@ -0,0 +1,52 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Depot.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.depot import Depot
+
+
+def decode(obj: Any) -> Depot:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_depot_display_id = obj.get("depotDisplayId")
+    if f_depot_display_id is not None and type(f_depot_display_id) is not str:
+        raise Fallback
+    f_client_id = obj.get("clientId")
+    if f_client_id is not None and type(f_client_id) is not str:
+        raise Fallback
+    f_default_settlement_account_id = obj.get("defaultSettlementAccountId")
+    if f_default_settlement_account_id is not None and type(f_default_settlement_account_id) is not str:
+        raise Fallback
+    f_settlement_account_ids = obj.get("settlementAccountIds")
+    if f_settlement_account_ids is not None:
+        if type(f_settlement_account_ids) is not list:
+            raise Fallback
+        for item in f_settlement_account_ids:
+            if type(item) is not str:
+                raise Fallback
+        f_settlement_account_ids = list(f_settlement_account_ids)
+    return construct(
+        Depot,
+        {
+            "depot_id": f_depot_id,
+            "depot_display_id": f_depot_display_id,
+            "client_id": f_client_id,
+            "default_settlement_account_id": f_default_settlement_account_id,
+            "settlement_account_ids": f_settlement_account_ids,
+        },
+    )
+
+
+decode_lazy = decode
@@ -0,0 +1,149 @@
+# coding: utf-8
+
+"""
+Compiled decoder for DepotAggregation.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.depot_aggregation import DepotAggregation
+
+
+def decode(obj: Any) -> DepotAggregation:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot = obj.get("depot")
+    if f_depot is not None:
+        f_depot = decode_depot(f_depot)
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_date_last_update = obj.get("dateLastUpdate")
+    if f_date_last_update is not None and type(f_date_last_update) is not str:
+        raise Fallback
+    f_current_value = obj.get("currentValue")
+    if f_current_value is not None:
+        f_current_value = decode_amount_value(f_current_value)
+    f_purchase_value = obj.get("purchaseValue")
+    if f_purchase_value is not None:
+        f_purchase_value = decode_amount_value(f_purchase_value)
+    f_prev_day_value = obj.get("prevDayValue")
+    if f_prev_day_value is not None:
+        f_prev_day_value = decode_amount_value(f_prev_day_value)
+    f_lending_value = obj.get("lendingValue")
+    if f_lending_value is not None:
+        f_lending_value = decode_amount_value(f_lending_value)
+    f_profit_loss_purchase_abs = obj.get("profitLossPurchaseAbs")
+    if f_profit_loss_purchase_abs is not None:
+        f_profit_loss_purchase_abs = decode_amount_value(f_profit_loss_purchase_abs)
+    f_profit_loss_purchase_rel = obj.get("profitLossPurchaseRel")
+    if f_profit_loss_purchase_rel is not None and type(f_profit_loss_purchase_rel) is not str:
+        raise Fallback
+    f_profit_loss_prev_day_abs = obj.get("profitLossPrevDayAbs")
+    if f_profit_loss_prev_day_abs is not None:
+        f_profit_loss_prev_day_abs = decode_amount_value(f_profit_loss_prev_day_abs)
+    f_profit_loss_prev_day_rel = obj.get("profitLossPrevDayRel")
+    if f_profit_loss_prev_day_rel is not None and type(f_profit_loss_prev_day_rel) is not str:
+        raise Fallback
+    return construct(
+        DepotAggregation,
+        {
+            "depot": f_depot,
+            "depot_id": f_depot_id,
+            "date_last_update": f_date_last_update,
+            "current_value": f_current_value,
+            "purchase_value": f_purchase_value,
+            "prev_day_value": f_prev_day_value,
+            "lending_value": f_lending_value,
+            "profit_loss_purchase_abs": f_profit_loss_purchase_abs,
+            "profit_loss_purchase_rel": f_profit_loss_purchase_rel,
+            "profit_loss_prev_day_abs": f_profit_loss_prev_day_abs,
+            "profit_loss_prev_day_rel": f_profit_loss_prev_day_rel,
+        },
+    )
+
+
+def _load_depot(f_depot: Any) -> Any:
+    return decode_lazy_depot(f_depot)
+
+
+def _load_current_value(f_current_value: Any) -> Any:
+    return decode_lazy_amount_value(f_current_value)
+
+
+def _load_purchase_value(f_purchase_value: Any) -> Any:
+    return decode_lazy_amount_value(f_purchase_value)
+
+
+def _load_prev_day_value(f_prev_day_value: Any) -> Any:
+    return decode_lazy_amount_value(f_prev_day_value)
+
+
+def _load_lending_value(f_lending_value: Any) -> Any:
+    return decode_lazy_amount_value(f_lending_value)
+
+
+def _load_profit_loss_purchase_abs(f_profit_loss_purchase_abs: Any) -> Any:
+    return decode_lazy_amount_value(f_profit_loss_purchase_abs)
+
+
+def _load_profit_loss_prev_day_abs(f_profit_loss_prev_day_abs: Any) -> Any:
+    return decode_lazy_amount_value(f_profit_loss_prev_day_abs)
+
+
+_LAZY_FIELDS = {
+    "depot": _load_depot,
+    "current_value": _load_current_value,
+    "purchase_value": _load_purchase_value,
+    "prev_day_value": _load_prev_day_value,
+    "lending_value": _load_lending_value,
+    "profit_loss_purchase_abs": _load_profit_loss_purchase_abs,
+    "profit_loss_prev_day_abs": _load_profit_loss_prev_day_abs,
+}
+
+
+def decode_lazy(obj: Any) -> DepotAggregation:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_date_last_update = obj.get("dateLastUpdate")
+    if f_date_last_update is not None and type(f_date_last_update) is not str:
+        raise Fallback
+    f_profit_loss_purchase_rel = obj.get("profitLossPurchaseRel")
+    if f_profit_loss_purchase_rel is not None and type(f_profit_loss_purchase_rel) is not str:
+        raise Fallback
+    f_profit_loss_prev_day_rel = obj.get("profitLossPrevDayRel")
+    if f_profit_loss_prev_day_rel is not None and type(f_profit_loss_prev_day_rel) is not str:
+        raise Fallback
+    return construct_lazy(
+        DepotAggregation,
+        _LAZY_FIELDS,
+        {
+            "depot_id": f_depot_id,
+            "date_last_update": f_date_last_update,
+            "profit_loss_purchase_rel": f_profit_loss_purchase_rel,
+            "profit_loss_prev_day_rel": f_profit_loss_prev_day_rel,
+        },
+        {
+            "depot": obj.get("depot"),
+            "current_value": obj.get("currentValue"),
+            "purchase_value": obj.get("purchaseValue"),
+            "prev_day_value": obj.get("prevDayValue"),
+            "lending_value": obj.get("lendingValue"),
+            "profit_loss_purchase_abs": obj.get("profitLossPurchaseAbs"),
+            "profit_loss_prev_day_abs": obj.get("profitLossPrevDayAbs"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.depot import decode as decode_depot
+from openapi_client.decoders.depot import decode_lazy as decode_lazy_depot
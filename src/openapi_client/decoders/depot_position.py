@@ -0,0 +1,215 @@
+# coding: utf-8
+
+"""
+Compiled decoder for DepotPosition.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.depot_position import DepotPosition
+
+
+def decode(obj: Any) -> DepotPosition:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_position_id = obj.get("positionId")
+    if f_position_id is not None and type(f_position_id) is not str:
+        raise Fallback
+    f_wkn = obj.get("wkn")
+    if f_wkn is not None and type(f_wkn) is not str:
+        raise Fallback
+    f_custody_type = obj.get("custodyType")
+    if f_custody_type is not None and type(f_custody_type) is not str:
+        raise Fallback
+    f_quantity = obj.get("quantity")
+    if f_quantity is not None:
+        f_quantity = decode_amount_value(f_quantity)
+    f_available_quantity = obj.get("availableQuantity")
+    if f_available_quantity is not None:
+        f_available_quantity = decode_amount_value(f_available_quantity)
+    f_current_price = obj.get("currentPrice")
+    if f_current_price is not None:
+        f_current_price = decode_price(f_current_price)
+    f_purchase_price = obj.get("purchasePrice")
+    if f_purchase_price is not None:
+        f_purchase_price = decode_amount_value(f_purchase_price)
+    f_prev_day_price = obj.get("prevDayPrice")
+    if f_prev_day_price is not None:
+        f_prev_day_price = decode_price(f_prev_day_price)
+    f_current_value = obj.get("currentValue")
+    if f_current_value is not None:
+        f_current_value = decode_amount_value(f_current_value)
+    f_purchase_value = obj.get("purchaseValue")
+    if f_purchase_value is not None:
+        f_purchase_value = decode_amount_value(f_purchase_value)
+    f_prev_day_value = obj.get("prevDayValue")
+    if f_prev_day_value is not None:
+        f_prev_day_value = decode_amount_value(f_prev_day_value)
+    f_profit_loss_purchase_abs = obj.get("profitLossPurchaseAbs")
+    if f_profit_loss_purchase_abs is not None:
+        f_profit_loss_purchase_abs = decode_amount_value(f_profit_loss_purchase_abs)
+    f_profit_loss_purchase_rel = obj.get("profitLossPurchaseRel")
+    if f_profit_loss_purchase_rel is not None and type(f_profit_loss_purchase_rel) is not str:
+        raise Fallback
+    f_profit_loss_prev_day_abs = obj.get("profitLossPrevDayAbs")
+    if f_profit_loss_prev_day_abs is not None:
+        f_profit_loss_prev_day_abs = decode_amount_value(f_profit_loss_prev_day_abs)
+    f_profit_loss_prev_day_rel = obj.get("profitLossPrevDayRel")
+    if f_profit_loss_prev_day_rel is not None and type(f_profit_loss_prev_day_rel) is not str:
+        raise Fallback
+    f_instrument = obj.get("instrument")
+    if f_instrument is not None:
+        f_instrument = decode_instrument(f_instrument)
+    f_version = obj.get("version")
+    if f_version is not None and type(f_version) is not str:
+        raise Fallback
+    return construct(
+        DepotPosition,
+        {
+            "depot_id": f_depot_id,
+            "position_id": f_position_id,
+            "wkn": f_wkn,
+            "custody_type": f_custody_type,
+            "quantity": f_quantity,
+            "available_quantity": f_available_quantity,
+            "current_price": f_current_price,
+            "purchase_price": f_purchase_price,
+            "prev_day_price": f_prev_day_price,
+            "current_value": f_current_value,
+            "purchase_value": f_purchase_value,
+            "prev_day_value": f_prev_day_value,
+            "profit_loss_purchase_abs": f_profit_loss_purchase_abs,
+            "profit_loss_purchase_rel": f_profit_loss_purchase_rel,
+            "profit_loss_prev_day_abs": f_profit_loss_prev_day_abs,
+            "profit_loss_prev_day_rel": f_profit_loss_prev_day_rel,
+            "instrument": f_instrument,
+            "version": f_version,
+        },
+    )
+
+
+def _load_quantity(f_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_quantity)
+
+
+def _load_available_quantity(f_available_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_available_quantity)
+
+
+def _load_current_price(f_current_price: Any) -> Any:
+    return decode_lazy_price(f_current_price)
+
+
+def _load_purchase_price(f_purchase_price: Any) -> Any:
+    return decode_lazy_amount_value(f_purchase_price)
+
+
+def _load_prev_day_price(f_prev_day_price: Any) -> Any:
+    return decode_lazy_price(f_prev_day_price)
+
+
+def _load_current_value(f_current_value: Any) -> Any:
+    return decode_lazy_amount_value(f_current_value)
+
+
+def _load_purchase_value(f_purchase_value: Any) -> Any:
+    return decode_lazy_amount_value(f_purchase_value)
+
+
+def _load_prev_day_value(f_prev_day_value: Any) -> Any:
+    return decode_lazy_amount_value(f_prev_day_value)
+
+
+def _load_profit_loss_purchase_abs(f_profit_loss_purchase_abs: Any) -> Any:
+    return decode_lazy_amount_value(f_profit_loss_purchase_abs)
+
+
+def _load_profit_loss_prev_day_abs(f_profit_loss_prev_day_abs: Any) -> Any:
+    return decode_lazy_amount_value(f_profit_loss_prev_day_abs)
+
+
+def _load_instrument(f_instrument: Any) -> Any:
+    return decode_lazy_instrument(f_instrument)
+
+
+_LAZY_FIELDS = {
+    "quantity": _load_quantity,
+    "available_quantity": _load_available_quantity,
+    "current_price": _load_current_price,
+    "purchase_price": _load_purchase_price,
+    "prev_day_price": _load_prev_day_price,
+    "current_value": _load_current_value,
+    "purchase_value": _load_purchase_value,
+    "prev_day_value": _load_prev_day_value,
+    "profit_loss_purchase_abs": _load_profit_loss_purchase_abs,
+    "profit_loss_prev_day_abs": _load_profit_loss_prev_day_abs,
+    "instrument": _load_instrument,
+}
+
+
+def decode_lazy(obj: Any) -> DepotPosition:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and type(f_depot_id) is not str:
+        raise Fallback
+    f_position_id = obj.get("positionId")
+    if f_position_id is not None and type(f_position_id) is not str:
+        raise Fallback
+    f_wkn = obj.get("wkn")
+    if f_wkn is not None and type(f_wkn) is not str:
+        raise Fallback
+    f_custody_type = obj.get("custodyType")
+    if f_custody_type is not None and type(f_custody_type) is not str:
+        raise Fallback
+    f_profit_loss_purchase_rel = obj.get("profitLossPurchaseRel")
+    if f_profit_loss_purchase_rel is not None and type(f_profit_loss_purchase_rel) is not str:
+        raise Fallback
+    f_profit_loss_prev_day_rel = obj.get("profitLossPrevDayRel")
+    if f_profit_loss_prev_day_rel is not None and type(f_profit_loss_prev_day_rel) is not str:
+        raise Fallback
+    f_version = obj.get("version")
+    if f_version is not None and type(f_version) is not str:
+        raise Fallback
+    return construct_lazy(
+        DepotPosition,
+        _LAZY_FIELDS,
+        {
+            "depot_id": f_depot_id,
+            "position_id": f_position_id,
+            "wkn": f_wkn,
+            "custody_type": f_custody_type,
+            "profit_loss_purchase_rel": f_profit_loss_purchase_rel,
+            "profit_loss_prev_day_rel": f_profit_loss_prev_day_rel,
+            "version": f_version,
+        },
+        {
+            "quantity": obj.get("quantity"),
+            "available_quantity": obj.get("availableQuantity"),
+            "current_price": obj.get("currentPrice"),
+            "purchase_price": obj.get("purchasePrice"),
+            "prev_day_price": obj.get("prevDayPrice"),
+            "current_value": obj.get("currentValue"),
+            "purchase_value": obj.get("purchaseValue"),
+            "prev_day_value": obj.get("prevDayValue"),
+            "profit_loss_purchase_abs": obj.get("profitLossPurchaseAbs"),
+            "profit_loss_prev_day_abs": obj.get("profitLossPrevDayAbs"),
+            "instrument": obj.get("instrument"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.instrument import decode as decode_instrument
+from openapi_client.decoders.instrument import decode_lazy as decode_lazy_instrument
+from openapi_client.decoders.price import decode as decode_price
+from openapi_client.decoders.price import decode_lazy as decode_lazy_price
@@ -0,0 +1,190 @@
+# coding: utf-8
+
+"""
+Compiled decoder for DepotTransaction.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+import re
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.depot_transaction import DepotTransaction
+
+_BOOKING_STATUS_ENUM = frozenset(["BOOKED", "NOTBOOKED"])
+_BOOKING_DATE_PATTERN = re.compile("^\\d{4}-\\d{2}-\\d{2}$")
+_BUSINESS_DATE_PATTERN = re.compile("^\\d{4}-\\d{2}-\\d{2}$")
+_TRANSACTION_DIRECTION_ENUM = frozenset(["IN", "OUT"])
+_TRANSACTION_TYPE_ENUM = frozenset(["BUY", "SELL", "TRANSFER_IN", "TRANSFER_OUT", "OTHER"])
+
+
+def decode(obj: Any) -> DepotTransaction:
+    if type(obj) is not dict:
+        raise Fallback
+    f_transaction_id = obj.get("transactionId")
+    if f_transaction_id is not None and type(f_transaction_id) is not str:
+        raise Fallback
+    f_booking_status = obj.get("bookingStatus")
+    if f_booking_status is not None and (
+        type(f_booking_status) is not str or f_booking_status not in _BOOKING_STATUS_ENUM
+    ):
+        raise Fallback
+    f_booking_date = obj.get("bookingDate")
+    if f_booking_date is not None and (
+        type(f_booking_date) is not str or not _BOOKING_DATE_PATTERN.match(f_booking_date)
+    ):
+        raise Fallback
+    f_settlement_date = obj.get("settlementDate")
+    if f_settlement_date is not None and type(f_settlement_date) is not str:
+        raise Fallback
+    f_business_date = obj.get("businessDate")
+    if f_business_date is not None and (
+        type(f_business_date) is not str or not _BUSINESS_DATE_PATTERN.match(f_business_date)
+    ):
+        raise Fallback
+    f_quantity = obj.get("quantity")
+    if f_quantity is not None:
+        f_quantity = decode_amount_value(f_quantity)
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and type(f_instrument_id) is not str:
+        raise Fallback
+    f_instrument = obj.get("instrument")
+    if f_instrument is not None:
+        f_instrument = decode_instrument(f_instrument)
+    f_execution_price = obj.get("executionPrice")
+    if f_execution_price is not None:
+        f_execution_price = decode_amount_value(f_execution_price)
+    f_transaction_value = obj.get("transactionValue")
+    if f_transaction_value is not None:
+        f_transaction_value = decode_amount_value(f_transaction_value)
+    f_transaction_direction = obj.get("transactionDirection")
+    if f_transaction_direction is not None and (
+        type(f_transaction_direction) is not str or f_transaction_direction not in _TRANSACTION_DIRECTION_ENUM
+    ):
+        raise Fallback
+    f_transaction_type = obj.get("transactionType")
+    if f_transaction_type is not None and (
+        type(f_transaction_type) is not str or f_transaction_type not in _TRANSACTION_TYPE_ENUM
+    ):
+        raise Fallback
+    f_fx_rate = obj.get("fxRate")
+    if f_fx_rate is not None:
+        f_fx_rate = decode_fx_rate_eur(f_fx_rate)
+    return construct(
+        DepotTransaction,
+        {
+            "transaction_id": f_transaction_id,
+            "booking_status": f_booking_status,
+            "booking_date": f_booking_date,
+            "settlement_date": f_settlement_date,
+            "business_date": f_business_date,
+            "quantity": f_quantity,
+            "instrument_id": f_instrument_id,
+            "instrument": f_instrument,
+            "execution_price": f_execution_price,
+            "transaction_value": f_transaction_value,
+            "transaction_direction": f_transaction_direction,
+            "transaction_type": f_transaction_type,
+            "fx_rate": f_fx_rate,
+        },
+    )
+
+
+def _load_quantity(f_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_quantity)
+
+
+def _load_instrument(f_instrument: Any) -> Any:
+    return decode_lazy_instrument(f_instrument)
+
+
+def _load_execution_price(f_execution_price: Any) -> Any:
+    return decode_lazy_amount_value(f_execution_price)
+
+
+def _load_transaction_value(f_transaction_value: Any) -> Any:
+    return decode_lazy_amount_value(f_transaction_value)
+
+
+def _load_fx_rate(f_fx_rate: Any) -> Any:
+    return decode_lazy_fx_rate_eur(f_fx_rate)
+
+
+_LAZY_FIELDS = {
+    "quantity": _load_quantity,
+    "instrument": _load_instrument,
+    "execution_price": _load_execution_price,
+    "transaction_value": _load_transaction_value,
+    "fx_rate": _load_fx_rate,
+}
+
+
+def decode_lazy(obj: Any) -> DepotTransaction:
+    if type(obj) is not dict:
+        raise Fallback
+    f_transaction_id = obj.get("transactionId")
+    if f_transaction_id is not None and type(f_transaction_id) is not str:
+        raise Fallback
+    f_booking_status = obj.get("bookingStatus")
+    if f_booking_status is not None and (
+        type(f_booking_status) is not str or f_booking_status not in _BOOKING_STATUS_ENUM
+    ):
+        raise Fallback
+    f_booking_date = obj.get("bookingDate")
+    if f_booking_date is not None and (
+        type(f_booking_date) is not str or not _BOOKING_DATE_PATTERN.match(f_booking_date)
+    ):
+        raise Fallback
+    f_settlement_date = obj.get("settlementDate")
+    if f_settlement_date is not None and type(f_settlement_date) is not str:
+        raise Fallback
+    f_business_date = obj.get("businessDate")
+    if f_business_date is not None and (
+        type(f_business_date) is not str or not _BUSINESS_DATE_PATTERN.match(f_business_date)
+    ):
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and type(f_instrument_id) is not str:
+        raise Fallback
+    f_transaction_direction = obj.get("transactionDirection")
+    if f_transaction_direction is not None and (
+        type(f_transaction_direction) is not str or f_transaction_direction not in _TRANSACTION_DIRECTION_ENUM
+    ):
+        raise Fallback
+    f_transaction_type = obj.get("transactionType")
+    if f_transaction_type is not None and (
+        type(f_transaction_type) is not str or f_transaction_type not in _TRANSACTION_TYPE_ENUM
+    ):
+        raise Fallback
+    return construct_lazy(
+        DepotTransaction,
+        _LAZY_FIELDS,
+        {
+            "transaction_id": f_transaction_id,
+            "booking_status": f_booking_status,
+            "booking_date": f_booking_date,
+            "settlement_date": f_settlement_date,
+            "business_date": f_business_date,
+            "instrument_id": f_instrument_id,
+            "transaction_direction": f_transaction_direction,
+            "transaction_type": f_transaction_type,
+        },
+        {
+            "quantity": obj.get("quantity"),
+            "instrument": obj.get("instrument"),
+            "execution_price": obj.get("executionPrice"),
+            "transaction_value": obj.get("transactionValue"),
+            "fx_rate": obj.get("fxRate"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.fx_rate_eur import decode as decode_fx_rate_eur
+from openapi_client.decoders.fx_rate_eur import decode_lazy as decode_lazy_fx_rate_eur
+from openapi_client.decoders.instrument import decode as decode_instrument
+from openapi_client.decoders.instrument import decode_lazy as decode_lazy_instrument
@@ -0,0 +1,207 @@
+# coding: utf-8
+
+"""
+Compiled decoder for DerivativeData.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.derivative_data import DerivativeData
+
+_CERTIFICATE_TYPE_ENUM = frozenset(
+    [
+        "Hebel",
+        "Index",
+        "Basket",
+        "Hedge-Fonds-Zertifikat",
+        "Discount",
+        "Aktienanleihe",
+        "Bandbreite",
+        "Outperformance",
+        "Express",
+        "Bonus",
+        "Kapitalschutz",
+    ]
+)
+_WARRANT_TYPE_ENUM = frozenset(["Call", "Put"])
+_INTEREST_PAYMENT_INTERVAL_ENUM = frozenset(["MONTHLY", "QUARTERLY", "SEMIANNUALLY", "ANNUALLY", "OTHER"])
+
+
+def decode(obj: Any) -> DerivativeData:
+    if type(obj) is not dict:
+        raise Fallback
+    f_underlying_instrument = obj.get("underlyingInstrument")
+    if f_underlying_instrument is not None:
+        f_underlying_instrument = decode_instrument(f_underlying_instrument)
+    f_underlying_price = obj.get("underlyingPrice")
+    if f_underlying_price is not None:
+        f_underlying_price = decode_price(f_underlying_price)
+    f_certificate_type = obj.get("certificateType")
+    if f_certificate_type is not None and (
+        type(f_certificate_type) is not str or f_certificate_type not in _CERTIFICATE_TYPE_ENUM
+    ):
+        raise Fallback
+    f_rating = obj.get("rating")
+    if f_rating is not None:
+        f_rating = decode_rating(f_rating)
+    f_strike_price = obj.get("strikePrice")
+    if f_strike_price is not None:
+        f_strike_price = decode_amount_value(f_strike_price)
+    f_leverage = obj.get("leverage")
+    if f_leverage is not None and type(f_leverage) is not str:
+        raise Fallback
+    f_multiplier = obj.get("multiplier")
+    if f_multiplier is not None and type(f_multiplier) is not str:
+        raise Fallback
+    f_expiry_date = obj.get("expiryDate")
+    if f_expiry_date is not None and type(f_expiry_date) is not str:
+        raise Fallback
+    f_yield_pa = obj.get("yieldPA")
+    if f_yield_pa is not None and type(f_yield_pa) is not str:
+        raise Fallback
+    f_remaining_term_in_years = obj.get("remainingTermInYears")
+    if f_remaining_term_in_years is not None and type(f_remaining_term_in_years) is not str:
+        raise Fallback
+    f_nominal_rate = obj.get("nominalRate")
+    if f_nominal_rate is not None and type(f_nominal_rate) is not str:
+        raise Fallback
+    f_warrant_type = obj.get("warrantType")
+    if f_warrant_type is not None and (type(f_warrant_type) is not str or f_warrant_type not in _WARRANT_TYPE_ENUM):
+        raise Fallback
+    f_maturity_date = obj.get("maturityDate")
+    if f_maturity_date is not None and type(f_maturity_date) is not str:
+        raise Fallback
+    f_interest_payment_date = obj.get("interestPaymentDate")
+    if f_interest_payment_date is not None and type(f_interest_payment_date) is not str:
+        raise Fallback
+    f_interest_payment_interval = obj.get("interestPaymentInterval")
+    if f_interest_payment_interval is not None and (
+        type(f_interest_payment_interval) is not str
+        or f_interest_payment_interval not in _INTEREST_PAYMENT_INTERVAL_ENUM
+    ):
+        raise Fallback
+    return construct(
+        DerivativeData,
+        {
+            "underlying_instrument": f_underlying_instrument,
+            "underlying_price": f_underlying_price,
+            "certificate_type": f_certificate_type,
+            "rating": f_rating,
+            "strike_price": f_strike_price,
+            "leverage": f_leverage,
+            "multiplier": f_multiplier,
+            "expiry_date": f_expiry_date,
+            "yield_pa": f_yield_pa,
+            "remaining_term_in_years": f_remaining_term_in_years,
+            "nominal_rate": f_nominal_rate,
+            "warrant_type": f_warrant_type,
+            "maturity_date": f_maturity_date,
+            "interest_payment_date": f_interest_payment_date,
+            "interest_payment_interval": f_interest_payment_interval,
+        },
+    )
+
+
+def _load_underlying_instrument(f_underlying_instrument: Any) -> Any:
+    return decode_lazy_instrument(f_underlying_instrument)
+
+
+def _load_underlying_price(f_underlying_price: Any) -> Any:
+    return decode_lazy_price(f_underlying_price)
+
+
+def _load_rating(f_rating: Any) -> Any:
+    return decode_lazy_rating(f_rating)
+
+
+def _load_strike_price(f_strike_price: Any) -> Any:
+    return decode_lazy_amount_value(f_strike_price)
+
+
+_LAZY_FIELDS = {
+    "underlying_instrument": _load_underlying_instrument,
+    "underlying_price": _load_underlying_price,
+    "rating": _load_rating,
+    "strike_price": _load_strike_price,
+}
+
+
+def decode_lazy(obj: Any) -> DerivativeData:
+    if type(obj) is not dict:
+        raise Fallback
+    f_certificate_type = obj.get("certificateType")
+    if f_certificate_type is not None and (
+        type(f_certificate_type) is not str or f_certificate_type not in _CERTIFICATE_TYPE_ENUM
+    ):
+        raise Fallback
+    f_leverage = obj.get("leverage")
+    if f_leverage is not None and type(f_leverage) is not str:
+        raise Fallback
+    f_multiplier = obj.get("multiplier")
+    if f_multiplier is not None and type(f_multiplier) is not str:
+        raise Fallback
+    f_expiry_date = obj.get("expiryDate")
+    if f_expiry_date is not None and type(f_expiry_date) is not str:
+        raise Fallback
+    f_yield_pa = obj.get("yieldPA")
+    if f_yield_pa is not None and type(f_yield_pa) is not str:
+        raise Fallback
+    f_remaining_term_in_years = obj.get("remainingTermInYears")
+    if f_remaining_term_in_years is not None and type(f_remaining_term_in_years) is not str:
+        raise Fallback
+    f_nominal_rate = obj.get("nominalRate")
+    if f_nominal_rate is not None and type(f_nominal_rate) is not str:
+        raise Fallback
+    f_warrant_type = obj.get("warrantType")
+    if f_warrant_type is not None and (type(f_warrant_type) is not str or f_warrant_type not in _WARRANT_TYPE_ENUM):
+        raise Fallback
+    f_maturity_date = obj.get("maturityDate")
+    if f_maturity_date is not None and type(f_maturity_date) is not str:
+        raise Fallback
+    f_interest_payment_date = obj.get("interestPaymentDate")
+    if f_interest_payment_date is not None and type(f_interest_payment_date) is not str:
+        raise Fallback
+    f_interest_payment_interval = obj.get("interestPaymentInterval")
+    if f_interest_payment_interval is not None and (
+        type(f_interest_payment_interval) is not str
+        or f_interest_payment_interval not in _INTEREST_PAYMENT_INTERVAL_ENUM
+    ):
+        raise Fallback
+    return construct_lazy(
+        DerivativeData,
+        _LAZY_FIELDS,
+        {
+            "certificate_type": f_certificate_type,
+            "leverage": f_leverage,
+            "multiplier": f_multiplier,
+            "expiry_date": f_expiry_date,
+            "yield_pa": f_yield_pa,
+            "remaining_term_in_years": f_remaining_term_in_years,
+            "nominal_rate": f_nominal_rate,
+            "warrant_type": f_warrant_type,
+            "maturity_date": f_maturity_date,
+            "interest_payment_date": f_interest_payment_date,
+            "interest_payment_interval": f_interest_payment_interval,
+        },
+        {
+            "underlying_instrument": obj.get("underlyingInstrument"),
+            "underlying_price": obj.get("underlyingPrice"),
+            "rating": obj.get("rating"),
+            "strike_price": obj.get("strikePrice"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.instrument import decode as decode_instrument
+from openapi_client.decoders.instrument import decode_lazy as decode_lazy_instrument
+from openapi_client.decoders.price import decode as decode_price
+from openapi_client.decoders.price import decode_lazy as decode_lazy_price
+from openapi_client.decoders.rating import decode as decode_rating
+from openapi_client.decoders.rating import decode_lazy as decode_lazy_rating
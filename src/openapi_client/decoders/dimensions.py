@@ -0,0 +1,45 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Dimensions.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.dimensions import Dimensions
+
+
+def decode(obj: Any) -> Dimensions:
+    if type(obj) is not dict:
+        raise Fallback
+    f_venues = obj.get("venues")
+    if f_venues is not None:
+        if type(f_venues) is not list:
+            raise Fallback
+        f_venues = [decode_venue(item) for item in f_venues]
+    return construct(Dimensions, {"venues": f_venues})
+
+
+def _load_venues(f_venues: Any) -> Any:
+    if type(f_venues) is not list:
+        raise Fallback
+    f_venues = [decode_lazy_venue(item) for item in f_venues]
+    return f_venues
+
+
+_LAZY_FIELDS = {"venues": _load_venues}
+
+
+def decode_lazy(obj: Any) -> Dimensions:
+    if type(obj) is not dict:
+        raise Fallback
+    return construct_lazy(Dimensions, _LAZY_FIELDS, {}, {"venues": obj.get("venues")})
+
+
+from openapi_client.decoders.venue import decode as decode_venue
+from openapi_client.decoders.venue import decode_lazy as decode_lazy_venue
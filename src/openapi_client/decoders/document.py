@@ -0,0 +1,107 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Document.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.document import Document
+
+
+def decode(obj: Any) -> Document:
+    if type(obj) is not dict:
+        raise Fallback
+    f_document_id = obj.get("documentId")
+    if f_document_id is not None and type(f_document_id) is not str:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and (type(f_name) is not str or len(f_name) > 255):
+        raise Fallback
+    f_date_creation = obj.get("dateCreation")
+    if f_date_creation is not None and type(f_date_creation) is not str:
+        raise Fallback
+    f_mime_type = obj.get("mimeType")
+    if f_mime_type is not None and type(f_mime_type) is not str:
+        raise Fallback
+    f_deletable = obj.get("deletable")
+    if f_deletable is None:
+        f_deletable = False
+    elif f_deletable is not True and f_deletable is not False:
+        raise Fallback
+    f_advertisement = obj.get("advertisement")
+    if f_advertisement is None:
+        f_advertisement = False
+    elif f_advertisement is not True and f_advertisement is not False:
+        raise Fallback
+    f_document_meta_data = obj.get("documentMetaData")
+    if f_document_meta_data is not None:
+        f_document_meta_data = decode_document_metadata(f_document_meta_data)
+    return construct(
+        Document,
+        {
+            "document_id": f_document_id,
+            "name": f_name,
+            "date_creation": f_date_creation,
+            "mime_type": f_mime_type,
+            "deletable": f_deletable,
+            "advertisement": f_advertisement,
+            "document_meta_data": f_document_meta_data,
+        },
+    )
+
+
+def _load_document_meta_data(f_document_meta_data: Any) -> Any:
+    return decode_lazy_document_metadata(f_document_meta_data)
+
+
+_LAZY_FIELDS = {"document_meta_data": _load_document_meta_data}
+
+
+def decode_lazy(obj: Any) -> Document:
+    if type(obj) is not dict:
+        raise Fallback
+    f_document_id = obj.get("documentId")
+    if f_document_id is not None and type(f_document_id) is not str:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and (type(f_name) is not str or len(f_name) > 255):
+        raise Fallback
+    f_date_creation = obj.get("dateCreation")
+    if f_date_creation is not None and type(f_date_creation) is not str:
+        raise Fallback
+    f_mime_type = obj.get("mimeType")
+    if f_mime_type is not None and type(f_mime_type) is not str:
+        raise Fallback
+    f_deletable = obj.get("deletable")
+    if f_deletable is None:
+        f_deletable = False
+    elif f_deletable is not True and f_deletable is not False:
+        raise Fallback
+    f_advertisement = obj.get("advertisement")
+    if f_advertisement is None:
+        f_advertisement = False
+    elif f_advertisement is not True and f_advertisement is not False:
+        raise Fallback
+    return construct_lazy(
+        Document,
+        _LAZY_FIELDS,
+        {
+            "document_id": f_document_id,
+            "name": f_name,
+            "date_creation": f_date_creation,
+            "mime_type": f_mime_type,
+            "deletable": f_deletable,
+            "advertisement": f_advertisement,
+        },
+        {"document_meta_data": obj.get("documentMetaData")},
+    )
+
+
+from openapi_client.decoders.document_metadata import decode as decode_document_metadata
+from openapi_client.decoders.document_metadata import decode_lazy as decode_lazy_document_metadata
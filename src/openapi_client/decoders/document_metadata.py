@@ -0,0 +1,49 @@
+# coding: utf-8
+
+"""
+Compiled decoder for DocumentMetadata.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.document_metadata import DocumentMetadata
+
+
+def decode(obj: Any) -> DocumentMetadata:
+    if type(obj) is not dict:
+        raise Fallback
+    f_archived = obj.get("archived")
+    if f_archived is None:
+        f_archived = False
+    elif f_archived is not True and f_archived is not False:
+        raise Fallback
+    f_date_read = obj.get("dateRead")
+    if f_date_read is not None and type(f_date_read) is not str:
+        raise Fallback
+    f_already_read = obj.get("alreadyRead")
+    if f_already_read is None:
+        f_already_read = False
+    elif f_already_read is not True and f_already_read is not False:
+        raise Fallback
+    f_predocument_exists = obj.get("predocumentExists")
+    if f_predocument_exists is None:
+        f_predocument_exists = False
+    elif f_predocument_exists is not True and f_predocument_exists is not False:
+        raise Fallback
+    return construct(
+        DocumentMetadata,
+        {
+            "archived": f_archived,
+            "date_read": f_date_read,
+            "already_read": f_already_read,
+            "predocument_exists": f_predocument_exists,
+        },
+    )
+
+
+decode_lazy = decode
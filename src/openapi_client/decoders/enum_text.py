@@ -0,0 +1,29 @@
+# coding: utf-8
+
+"""
+Compiled decoder for EnumText.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.enum_text import EnumText
+
+
+def decode(obj: Any) -> EnumText:
+    if type(obj) is not dict:
+        raise Fallback
+    f_key = obj.get("key")
+    if f_key is not None and (type(f_key) is not str or len(f_key) < 1 or len(f_key) > 40):
+        raise Fallback
+    f_text = obj.get("text")
+    if f_text is not None and (type(f_text) is not str or len(f_text) > 65):
+        raise Fallback
+    return construct(EnumText, {"key": f_key, "text": f_text})
+
+
+decode_lazy = decode
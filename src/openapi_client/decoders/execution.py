@@ -0,0 +1,83 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Execution.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.execution import Execution
+
+
+def decode(obj: Any) -> Execution:
+    if type(obj) is not dict:
+        raise Fallback
+    f_execution_id = obj.get("executionId")
+    if f_execution_id is not None and (type(f_execution_id) is not str or len(f_execution_id) > 40):
+        raise Fallback
+    f_execution_number = obj.get("executionNumber")
+    if f_execution_number is not None and type(f_execution_number) is not int:
+        raise Fallback
+    f_executed_quantity = obj.get("executedQuantity")
+    if f_executed_quantity is not None:
+        f_executed_quantity = decode_amount_value(f_executed_quantity)
+    f_execution_price = obj.get("executionPrice")
+    if f_execution_price is not None:
+        f_execution_price = decode_amount_value(f_execution_price)
+    f_execution_timestamp = obj.get("executionTimestamp")
+    if f_execution_timestamp is not None and type(f_execution_timestamp) is not str:
+        raise Fallback
+    return construct(
+        Execution,
+        {
+            "execution_id": f_execution_id,
+            "execution_number": f_execution_number,
+            "executed_quantity": f_executed_quantity,
+            "execution_price": f_execution_price,
+            "execution_timestamp": f_execution_timestamp,
+        },
+    )
+
+
+def _load_executed_quantity(f_executed_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_executed_quantity)
+
+
+def _load_execution_price(f_execution_price: Any) -> Any:
+    return decode_lazy_amount_value(f_execution_price)
+
+
+_LAZY_FIELDS = {"executed_quantity": _load_executed_quantity, "execution_price": _load_execution_price}
+
+
+def decode_lazy(obj: Any) -> Execution:
+    if type(obj) is not dict:
+        raise Fallback
+    f_execution_id = obj.get("executionId")
+    if f_execution_id is not None and (type(f_execution_id) is not str or len(f_execution_id) > 40):
+        raise Fallback
+    f_execution_number = obj.get("executionNumber")
+    if f_execution_number is not None and type(f_execution_number) is not int:
+        raise Fallback
+    f_execution_timestamp = obj.get("executionTimestamp")
+    if f_execution_timestamp is not None and type(f_execution_timestamp) is not str:
+        raise Fallback
+    return construct_lazy(
+        Execution,
+        _LAZY_FIELDS,
+        {
+            "execution_id": f_execution_id,
+            "execution_number": f_execution_number,
+            "execution_timestamp": f_execution_timestamp,
+        },
+        {"executed_quantity": obj.get("executedQuantity"), "execution_price": obj.get("executionPrice")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
@@ -0,0 +1,133 @@
+# coding: utf-8
+
+"""
+Compiled decoder for FixedTermSavings.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.fixed_term_savings import FixedTermSavings
+
+_FIXED_TERM_SAVINGS_TYPE_ENUM = frozenset(["SHORT_TERM", "LONG_TERM"])
+
+
+def decode(obj: Any) -> FixedTermSavings:
+    if type(obj) is not dict:
+        raise Fallback
+    f_fixed_term_savings_id = obj.get("fixedTermSavingsId")
+    if f_fixed_term_savings_id is not None and type(f_fixed_term_savings_id) is not str:
+        raise Fallback
+    f_savings_amount = obj.get("savingsAmount")
+    if f_savings_amount is not None:
+        f_savings_amount = decode_amount_value(f_savings_amount)
+    f_interest_rate = obj.get("interestRate")
+    if f_interest_rate is not None and type(f_interest_rate) is not str:
+        raise Fallback
+    f_fixed_term_savings_type = obj.get("fixedTermSavingsType")
+    if f_fixed_term_savings_type is not None and (
+        type(f_fixed_term_savings_type) is not str or f_fixed_term_savings_type not in _FIXED_TERM_SAVINGS_TYPE_ENUM
+    ):
+        raise Fallback
+    f_fixed_term_savings_display_name = obj.get("fixedTermSavingsDisplayName")
+    if f_fixed_term_savings_display_name is not None and type(f_fixed_term_savings_display_name) is not str:
+        raise Fallback
+    f_contract_period_in_months = obj.get("contractPeriodInMonths")
+    if f_contract_period_in_months is not None and type(f_contract_period_in_months) is not int:
+        raise Fallback
+    f_creation_date = obj.get("creationDate")
+    if f_creation_date is not None and type(f_creation_date) is not str:
+        raise Fallback
+    f_expiration_date = obj.get("expirationDate")
+    if f_expiration_date is not None and type(f_expiration_date) is not str:
+        raise Fallback
+    f_prolongation_amount = obj.get("prolongationAmount")
+    if f_prolongation_amount is not None:
+        f_prolongation_amount = decode_amount_value(f_prolongation_amount)
+    f_extendable = obj.get("extendable")
+    if f_extendable is None:
+        f_extendable = False
+    elif f_extendable is not True and f_extendable is not False:
+        raise Fallback
+    return construct(
+        FixedTermSavings,
+        {
+            "fixed_term_savings_id": f_fixed_term_savings_id,
+            "savings_amount": f_savings_amount,
+            "interest_rate": f_interest_rate,
+            "fixed_term_savings_type": f_fixed_term_savings_type,
+            "fixed_term_savings_display_name": f_fixed_term_savings_display_name,
+            "contract_period_in_months": f_contract_period_in_months,
+            "creation_date": f_creation_date,
+            "expiration_date": f_expiration_date,
+            "prolongation_amount": f_prolongation_amount,
+            "extendable": f_extendable,
+        },
+    )
+
+
+def _load_savings_amount(f_savings_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_savings_amount)
+
+
+def _load_prolongation_amount(f_prolongation_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_prolongation_amount)
+
+
+_LAZY_FIELDS = {"savings_amount": _load_savings_amount, "prolongation_amount": _load_prolongation_amount}
+
+
+def decode_lazy(obj: Any) -> FixedTermSavings:
+    if type(obj) is not dict:
+        raise Fallback
+    f_fixed_term_savings_id = obj.get("fixedTermSavingsId")
+    if f_fixed_term_savings_id is not None and type(f_fixed_term_savings_id) is not str:
+        raise Fallback
+    f_interest_rate = obj.get("interestRate")
+    if f_interest_rate is not None and type(f_interest_rate) is not str:
+        raise Fallback
+    f_fixed_term_savings_type = obj.get("fixedTermSavingsType")
+    if f_fixed_term_savings_type is not None and (
+        type(f_fixed_term_savings_type) is not str or f_fixed_term_savings_type not in _FIXED_TERM_SAVINGS_TYPE_ENUM
+    ):
+        raise Fallback
+    f_fixed_term_savings_display_name = obj.get("fixedTermSavingsDisplayName")
+    if f_fixed_term_savings_display_name is not None and type(f_fixed_term_savings_display_name) is not str:
+        raise Fallback
+    f_contract_period_in_months = obj.get("contractPeriodInMonths")
+    if f_contract_period_in_months is not None and type(f_contract_period_in_months) is not int:
+        raise Fallback
+    f_creation_date = obj.get("creationDate")
+    if f_creation_date is not None and type(f_creation_date) is not str:
+        raise Fallback
+    f_expiration_date = obj.get("expirationDate")
+    if f_expiration_date is not None and type(f_expiration_date) is not str:
+        raise Fallback
+    f_extendable = obj.get("extendable")
+    if f_extendable is None:
+        f_extendable = False
+    elif f_extendable is not True and f_extendable is not False:
+        raise Fallback
+    return construct_lazy(
+        FixedTermSavings,
+        _LAZY_FIELDS,
+        {
+            "fixed_term_savings_id": f_fixed_term_savings_id,
+            "interest_rate": f_interest_rate,
+            "fixed_term_savings_type": f_fixed_term_savings_type,
+            "fixed_term_savings_display_name": f_fixed_term_savings_display_name,
+            "contract_period_in_months": f_contract_period_in_months,
+            "creation_date": f_creation_date,
+            "expiration_date": f_expiration_date,
+            "extendable": f_extendable,
+        },
+        {"savings_amount": obj.get("savingsAmount"), "prolongation_amount": obj.get("prolongationAmount")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
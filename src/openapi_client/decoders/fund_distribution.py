@@ -0,0 +1,161 @@
+# coding: utf-8
+
+"""
+Compiled decoder for FundDistribution.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.fund_distribution import FundDistribution
+
+_FUND_STATUS_ENUM = frozenset(["A", "K", "P", "R", "V", "N", "L", "D", "F", "I", "M"])
+
+
+def decode(obj: Any) -> FundDistribution:
+    if type(obj) is not dict:
+        raise Fallback
+    f_fund_status = obj.get("fundStatus")
+    if f_fund_status is not None and (type(f_fund_status) is not str or f_fund_status not in _FUND_STATUS_ENUM):
+        raise Fallback
+    f_fund_flags = obj.get("fundFlags")
+    if f_fund_flags is not None:
+        if type(f_fund_flags) is not list:
+            raise Fallback
+        for item in f_fund_flags:
+            if type(item) is not str:
+                raise Fallback
+        f_fund_flags = list(f_fund_flags)
+    f_currency = obj.get("currency")
+    if f_currency is not None and type(f_currency) is not str:
+        raise Fallback
+    f_regular_issue_surcharge = obj.get("regularIssueSurcharge")
+    if f_regular_issue_surcharge is not None and type(f_regular_issue_surcharge) is not str:
+        raise Fallback
+    f_discount_issue_surcharge = obj.get("discountIssueSurcharge")
+    if f_discount_issue_surcharge is not None and type(f_discount_issue_surcharge) is not str:
+        raise Fallback
+    f_reduced_issue_surcharge = obj.get("reducedIssueSurcharge")
+    if f_reduced_issue_surcharge is not None and type(f_reduced_issue_surcharge) is not str:
+        raise Fallback
+    f_individual_issue_surcharge = obj.get("individualIssueSurcharge")
+    if f_individual_issue_surcharge is not None and type(f_individual_issue_surcharge) is not str:
+        raise Fallback
+    f_is_individual_issue_surcharge_corrected = obj.get("isIndividualIssueSurchargeCorrected")
+    if f_is_individual_issue_surcharge_corrected is None:
+        f_is_individual_issue_surcharge_corrected = False
+    elif (
+        f_is_individual_issue_surcharge_corrected is not True
+        and f_is_individual_issue_surcharge_corrected is not False
+    ):
+        raise Fallback
+    f_bonification = obj.get("bonification")
+    if f_bonification is not None and type(f_bonification) is not str:
+        raise Fallback
+    f_investment_category = obj.get("investmentCategory")
+    if f_investment_category is not None and type(f_investment_category) is not str:
+        raise Fallback
+    f_total_expense_ratio = obj.get("totalExpenseRatio")
+    if f_total_expense_ratio is not None and type(f_total_expense_ratio) is not str:
+        raise Fallback
+    f_rating = obj.get("rating")
+    if f_rating is not None:
+        f_rating = decode_rating(f_rating)
+    return construct(
+        FundDistribution,
+        {
+            "fund_status": f_fund_status,
+            "fund_flags": f_fund_flags,
+            "currency": f_currency,
+            "regular_issue_surcharge": f_regular_issue_surcharge,
+            "discount_issue_surcharge": f_discount_issue_surcharge,
+            "reduced_issue_surcharge": f_reduced_issue_surcharge,
+            "individual_issue_surcharge": f_individual_issue_surcharge,
+            "is_individual_issue_surcharge_corrected": f_is_individual_issue_surcharge_corrected,
+            "bonification": f_bonification,
+            "investment_category": f_investment_category,
+            "total_expense_ratio": f_total_expense_ratio,
+            "rating": f_rating,
+        },
+    )
+
+
+def _load_rating(f_rating: Any) -> Any:
+    return decode_lazy_rating(f_rating)
+
+
+_LAZY_FIELDS = {"rating": _load_rating}
+
+
+def decode_lazy(obj: Any) -> FundDistribution:
+    if type(obj) is not dict:
+        raise Fallback
+    f_fund_status = obj.get("fundStatus")
+    if f_fund_status is not None and (type(f_fund_status) is not str or f_fund_status not in _FUND_STATUS_ENUM):
+        raise Fallback
+    f_fund_flags = obj.get("fundFlags")
+    if f_fund_flags is not None:
+        if type(f_fund_flags) is not list:
+            raise Fallback
+        for item in f_fund_flags:
+            if type(item) is not str:
+                raise Fallback
+        f_fund_flags = list(f_fund_flags)
+    f_currency = obj.get("currency")
+    if f_currency is not None and type(f_currency) is not str:
+        raise Fallback
+    f_regular_issue_surcharge = obj.get("regularIssueSurcharge")
+    if f_regular_issue_surcharge is not None and type(f_regular_issue_surcharge) is not str:
+        raise Fallback
+    f_discount_issue_surcharge = obj.get("discountIssueSurcharge")
+    if f_discount_issue_surcharge is not None and type(f_discount_issue_surcharge) is not str:
+        raise Fallback
+    f_reduced_issue_surcharge = obj.get("reducedIssueSurcharge")
+    if f_reduced_issue_surcharge is not None and type(f_reduced_issue_surcharge) is not str:
+        raise Fallback
+    f_individual_issue_surcharge = obj.get("individualIssueSurcharge")
+    if f_individual_issue_surcharge is not None and type(f_individual_issue_surcharge) is not str:
+        raise Fallback
+    f_is_individual_issue_surcharge_corrected = obj.get("isIndividualIssueSurchargeCorrected")
+    if f_is_individual_issue_surcharge_corrected is None:
+        f_is_individual_issue_surcharge_corrected = False
+    elif (
+        f_is_individual_issue_surcharge_corrected is not True
+        and f_is_individual_issue_surcharge_corrected is not False
+    ):
+        raise Fallback
+    f_bonification = obj.get("bonification")
+    if f_bonification is not None and type(f_bonification) is not str:
+        raise Fallback
+    f_investment_category = obj.get("investmentCategory")
+    if f_investment_category is not None and type(f_investment_category) is not str:
+        raise Fallback
+    f_total_expense_ratio = obj.get("totalExpenseRatio")
+    if f_total_expense_ratio is not None and type(f_total_expense_ratio) is not str:
+        raise Fallback
+    return construct_lazy(
+        FundDistribution,
+        _LAZY_FIELDS,
+        {
+            "fund_status": f_fund_status,
+            "fund_flags": f_fund_flags,
+            "currency": f_currency,
+            "regular_issue_surcharge": f_regular_issue_surcharge,
+            "discount_issue_surcharge": f_discount_issue_surcharge,
+            "reduced_issue_surcharge": f_reduced_issue_surcharge,
+            "individual_issue_surcharge": f_individual_issue_surcharge,
+            "is_individual_issue_surcharge_corrected": f_is_individual_issue_surcharge_corrected,
+            "bonification": f_bonification,
+            "investment_category": f_investment_category,
+            "total_expense_ratio": f_total_expense_ratio,
+        },
+        {"rating": obj.get("rating")},
+    )
+
+
+from openapi_client.decoders.rating import decode as decode_rating
+from openapi_client.decoders.rating import decode_lazy as decode_lazy_rating
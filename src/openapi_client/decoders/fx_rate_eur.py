@@ -0,0 +1,47 @@
+# coding: utf-8
+
+"""
+Compiled decoder for FXRateEUR.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.fx_rate_eur import FXRateEUR
+
+
+def decode(obj: Any) -> FXRateEUR:
+    if type(obj) is not dict:
+        raise Fallback
+    f_bid = obj.get("bid")
+    if f_bid is not None:
+        f_bid = decode_amount_value(f_bid)
+    f_ask = obj.get("ask")
+    if f_ask is not None:
+        f_ask = decode_amount_value(f_ask)
+    return construct(FXRateEUR, {"bid": f_bid, "ask": f_ask})
+
+
+def _load_bid(f_bid: Any) -> Any:
+    return decode_lazy_amount_value(f_bid)
+
+
+def _load_ask(f_ask: Any) -> Any:
+    return decode_lazy_amount_value(f_ask)
+
+
+_LAZY_FIELDS = {"bid": _load_bid, "ask": _load_ask}
+
+
+def decode_lazy(obj: Any) -> FXRateEUR:
+    if type(obj) is not dict:
+        raise Fallback
+    return construct_lazy(FXRateEUR, _LAZY_FIELDS, {}, {"bid": obj.get("bid"), "ask": obj.get("ask")})
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
@@ -0,0 +1,50 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Inducement.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.inducement import Inducement
+
+
+def decode(obj: Any) -> Inducement:
+    if type(obj) is not dict:
+        raise Fallback
+    f_amount = obj.get("amount")
+    if f_amount is not None:
+        f_amount = decode_amount_value(f_amount)
+    f_estimated = obj.get("estimated")
+    if f_estimated is None:
+        f_estimated = False
+    elif f_estimated is not True and f_estimated is not False:
+        raise Fallback
+    return construct(Inducement, {"amount": f_amount, "estimated": f_estimated})
+
+
+def _load_amount(f_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_amount)
+
+
+_LAZY_FIELDS = {"amount": _load_amount}
+
+
+def decode_lazy(obj: Any) -> Inducement:
+    if type(obj) is not dict:
+        raise Fallback
+    f_estimated = obj.get("estimated")
+    if f_estimated is None:
+        f_estimated = False
+    elif f_estimated is not True and f_estimated is not False:
+        raise Fallback
+    return construct_lazy(Inducement, _LAZY_FIELDS, {"estimated": f_estimated}, {"amount": obj.get("amount")})
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
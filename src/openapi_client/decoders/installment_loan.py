@@ -0,0 +1,133 @@
+# coding: utf-8
+
+"""
+Compiled decoder for InstallmentLoan.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.installment_loan import InstallmentLoan
+
+
+def decode(obj: Any) -> InstallmentLoan:
+    if type(obj) is not dict:
+        raise Fallback
+    f_installment_loan_id = obj.get("installmentLoanId")
+    if f_installment_loan_id is not None and type(f_installment_loan_id) is not str:
+        raise Fallback
+    f_product_display_id = obj.get("productDisplayId")
+    if f_product_display_id is not None and type(f_product_display_id) is not str:
+        raise Fallback
+    f_credit_amount = obj.get("creditAmount")
+    if f_credit_amount is not None:
+        f_credit_amount = decode_amount_value(f_credit_amount)
+    f_net_credit_amount = obj.get("netCreditAmount")
+    if f_net_credit_amount is not None:
+        f_net_credit_amount = decode_amount_value(f_net_credit_amount)
+    f_paid_out_amount = obj.get("paidOutAmount")
+    if f_paid_out_amount is not None:
+        f_paid_out_amount = decode_amount_value(f_paid_out_amount)
+    f_installment_amount = obj.get("installmentAmount")
+    if f_installment_amount is not None:
+        f_installment_amount = decode_amount_value(f_installment_amount)
+    f_contract_period_in_months = obj.get("contractPeriodInMonths")
+    if f_contract_period_in_months is not None and type(f_contract_period_in_months) is not int:
+        raise Fallback
+    f_effective_interest = obj.get("effectiveInterest")
+    if f_effective_interest is not None and type(f_effective_interest) is not str:
+        raise Fallback
+    f_nominal_interest = obj.get("nominalInterest")
+    if f_nominal_interest is not None and type(f_nominal_interest) is not str:
+        raise Fallback
+    f_contract_conclusion_date = obj.get("contractConclusionDate")
+    if f_contract_conclusion_date is not None and type(f_contract_conclusion_date) is not str:
+        raise Fallback
+    return construct(
+        InstallmentLoan,
+        {
+            "installment_loan_id": f_installment_loan_id,
+            "product_display_id": f_product_display_id,
+            "credit_amount": f_credit_amount,
+            "net_credit_amount": f_net_credit_amount,
+            "paid_out_amount": f_paid_out_amount,
+            "installment_amount": f_installment_amount,
+            "contract_period_in_months": f_contract_period_in_months,
+            "effective_interest": f_effective_interest,
+            "nominal_interest": f_nominal_interest,
+            "contract_conclusion_date": f_contract_conclusion_date,
+        },
+    )
+
+
+def _load_credit_amount(f_credit_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_credit_amount)
+
+
+def _load_net_credit_amount(f_net_credit_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_net_credit_amount)
+
+
+def _load_paid_out_amount(f_paid_out_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_paid_out_amount)
+
+
+def _load_installment_amount(f_installment_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_installment_amount)
+
+
+_LAZY_FIELDS = {
+    "credit_amount": _load_credit_amount,
+    "net_credit_amount": _load_net_credit_amount,
+    "paid_out_amount": _load_paid_out_amount,
+    "installment_amount": _load_installment_amount,
+}
+
+
+def decode_lazy(obj: Any) -> InstallmentLoan:
+    if type(obj) is not dict:
+        raise Fallback
+    f_installment_loan_id = obj.get("installmentLoanId")
+    if f_installment_loan_id is not None and type(f_installment_loan_id) is not str:
+        raise Fallback
+    f_product_display_id = obj.get("productDisplayId")
+    if f_product_display_id is not None and type(f_product_display_id) is not str:
+        raise Fallback
+    f_contract_period_in_months = obj.get("contractPeriodInMonths")
+    if f_contract_period_in_months is not None and type(f_contract_period_in_months) is not int:
+        raise Fallback
+    f_effective_interest = obj.get("effectiveInterest")
+    if f_effective_interest is not None and type(f_effective_interest) is not str:
+        raise Fallback
+    f_nominal_interest = obj.get("nominalInterest")
+    if f_nominal_interest is not None and type(f_nominal_interest) is not str:
+        raise Fallback
+    f_contract_conclusion_date = obj.get("contractConclusionDate")
+    if f_contract_conclusion_date is not None and type(f_contract_conclusion_date) is not str:
+        raise Fallback
+    return construct_lazy(
+        InstallmentLoan,
+        _LAZY_FIELDS,
+        {
+            "installment_loan_id": f_installment_loan_id,
+            "product_display_id": f_product_display_id,
+            "contract_period_in_months": f_contract_period_in_months,
+            "effective_interest": f_effective_interest,
+            "nominal_interest": f_nominal_interest,
+            "contract_conclusion_date": f_contract_conclusion_date,
+        },
+        {
+            "credit_amount": obj.get("creditAmount"),
+            "net_credit_amount": obj.get("netCreditAmount"),
+            "paid_out_amount": obj.get("paidOutAmount"),
+            "installment_amount": obj.get("installmentAmount"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
@@ -0,0 +1,63 @@
+# coding: utf-8
+
+"""
+Compiled decoder for InstallmentLoanBalance.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.installment_loan_balance import InstallmentLoanBalance
+
+
+def decode(obj: Any) -> InstallmentLoanBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_installment_loan_id = obj.get("installmentLoanId")
+    if f_installment_loan_id is not None and type(f_installment_loan_id) is not str:
+        raise Fallback
+    f_installment_loan = obj.get("installmentLoan")
+    if f_installment_loan is not None:
+        f_installment_loan = decode_installment_loan(f_installment_loan)
+    f_balance = obj.get("balance")
+    if f_balance is not None:
+        f_balance = decode_amount_value(f_balance)
+    return construct(
+        InstallmentLoanBalance,
+        {"installment_loan_id": f_installment_loan_id, "installment_loan": f_installment_loan, "balance": f_balance},
+    )
+
+
+def _load_installment_loan(f_installment_loan: Any) -> Any:
+    return decode_lazy_installment_loan(f_installment_loan)
+
+
+def _load_balance(f_balance: Any) -> Any:
+    return decode_lazy_amount_value(f_balance)
+
+
+_LAZY_FIELDS = {"installment_loan": _load_installment_loan, "balance": _load_balance}
+
+
+def decode_lazy(obj: Any) -> InstallmentLoanBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_installment_loan_id = obj.get("installmentLoanId")
+    if f_installment_loan_id is not None and type(f_installment_loan_id) is not str:
+        raise Fallback
+    return construct_lazy(
+        InstallmentLoanBalance,
+        _LAZY_FIELDS,
+        {"installment_loan_id": f_installment_loan_id},
+        {"installment_loan": obj.get("installmentLoan"), "balance": obj.get("balance")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.installment_loan import decode as decode_installment_loan
+from openapi_client.decoders.installment_loan import decode_lazy as decode_lazy_installment_loan
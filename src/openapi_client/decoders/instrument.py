@@ -0,0 +1,139 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Instrument.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.instrument import Instrument
+
+
+def decode(obj: Any) -> Instrument:
+    if type(obj) is not dict:
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and type(f_instrument_id) is not str:
+        raise Fallback
+    f_wkn = obj.get("wkn")
+    if f_wkn is not None and type(f_wkn) is not str:
+        raise Fallback
+    f_isin = obj.get("isin")
+    if f_isin is not None and type(f_isin) is not str:
+        raise Fallback
+    f_mnemonic = obj.get("mnemonic")
+    if f_mnemonic is not None and type(f_mnemonic) is not str:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and type(f_name) is not str:
+        raise Fallback
+    f_short_name = obj.get("shortName")
+    if f_short_name is not None and type(f_short_name) is not str:
+        raise Fallback
+    f_static_data = obj.get("staticData")
+    if f_static_data is not None:
+        f_static_data = decode_static_data(f_static_data)
+    f_order_dimensions = obj.get("orderDimensions")
+    if f_order_dimensions is not None:
+        f_order_dimensions = decode_dimensions(f_order_dimensions)
+    f_funds_distribution = obj.get("fundsDistribution")
+    if f_funds_distribution is not None:
+        f_funds_distribution = decode_fund_distribution(f_funds_distribution)
+    f_derivative_data = obj.get("derivativeData")
+    if f_derivative_data is not None:
+        f_derivative_data = decode_derivative_data(f_derivative_data)
+    return construct(
+        Instrument,
+        {
+            "instrument_id": f_instrument_id,
+            "wkn": f_wkn,
+            "isin": f_isin,
+            "mnemonic": f_mnemonic,
+            "name": f_name,
+            "short_name": f_short_name,
+            "static_data": f_static_data,
+            "order_dimensions": f_order_dimensions,
+            "funds_distribution": f_funds_distribution,
+            "derivative_data": f_derivative_data,
+        },
+    )
+
+
+def _load_static_data(f_static_data: Any) -> Any:
+    return decode_lazy_static_data(f_static_data)
+
+
+def _load_order_dimensions(f_order_dimensions: Any) -> Any:
+    return decode_lazy_dimensions(f_order_dimensions)
+
+
+def _load_funds_distribution(f_funds_distribution: Any) -> Any:
+    return decode_lazy_fund_distribution(f_funds_distribution)
+
+
+def _load_derivative_data(f_derivative_data: Any) -> Any:
+    return decode_lazy_derivative_data(f_derivative_data)
+
+
+_LAZY_FIELDS = {
+    "static_data": _load_static_data,
+    "order_dimensions": _load_order_dimensions,
+    "funds_distribution": _load_funds_distribution,
+    "derivative_data": _load_derivative_data,
+}
+
+
+def decode_lazy(obj: Any) -> Instrument:
+    if type(obj) is not dict:
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and type(f_instrument_id) is not str:
+        raise Fallback
+    f_wkn = obj.get("wkn")
+    if f_wkn is not None and type(f_wkn) is not str:
+        raise Fallback
+    f_isin = obj.get("isin")
+    if f_isin is not None and type(f_isin) is not str:
+        raise Fallback
+    f_mnemonic = obj.get("mnemonic")
+    if f_mnemonic is not None and type(f_mnemonic) is not str:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and type(f_name) is not str:
+        raise Fallback
+    f_short_name = obj.get("shortName")
+    if f_short_name is not None and type(f_short_name) is not str:
+        raise Fallback
+    return construct_lazy(
+        Instrument,
+        _LAZY_FIELDS,
+        {
+            "instrument_id": f_instrument_id,
+            "wkn": f_wkn,
+            "isin": f_isin,
+            "mnemonic": f_mnemonic,
+            "name": f_name,
+            "short_name": f_short_name,
+        },
+        {
+            "static_data": obj.get("staticData"),
+            "order_dimensions": obj.get("orderDimensions"),
+            "funds_distribution": obj.get("fundsDistribution"),
+            "derivative_data": obj.get("derivativeData"),
+        },
+    )
+
+
+from openapi_client.decoders.derivative_data import decode as decode_derivative_data
+from openapi_client.decoders.derivative_data import decode_lazy as decode_lazy_derivative_data
+from openapi_client.decoders.dimensions import decode as decode_dimensions
+from openapi_client.decoders.dimensions import decode_lazy as decode_lazy_dimensions
+from openapi_client.decoders.fund_distribution import decode as decode_fund_distribution
+from openapi_client.decoders.fund_distribution import decode_lazy as decode_lazy_fund_distribution
+from openapi_client.decoders.static_data import decode as decode_static_data
+from openapi_client.decoders.static_data import decode_lazy as decode_lazy_static_data
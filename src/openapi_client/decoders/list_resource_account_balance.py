@@ -0,0 +1,69 @@
+# coding: utf-8
+
+"""
+Compiled decoder for ListResourceAccountBalance.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.list_resource_account_balance import ListResourceAccountBalance
+
+
+def decode(obj: Any) -> ListResourceAccountBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_paging = obj.get("paging")
+    if f_paging is not None:
+        f_paging = decode_paging_info(f_paging)
+    f_aggregated = obj.get("aggregated")
+    if f_aggregated is not None:
+        if type(f_aggregated) is not dict:
+            raise Fallback
+        f_aggregated = dict(f_aggregated)
+    f_values = obj.get("values")
+    if f_values is not None:
+        if type(f_values) is not list:
+            raise Fallback
+        f_values = [decode_account_balance(item) for item in f_values]
+    return construct(ListResourceAccountBalance, {"paging": f_paging, "aggregated": f_aggregated, "values": f_values})
+
+
+def _load_paging(f_paging: Any) -> Any:
+    return decode_lazy_paging_info(f_paging)
+
+
+def _load_values(f_values: Any) -> Any:
+    if type(f_values) is not list:
+        raise Fallback
+    f_values = [decode_lazy_account_balance(item) for item in f_values]
+    return f_values
+
+
+_LAZY_FIELDS = {"paging": _load_paging, "values": _load_values}
+
+
+def decode_lazy(obj: Any) -> ListResourceAccountBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_aggregated = obj.get("aggregated")
+    if f_aggregated is not None:
+        if type(f_aggregated) is not dict:
+            raise Fallback
+        f_aggregated = dict(f_aggregated)
+    return construct_lazy(
+        ListResourceAccountBalance,
+        _LAZY_FIELDS,
+        {"aggregated": f_aggregated},
+        {"paging": obj.get("paging"), "values": obj.get("values")},
+    )
+
+
+from openapi_client.decoders.account_balance import decode as decode_account_balance
+from openapi_client.decoders.account_balance import decode_lazy as decode_lazy_account_balance
+from openapi_client.decoders.paging_info import decode as decode_paging_info
+from openapi_client.decoders.paging_info import decode_lazy as decode_lazy_paging_info
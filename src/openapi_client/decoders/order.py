@@ -0,0 +1,380 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Order.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+import re
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.order import Order
+
+_ORDER_TYPE_ENUM = frozenset(
+    [
+        "MARKET",
+        "LIMIT",
+        "QUOTE",
+        "STOP_MARKET",
+        "STOP_LIMIT",
+        "TRAILING_STOP_MARKET",
+        "TRAILING_STOP_LIMIT",
+        "ONE_CANCELS_OTHER",
+        "NEXT_ORDER",
+    ]
+)
+_ORDER_STATUS_ENUM = frozenset(
+    [
+        "PENDING",
+        "OPEN",
+        "EXECUTED",
+        "SETTLED",
+        "CANCELLED_USER",
+        "EXPIRED",
+        "CANCELLED_SYSTEM",
+        "CANCELLED_TRADE",
+        "UNKNOWN",
+    ]
+)
+_SIDE_ENUM = frozenset(["BUY", "SELL"])
+_LIMIT_EXTENSION_ENUM = frozenset(["FOK", "IOC", "AON"])
+_TRADING_RESTRICTION_ENUM = frozenset(["OAO", "AO", "CAO"])
+_VALIDITY_TYPE_ENUM = frozenset(["GFD", "GTD"])
+_VALIDITY_PATTERN = re.compile("^\\d{4}-\\d{2}-\\d{2}$")
+
+
+def decode(obj: Any) -> Order:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and (type(f_depot_id) is not str or len(f_depot_id) > 40):
+        raise Fallback
+    f_settlement_account_id = obj.get("settlementAccountId")
+    if f_settlement_account_id is not None and (
+        type(f_settlement_account_id) is not str or len(f_settlement_account_id) > 40
+    ):
+        raise Fallback
+    f_order_id = obj.get("orderId")
+    if f_order_id is not None and (type(f_order_id) is not str or len(f_order_id) > 40):
+        raise Fallback
+    f_creation_timestamp = obj.get("creationTimestamp")
+    if f_creation_timestamp is not None and type(f_creation_timestamp) is not str:
+        raise Fallback
+    f_leg_number = obj.get("legNumber")
+    if f_leg_number is not None and type(f_leg_number) is not int:
+        raise Fallback
+    f_best_ex = obj.get("bestEx")
+    if f_best_ex is None:
+        f_best_ex = False
+    elif f_best_ex is not True and f_best_ex is not False:
+        raise Fallback
+    f_order_type = obj.get("orderType")
+    if f_order_type is not None and (
+        type(f_order_type) is not str or len(f_order_type) > 30 or f_order_type not in _ORDER_TYPE_ENUM
+    ):
+        raise Fallback
+    f_order_status = obj.get("orderStatus")
+    if f_order_status is not None and (
+        type(f_order_status) is not str or len(f_order_status) > 30 or f_order_status not in _ORDER_STATUS_ENUM
+    ):
+        raise Fallback
+    f_sub_orders = obj.get("subOrders")
+    if f_sub_orders is not None:
+        if type(f_sub_orders) is not list:
+            raise Fallback
+        f_sub_orders = [decode_order(item) for item in f_sub_orders]
+    f_side = obj.get("side")
+    if f_side is not None and (type(f_side) is not str or len(f_side) > 4 or f_side not in _SIDE_ENUM):
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and (type(f_instrument_id) is not str or len(f_instrument_id) > 40):
+        raise Fallback
+    f_quote_id = obj.get("quoteId")
+    if f_quote_id is not None and (type(f_quote_id) is not str or len(f_quote_id) > 40):
+        raise Fallback
+    f_venue_id = obj.get("venueId")
+    if f_venue_id is not None and (type(f_venue_id) is not str or len(f_venue_id) > 40):
+        raise Fallback
+    f_quantity = obj.get("quantity")
+    if f_quantity is not None:
+        f_quantity = decode_amount_value(f_quantity)
+    f_open_quantity = obj.get("openQuantity")
+    if f_open_quantity is not None:
+        f_open_quantity = decode_amount_value(f_open_quantity)
+    f_cancelled_quantity = obj.get("cancelledQuantity")
+    if f_cancelled_quantity is not None:
+        f_cancelled_quantity = decode_amount_value(f_cancelled_quantity)
+    f_executed_quantity = obj.get("executedQuantity")
+    if f_executed_quantity is not None:
+        f_executed_quantity = decode_amount_value(f_executed_quantity)
+    f_limit_extension = obj.get("limitExtension")
+    if f_limit_extension is not None and (
+        type(f_limit_extension) is not str
+        or len(f_limit_extension) > 3
+        or f_limit_extension not in _LIMIT_EXTENSION_ENUM
+    ):
+        raise Fallback
+    f_trading_restriction = obj.get("tradingRestriction")
+    if f_trading_restriction is not None and (
+        type(f_trading_restriction) is not str
+        or len(f_trading_restriction) > 3
+        or f_trading_restriction not in _TRADING_RESTRICTION_ENUM
+    ):
+        raise Fallback
+    f_limit = obj.get("limit")
+    if f_limit is not None:
+        f_limit = decode_amount_value(f_limit)
+    f_trigger_limit = obj.get("triggerLimit")
+    if f_trigger_limit is not None:
+        f_trigger_limit = decode_amount_value(f_trigger_limit)
+    f_trailing_limit_dist_abs = obj.get("trailingLimitDistAbs")
+    if f_trailing_limit_dist_abs is not None:
+        f_trailing_limit_dist_abs = decode_amount_value(f_trailing_limit_dist_abs)
+    f_trailing_limit_dist_rel = obj.get("trailingLimitDistRel")
+    if f_trailing_limit_dist_rel is not None and type(f_trailing_limit_dist_rel) is not str:
+        raise Fallback
+    f_validity_type = obj.get("validityType")
+    if f_validity_type is not None and (
+        type(f_validity_type) is not str or len(f_validity_type) > 3 or f_validity_type not in _VALIDITY_TYPE_ENUM
+    ):
+        raise Fallback
+    f_validity = obj.get("validity")
+    if f_validity is not None and (type(f_validity) is not str or not _VALIDITY_PATTERN.match(f_validity)):
+        raise Fallback
+    f_expected_value = obj.get("expectedValue")
+    if f_expected_value is not None:
+        f_expected_value = decode_amount_value(f_expected_value)
+    f_executions = obj.get("executions")
+    if f_executions is not None:
+        if type(f_executions) is not list:
+            raise Fallback
+        f_executions = [decode_execution(item) for item in f_executions]
+    f_quote_ticket_id = obj.get("quoteTicketId")
+    if f_quote_ticket_id is not None and (type(f_quote_ticket_id) is not str or len(f_quote_ticket_id) > 40):
+        raise Fallback
+    f_version = obj.get("version")
+    if f_version is not None and type(f_version) is not str:
+        raise Fallback
+    return construct(
+        Order,
+        {
+            "depot_id": f_depot_id,
+            "settlement_account_id": f_settlement_account_id,
+            "order_id": f_order_id,
+            "creation_timestamp": f_creation_timestamp,
+            "leg_number": f_leg_number,
+            "best_ex": f_best_ex,
+            "order_type": f_order_type,
+            "order_status": f_order_status,
+            "sub_orders": f_sub_orders,
+            "side": f_side,
+            "instrument_id": f_instrument_id,
+            "quote_id": f_quote_id,
+            "venue_id": f_venue_id,
+            "quantity": f_quantity,
+            "open_quantity": f_open_quantity,
+            "cancelled_quantity": f_cancelled_quantity,
+            "executed_quantity": f_executed_quantity,
+            "limit_extension": f_limit_extension,
+            "trading_restriction": f_trading_restriction,
+            "limit": f_limit,
+            "trigger_limit": f_trigger_limit,
+            "trailing_limit_dist_abs": f_trailing_limit_dist_abs,
+            "trailing_limit_dist_rel": f_trailing_limit_dist_rel,
+            "validity_type": f_validity_type,
+            "validity": f_validity,
+            "expected_value": f_expected_value,
+            "executions": f_executions,
+            "quote_ticket_id": f_quote_ticket_id,
+            "version": f_version,
+        },
+    )
+
+
+def _load_sub_orders(f_sub_orders: Any) -> Any:
+    if type(f_sub_orders) is not list:
+        raise Fallback
+    f_sub_orders = [decode_lazy_order(item) for item in f_sub_orders]
+    return f_sub_orders
+
+
+def _load_quantity(f_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_quantity)
+
+
+def _load_open_quantity(f_open_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_open_quantity)
+
+
+def _load_cancelled_quantity(f_cancelled_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_cancelled_quantity)
+
+
+def _load_executed_quantity(f_executed_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_executed_quantity)
+
+
+def _load_limit(f_limit: Any) -> Any:
+    return decode_lazy_amount_value(f_limit)
+
+
+def _load_trigger_limit(f_trigger_limit: Any) -> Any:
+    return decode_lazy_amount_value(f_trigger_limit)
+
+
+def _load_trailing_limit_dist_abs(f_trailing_limit_dist_abs: Any) -> Any:
+    return decode_lazy_amount_value(f_trailing_limit_dist_abs)
+
+
+def _load_expected_value(f_expected_value: Any) -> Any:
+    return decode_lazy_amount_value(f_expected_value)
+
+
+def _load_executions(f_executions: Any) -> Any:
+    if type(f_executions) is not list:
+        raise Fallback
+    f_executions = [decode_lazy_execution(item) for item in f_executions]
+    return f_executions
+
+
+_LAZY_FIELDS = {
+    "sub_orders": _load_sub_orders,
+    "quantity": _load_quantity,
+    "open_quantity": _load_open_quantity,
+    "cancelled_quantity": _load_cancelled_quantity,
+    "executed_quantity": _load_executed_quantity,
+    "limit": _load_limit,
+    "trigger_limit": _load_trigger_limit,
+    "trailing_limit_dist_abs": _load_trailing_limit_dist_abs,
+    "expected_value": _load_expected_value,
+    "executions": _load_executions,
+}
+
+
+def decode_lazy(obj: Any) -> Order:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and (type(f_depot_id) is not str or len(f_depot_id) > 40):
+        raise Fallback
+    f_settlement_account_id = obj.get("settlementAccountId")
+    if f_settlement_account_id is not None and (
+        type(f_settlement_account_id) is not str or len(f_settlement_account_id) > 40
+    ):
+        raise Fallback
+    f_order_id = obj.get("orderId")
+    if f_order_id is not None and (type(f_order_id) is not str or len(f_order_id) > 40):
+        raise Fallback
+    f_creation_timestamp = obj.get("creationTimestamp")
+    if f_creation_timestamp is not None and type(f_creation_timestamp) is not str:
+        raise Fallback
+    f_leg_number = obj.get("legNumber")
+    if f_leg_number is not None and type(f_leg_number) is not int:
+        raise Fallback
+    f_best_ex = obj.get("bestEx")
+    if f_best_ex is None:
+        f_best_ex = False
+    elif f_best_ex is not True and f_best_ex is not False:
+        raise Fallback
+    f_order_type = obj.get("orderType")
+    if f_order_type is not None and (
+        type(f_order_type) is not str or len(f_order_type) > 30 or f_order_type not in _ORDER_TYPE_ENUM
+    ):
+        raise Fallback
+    f_order_status = obj.get("orderStatus")
+    if f_order_status is not None and (
+        type(f_order_status) is not str or len(f_order_status) > 30 or f_order_status not in _ORDER_STATUS_ENUM
+    ):
+        raise Fallback
+    f_side = obj.get("side")
+    if f_side is not None and (type(f_side) is not str or len(f_side) > 4 or f_side not in _SIDE_ENUM):
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and (type(f_instrument_id) is not str or len(f_instrument_id) > 40):
+        raise Fallback
+    f_quote_id = obj.get("quoteId")
+    if f_quote_id is not None and (type(f_quote_id) is not str or len(f_quote_id) > 40):
+        raise Fallback
+    f_venue_id = obj.get("venueId")
+    if f_venue_id is not None and (type(f_venue_id) is not str or len(f_venue_id) > 40):
+        raise Fallback
+    f_limit_extension = obj.get("limitExtension")
+    if f_limit_extension is not None and (
+        type(f_limit_extension) is not str
+        or len(f_limit_extension) > 3
+        or f_limit_extension not in _LIMIT_EXTENSION_ENUM
+    ):
+        raise Fallback
+    f_trading_restriction = obj.get("tradingRestriction")
+    if f_trading_restriction is not None and (
+        type(f_trading_restriction) is not str
+        or len(f_trading_restriction) > 3
+        or f_trading_restriction not in _TRADING_RESTRICTION_ENUM
+    ):
+        raise Fallback
+    f_trailing_limit_dist_rel = obj.get("trailingLimitDistRel")
+    if f_trailing_limit_dist_rel is not None and type(f_trailing_limit_dist_rel) is not str:
+        raise Fallback
+    f_validity_type = obj.get("validityType")
+    if f_validity_type is not None and (
+        type(f_validity_type) is not str or len(f_validity_type) > 3 or f_validity_type not in _VALIDITY_TYPE_ENUM
+    ):
+        raise Fallback
+    f_validity = obj.get("validity")
+    if f_validity is not None and (type(f_validity) is not str or not _VALIDITY_PATTERN.match(f_validity)):
+        raise Fallback
+    f_quote_ticket_id = obj.get("quoteTicketId")
+    if f_quote_ticket_id is not None and (type(f_quote_ticket_id) is not str or len(f_quote_ticket_id) > 40):
+        raise Fallback
+    f_version = obj.get("version")
+    if f_version is not None and type(f_version) is not str:
+        raise Fallback
+    return construct_lazy(
+        Order,
+        _LAZY_FIELDS,
+        {
+            "depot_id": f_depot_id,
+            "settlement_account_id": f_settlement_account_id,
+            "order_id": f_order_id,
+            "creation_timestamp": f_creation_timestamp,
+            "leg_number": f_leg_number,
+            "best_ex": f_best_ex,
+            "order_type": f_order_type,
+            "order_status": f_order_status,
+            "side": f_side,
+            "instrument_id": f_instrument_id,
+            "quote_id": f_quote_id,
+            "venue_id": f_venue_id,
+            "limit_extension": f_limit_extension,
+            "trading_restriction": f_trading_restriction,
+            "trailing_limit_dist_rel": f_trailing_limit_dist_rel,
+            "validity_type": f_validity_type,
+            "validity": f_validity,
+            "quote_ticket_id": f_quote_ticket_id,
+            "version": f_version,
+        },
+        {
+            "sub_orders": obj.get("subOrders"),
+            "quantity": obj.get("quantity"),
+            "open_quantity": obj.get("openQuantity"),
+            "cancelled_quantity": obj.get("cancelledQuantity"),
+            "executed_quantity": obj.get("executedQuantity"),
+            "limit": obj.get("limit"),
+            "trigger_limit": obj.get("triggerLimit"),
+            "trailing_limit_dist_abs": obj.get("trailingLimitDistAbs"),
+            "expected_value": obj.get("expectedValue"),
+            "executions": obj.get("executions"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.execution import decode as decode_execution
+from openapi_client.decoders.execution import decode_lazy as decode_lazy_execution
+from openapi_client.decoders.order import decode as decode_order
+from openapi_client.decoders.order import decode_lazy as decode_lazy_order
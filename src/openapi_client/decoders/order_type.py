@@ -0,0 +1,41 @@
+# coding: utf-8
+
+"""
+Compiled decoder for OrderType.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.order_type import OrderType
+
+
+def decode(obj: Any) -> OrderType:
+    if type(obj) is not dict:
+        raise Fallback
+    f_limit_extensions = obj.get("limitExtensions")
+    if f_limit_extensions is not None:
+        if type(f_limit_extensions) is not list:
+            raise Fallback
+        for item in f_limit_extensions:
+            if type(item) is not str:
+                raise Fallback
+        f_limit_extensions = list(f_limit_extensions)
+    f_trading_restrictions = obj.get("tradingRestrictions")
+    if f_trading_restrictions is not None:
+        if type(f_trading_restrictions) is not list:
+            raise Fallback
+        for item in f_trading_restrictions:
+            if type(item) is not str:
+                raise Fallback
+        f_trading_restrictions = list(f_trading_restrictions)
+    return construct(
+        OrderType, {"limit_extensions": f_limit_extensions, "trading_restrictions": f_trading_restrictions}
+    )
+
+
+decode_lazy = decode
@@ -0,0 +1,29 @@
+# coding: utf-8
+
+"""
+Compiled decoder for PagingInfo.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.paging_info import PagingInfo
+
+
+def decode(obj: Any) -> PagingInfo:
+    if type(obj) is not dict:
+        raise Fallback
+    f_index = obj.get("index")
+    if f_index is not None and type(f_index) is not int:
+        raise Fallback
+    f_matches = obj.get("matches")
+    if f_matches is not None and type(f_matches) is not int:
+        raise Fallback
+    return construct(PagingInfo, {"index": f_index, "matches": f_matches})
+
+
+decode_lazy = decode
@@ -0,0 +1,66 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Price.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.price import Price
+
+
+def decode(obj: Any) -> Price:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or len(f_type) < 3 or len(f_type) > 3):
+        raise Fallback
+    f_price = obj.get("price")
+    if f_price is not None:
+        f_price = decode_amount_value(f_price)
+    f_quantity = obj.get("quantity")
+    if f_quantity is not None:
+        f_quantity = decode_amount_value(f_quantity)
+    f_price_date_time = obj.get("priceDateTime")
+    if f_price_date_time is not None and type(f_price_date_time) is not str:
+        raise Fallback
+    return construct(
+        Price, {"type": f_type, "price": f_price, "quantity": f_quantity, "price_date_time": f_price_date_time}
+    )
+
+
+def _load_price(f_price: Any) -> Any:
+    return decode_lazy_amount_value(f_price)
+
+
+def _load_quantity(f_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_quantity)
+
+
+_LAZY_FIELDS = {"price": _load_price, "quantity": _load_quantity}
+
+
+def decode_lazy(obj: Any) -> Price:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or len(f_type) < 3 or len(f_type) > 3):
+        raise Fallback
+    f_price_date_time = obj.get("priceDateTime")
+    if f_price_date_time is not None and type(f_price_date_time) is not str:
+        raise Fallback
+    return construct_lazy(
+        Price,
+        _LAZY_FIELDS,
+        {"type": f_type, "price_date_time": f_price_date_time},
+        {"price": obj.get("price"), "quantity": obj.get("quantity")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
@@ -0,0 +1,90 @@
+# coding: utf-8
+
+"""
+Compiled decoder for ProductBalance.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.product_balance import ProductBalance
+
+_PRODUCT_TYPE_ENUM = frozenset(["ACCOUNT", "CARD", "DEPOT", "LOAN", "SAVINGS"])
+_CLIENT_CONNECTION_TYPE_ENUM = frozenset(["CURRENT_CLIENT", "OTHER_COMDIRECT", "OTHER_EXTERNAL"])
+
+
+def decode(obj: Any) -> ProductBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_product_id = obj.get("productId")
+    if f_product_id is not None and type(f_product_id) is not str:
+        raise Fallback
+    f_product_type = obj.get("productType")
+    if f_product_type is not None and (type(f_product_type) is not str or f_product_type not in _PRODUCT_TYPE_ENUM):
+        raise Fallback
+    f_target_client_id = obj.get("targetClientId")
+    if f_target_client_id is not None and type(f_target_client_id) is not str:
+        raise Fallback
+    f_client_connection_type = obj.get("clientConnectionType")
+    if f_client_connection_type is not None and (
+        type(f_client_connection_type) is not str or f_client_connection_type not in _CLIENT_CONNECTION_TYPE_ENUM
+    ):
+        raise Fallback
+    f_balance = obj.get("balance")
+    if f_balance is not None:
+        f_balance = decode_balance(f_balance)
+    return construct(
+        ProductBalance,
+        {
+            "product_id": f_product_id,
+            "product_type": f_product_type,
+            "target_client_id": f_target_client_id,
+            "client_connection_type": f_client_connection_type,
+            "balance": f_balance,
+        },
+    )
+
+
+def _load_balance(f_balance: Any) -> Any:
+    return decode_lazy_balance(f_balance)
+
+
+_LAZY_FIELDS = {"balance": _load_balance}
+
+
+def decode_lazy(obj: Any) -> ProductBalance:
+    if type(obj) is not dict:
+        raise Fallback
+    f_product_id = obj.get("productId")
+    if f_product_id is not None and type(f_product_id) is not str:
+        raise Fallback
+    f_product_type = obj.get("productType")
+    if f_product_type is not None and (type(f_product_type) is not str or f_product_type not in _PRODUCT_TYPE_ENUM):
+        raise Fallback
+    f_target_client_id = obj.get("targetClientId")
+    if f_target_client_id is not None and type(f_target_client_id) is not str:
+        raise Fallback
+    f_client_connection_type = obj.get("clientConnectionType")
+    if f_client_connection_type is not None and (
+        type(f_client_connection_type) is not str or f_client_connection_type not in _CLIENT_CONNECTION_TYPE_ENUM
+    ):
+        raise Fallback
+    return construct_lazy(
+        ProductBalance,
+        _LAZY_FIELDS,
+        {
+            "product_id": f_product_id,
+            "product_type": f_product_type,
+            "target_client_id": f_target_client_id,
+            "client_connection_type": f_client_connection_type,
+        },
+        {"balance": obj.get("balance")},
+    )
+
+
+from openapi_client.decoders.balance import decode as decode_balance
+from openapi_client.decoders.balance import decode_lazy as decode_lazy_balance
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Quote.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.quote import Quote
+
+_SIDE_ENUM = frozenset(["BUY", "SELL"])
+
+
+def decode(obj: Any) -> Quote:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and (type(f_depot_id) is not str or len(f_depot_id) > 40):
+        raise Fallback
+    f_side = obj.get("side")
+    if f_side is not None and (type(f_side) is not str or len(f_side) > 4 or f_side not in _SIDE_ENUM):
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and (type(f_instrument_id) is not str or len(f_instrument_id) > 40):
+        raise Fallback
+    f_venue_id = obj.get("venueId")
+    if f_venue_id is not None and (type(f_venue_id) is not str or len(f_venue_id) > 40):
+        raise Fallback
+    f_quantity = obj.get("quantity")
+    if f_quantity is not None:
+        f_quantity = decode_amount_value(f_quantity)
+    return construct(
+        Quote,
+        {
+            "depot_id": f_depot_id,
+            "side": f_side,
+            "instrument_id": f_instrument_id,
+            "venue_id": f_venue_id,
+            "quantity": f_quantity,
+        },
+    )
+
+
+def _load_quantity(f_quantity: Any) -> Any:
+    return decode_lazy_amount_value(f_quantity)
+
+
+_LAZY_FIELDS = {"quantity": _load_quantity}
+
+
+def decode_lazy(obj: Any) -> Quote:
+    if type(obj) is not dict:
+        raise Fallback
+    f_depot_id = obj.get("depotId")
+    if f_depot_id is not None and (type(f_depot_id) is not str or len(f_depot_id) > 40):
+        raise Fallback
+    f_side = obj.get("side")
+    if f_side is not None and (type(f_side) is not str or len(f_side) > 4 or f_side not in _SIDE_ENUM):
+        raise Fallback
+    f_instrument_id = obj.get("instrumentId")
+    if f_instrument_id is not None and (type(f_instrument_id) is not str or len(f_instrument_id) > 40):
+        raise Fallback
+    f_venue_id = obj.get("venueId")
+    if f_venue_id is not None and (type(f_venue_id) is not str or len(f_venue_id) > 40):
+        raise Fallback
+    return construct_lazy(
+        Quote,
+        _LAZY_FIELDS,
+        {"depot_id": f_depot_id, "side": f_side, "instrument_id": f_instrument_id, "venue_id": f_venue_id},
+        {"quantity": obj.get("quantity")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
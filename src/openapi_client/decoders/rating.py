@@ -0,0 +1,29 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Rating.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.rating import Rating
+
+
+def decode(obj: Any) -> Rating:
+    if type(obj) is not dict:
+        raise Fallback
+    f_morningstar = obj.get("morningstar")
+    if f_morningstar is not None and type(f_morningstar) is not str:
+        raise Fallback
+    f_moodys = obj.get("moodys")
+    if f_moodys is not None and type(f_moodys) is not str:
+        raise Fallback
+    return construct(Rating, {"morningstar": f_morningstar, "moodys": f_moodys})
+
+
+decode_lazy = decode
@@ -0,0 +1,47 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Session.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.session import Session
+
+
+def decode(obj: Any) -> Session:
+    if type(obj) is not dict:
+        raise Fallback
+    f_id = obj.get("id")
+    if f_id is not None and type(f_id) is not int:
+        raise Fallback
+    f_identifier = obj.get("identifier")
+    if f_identifier is not None and type(f_identifier) is not str:
+        raise Fallback
+    f_session_tan_active = obj.get("sessionTanActive")
+    if f_session_tan_active is None:
+        f_session_tan_active = False
+    elif f_session_tan_active is not True and f_session_tan_active is not False:
+        raise Fallback
+    f_activated2_fa = obj.get("activated2FA")
+    if f_activated2_fa is None:
+        f_activated2_fa = False
+    elif f_activated2_fa is not True and f_activated2_fa is not False:
+        raise Fallback
+    return construct(
+        Session,
+        {
+            "id": f_id,
+            "identifier": f_identifier,
+            "session_tan_active": f_session_tan_active,
+            "activated2_fa": f_activated2_fa,
+        },
+    )
+
+
+decode_lazy = decode
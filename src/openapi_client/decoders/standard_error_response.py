@@ -0,0 +1,51 @@
+# coding: utf-8
+
+"""
+Compiled decoder for StandardErrorResponse.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.standard_error_response import StandardErrorResponse
+
+
+def decode(obj: Any) -> StandardErrorResponse:
+    if type(obj) is not dict:
+        raise Fallback
+    f_code = obj.get("code")
+    if f_code is not None and type(f_code) is not str:
+        raise Fallback
+    f_messages = obj.get("messages")
+    if f_messages is not None:
+        if type(f_messages) is not list:
+            raise Fallback
+        f_messages = [decode_business_message(item) for item in f_messages]
+    return construct(StandardErrorResponse, {"code": f_code, "messages": f_messages})
+
+
+def _load_messages(f_messages: Any) -> Any:
+    if type(f_messages) is not list:
+        raise Fallback
+    f_messages = [decode_lazy_business_message(item) for item in f_messages]
+    return f_messages
+
+
+_LAZY_FIELDS = {"messages": _load_messages}
+
+
+def decode_lazy(obj: Any) -> StandardErrorResponse:
+    if type(obj) is not dict:
+        raise Fallback
+    f_code = obj.get("code")
+    if f_code is not None and type(f_code) is not str:
+        raise Fallback
+    return construct_lazy(StandardErrorResponse, _LAZY_FIELDS, {"code": f_code}, {"messages": obj.get("messages")})
+
+
+from openapi_client.decoders.business_message import decode as decode_business_message
+from openapi_client.decoders.business_message import decode_lazy as decode_lazy_business_message
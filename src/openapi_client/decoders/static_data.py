@@ -0,0 +1,80 @@
+# coding: utf-8
+
+"""
+Compiled decoder for StaticData.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.static_data import StaticData
+
+_NOTATION_ENUM = frozenset(["XXX", "XXC", "XXM", "XXP", "XXU"])
+_INSTRUMENT_TYPE_ENUM = frozenset(
+    [
+        "SHARE",
+        "BONDS",
+        "SUBSCRIPTION_RIGHT",
+        "ETF",
+        "PROFIT_PART_CERTIFICATE",
+        "FUND",
+        "WARRANT",
+        "CERTIFICATE",
+        "NOT_AVAILABLE",
+    ]
+)
+
+
+def decode(obj: Any) -> StaticData:
+    if type(obj) is not dict:
+        raise Fallback
+    f_notation = obj.get("notation")
+    if f_notation is not None and (type(f_notation) is not str or f_notation not in _NOTATION_ENUM):
+        raise Fallback
+    f_currency = obj.get("currency")
+    if f_currency is not None and type(f_currency) is not str:
+        raise Fallback
+    f_instrument_type = obj.get("instrumentType")
+    if f_instrument_type is not None and (
+        type(f_instrument_type) is not str or f_instrument_type not in _INSTRUMENT_TYPE_ENUM
+    ):
+        raise Fallback
+    f_priips_relevant = obj.get("priipsRelevant")
+    if f_priips_relevant is None:
+        f_priips_relevant = False
+    elif f_priips_relevant is not True and f_priips_relevant is not False:
+        raise Fallback
+    f_kid_available = obj.get("kidAvailable")
+    if f_kid_available is None:
+        f_kid_available = False
+    elif f_kid_available is not True and f_kid_available is not False:
+        raise Fallback
+    f_shipping_waiver_required = obj.get("shippingWaiverRequired")
+    if f_shipping_waiver_required is None:
+        f_shipping_waiver_required = False
+    elif f_shipping_waiver_required is not True and f_shipping_waiver_required is not False:
+        raise Fallback
+    f_fund_redemption_limited = obj.get("fundRedemptionLimited")
+    if f_fund_redemption_limited is None:
+        f_fund_redemption_limited = False
+    elif f_fund_redemption_limited is not True and f_fund_redemption_limited is not False:
+        raise Fallback
+    return construct(
+        StaticData,
+        {
+            "notation": f_notation,
+            "currency": f_currency,
+            "instrument_type": f_instrument_type,
+            "priips_relevant": f_priips_relevant,
+            "kid_available": f_kid_available,
+            "shipping_waiver_required": f_shipping_waiver_required,
+            "fund_redemption_limited": f_fund_redemption_limited,
+        },
+    )
+
+
+decode_lazy = decode
@@ -0,0 +1,86 @@
+# coding: utf-8
+
+"""
+Compiled decoder for TotalCostBlock.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.total_cost_block import TotalCostBlock
+
+
+def decode(obj: Any) -> TotalCostBlock:
+    if type(obj) is not dict:
+        raise Fallback
+    f_service_costs = obj.get("serviceCosts")
+    if f_service_costs is not None:
+        f_service_costs = decode_total_cost_entry(f_service_costs)
+    f_service_inducement = obj.get("serviceInducement")
+    if f_service_inducement is not None:
+        f_service_inducement = decode_amount_value(f_service_inducement)
+    f_external_costs = obj.get("externalCosts")
+    if f_external_costs is not None:
+        f_external_costs = decode_total_cost_entry(f_external_costs)
+    f_product_costs = obj.get("productCosts")
+    if f_product_costs is not None:
+        f_product_costs = decode_total_cost_entry(f_product_costs)
+    return construct(
+        TotalCostBlock,
+        {
+            "service_costs": f_service_costs,
+            "service_inducement": f_service_inducement,
+            "external_costs": f_external_costs,
+            "product_costs": f_product_costs,
+        },
+    )
+
+
+def _load_service_costs(f_service_costs: Any) -> Any:
+    return decode_lazy_total_cost_entry(f_service_costs)
+
+
+def _load_service_inducement(f_service_inducement: Any) -> Any:
+    return decode_lazy_amount_value(f_service_inducement)
+
+
+def _load_external_costs(f_external_costs: Any) -> Any:
+    return decode_lazy_total_cost_entry(f_external_costs)
+
+
+def _load_product_costs(f_product_costs: Any) -> Any:
+    return decode_lazy_total_cost_entry(f_product_costs)
+
+
+_LAZY_FIELDS = {
+    "service_costs": _load_service_costs,
+    "service_inducement": _load_service_inducement,
+    "external_costs": _load_external_costs,
+    "product_costs": _load_product_costs,
+}
+
+
+def decode_lazy(obj: Any) -> TotalCostBlock:
+    if type(obj) is not dict:
+        raise Fallback
+    return construct_lazy(
+        TotalCostBlock,
+        _LAZY_FIELDS,
+        {},
+        {
+            "service_costs": obj.get("serviceCosts"),
+            "service_inducement": obj.get("serviceInducement"),
+            "external_costs": obj.get("externalCosts"),
+            "product_costs": obj.get("productCosts"),
+        },
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
+from openapi_client.decoders.total_cost_entry import decode as decode_total_cost_entry
+from openapi_client.decoders.total_cost_entry import decode_lazy as decode_lazy_total_cost_entry
@@ -0,0 +1,59 @@
+# coding: utf-8
+
+"""
+Compiled decoder for TotalHoldingCostBlock.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.total_holding_cost_block import TotalHoldingCostBlock
+
+
+def decode(obj: Any) -> TotalHoldingCostBlock:
+    if type(obj) is not dict:
+        raise Fallback
+    f_year1 = obj.get("year1")
+    if f_year1 is not None:
+        f_year1 = decode_total_holding_cost_entry(f_year1)
+    f_year2 = obj.get("year2")
+    if f_year2 is not None:
+        f_year2 = decode_total_holding_cost_entry(f_year2)
+    f_sales = obj.get("sales")
+    if f_sales is not None:
+        f_sales = decode_total_holding_cost_entry(f_sales)
+    return construct(TotalHoldingCostBlock, {"year1": f_year1, "year2": f_year2, "sales": f_sales})
+
+
+def _load_year1(f_year1: Any) -> Any:
+    return decode_lazy_total_holding_cost_entry(f_year1)
+
+
+def _load_year2(f_year2: Any) -> Any:
+    return decode_lazy_total_holding_cost_entry(f_year2)
+
+
+def _load_sales(f_sales: Any) -> Any:
+    return decode_lazy_total_holding_cost_entry(f_sales)
+
+
+_LAZY_FIELDS = {"year1": _load_year1, "year2": _load_year2, "sales": _load_sales}
+
+
+def decode_lazy(obj: Any) -> TotalHoldingCostBlock:
+    if type(obj) is not dict:
+        raise Fallback
+    return construct_lazy(
+        TotalHoldingCostBlock,
+        _LAZY_FIELDS,
+        {},
+        {"year1": obj.get("year1"), "year2": obj.get("year2"), "sales": obj.get("sales")},
+    )
+
+
+from openapi_client.decoders.total_holding_cost_entry import decode as decode_total_holding_cost_entry
+from openapi_client.decoders.total_holding_cost_entry import decode_lazy as decode_lazy_total_holding_cost_entry
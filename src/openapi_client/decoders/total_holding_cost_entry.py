@@ -0,0 +1,61 @@
+# coding: utf-8
+
+"""
+Compiled decoder for TotalHoldingCostEntry.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.total_holding_cost_entry import TotalHoldingCostEntry
+
+_TYPE_ENUM = frozenset(["IM_ERSTEN_JAHR", "IM_ZWEITEN_JAHR", "IM_JAHR_DER_VERAUESSERUNG"])
+
+
+def decode(obj: Any) -> TotalHoldingCostEntry:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or f_type not in _TYPE_ENUM):
+        raise Fallback
+    f_amount = obj.get("amount")
+    if f_amount is not None:
+        f_amount = decode_amount_value(f_amount)
+    f_average_return_pa = obj.get("averageReturnPA")
+    if f_average_return_pa is not None and type(f_average_return_pa) is not str:
+        raise Fallback
+    return construct(
+        TotalHoldingCostEntry, {"type": f_type, "amount": f_amount, "average_return_pa": f_average_return_pa}
+    )
+
+
+def _load_amount(f_amount: Any) -> Any:
+    return decode_lazy_amount_value(f_amount)
+
+
+_LAZY_FIELDS = {"amount": _load_amount}
+
+
+def decode_lazy(obj: Any) -> TotalHoldingCostEntry:
+    if type(obj) is not dict:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and (type(f_type) is not str or f_type not in _TYPE_ENUM):
+        raise Fallback
+    f_average_return_pa = obj.get("averageReturnPA")
+    if f_average_return_pa is not None and type(f_average_return_pa) is not str:
+        raise Fallback
+    return construct_lazy(
+        TotalHoldingCostEntry,
+        _LAZY_FIELDS,
+        {"type": f_type, "average_return_pa": f_average_return_pa},
+        {"amount": obj.get("amount")},
+    )
+
+
+from openapi_client.decoders.amount_value import decode as decode_amount_value
+from openapi_client.decoders.amount_value import decode_lazy as decode_lazy_amount_value
@@ -0,0 +1,142 @@
+# coding: utf-8
+
+"""
+Compiled decoder for Venue.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct, construct_lazy
+from openapi_client.models.venue import Venue
+
+
+def decode(obj: Any) -> Venue:
+    if type(obj) is not dict:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and type(f_name) is not str:
+        raise Fallback
+    f_venue_id = obj.get("venueId")
+    if f_venue_id is not None and type(f_venue_id) is not str:
+        raise Fallback
+    f_country = obj.get("country")
+    if f_country is not None and type(f_country) is not str:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and type(f_type) is not str:
+        raise Fallback
+    f_currencies = obj.get("currencies")
+    if f_currencies is not None:
+        if type(f_currencies) is not list:
+            raise Fallback
+        for item in f_currencies:
+            if type(item) is not str:
+                raise Fallback
+        f_currencies = list(f_currencies)
+    f_sides = obj.get("sides")
+    if f_sides is not None:
+        if type(f_sides) is not list:
+            raise Fallback
+        for item in f_sides:
+            if type(item) is not str:
+                raise Fallback
+        f_sides = list(f_sides)
+    f_validity_types = obj.get("validityTypes")
+    if f_validity_types is not None:
+        if type(f_validity_types) is not list:
+            raise Fallback
+        for item in f_validity_types:
+            if type(item) is not str:
+                raise Fallback
+        f_validity_types = list(f_validity_types)
+    f_order_types = obj.get("orderTypes")
+    if f_order_types is not None:
+        if type(f_order_types) is not dict:
+            raise Fallback
+        f_order_types = {key: decode_order_type(item) for key, item in f_order_types.items()}
+    return construct(
+        Venue,
+        {
+            "name": f_name,
+            "venue_id": f_venue_id,
+            "country": f_country,
+            "type": f_type,
+            "currencies": f_currencies,
+            "sides": f_sides,
+            "validity_types": f_validity_types,
+            "order_types": f_order_types,
+        },
+    )
+
+
+def _load_order_types(f_order_types: Any) -> Any:
+    if type(f_order_types) is not dict:
+        raise Fallback
+    f_order_types = {key: decode_lazy_order_type(item) for key, item in f_order_types.items()}
+    return f_order_types
+
+
+_LAZY_FIELDS = {"order_types": _load_order_types}
+
+
+def decode_lazy(obj: Any) -> Venue:
+    if type(obj) is not dict:
+        raise Fallback
+    f_name = obj.get("name")
+    if f_name is not None and type(f_name) is not str:
+        raise Fallback
+    f_venue_id = obj.get("venueId")
+    if f_venue_id is not None and type(f_venue_id) is not str:
+        raise Fallback
+    f_country = obj.get("country")
+    if f_country is not None and type(f_country) is not str:
+        raise Fallback
+    f_type = obj.get("type")
+    if f_type is not None and type(f_type) is not str:
+        raise Fallback
+    f_currencies = obj.get("currencies")
+    if f_currencies is not None:
+        if type(f_currencies) is not list:
+            raise Fallback
+        for item in f_currencies:
+            if type(item) is not str:
+                raise Fallback
+        f_currencies = list(f_currencies)
+    f_sides = obj.get("sides")
+    if f_sides is not None:
+        if type(f_sides) is not list:
+            raise Fallback
+        for item in f_sides:
+            if type(item) is not str:
+                raise Fallback
+        f_sides = list(f_sides)
+    f_validity_types = obj.get("validityTypes")
+    if f_validity_types is not None:
+        if type(f_validity_types) is not list:
+            raise Fallback
+        for item in f_validity_types:
+            if type(item) is not str:
+                raise Fallback
+        f_validity_types = list(f_validity_types)
+    return construct_lazy(
+        Venue,
+        _LAZY_FIELDS,
+        {
+            "name": f_name,
+            "venue_id": f_venue_id,
+            "country": f_country,
+            "type": f_type,
+            "currencies": f_currencies,
+            "sides": f_sides,
+            "validity_types": f_validity_types,
+        },
+        {"order_types": obj.get("orderTypes")},
+    )
+
+
+from openapi_client.decoders.order_type import decode as decode_order_type
+from openapi_client.decoders.order_type import decode_lazy as decode_lazy_order_type
@@ -0,0 +1,39 @@
+# coding: utf-8
+
+"""
+Compiled decoder for VisaCardImage.
+
+Generated by scripts/compile_decoders.py.
+
+Do not edit the class manually.
+"""  # noqa: E501
+
+from typing import Any
+
+from openapi_client.decoders import Fallback, construct
+from openapi_client.models.visa_card_image import VisaCardImage
+
+
+def decode(obj: Any) -> VisaCardImage:
+    if type(obj) is not dict:
+        raise Fallback
+    f_visa_card_image_id = obj.get("visaCardImageId")
+    if f_visa_card_image_id is not None and type(f_visa_card_image_id) is not str:
+        raise Fallback
+    f_image_description = obj.get("imageDescription")
+    if f_image_description is not None and type(f_image_description) is not str:
+        raise Fallback
+    f_image_base_filename = obj.get("imageBaseFilename")
+    if f_image_base_filename is not None and type(f_image_base_filename) is not str:
+        raise Fallback
+    return construct(
+        VisaCardImage,
+        {
+            "visa_card_image_id": f_visa_card_image_id,
+            "image_description": f_image_description,
+            "image_base_filename": f_image_base_filename,
+        },
+    )
+
+
+decode_lazy = decode
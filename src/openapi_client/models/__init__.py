@@ -12,60 +12,138 @@
     Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from openapi_client.models.account import Account
-from openapi_client.models.account_balance import AccountBalance
-from openapi_client.models.account_information import AccountInformation
-from openapi_client.models.account_transaction import AccountTransaction
-from openapi_client.models.amount_value import AmountValue
-from openapi_client.models.balance import Balance
-from openapi_client.models.business_message import BusinessMessage
-from openapi_client.models.card import Card
-from openapi_client.models.card_balance import CardBalance
-from openapi_client.models.cost_entry import CostEntry
-from openapi_client.models.cost_group import CostGroup
-from openapi_client.models.cost_indication_ex_ante import CostIndicationExAnte
-from openapi_client.models.depot import Depot
-from openapi_client.models.depot_aggregation import DepotAggregation
-from openapi_client.models.depot_position import DepotPosition
-from openapi_client.models.depot_transaction import DepotTransaction
-from openapi_client.models.derivative_data import DerivativeData
-from openapi_client.models.dimensions import Dimensions
-from openapi_client.models.document import Document
-from openapi_client.models.document_metadata import DocumentMetadata
-from openapi_client.models.enum_text import EnumText
-from openapi_client.models.execution import Execution
-from openapi_client.models.fx_rate_eur import FXRateEUR
-from openapi_client.models.fixed_term_savings import FixedTermSavings
-from openapi_client.models.fund_distribution import FundDistribution
-from openapi_client.models.inducement import Inducement
-from openapi_client.models.installment_loan import InstallmentLoan
-from openapi_client.models.installment_loan_balance import InstallmentLoanBalance
-from openapi_client.models.instrument import Instrument
-from openapi_client.models.list_resource_account_balance import ListResourceAccountBalance
-from openapi_client.models.list_resource_account_transaction import ListResourceAccountTransaction
-from openapi_client.models.list_resource_cost_indication_ex_ante import ListResourceCostIndicationExAnte
-from openapi_client.models.list_resource_depot import ListResourceDepot
-from openapi_client.models.list_resource_depot_position import ListResourceDepotPosition
-from openapi_client.models.list_resource_depot_transaction import ListResourceDepotTransaction
-from openapi_client.models.list_resource_dimensions import ListResourceDimensions
-from openapi_client.models.list_resource_document import ListResourceDocument
-from openapi_client.models.list_resource_instrument import ListResourceInstrument
-from openapi_client.models.list_resource_order import ListResourceOrder
-from openapi_client.models.list_resource_product_balance import ListResourceProductBalance
-from openapi_client.models.order import Order
-from openapi_client.models.order_type import OrderType
-from openapi_client.models.paging_info import PagingInfo
-from openapi_client.models.price import Price
-from openapi_client.models.product_balance import ProductBalance
-from openapi_client.models.quote import Quote
-from openapi_client.models.rating import Rating
-from openapi_client.models.session import Session
-from openapi_client.models.standard_error_response import StandardErrorResponse
-from openapi_client.models.static_data import StaticData
-from openapi_client.models.total_cost_block import TotalCostBlock
-from openapi_client.models.total_cost_entry import TotalCostEntry
-from openapi_client.models.total_holding_cost_block import TotalHoldingCostBlock
-from openapi_client.models.total_holding_cost_entry import TotalHoldingCostEntry
-from openapi_client.models.venue import Venue
-from openapi_client.models.visa_card_image import VisaCardImage
+import importlib as _importlib
+from typing import TYPE_CHECKING
+
+# lazily import apis/models on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "Account": "openapi_client.models.account",
+    "AccountBalance": "openapi_client.models.account_balance",
+    "AccountInformation": "openapi_client.models.account_information",
+    "AccountTransaction": "openapi_client.models.account_transaction",
+    "AmountValue": "openapi_client.models.amount_value",
+    "Balance": "openapi_client.models.balance",
+    "BusinessMessage": "openapi_client.models.business_message",
+    "Card": "openapi_client.models.card",
+    "CardBalance": "openapi_client.models.card_balance",
+    "CostEntry": "openapi_client.models.cost_entry",
+    "CostGroup": "openapi_client.models.cost_group",
+    "CostIndicationExAnte": "openapi_client.models.cost_indication_ex_ante",
+    "Depot": "openapi_client.models.depot",
+    "DepotAggregation": "openapi_client.models.depot_aggregation",
+    "DepotPosition": "openapi_client.models.depot_position",
+    "DepotTransaction": "openapi_client.models.depot_transaction",
+    "DerivativeData": "openapi_client.models.derivative_data",
+    "Dimensions": "openapi_client.models.dimensions",
+    "Document": "openapi_client.models.document",
+    "DocumentMetadata": "openapi_client.models.document_metadata",
+    "EnumText": "openapi_client.models.enum_text",
+    "Execution": "openapi_client.models.execution",
+    "FXRateEUR": "openapi_client.models.fx_rate_eur",
+    "FixedTermSavings": "openapi_client.models.fixed_term_savings",
+    "FundDistribution": "openapi_client.models.fund_distribution",
+    "Inducement": "openapi_client.models.inducement",
+    "InstallmentLoan": "openapi_client.models.installment_loan",
+    "InstallmentLoanBalance": "openapi_client.models.installment_loan_balance",
+    "Instrument": "openapi_client.models.instrument",
+    "ListResourceAccountBalance": "openapi_client.models.list_resource_account_balance",
+    "ListResourceAccountTransaction": "openapi_client.models.list_resource_account_transaction",
+    "ListResourceCostIndicationExAnte": "openapi_client.models.list_resource_cost_indication_ex_ante",
+    "ListResourceDepot": "openapi_client.models.list_resource_depot",
+    "ListResourceDepotPosition": "openapi_client.models.list_resource_depot_position",
+    "ListResourceDepotTransaction": "openapi_client.models.list_resource_depot_transaction",
+    "ListResourceDimensions": "openapi_client.models.list_resource_dimensions",
+    "ListResourceDocument": "openapi_client.models.list_resource_document",
+    "ListResourceInstrument": "openapi_client.models.list_resource_instrument",
+    "ListResourceOrder": "openapi_client.models.list_resource_order",
+    "ListResourceProductBalance": "openapi_client.models.list_resource_product_balance",
+    "Order": "openapi_client.models.order",
+    "OrderType": "openapi_client.models.order_type",
+    "PagingInfo": "openapi_client.models.paging_info",
+    "Price": "openapi_client.models.price",
+    "ProductBalance": "openapi_client.models.product_balance",
+    "Quote": "openapi_client.models.quote",
+    "Rating": "openapi_client.models.rating",
+    "Session": "openapi_client.models.session",
+    "StandardErrorResponse": "openapi_client.models.standard_error_response",
+    "StaticData": "openapi_client.models.static_data",
+    "TotalCostBlock": "openapi_client.models.total_cost_block",
+    "TotalCostEntry": "openapi_client.models.total_cost_entry",
+    "TotalHoldingCostBlock": "openapi_client.models.total_holding_cost_block",
+    "TotalHoldingCostEntry": "openapi_client.models.total_holding_cost_entry",
+    "Venue": "openapi_client.models.venue",
+    "VisaCardImage": "openapi_client.models.visa_card_image",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+if TYPE_CHECKING:
+    # import models into model package
+    from openapi_client.models.account import Account
+    from openapi_client.models.account_balance import AccountBalance
+    from openapi_client.models.account_information import AccountInformation
+    from openapi_client.models.account_transaction import AccountTransaction
+    from openapi_client.models.amount_value import AmountValue
+    from openapi_client.models.balance import Balance
+    from openapi_client.models.business_message import BusinessMessage
+    from openapi_client.models.card import Card
+    from openapi_client.models.card_balance import CardBalance
+    from openapi_client.models.cost_entry import CostEntry
+    from openapi_client.models.cost_group import CostGroup
+    from openapi_client.models.cost_indication_ex_ante import CostIndicationExAnte
+    from openapi_client.models.depot import Depot
+    from openapi_client.models.depot_aggregation import DepotAggregation
+    from openapi_client.models.depot_position import DepotPosition
+    from openapi_client.models.depot_transaction import DepotTransaction
+    from openapi_client.models.derivative_data import DerivativeData
+    from openapi_client.models.dimensions import Dimensions
+    from openapi_client.models.document import Document
+    from openapi_client.models.document_metadata import DocumentMetadata
+    from openapi_client.models.enum_text import EnumText
+    from openapi_client.models.execution import Execution
+    from openapi_client.models.fx_rate_eur import FXRateEUR
+    from openapi_client.models.fixed_term_savings import FixedTermSavings
+    from openapi_client.models.fund_distribution import FundDistribution
+    from openapi_client.models.inducement import Inducement
+    from openapi_client.models.installment_loan import InstallmentLoan
+    from openapi_client.models.installment_loan_balance import InstallmentLoanBalance
+    from openapi_client.models.instrument import Instrument
+    from openapi_client.models.list_resource_account_balance import ListResourceAccountBalance
+    from openapi_client.models.list_resource_account_transaction import ListResourceAccountTransaction
+    from openapi_client.models.list_resource_cost_indication_ex_ante import ListResourceCostIndicationExAnte
+    from openapi_client.models.list_resource_depot import ListResourceDepot
+    from openapi_client.models.list_resource_depot_position import ListResourceDepotPosition
+    from openapi_client.models.list_resource_depot_transaction import ListResourceDepotTransaction
+    from openapi_client.models.list_resource_dimensions import ListResourceDimensions
+    from openapi_client.models.list_resource_document import ListResourceDocument
+    from openapi_client.models.list_resource_instrument import ListResourceInstrument
+    from openapi_client.models.list_resource_order import ListResourceOrder
+    from openapi_client.models.list_resource_product_balance import ListResourceProductBalance
+    from openapi_client.models.order import Order
+    from openapi_client.models.order_type import OrderType
+    from openapi_client.models.paging_info import PagingInfo
+    from openapi_client.models.price import Price
+    from openapi_client.models.product_balance import ProductBalance
+    from openapi_client.models.quote import Quote
+    from openapi_client.models.rating import Rating
+    from openapi_client.models.session import Session
+    from openapi_client.models.standard_error_response import StandardErrorResponse
+    from openapi_client.models.static_data import StaticData
+    from openapi_client.models.total_cost_block import TotalCostBlock
+    from openapi_client.models.total_cost_entry import TotalCostEntry
+    from openapi_client.models.total_holding_cost_block import TotalHoldingCostBlock
+    from openapi_client.models.total_holding_cost_entry import TotalHoldingCostEntry
+    from openapi_client.models.venue import Venue
+    from openapi_client.models.visa_card_image import VisaCardImage
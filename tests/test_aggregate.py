@@ -0,0 +1,133 @@
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from comdirect_api.domain.aggregate import period_key, portfolio_overview, summarize_cash_flow, top_counterparties
+from comdirect_api.domain.models import AccountHolder, DepotBalance, DepotPosition, Transaction
+
+
+def _tx(day, amount, type_="TRANSFER", creditor=None, remitter=None):
+    return Transaction(
+        account_id="acc_1",
+        booking_date=day,
+        amount=Decimal(amount),
+        currency="EUR",
+        purpose=None,
+        type=type_,
+        creditor=creditor,
+        remitter=remitter,
+    )
+
+
+SHOP = AccountHolder("Shop", "DE11 2222 3333", None)
+EMPLOYER = AccountHolder("Employer", "DE99 8888", None)
+
+TRANSACTIONS = [
+    _tx(date(2023, 1, 5), "2500.00", remitter=EMPLOYER),
+    _tx(date(2023, 1, 10), "-30.00", "DIRECT_DEBIT", creditor=SHOP),
+    _tx(date(2023, 1, 20), "-20.00", creditor=AccountHolder("SHOP GmbH", "DE1122223333", None)),
+    _tx(date(2023, 2, 1), "-100.00", creditor=AccountHolder("Landlord", None, None)),
+]
+
+
+def _balance(depot_id, current, purchase):
+    return DepotBalance(
+        depot_id=depot_id,
+        date_last_update=None,
+        current_value=Decimal(current),
+        current_value_currency="EUR",
+        purchase_value=Decimal(purchase),
+        purchase_value_currency="EUR",
+        prev_day_value=Decimal(current),
+        prev_day_value_currency="EUR",
+        profit_loss_purchase_abs=None,
+        profit_loss_purchase_rel=None,
+        profit_loss_prev_day_abs=None,
+        profit_loss_prev_day_rel=None,
+    )
+
+
+def _position(depot_id, wkn, current):
+    return DepotPosition(
+        depot_id=depot_id,
+        position_id=wkn,
+        wkn=wkn,
+        quantity=Decimal(1),
+        quantity_unit="XXX",
+        current_value=Decimal(current),
+        current_value_currency="EUR",
+        purchase_value=Decimal(current),
+        purchase_value_currency="EUR",
+        profit_loss_purchase_abs=None,
+        profit_loss_purchase_rel=None,
+        profit_loss_prev_day_abs=None,
+        profit_loss_prev_day_rel=None,
+        instrument_name=wkn,
+    )
+
+
+class TestAggregate(unittest.TestCase):
+    def test_period_key(self):
+        d = date(2023, 2, 1)
+        self.assertEqual(period_key(d, "month"), "2023-02")
+        self.assertEqual(period_key(d, "quarter"), "2023-Q1")
+        self.assertEqual(period_key(d, "week"), "2023-W05")
+        self.assertEqual(period_key(d, "year"), "2023")
+        with self.assertRaises(ValueError):
+            period_key(d, "decade")
+
+    def test_summarize_cash_flow(self):
+        summary = summarize_cash_flow(iter(TRANSACTIONS))
+        self.assertEqual(
+            summary["rows"],
+            [
+                {
+                    "period": "2023-01",
+                    "income": Decimal("2500.00"),
+                    "expenses": Decimal("-50.00"),
+                    "net": Decimal("2450.00"),
+                    "count": 3,
+                },
+                {
+                    "period": "2023-02",
+                    "income": Decimal(0),
+                    "expenses": Decimal("-100.00"),
+                    "net": Decimal("-100.00"),
+                    "count": 1,
+                },
+            ],
+        )
+        self.assertEqual(summary["total"]["net"], Decimal("2350.00"))
+
+    def test_summarize_grouped(self):
+        summary = summarize_cash_flow(TRANSACTIONS, period="year", group_by=lambda tx: tx.type)
+        self.assertEqual(
+            [(r["group"], r["expenses"]) for r in summary["rows"]],
+            [("DIRECT_DEBIT", Decimal("-30.00")), ("TRANSFER", Decimal("-120.00"))],
+        )
+
+    def test_top_counterparties_merges_by_iban(self):
+        ranked = top_counterparties(TRANSACTIONS, direction="OUTGOING")
+        self.assertEqual(
+            [(e["name"], e["total"], e["count"]) for e in ranked],
+            [("Landlord", Decimal("-100.00"), 1), ("Shop", Decimal("-50.00"), 2)],
+        )
+        self.assertEqual(top_counterparties(TRANSACTIONS, limit=1)[0]["name"], "Employer")
+
+    def test_portfolio_overview(self):
+        overview = portfolio_overview(
+            [
+                (_balance("D1", "300", "200"), [_position("D1", "A", "100"), _position("D1", "B", "200")]),
+                (_balance("D2", "100", "150"), [_position("D2", "C", "100")]),
+            ],
+            top=2,
+        )
+        self.assertEqual(overview["totals"]["EUR"]["current_value"], Decimal("400"))
+        self.assertEqual(overview["totals"]["EUR"]["profit_loss_purchase_abs"], Decimal("50"))
+        self.assertEqual(overview["position_count"], 3)
+        self.assertEqual([p["wkn"] for p in overview["top_positions"]], ["B", "A"])
+        self.assertEqual(overview["top_positions"][0]["weight_percent"], Decimal("50.00"))
+
+
+if __name__ == "__main__":
+    unittest.main()
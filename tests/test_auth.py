@@ -0,0 +1,152 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import urllib3
+
+from comdirect_api.auth import Authenticator
+from comdirect_api.exceptions import AuthenticationError, TanError
+
+
+def _resp(status=200, body=None, headers=None):
+    data = json.dumps(body).encode() if body is not None else b""
+    return urllib3.HTTPResponse(body=data, status=status, headers=headers or {}, preload_content=True)
+
+
+class TestAuthenticator(unittest.TestCase):
+    def setUp(self):
+        self.pool = MagicMock()
+        self.push_cb = MagicMock(return_value="")
+        self.auth = Authenticator(
+            "user",
+            "pwd",
+            "cid",
+            "csec",
+            photo_tan_cb=MagicMock(),
+            sms_tan_cb=MagicMock(),
+            push_tan_cb=self.push_cb,
+            pool_manager=self.pool,
+        )
+
+    def test_authenticate_runs_on_shared_pool(self):
+        self.pool.request.side_effect = [
+            _resp(body={"access_token": "primary"}),
+            _resp(body=[{"identifier": "sess_1"}]),
+            _resp(201, headers={"x-once-authentication-info": json.dumps({"id": "ch1", "typ": "P_TAN_PUSH"})}),
+            _resp(body={}),
+            _resp(body={"access_token": "secondary", "refresh_token": "refresh", "expires_in": 599}),
+        ]
+
+        session_id, tokens = self.auth.authenticate()
+
+        self.assertEqual(session_id, "sess_1")
+        self.assertEqual(tokens["refresh_token"], "refresh")
+        self.push_cb.assert_called_once()
+
+        methods = [c.args[0] for c in self.pool.request.call_args_list]
+        self.assertEqual(methods, ["POST", "GET", "POST", "PATCH", "POST"])
+        # Token requests are form encoded, session validation is JSON
+        first = self.pool.request.call_args_list[0]
+        self.assertEqual(first.kwargs["fields"]["grant_type"], "password")
+        self.assertFalse(first.kwargs["encode_multipart"])
+        validate = self.pool.request.call_args_list[2]
+        self.assertEqual(json.loads(validate.kwargs["body"])["identifier"], "sess_1")
+        self.assertEqual(self.pool.request.call_args_list[3].kwargs["headers"]["x-once-authentication"], "")
+
+    def test_error_response(self):
+        self.pool.request.return_value = _resp(401, body={"error_description": "bad credentials"})
+        with self.assertRaisesRegex(AuthenticationError, "bad credentials"):
+            self.auth.authenticate()
+
+    def test_network_error(self):
+        self.pool.request.side_effect = urllib3.exceptions.MaxRetryError(None, "/oauth/token")
+        with self.assertRaisesRegex(AuthenticationError, "Network error"):
+            self.auth.refresh("refresh")
+
+
+PUSH_CHALLENGE = {
+    "id": "ch1",
+    "typ": "P_TAN_PUSH",
+    "link": {"href": "/api/session/v1/authentications/ch1", "rel": "self", "method": "GET"},
+}
+
+
+class TestPushTanPolling(unittest.TestCase):
+    def setUp(self):
+        self.pool = MagicMock()
+        self.push_cb = MagicMock(return_value=None)
+        self.auth = Authenticator(
+            "user",
+            "pwd",
+            "cid",
+            "csec",
+            photo_tan_cb=MagicMock(),
+            sms_tan_cb=MagicMock(),
+            push_tan_cb=self.push_cb,
+            pool_manager=self.pool,
+            push_tan_poll=True,
+            push_tan_timeout=5,
+        )
+
+    def _responses(self, *statuses):
+        return [
+            _resp(body={"access_token": "primary"}),
+            _resp(body=[{"identifier": "sess_1"}]),
+            _resp(201, headers={"x-once-authentication-info": json.dumps(PUSH_CHALLENGE)}),
+            *[_resp(body={"authenticationId": "ch1", "status": s}) for s in statuses],
+            _resp(body={}),
+            _resp(body={"access_token": "secondary", "refresh_token": "refresh", "expires_in": 599}),
+        ]
+
+    @patch("comdirect_api.auth.time.sleep")
+    def test_completes_when_approved(self, sleep):
+        self.pool.request.side_effect = self._responses("PENDING", "PENDING", "AUTHENTICATED")
+
+        session_id, tokens = self.auth.authenticate()
+
+        self.assertEqual(tokens["access_token"], "secondary")
+        self.push_cb.assert_called_once()
+        polls = [c for c in self.pool.request.call_args_list if c.args[0] == "GET"][1:]
+        self.assertEqual(len(polls), 3)
+        self.assertEqual(polls[0].args[1], "https://api.comdirect.de/api/session/v1/authentications/ch1")
+        # Backoff between the polls
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 0.75])
+        patch_call = self.pool.request.call_args_list[-2]
+        self.assertEqual(patch_call.args[0], "PATCH")
+        self.assertEqual(patch_call.kwargs["headers"]["x-once-authentication"], Authenticator.PUSH_TAN)
+
+    @patch("comdirect_api.auth.time.sleep")
+    def test_declined(self, sleep):
+        self.pool.request.side_effect = self._responses("PENDING", "REJECTED")
+        with self.assertRaisesRegex(TanError, "REJECTED"):
+            self.auth.authenticate()
+
+    @patch("comdirect_api.auth.time.monotonic")
+    @patch("comdirect_api.auth.time.sleep")
+    def test_deadline(self, sleep, monotonic):
+        monotonic.side_effect = [0, 1, 6]
+        self.pool.request.side_effect = self._responses("PENDING", "PENDING")
+        with self.assertRaisesRegex(TanError, "not approved within 5s"):
+            self.auth.authenticate()
+        sleep.assert_called_once()
+
+    def test_async_variant(self):
+        self.pool.request.side_effect = self._responses("PENDING", "AUTHENTICATED")
+
+        with patch("comdirect_api.auth.asyncio.sleep") as sleep:
+            sleep.return_value = None
+
+            async def _no_wait(delay):
+                return None
+
+            sleep.side_effect = _no_wait
+            session_id, tokens = asyncio.run(self.auth.authenticate_async())
+
+        self.assertEqual(session_id, "sess_1")
+        self.assertEqual(tokens["refresh_token"], "refresh")
+        sleep.assert_called_once_with(0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
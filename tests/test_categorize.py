@@ -0,0 +1,92 @@
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+from comdirect_api.domain.categorize import Categorizer, CategoryRule, _Automaton
+from comdirect_api.domain.models import AccountHolder, Transaction
+
+
+def _tx(purpose, creditor=None, creditor_id=None):
+    return Transaction(
+        account_id="acc_1",
+        booking_date=date(2023, 1, 1),
+        amount=Decimal("-10.00"),
+        currency="EUR",
+        purpose=purpose,
+        type="DIRECT_DEBIT",
+        creditor=creditor,
+        direct_debit_creditor_id=creditor_id,
+    )
+
+
+class TestCategorizer(unittest.TestCase):
+    def setUp(self):
+        self.rules = [
+            CategoryRule("rent", ibans=["DE11 2222 3333 4444"], name="landlord"),
+            CategoryRule("insurance", creditor_ids=["DE98ZZZ09999999999"]),
+            CategoryRule("groceries", contains=["REWE", "edeka"]),
+            CategoryRule("shopping", patterns=[r"amazon(\.de)?", r"zalando"]),
+            CategoryRule("food", contains=["rewe to go"]),
+        ]
+        self.categorizer = Categorizer(self.rules, default="other")
+
+    def test_matchers(self):
+        landlord = AccountHolder(holder_name="Hausverwaltung", iban="DE11222233334444", bic=None)
+        txs = [
+            _tx("Miete", creditor=landlord),
+            _tx("Beitrag", creditor_id="DE98ZZZ09999999999"),
+            _tx("REWE Markt GmbH"),
+            _tx("Order AMAZON.DE 123"),
+            _tx("Kiosk"),
+            _tx(None, creditor=AccountHolder(holder_name="Edeka Center", iban=None, bic=None)),
+        ]
+        self.assertEqual(
+            self.categorizer.categorize_batch(txs),
+            ["rent", "insurance", "groceries", "shopping", "other", "groceries"],
+        )
+        self.assertEqual(self.categorizer.hit_counts["landlord"], 1)
+        self.assertEqual(self.categorizer.hit_counts["groceries"], 2)
+        self.assertNotIn("other", self.categorizer.hit_counts)
+
+    def test_first_rule_wins(self):
+        # "rewe to go" also matches the earlier "REWE" rule.
+        self.assertEqual(self.categorizer.categorize(_tx("Rewe To Go Bahnhof")), "groceries")
+        # Priority holds even when a later rule matches earlier in the text.
+        self.assertEqual(self.categorizer.categorize(_tx("zalando retoure via rewe")), "groceries")
+
+    def test_many_rules(self):
+        rules = [CategoryRule(f"cat{i}", contains=[f"merchant{i:04d}"]) for i in range(2000)]
+        categorizer = Categorizer(rules)
+        self.assertEqual(categorizer.categorize(_tx("Payment MERCHANT1999 ref")), "cat1999")
+        self.assertIsNone(categorizer.categorize(_tx("unknown")))
+        categorizer.reset_stats()
+        self.assertEqual(sum(categorizer.hit_counts.values()), 0)
+
+    def test_literal_patterns_and_regex_priority(self):
+        rules = [
+            CategoryRule("late-regex", patterns=[r"shop\d+"]),
+            CategoryRule("literal-pattern", patterns=["Bäckerei"]),
+        ]
+        categorizer = Categorizer(rules)
+        self.assertEqual(categorizer.categorize(_tx("BÄCKEREI shop12")), "late-regex")
+        self.assertEqual(categorizer.categorize(_tx("bäckerei Müller")), "literal-pattern")
+        # a literal rule listed first beats a later regex rule without running it
+        categorizer = Categorizer(list(reversed(rules)))
+        self.assertEqual(categorizer.categorize(_tx("BÄCKEREI shop12")), "literal-pattern")
+
+    def test_substring_rules_are_matched_in_one_pass(self):
+        rules = [CategoryRule(f"cat{i}", contains=[f"merchant{i:04d}"]) for i in range(1000)]
+        rules.append(CategoryRule("fallback", patterns=[r"payment \d+"]))
+        categorizer = Categorizer(rules)
+        # one automaton for all substring rules, one regex only for the rule that needs it
+        self.assertEqual([idx for idx, _ in categorizer._regexes], [1000])
+
+        txs = [_tx("Payment MERCHANT0999 ref"), _tx("payment 12"), _tx("unknown")]
+        with patch.object(_Automaton, "first_rule", autospec=True, side_effect=_Automaton.first_rule) as first_rule:
+            self.assertEqual(categorizer.categorize_batch(txs), ["cat999", "fallback", None])
+        self.assertEqual(first_rule.call_count, len(txs))
+
+
+if __name__ == "__main__":
+    unittest.main()
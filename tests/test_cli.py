@@ -0,0 +1,98 @@
+import csv
+import io
+import json
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from comdirect_api.cli import FIELDNAMES, _iter_parallel, build_parser, export_transactions
+from comdirect_api.domain.models import Transaction
+
+
+def _tx(account_id, i):
+    return Transaction(
+        account_id=account_id,
+        booking_date=date(2023, 1, 1),
+        amount=Decimal("1.50") * i,
+        currency="EUR",
+        purpose=f"Tx {i}",
+        type="TRANSFER",
+    )
+
+
+class TestExportTransactions(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.iter_all_transactions.side_effect = lambda account_id, **kw: (_tx(account_id, i) for i in range(5))
+
+    def test_ndjson(self):
+        out = io.StringIO()
+        count = export_transactions(self.client, ["acc_1"], out, since="2023-01-01")
+
+        self.assertEqual(count, 5)
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        row = json.loads(lines[1])
+        self.assertEqual(row["amount"], "1.50")
+        self.assertEqual(row["booking_date"], "2023-01-01")
+        self.client.iter_all_transactions.assert_called_with(account_id="acc_1", min_booking_date="2023-01-01")
+
+    def test_csv(self):
+        out = io.StringIO()
+        export_transactions(self.client, ["acc_1"], out, fmt="csv")
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(list(rows[0].keys()), FIELDNAMES)
+
+    def test_parallel_workers(self):
+        out = io.StringIO()
+        count = export_transactions(self.client, ["acc_1", "acc_2", "acc_3"], out, workers=3)
+
+        self.assertEqual(count, 15)
+        accounts = {json.loads(line)["account_id"] for line in out.getvalue().splitlines()}
+        self.assertEqual(accounts, {"acc_1", "acc_2", "acc_3"})
+
+    def test_parallel_worker_error_propagates(self):
+        def failing(account_id, **kw):
+            if account_id == "bad":
+                raise RuntimeError("boom")
+            return (_tx(account_id, i) for i in range(3))
+
+        self.client.iter_all_transactions.side_effect = failing
+        with self.assertRaises(RuntimeError):
+            export_transactions(self.client, ["acc_1", "bad"], io.StringIO(), workers=2)
+
+    def test_stopping_early_does_not_start_queued_accounts(self):
+        accounts = [f"acc_{i}" for i in range(5)]
+        items = _iter_parallel(self.client, accounts, workers=1)
+        self.assertEqual(next(items).account_id, "acc_0")
+        items.close()
+        self.assertEqual([c.kwargs["account_id"] for c in self.client.iter_all_transactions.call_args_list], ["acc_0"])
+
+    def test_worker_error_stops_queued_accounts(self):
+        def failing(account_id, **kw):
+            raise RuntimeError("boom")
+
+        self.client.iter_all_transactions.side_effect = failing
+        with self.assertRaises(RuntimeError):
+            export_transactions(self.client, ["bad", "acc_1", "acc_2"], io.StringIO(), workers=1)
+        self.assertEqual(self.client.iter_all_transactions.call_count, 1)
+
+    def test_stopping_early_unblocks_producers_on_a_full_queue(self):
+        self.client.iter_all_transactions.side_effect = lambda account_id, **kw: (
+            _tx(account_id, i) for i in range(50)
+        )
+        with patch("comdirect_api.cli._QUEUE_SIZE", 2):
+            items = _iter_parallel(self.client, ["acc_1", "acc_2", "acc_3"], workers=3)
+            next(items)
+            items.close()
+
+    def test_parser_rejects_bad_date(self):
+        with self.assertRaises(SystemExit):
+            build_parser().parse_args(["--since", "yesterday"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 from decimal import Decimal
@@ -20,13 +21,13 @@ class TestComdirectClient(unittest.TestCase):
         self.auth_patcher = patch("comdirect_api.client.Authenticator")
         self.MockAuthenticator = self.auth_patcher.start()
 
-        self.banking_patcher = patch("comdirect_api.client.BankingApi")
+        self.banking_patcher = patch("openapi_client.api.banking_api.BankingApi")
         self.MockBankingApi = self.banking_patcher.start()
 
-        self.brokerage_patcher = patch("comdirect_api.client.BrokerageApi")
+        self.brokerage_patcher = patch("openapi_client.api.brokerage_api.BrokerageApi")
         self.MockBrokerageApi = self.brokerage_patcher.start()
 
-        self.messages_patcher = patch("comdirect_api.client.MessagesApi")
+        self.messages_patcher = patch("openapi_client.api.messages_api.MessagesApi")
         self.MockMessagesApi = self.messages_patcher.start()
 
         self.client = ComdirectClient(self.credentials, self.tan_handlers)
@@ -51,6 +52,64 @@ class TestComdirectClient(unittest.TestCase):
         self.assertEqual(self.client._session_id, "session_123")
         self.assertEqual(self.client._api_client.configuration.access_token, "token_abc")
 
+    def test_login_keeps_refresh_token(self):
+        self.mock_auth_instance.authenticate.return_value = (
+            "session_123",
+            {"access_token": "token_abc", "refresh_token": "refresh_abc", "expires_in": 599},
+        )
+        self.mock_auth_instance.refresh.return_value = {"access_token": "token_new", "expires_in": 599}
+        self.client.login()
+        self.addCleanup(self.client.logout)
+
+        self.client.refresh_token()
+
+        self.mock_auth_instance.refresh.assert_called_once_with("refresh_abc")
+        self.assertEqual(self.client._api_client.configuration.access_token, "token_new")
+
+    def test_concurrent_login_runs_2fa_once(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_authenticate():
+            started.set()
+            release.wait(2)
+            return "session_123", {"access_token": "token_abc"}
+
+        self.mock_auth_instance.authenticate.side_effect = slow_authenticate
+        threads = [threading.Thread(target=self.client.login) for _ in range(5)]
+        threads[0].start()
+        started.wait(2)
+        for t in threads[1:]:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(2)
+
+        self.mock_auth_instance.authenticate.assert_called_once()
+        self.assertEqual(self.client._state.credentials, ("session_123", "token_abc"))
+
+    def test_concurrent_unauthorized_refreshes_once(self):
+        self.mock_auth_instance.authenticate.return_value = (
+            "session_123",
+            {"access_token": "token_abc", "refresh_token": "refresh_abc"},
+        )
+        self.mock_auth_instance.refresh.return_value = {"access_token": "token_new"}
+        self.client.login()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.client._refresh_on_unauthorized("token_abc")))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(2)
+
+        self.mock_auth_instance.refresh.assert_called_once_with("refresh_abc")
+        self.assertEqual(results, ["token_new"] * 5)
+        self.assertEqual(self.client._state.credentials, ("session_123", "token_new"))
+
     def test_list_accounts(self):
         # Mock response from banking API
         mock_balance = MagicMock()
@@ -211,3 +270,20 @@ class TestComdirectApiClient(unittest.TestCase):
             self.assertIn("sess_123", headers["x-http-request-info"])
 
             self.assertEqual(headers["Content-Type"], "application/json")
+
+    def test_unauthorized_refreshes_and_retries(self):
+        config = MagicMock()
+        config.access_token = "expired"
+        config.assert_hostname = None
+        config.proxy = None
+        refresher = MagicMock(return_value="fresh")
+        client = ComdirectApiClient(MagicMock(return_value=None), configuration=config, token_refresher=refresher)
+
+        with patch("openapi_client.ApiClient.call_api") as mock_super_call:
+            mock_super_call.side_effect = [MagicMock(status=401), MagicMock(status=200)]
+            response = client.call_api("GET", "/test")
+
+        self.assertEqual(response.status, 200)
+        refresher.assert_called_once()
+        self.assertEqual(mock_super_call.call_count, 2)
+        self.assertEqual(mock_super_call.call_args.kwargs["header_params"]["Authorization"], "Bearer fresh")
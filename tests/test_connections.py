@@ -0,0 +1,137 @@
+import socket
+import threading
+import time
+import unittest
+
+import urllib3
+
+from comdirect_api.connections import ConnectionManager, record_activity
+
+
+class _Listener:
+    """Accepts TCP connections without speaking HTTP; enough to open pooled connections."""
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(16)
+        self.accepted = []
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            self.accepted.append(conn)
+
+    def close(self):
+        for conn in self.accepted:
+            conn.close()
+        self.sock.close()
+
+
+class TestConnectionManager(unittest.TestCase):
+    def setUp(self):
+        self.listener = _Listener()
+        self.addCleanup(self.listener.close)
+        self.pool_manager = urllib3.PoolManager(maxsize=4)
+        self.addCleanup(self.pool_manager.clear)
+        self.last_activity = None
+        self.manager = ConnectionManager(
+            self.pool_manager,
+            last_activity=lambda: self.last_activity,
+            url=self.listener.url,
+            max_idle=0.05,
+            check_interval=0.01,
+        )
+        self.addCleanup(self.manager.stop)
+
+    def test_warm_up_opens_connections(self):
+        self.assertEqual(self.manager.warm_up(3), 3)
+        stats = self.manager.stats()
+        self.assertEqual(stats["idle_connected"], 3)
+        self.assertEqual(stats["connections_created"], 3)
+        self.assertEqual(stats["maxsize"], 4)
+
+        # Already open connections are reused
+        self.assertEqual(self.manager.warm_up(3), 0)
+
+    def test_warm_up_is_bounded_by_pool_size(self):
+        self.assertEqual(self.manager.warm_up(10), 4)
+
+    def test_recycle_idle_closes_connections(self):
+        self.manager.warm_up(2)
+        self.assertEqual(self.manager.recycle_idle(), 2)
+        self.assertEqual(self.manager.stats()["idle_connected"], 0)
+
+    def test_check_recycles_and_rewarms_after_idle(self):
+        self.manager.warm_up(2)
+        self.last_activity = time.monotonic()
+        self.manager.check()
+        self.assertEqual(self.manager.stats()["connections_created"], 2)
+
+        self.last_activity -= 1
+        self.manager.check()
+        stats = self.manager.stats()
+        self.assertEqual(stats["idle_connected"], 2)
+        self.assertEqual(stats["connections_created"], 2)
+
+    def test_warm_up_failure_is_not_raised(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            closed_port = s.getsockname()[1]
+        manager = ConnectionManager(self.pool_manager, lambda: None, url=f"http://127.0.0.1:{closed_port}")
+        self.assertEqual(manager.warm_up(2), 0)
+
+    def test_recycle_while_connections_are_checked_out(self):
+        self.manager.warm_up(4)
+        pool = self.pool_manager.connection_from_url(self.listener.url)
+        busy = pool._get_conn()
+        self.assertEqual(self.manager.recycle_idle(), 3)
+        pool._put_conn(busy)  # the queue must still have room for it
+        stats = self.manager.stats()
+        self.assertEqual(stats["idle_slots"], 4)
+        self.assertEqual(stats["idle_connected"], 1)
+
+    def test_keepalive_thread_survives_errors(self):
+        calls = []
+
+        def failing_check():
+            calls.append(1)
+            raise RuntimeError("boom")
+
+        self.manager.check = failing_check
+        with self.assertLogs("comdirect_api.connections", level="ERROR"):
+            self.manager.start()
+            deadline = time.monotonic() + 2
+            while len(calls) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        self.assertGreaterEqual(len(calls), 3)
+        self.assertTrue(self.manager._thread.is_alive())
+
+    def test_shared_pool_is_not_recycled_while_another_client_is_active(self):
+        other = ConnectionManager(self.pool_manager, lambda: None, url=self.listener.url, max_idle=0.05)
+        self.manager.warm_up(2)
+        self.last_activity = time.monotonic() - 1
+        # this manager's own client is idle, but another client of the pool just made a request
+        record_activity(self.pool_manager)
+        self.manager.check()
+        self.assertEqual(self.manager.stats()["idle_connected"], 2)
+
+        # once the whole pool is idle it is recycled once, not by every manager in turn
+        time.sleep(0.06)
+        self.manager.check()
+        created = self.manager.stats()["connections_created"]
+        other.check()
+        self.assertEqual(self.manager.stats()["connections_created"], created)
+
+
+if __name__ == "__main__":
+    unittest.main()
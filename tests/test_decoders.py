@@ -0,0 +1,277 @@
+import copy
+import json
+import pickle
+import sys
+import threading
+import typing
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pydantic import BaseModel, ValidationError
+
+import openapi_client.models
+from comdirect_api.client import ComdirectApiClient
+from comdirect_api.domain.mappers import map_depot_position
+from openapi_client.decoders import DECODER_MODULES, LazyModel, decoder_for, materialize
+
+TRANSACTIONS = {
+    "paging": {"index": 0, "matches": 2},
+    "aggregated": {"account": {"accountId": "A1"}},
+    "values": [
+        {
+            "reference": "REF1",
+            "bookingStatus": "BOOKED",
+            "bookingDate": "2024-01-31",
+            "amount": {"value": "-12.34", "unit": "EUR"},
+            "creditor": {"holderName": "Shop", "iban": "DE11 2222"},
+            "valutaDate": "2024-02-01",
+            "newTransaction": None,
+            "remittanceInfo": "01Purchase",
+            "transactionType": {"key": "DIRECT_DEBIT", "text": "Lastschrift"},
+            "unknownField": 1,
+        },
+        {"bookingStatus": "NOTBOOKED", "amount": {"value": "100", "unit": "EUR"}, "newTransaction": True},
+    ],
+}
+
+POSITIONS = {
+    "paging": {"index": 0, "matches": 1},
+    "aggregated": {"depot": {"depotId": "D1"}, "prevDayValue": {"value": "1", "unit": "EUR"}},
+    "values": [
+        {
+            "depotId": "D1",
+            "positionId": "P1",
+            "wkn": "A0B1C2",
+            "quantity": {"value": "3", "unit": "XXX"},
+            "currentPrice": {"price": {"value": "10", "unit": "EUR"}, "priceDateTime": "2024-01-31T10:00:00+01:00"},
+            "instrument": {
+                "instrumentId": "I1",
+                "wkn": "A0B1C2",
+                "name": "Fund",
+                "staticData": {"notation": "XXX", "instrumentType": "FUND", "priipsRelevant": True},
+            },
+        }
+    ],
+}
+
+
+def _valid_string(validator):
+    """Finds a value the generated enum/pattern validator accepts among its own constants."""
+    candidates = ["2024-01-31"]
+    for const in validator.__code__.co_consts:
+        candidates.extend(const if isinstance(const, (tuple, frozenset)) else [const])
+    for candidate in filter(lambda c: isinstance(c, str), candidates):
+        try:
+            return validator(candidate)
+        except ValueError:
+            pass
+    raise AssertionError(f"no valid sample for {validator}")
+
+
+def _sample(model, depth=0):
+    """Builds a payload for ``model`` that sets every field the model can validate."""
+    payload = {}
+    for name, info in model.model_fields.items():
+        annotation = typing.get_args(info.annotation)[0]
+        payload[info.alias or name] = _sample_value(model, name, annotation, depth)
+    return payload
+
+
+def _sample_value(model, name, annotation, depth):
+    origin = typing.get_origin(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _sample(annotation, depth + 1) if depth < 4 else {}
+    if origin is list:
+        return [_sample_value(model, name, typing.get_args(annotation)[0], depth)]
+    if origin is dict:
+        value = typing.get_args(annotation)[1]
+        return {"key": "value"} if value is typing.Any else {"key": _sample_value(model, name, value, depth)}
+    base = typing.get_args(annotation)[0]
+    if base is bool:
+        return True
+    if base is int:
+        return 1
+    for decorator in model.__pydantic_decorators__.field_validators.values():
+        if name in decorator.info.fields:
+            return _valid_string(decorator.func)
+    metadata = [m for arg in typing.get_args(annotation)[1:] for m in getattr(arg, "metadata", [arg])]
+    max_length = next((m.max_length for m in metadata if hasattr(m, "max_length")), None)
+    return "EUR" if max_length == 3 else "value"
+
+
+def _decode_both(klass, payload):
+    model = getattr(openapi_client.models, klass)
+    expected = model.from_dict(json.loads(json.dumps(payload)))
+    actual = decoder_for(klass)(json.loads(json.dumps(payload)))
+    return expected, actual
+
+
+def _decode_lazy(klass, payload):
+    model = getattr(openapi_client.models, klass)
+    expected = model.from_dict(json.loads(json.dumps(payload)))
+    actual = decoder_for(klass, lazy=True)(json.loads(json.dumps(payload)))
+    return expected, actual
+
+
+class TestCompiledDecoders(unittest.TestCase):
+    def assertSameModel(self, expected, actual):
+        self.assertEqual(actual, expected)
+        self.assertIs(type(actual), type(expected))
+        self.assertEqual(actual.model_fields_set, expected.model_fields_set)
+        self.assertEqual(actual.to_dict(), expected.to_dict())
+
+    def test_transactions_match_pydantic(self):
+        expected, actual = _decode_both("ListResourceAccountTransaction", TRANSACTIONS)
+        self.assertSameModel(expected, actual)
+        self.assertIs(actual.values[0].new_transaction, False)
+        self.assertEqual(actual.values[0].creditor.holder_name, "Shop")
+
+    def test_positions_match_pydantic(self):
+        self.assertSameModel(*_decode_both("ListResourceDepotPosition", POSITIONS))
+
+    def test_every_model_matches_pydantic(self):
+        for klass in DECODER_MODULES:
+            with self.subTest(klass):
+                model = getattr(openapi_client.models, klass)
+                payload = _sample(model)
+                self.assertSameModel(*_decode_both(klass, payload))
+                self.assertSameModel(*_decode_both(klass, {}))
+
+    def test_invalid_input_raises_pydantic_error(self):
+        bad_enum = {"values": [{"bookingStatus": "SOMETIMES"}]}
+        bad_type = {"values": [{"amount": {"value": 12.5, "unit": "EUR"}}]}
+        bad_pattern = {"values": [{"bookingDate": "31.01.2024"}]}
+        for payload in (bad_enum, bad_type, bad_pattern, {"values": [None]}):
+            with self.subTest(payload):
+                with self.assertRaises(ValidationError) as expected:
+                    _decode_both("ListResourceAccountTransaction", payload)
+                with self.assertRaises(ValidationError) as actual:
+                    decoder_for("ListResourceAccountTransaction")(payload)
+                self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_unexpected_shape_falls_back_to_pydantic(self):
+        # from_dict iterates a dict given for a list field, the compiled decoder hands it over unchanged
+        self.assertSameModel(*_decode_both("ListResourceAccountTransaction", {"values": {}}))
+
+    def test_unknown_type_has_no_decoder(self):
+        self.assertIsNone(decoder_for("bytearray"))
+        self.assertIsNone(decoder_for("List[Document]"))
+
+    def test_engine_is_selectable(self):
+        text = json.dumps(TRANSACTIONS)
+        compiled = ComdirectApiClient(lambda: None, decode_engine="compiled")
+        generic = ComdirectApiClient(lambda: None)
+        self.assertEqual(generic.decode_engine, "pydantic")
+        self.assertEqual(
+            compiled.deserialize(text, "ListResourceAccountTransaction", "application/json"),
+            generic.deserialize(text, "ListResourceAccountTransaction", "application/json"),
+        )
+        self.assertEqual(compiled.deserialize("plain", "str", "text/plain"), "plain")
+        with self.assertRaises(ValueError):
+            ComdirectApiClient(lambda: None, decode_engine="fast")
+
+
+class TestLazyDecoders(unittest.TestCase):
+    def test_nested_models_are_decoded_on_first_read(self):
+        _, result = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+        self.assertIsInstance(result, openapi_client.models.ListResourceDepotPosition)
+        self.assertEqual(set(result.__pydantic_private__), {"paging", "values"})
+
+        position = result.values[0]
+        self.assertIsInstance(position, LazyModel)
+        self.assertEqual(position.wkn, "A0B1C2")
+        self.assertIn("instrument", position.__pydantic_private__)
+        instrument = position.instrument
+        self.assertIs(position.instrument, instrument)
+        self.assertNotIn("instrument", position.__pydantic_private__)
+        self.assertEqual(instrument.name, "Fund")
+        self.assertIn("static_data", instrument.__pydantic_private__)
+
+    def test_mapper_reads_only_what_it_needs(self):
+        expected, result = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+        self.assertEqual(map_depot_position(result.values[0]), map_depot_position(expected.values[0]))
+        self.assertIn("static_data", result.values[0].instrument.__pydantic_private__)
+
+    def test_every_model_matches_pydantic(self):
+        for klass in DECODER_MODULES:
+            with self.subTest(klass):
+                payload = _sample(getattr(openapi_client.models, klass))
+                expected, actual = _decode_lazy(klass, payload)
+                self.assertEqual(actual.model_fields_set, expected.model_fields_set)
+                self.assertEqual(actual.to_dict(), expected.to_dict())
+                self.assertEqual(repr(actual), repr(expected))
+                self.assertEqual(actual, expected)
+
+    def test_whole_model_operations_see_every_field(self):
+        expected, _ = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+        for operation in (repr, lambda m: m.model_dump_json(), lambda m: dict(m), lambda m: m.to_json()):
+            with self.subTest(operation):
+                _, actual = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+                self.assertEqual(operation(actual), operation(expected))
+
+    def test_copy_and_pickle(self):
+        expected, actual = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+        self.assertEqual(copy.copy(actual), expected)
+        self.assertEqual(copy.deepcopy(actual), expected)
+        restored = pickle.loads(pickle.dumps(actual))
+        self.assertIs(type(restored), type(expected))
+        self.assertEqual(restored, expected)
+
+    def test_assignment_replaces_pending_field(self):
+        _, result = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+        position = result.values[0]
+        position.instrument = None
+        self.assertIsNone(position.instrument)
+        position.quantity = openapi_client.models.AmountValue(value="4", unit="XXX")
+        position.current_price = None
+        self.assertEqual(position.__pydantic_private__, {})
+        with self.assertRaises(ValidationError):
+            position.quantity = "4"
+        self.assertEqual(position.quantity.value, "4")
+        self.assertEqual(list(position.model_dump()), list(openapi_client.models.DepotPosition.model_fields))
+
+    def test_invalid_nested_data_raises_when_read(self):
+        payload = {"values": [{"wkn": "A0B1C2", "instrument": {"wkn": 5}}]}
+        result = decoder_for("ListResourceDepotPosition", lazy=True)(payload)
+        position = result.values[0]
+        self.assertEqual(position.wkn, "A0B1C2")
+        with self.assertRaises(ValidationError) as expected:
+            openapi_client.models.DepotPosition.from_dict(payload["values"][0])
+        with self.assertRaises(ValidationError) as actual:
+            position.instrument
+        self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_materialize(self):
+        _, result = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+        self.assertIs(materialize(result), result)
+        self.assertEqual(result.__pydantic_private__, {})
+        self.assertEqual(result.values[0].instrument.__pydantic_private__, {})
+
+    def test_concurrent_reads_of_a_pending_field(self):
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        threads = 8
+        for _ in range(200):
+            _, result = _decode_lazy("ListResourceDepotPosition", POSITIONS)
+            position = result.values[0]
+            barrier = threading.Barrier(threads)
+
+            def read():
+                barrier.wait()
+                return position.instrument
+
+            with ThreadPoolExecutor(threads) as executor:
+                instruments = list(executor.map(lambda _: read(), range(threads)))
+            self.assertNotIn("instrument", position.__pydantic_private__)
+            self.assertTrue(all(instrument.name == "Fund" for instrument in instruments))
+
+    def test_lazy_engine(self):
+        client = ComdirectApiClient(lambda: None, decode_engine="lazy")
+        result = client.deserialize(json.dumps(POSITIONS), "ListResourceDepotPosition", "application/json")
+        self.assertIsInstance(result.values[0], LazyModel)
+        self.assertEqual(result, openapi_client.models.ListResourceDepotPosition.from_dict(POSITIONS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from comdirect_api.document_cache import DocumentCache
+
+
+class TestDocumentCache(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.cache = DocumentCache(self.dir)
+
+    def test_put_and_get(self):
+        entry = self.cache.put("doc1", "application/pdf", b"%PDF-1.4 content")
+        self.assertEqual(entry["size"], 16)
+        self.assertEqual(entry["mime_type"], "application/pdf")
+        with open(entry["path"], "rb") as f:
+            self.assertEqual(f.read(), b"%PDF-1.4 content")
+        self.assertEqual(self.cache.get("doc1"), entry)
+        self.assertIn("doc1", self.cache)
+        self.assertIsNone(self.cache.get("unknown"))
+
+    def test_identical_content_is_stored_once(self):
+        a = self.cache.put("doc1", "application/pdf", b"same")
+        b = self.cache.put("doc2", "application/pdf", b"same")
+        self.assertEqual(a["path"], b["path"])
+        self.assertEqual(len(self.cache.entries()), 2)
+
+    def test_fetch_downloads_once(self):
+        client = MagicMock()
+        client.download_document.return_value = b"data"
+        self.cache.fetch(client, "doc1", "application/pdf")
+        self.cache.fetch(client, "doc1", "application/pdf")
+        client.download_document.assert_called_once_with("doc1", "application/pdf")
+
+    def test_index_survives_restart(self):
+        self.cache.put("doc1", "application/pdf", b"data")
+        self.assertEqual(DocumentCache(self.dir).get("doc1")["size"], 4)
+
+    def test_missing_object_is_a_miss(self):
+        entry = self.cache.put("doc1", "application/pdf", b"data")
+        os.remove(entry["path"])
+        self.assertIsNone(self.cache.get("doc1"))
+
+    def test_representations_are_separate(self):
+        pdf = self.cache.put("doc1", "application/pdf", b"%PDF")
+        html = self.cache.put("doc1", "text/html", b"<html>")
+        self.assertEqual(self.cache.get("doc1", "application/pdf"), pdf)
+        self.assertEqual(self.cache.get("doc1", "text/html"), html)
+        self.assertIsNone(self.cache.get("doc1", "text/plain"))
+        self.assertEqual(self.cache.get("doc1"), html)
+
+        client = MagicMock()
+        client.download_document.return_value = b"text"
+        self.assertEqual(self.cache.fetch(client, "doc1", "text/plain")["mime_type"], "text/plain")
+        client.download_document.assert_called_once_with("doc1", "text/plain")
+        self.assertEqual(DocumentCache(self.dir).get("doc1", "application/pdf")["size"], 4)
+
+    def test_least_recently_used_are_evicted(self):
+        cache = DocumentCache(self.dir, max_bytes=10)
+        a = cache.put("a", "application/pdf", b"aaaa")
+        cache.put("b", "application/pdf", b"bbbb")
+        cache.get("a")
+        cache.put("c", "application/pdf", b"cccc")
+        self.assertEqual(sorted(e["document_id"] for e in cache.entries()), ["a", "c"])
+        self.assertEqual(sum(len(files) for _, _, files in os.walk(os.path.join(self.dir, "objects"))), 2)
+
+        cache = DocumentCache(self.dir, max_bytes=None, max_entries=1)
+        cache.put("d", "application/pdf", b"aaaa")  # same content as a, which stays on disk
+        self.assertEqual([e["document_id"] for e in cache.entries()], ["d"])
+        self.assertTrue(os.path.exists(a["path"]))
+
+    def test_oversized_document_is_kept(self):
+        cache = DocumentCache(self.dir, max_bytes=2)
+        cache.put("a", "application/pdf", b"aa")
+        self.assertEqual(cache.put("b", "application/pdf", b"bbbb")["size"], 4)
+        self.assertEqual([e["document_id"] for e in cache.entries()], ["b"])
+
+    def test_clear(self):
+        entry = self.cache.put("doc1", "application/pdf", b"data")
+        self.cache.clear()
+        self.assertFalse(os.path.exists(entry["path"]))
+        self.assertEqual(self.cache.entries(), [])
+        self.assertEqual(DocumentCache(self.dir).entries(), [])
+        self.cache.put("doc1", "application/pdf", b"data")
+        self.assertIn("doc1", self.cache)
+
+    def test_read_chunk(self):
+        self.cache.put("doc1", "application/pdf", b"0123456789")
+        self.assertEqual(self.cache.read_chunk("doc1", 4, 3), b"456")
+        self.assertEqual(self.cache.read_chunk("doc1", 8, 5), b"89")
+        with self.assertRaises(KeyError):
+            self.cache.read_chunk("unknown", 0, 1)
+        with self.assertRaises(ValueError):
+            self.cache.read_chunk("doc1", -1, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
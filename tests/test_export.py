@@ -0,0 +1,96 @@
+import os
+import re
+import tempfile
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from comdirect_api.domain.models import AccountHolder, Document, Transaction
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pq = None
+
+
+@unittest.skipIf(pq is None, "pyarrow not installed")
+class TestParquetExport(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _tx(self, i):
+        return Transaction(
+            account_id="acc_1",
+            booking_date=date(2023, 1, 1 + i % 28),
+            amount=Decimal("-12.34") * i,
+            currency="EUR",
+            purpose=f"Payment {i}",
+            type="DIRECT_DEBIT",
+            creditor=AccountHolder(holder_name="Shop", iban="DE00123", bic=None) if i % 2 else None,
+        )
+
+    def test_write_transactions_in_batches(self):
+        from comdirect_api.export import write_transactions_parquet
+
+        path = os.path.join(self.tmpdir.name, "tx.parquet")
+        rows = write_transactions_parquet((self._tx(i) for i in range(25)), path, batch_size=10)
+
+        self.assertEqual(rows, 25)
+        meta = pq.ParquetFile(path).metadata
+        self.assertEqual(meta.num_row_groups, 3)
+
+        table = pq.read_table(path)
+        self.assertEqual(table.column("amount")[2].as_py(), Decimal("-24.68"))
+        self.assertEqual(table.column("creditor_iban")[1].as_py(), "DE00123")
+        self.assertIsNone(table.column("creditor_iban")[0].as_py())
+        self.assertEqual(table.column("booking_date")[0].as_py(), date(2023, 1, 1))
+
+    def test_decimals_are_rounded_to_the_column_scale(self):
+        from comdirect_api.export import write_transactions_parquet
+
+        path = os.path.join(self.tmpdir.name, "tx.parquet")
+        amounts = ["0.1234567894", "0.1234567895", "0.1234567885", "-7.00000000049999"]
+        txs = [Transaction("acc_1", date(2023, 1, 1), Decimal(a), "EUR", None, "TRANSFER") for a in amounts]
+        write_transactions_parquet(txs, path)
+
+        self.assertEqual(
+            pq.read_table(path).column("amount").to_pylist(),
+            [Decimal("0.123456789"), Decimal("0.123456790"), Decimal("0.123456788"), Decimal("-7.000000000")],
+        )
+
+    def test_decimal_out_of_range_names_the_column(self):
+        from comdirect_api.export import write_transactions_parquet
+
+        for amount in ("1E+30", "Infinity", "NaN"):
+            with self.subTest(amount):
+                tx = Transaction("acc_1", date(2023, 1, 1), Decimal(amount), "EUR", None, "TRANSFER")
+                with self.assertRaisesRegex(ValueError, re.escape(f"amount value {amount} does not fit")):
+                    write_transactions_parquet([tx], os.path.join(self.tmpdir.name, "tx.parquet"))
+
+    def test_empty_input_keeps_schema(self):
+        from comdirect_api.export import DOCUMENT_COLUMNS, write_documents_parquet
+
+        path = os.path.join(self.tmpdir.name, "docs.parquet")
+        self.assertEqual(write_documents_parquet([], path), 0)
+        self.assertEqual(pq.read_schema(path).names, [c[0] for c in DOCUMENT_COLUMNS])
+
+    def test_write_documents(self):
+        from comdirect_api.export import write_documents_parquet
+
+        docs = [
+            Document(
+                id="doc_1",
+                name="Statement",
+                date_creation="2023-01-01",
+                mime_type="application/pdf",
+                advertisement=False,
+            )
+        ]
+        path = os.path.join(self.tmpdir.name, "docs.parquet")
+        write_documents_parquet(docs, path)
+        self.assertEqual(pq.read_table(path).to_pylist()[0]["name"], "Statement")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import MagicMock
+
+from pydantic import ValidationError
+
+from openapi_client.api.banking_api import BankingApi
+from openapi_client.api.brokerage_api import BrokerageApi
+from openapi_client.api.session_api import SessionApi
+
+
+def _api_client():
+    api_client = MagicMock()
+    api_client.select_header_accept.side_effect = lambda accepts: accepts[0]
+    api_client.select_header_content_type.side_effect = lambda types: types[0]
+    api_client.param_serialize.return_value = ("GET", "url", {}, None, [])
+    return api_client
+
+
+class TestGeneratedApi(unittest.TestCase):
+    def test_request_is_built_from_endpoint_table(self):
+        api_client = _api_client()
+        BankingApi(api_client).banking_v1_get_account_transactions(
+            "acc_1", paging_first=10, with_attr=None, _request_timeout=5.0
+        )
+        kwargs = api_client.param_serialize.call_args.kwargs
+        self.assertEqual(kwargs["method"], "GET")
+        self.assertEqual(kwargs["resource_path"], "/banking/v1/accounts/{accountId}/transactions")
+        self.assertEqual(kwargs["path_params"], {"accountId": "acc_1"})
+        self.assertEqual(kwargs["query_params"], [("paging-first", 10)])
+        self.assertEqual(kwargs["header_params"], {"Accept": "application/json"})
+        api_client.call_api.assert_called_once_with("GET", "url", {}, None, [], _request_timeout=5.0)
+
+    def test_call_styles(self):
+        api_client = _api_client()
+        api = BankingApi(api_client)
+        response = api_client.call_api.return_value
+
+        data = api.banking_v2_get_account_balances("user")
+        self.assertIs(data, api_client.response_deserialize.return_value.data)
+        api_client.response_deserialize.assert_called_with(
+            response_data=response,
+            response_types_map={"200": "ListResourceAccountBalance", "404": None, "422": None, "500": None},
+        )
+        self.assertIs(api.banking_v2_get_account_balances_with_http_info("user"), api_client.response_deserialize())
+
+        response.read.reset_mock()
+        raw = api.banking_v2_get_account_balances_without_preload_content("user")
+        self.assertIs(raw, response.response)
+        response.read.assert_not_called()
+
+    def test_body_content_type_and_auth(self):
+        api_client = _api_client()
+        SessionApi(api_client).session_v1_post_session_validation("user", "session", body=None)
+        kwargs = api_client.param_serialize.call_args.kwargs
+        self.assertEqual(kwargs["method"], "POST")
+        self.assertEqual(kwargs["header_params"]["Content-Type"], "application/json")
+        self.assertEqual(kwargs["auth_settings"], ["ResourceOwnerPasswordCredentials"])
+
+        BrokerageApi(api_client).brokerage_v1_get_instrument("WKN", _headers={"X": "1"})
+        kwargs = api_client.param_serialize.call_args.kwargs
+        self.assertEqual(kwargs["collection_formats"], {"with-attr": "multi", "without-attr": "multi"})
+        self.assertEqual(kwargs["header_params"], {"X": "1", "Accept": "application/json"})
+
+    def test_arguments_are_validated(self):
+        api = BankingApi(_api_client())
+        with self.assertRaises(ValidationError):
+            api.banking_v2_get_account_balances(user=123)
+        with self.assertRaises(ValidationError):
+            api.banking_v2_get_account_balances_without_preload_content("user", _host_index=1)
+
+    def test_method_metadata(self):
+        method = BankingApi.banking_v2_get_account_balances_with_http_info
+        self.assertEqual(method.__name__, "banking_v2_get_account_balances_with_http_info")
+        self.assertEqual(method.__qualname__, "BankingApi.banking_v2_get_account_balances_with_http_info")
+        self.assertIn(":param user:", method.__doc__)
+
+
+if __name__ == "__main__":
+    unittest.main()
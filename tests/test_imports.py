@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+BANKING_ONLY = """
+from comdirect_api.client import ComdirectClient
+credentials = dict(client_id="a", client_secret="b", username="c", password="d")
+handlers = dict(photo_tan_cb=None, sms_tan_cb=None, push_tan_cb=None)
+ComdirectClient(credentials, handlers)._banking
+"""
+
+
+def _loaded_modules(code):
+    """Runs ``code`` in a fresh interpreter and returns the openapi_client modules it imported."""
+    script = code + "\nimport sys\nprint(' '.join(m for m in sys.modules if m.startswith('openapi_client')))"
+    env = dict(os.environ, PYTHONPATH=SRC)
+    out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    return set(out.stdout.splitlines()[-1].split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_client_import_skips_apis_and_models(self):
+        modules = _loaded_modules("import comdirect_api.client")
+        self.assertFalse({m for m in modules if m.startswith("openapi_client.api.")})
+        self.assertFalse({m for m in modules if m.startswith("openapi_client.models.")})
+
+    def test_only_used_api_is_imported(self):
+        modules = _loaded_modules(BANKING_ONLY)
+        self.assertIn("openapi_client.api.banking_api", modules)
+        self.assertNotIn("openapi_client.api.brokerage_api", modules)
+        self.assertNotIn("openapi_client.api.messages_api", modules)
+
+    def test_package_attributes_resolve_on_access(self):
+        import openapi_client
+        import openapi_client.models
+        from openapi_client.models.account import Account
+
+        self.assertIs(openapi_client.Account, Account)
+        self.assertIs(getattr(openapi_client.models, "Account"), Account)
+        self.assertIn("BrokerageApi", dir(openapi_client))
+        self.assertEqual(set(openapi_client.__all__) - set(dir(openapi_client)), set())
+        with self.assertRaises(AttributeError):
+            openapi_client.NoSuchModel
+
+
+if __name__ == "__main__":
+    unittest.main()
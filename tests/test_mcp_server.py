@@ -0,0 +1,405 @@
+import asyncio
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from mcp.shared.exceptions import McpError
+from mcp.types import INVALID_PARAMS
+
+import mcp_server
+from comdirect_api.document_cache import DocumentCache
+from comdirect_api.domain.models import Transaction
+
+
+def _payload(result):
+    return json.loads(result[0].text)
+
+
+def _temp_document_cache(test):
+    tmp = tempfile.TemporaryDirectory()
+    test.addCleanup(tmp.cleanup)
+    patcher = patch.object(mcp_server, "_documents", DocumentCache(tmp.name))
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
+
+class _ServerTestCase(unittest.TestCase):
+    """Runs the tool handlers against a mocked client with fresh server state."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        patcher = patch.object(mcp_server, "_client", self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for state in (mcp_server._tool_semaphores, mcp_server._cursors, mcp_server._responses):
+            state.clear()
+            self.addCleanup(state.clear)
+        _temp_document_cache(self)
+
+
+class TestWorkerPool(_ServerTestCase):
+
+    def test_concurrent_calls_overlap(self):
+        def slow_accounts():
+            time.sleep(0.2)
+            return []
+
+        self.client.list_accounts.side_effect = slow_accounts
+
+        async def run():
+            start = time.monotonic()
+            results = await asyncio.gather(*[mcp_server.call_tool("list_accounts", {}) for _ in range(3)])
+            return time.monotonic() - start, results
+
+        elapsed, results = asyncio.run(run())
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual([_payload(r) for r in results], [{"accounts": []}] * 3)
+
+    def test_per_tool_limit(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def download(document_id, mime_type):
+            with lock:
+                active.append(document_id)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(document_id)
+            return b"%PDF"
+
+        self.client.download_document.side_effect = download
+        args = [{"document_id": str(i), "mime_type": "application/pdf"} for i in range(6)]
+
+        async def run():
+            return await asyncio.gather(*[mcp_server.call_tool("download_document", a) for a in args])
+
+        results = asyncio.run(run())
+        self.assertEqual(len(results), 6)
+        self.assertEqual(max(peak), mcp_server.TOOL_CONCURRENCY["download_document"])
+
+    def test_cancellation_stops_paging(self):
+        produced = []
+
+        def transactions(**kwargs):
+            for i in range(100):
+                time.sleep(0.01)
+                produced.append(i)
+                yield MagicMock()
+
+        self.client.iter_all_transactions.side_effect = transactions
+
+        async def run():
+            task = asyncio.create_task(mcp_server.call_tool("list_transactions", {"account_id": "A1", "limit": 100}))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        time.sleep(0.05)
+        count = len(produced)
+        time.sleep(0.05)
+        self.assertEqual(len(produced), count)
+        self.assertLess(count, 100)
+
+    def test_errors_are_reported(self):
+        self.client.list_depots.side_effect = RuntimeError("boom")
+        result = asyncio.run(mcp_server.call_tool("list_depots", {}))
+        self.assertEqual(result[0].text, "Error: Tool execution failed: RuntimeError: boom")
+
+
+class TestTransactionCursors(_ServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+        def transactions(account_id, paging_first=0, **kwargs):
+            self.calls.append(paging_first)
+            for i in range(paging_first, 7):
+                yield f"tx{i}"
+
+        self.client.iter_all_transactions.side_effect = transactions
+
+    def _call(self, **arguments):
+        return _payload(asyncio.run(mcp_server.call_tool("list_transactions", arguments)))
+
+    def test_follow_up_calls_continue_the_open_iterator(self):
+        page1 = self._call(account_id="A1", limit=3)
+        self.assertEqual(page1["transactions"], ["tx0", "tx1", "tx2"])
+        self.assertTrue(page1["truncated"])
+
+        page2 = self._call(cursor=page1["next_cursor"], limit=3)
+        self.assertEqual(page2["transactions"], ["tx3", "tx4", "tx5"])
+        self.assertEqual(page2["offset"], 3)
+
+        page3 = self._call(cursor=page2["next_cursor"], limit=3)
+        self.assertEqual(page3["transactions"], ["tx6"])
+        self.assertIsNone(page3["next_cursor"])
+        self.assertFalse(page3["truncated"])
+
+        self.assertEqual(self.calls, [0])
+        self.assertEqual(len(mcp_server._cursors), 0)
+
+    def test_exact_page_has_no_cursor(self):
+        page = self._call(account_id="A1", limit=7)
+        self.assertEqual(page["count"], 7)
+        self.assertIsNone(page["next_cursor"])
+
+    def test_expired_cursor_resumes_at_offset(self):
+        page1 = self._call(account_id="A1", limit=4)
+        mcp_server._cursors.clear()
+
+        page2 = self._call(cursor=page1["next_cursor"], limit=4)
+        self.assertEqual(page2["transactions"], ["tx4", "tx5", "tx6"])
+        self.assertEqual(self.calls, [0, 4])
+
+    def test_ttl_eviction(self):
+        cache = mcp_server._CursorCache(ttl=0.01)
+        cache.put("c1", 3, iter([]))
+        time.sleep(0.02)
+        self.assertIsNone(cache.take("c1", 3))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_cursor(self):
+        result = asyncio.run(mcp_server.call_tool("list_transactions", {"cursor": "not-a-cursor"}))
+        self.assertIn("Invalid cursor", result[0].text)
+
+
+class TestDocuments(_ServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.download_document.return_value = b"0123456789"
+
+    def _download(self, **extra):
+        args = {"document_id": "doc/1", "mime_type": "application/pdf", **extra}
+        return _payload(asyncio.run(mcp_server.call_tool("download_document", args)))
+
+    def test_download_returns_reference_and_hits_cache(self):
+        first = self._download()
+        self.assertEqual(first["resource_uri"], "comdirect://documents/doc%2F1/application%2Fpdf")
+        self.assertEqual(first["size"], 10)
+        self.assertFalse(first["cached"])
+        self.assertNotIn("base64", first)
+        with open(first["path"], "rb") as f:
+            self.assertEqual(f.read(), b"0123456789")
+
+        second = self._download(include_base64=True)
+        self.assertTrue(second["cached"])
+        self.assertEqual(base64.b64decode(second["base64"]), b"0123456789")
+        self.client.download_document.assert_called_once_with("doc/1", "application/pdf")
+
+    def test_resources_are_read_in_chunks(self):
+        self._download()
+        resources = asyncio.run(mcp_server.list_resources())
+        uri = "comdirect://documents/doc%2F1/application%2Fpdf"
+        self.assertEqual([str(r.uri) for r in resources], [uri])
+
+        with patch.object(mcp_server, "RESOURCE_CHUNK_SIZE", 4):
+            chunks = [asyncio.run(mcp_server.read_resource(f"{uri}?chunk={i}"))[0].content for i in range(3)]
+            for chunk in ("-1", "3", "x"):
+                with self.subTest(chunk):
+                    with self.assertRaises(McpError) as ctx:
+                        asyncio.run(mcp_server.read_resource(f"{uri}?chunk={chunk}"))
+                    self.assertEqual(ctx.exception.error.code, INVALID_PARAMS)
+        self.assertEqual(chunks, [b"0123", b"4567", b"89"])
+
+    def test_representations_are_cached_separately(self):
+        self._download()
+        self.client.download_document.return_value = b"<html>"
+        html = self._download(mime_type="text/html")
+        self.assertEqual(html["mime_type"], "text/html")
+        self.assertFalse(html["cached"])
+        self.assertEqual(self._download()["size"], 10)
+
+        contents = asyncio.run(mcp_server.read_resource("comdirect://documents/doc%2F1/text%2Fhtml"))[0]
+        self.assertEqual((contents.content, contents.mime_type), (b"<html>", "text/html"))
+
+    def test_logout_deletes_documents(self):
+        path = self._download()["path"]
+        asyncio.run(mcp_server.call_tool("logout", {}))
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(asyncio.run(mcp_server.list_resources()), [])
+
+    def test_uncached_resource(self):
+        with self.assertRaisesRegex(ValueError, "not cached"):
+            asyncio.run(mcp_server.read_resource("comdirect://documents/unknown"))
+
+
+class TestAggregationTools(_ServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.iter_all_transactions.side_effect = lambda **kwargs: iter(
+            [
+                Transaction("A1", date(2023, 1, 5), Decimal("100.00"), "EUR", None, "TRANSFER"),
+                Transaction("A1", date(2023, 1, 9), Decimal("-40.00"), "EUR", None, "DIRECT_DEBIT"),
+            ]
+        )
+
+    def test_summarize_cash_flow(self):
+        result = _payload(
+            asyncio.run(mcp_server.call_tool("summarize_cash_flow", {"account_id": "A1", "group_by": "type"}))
+        )
+        self.assertEqual(result["total"], {"income": "100.00", "expenses": "-40.00", "net": "60.00", "count": 2})
+        self.assertEqual([r["group"] for r in result["rows"]], ["DIRECT_DEBIT", "TRANSFER"])
+        self.client.iter_all_transactions.assert_called_once_with(
+            account_id="A1", min_booking_date=None, max_booking_date=None
+        )
+
+
+class TestResponseCache(_ServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.list_accounts.return_value = []
+
+    def _accounts(self, **arguments):
+        return _payload(asyncio.run(mcp_server.call_tool("list_accounts", arguments)))
+
+    def test_repeated_calls_hit_the_cache(self):
+        self._accounts()
+        self._accounts()
+        self.client.list_accounts.assert_called_once()
+
+    def test_refresh_bypasses_the_cache(self):
+        self._accounts()
+        self._accounts(refresh=True)
+        self.assertEqual(self.client.list_accounts.call_count, 2)
+
+    def test_ttl_expiry(self):
+        with patch.dict(mcp_server.CACHE_TTLS, {"list_accounts": 0.01}):
+            self._accounts()
+            time.sleep(0.02)
+            self._accounts()
+        self.assertEqual(self.client.list_accounts.call_count, 2)
+
+    def test_keys_are_normalized(self):
+        self.client.iter_all_transactions.side_effect = lambda **kwargs: iter([])
+        for args in ({"account_id": "A1"}, {"account_id": "A1", "limit": 250, "transaction_state": "BOOKED"}):
+            asyncio.run(mcp_server.call_tool("list_transactions", args))
+        self.client.iter_all_transactions.assert_called_once()
+
+    def test_errors_are_not_cached(self):
+        self.client.list_accounts.side_effect = [RuntimeError("boom"), []]
+        asyncio.run(mcp_server.call_tool("list_accounts", {}))
+        self.assertEqual(self._accounts(), {"accounts": []})
+
+    def test_logout_invalidates(self):
+        self._accounts()
+        asyncio.run(mcp_server.call_tool("logout", {}))
+        self.assertEqual(len(mcp_server._responses), 0)
+
+    def test_login_warms_up_the_cache(self):
+        client = MagicMock()
+        client.list_accounts.return_value = [{"id": "A1"}]
+        client.list_depots.return_value = []
+        client.iter_all_transactions.side_effect = lambda **kwargs: iter([])
+
+        async def run():
+            await mcp_server.call_tool("login", {})
+            await mcp_server._warm_up_task
+            await mcp_server.call_tool("list_accounts", {})
+            await mcp_server.call_tool("list_depots", {})
+            await mcp_server.call_tool("list_transactions", {"account_id": "A1"})
+
+        with patch.object(mcp_server, "_build_client", return_value=client):
+            asyncio.run(run())
+        client.login.assert_called_once()
+        client.list_accounts.assert_called_once()
+        client.list_depots.assert_called_once()
+        client.iter_all_transactions.assert_called_once()
+
+    def test_refresh_is_advertised(self):
+        tools = {t.name: t for t in asyncio.run(mcp_server.list_tools())}
+        self.assertIn("refresh", tools["list_accounts"].inputSchema["properties"])
+        self.assertNotIn("refresh", tools["download_document"].inputSchema["properties"])
+
+
+class TestLazyLogin(unittest.TestCase):
+    def setUp(self):
+        for name, value in (
+            ("_client", None),
+            ("_login_task", None),
+            ("_login_failures", 0),
+            ("_login_retry_at", 0.0),
+        ):
+            patcher = patch.object(mcp_server, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        mcp_server._tool_semaphores.clear()
+        mcp_server._responses.clear()
+        self.addCleanup(mcp_server._responses.clear)
+
+        self.built = []
+
+        def build():
+            client = MagicMock()
+            client.login.side_effect = lambda: time.sleep(0.1)
+            client.list_depots.return_value = []
+            self.built.append(client)
+            return client
+
+        patcher = patch.object(mcp_server, "_build_client", side_effect=build)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_calls_share_one_login(self):
+        async def run():
+            return await asyncio.gather(*[mcp_server._ensure_client() for _ in range(5)])
+
+        clients = asyncio.run(run())
+        self.assertEqual(len(self.built), 1)
+        self.assertTrue(all(c is self.built[0] for c in clients))
+        self.built[0].login.assert_called_once()
+
+    def test_cancelled_caller_does_not_abort_login(self):
+        async def run():
+            first = asyncio.create_task(mcp_server._ensure_client())
+            second = asyncio.create_task(mcp_server._ensure_client())
+            await asyncio.sleep(0.01)
+            first.cancel()
+            return await second
+
+        client = asyncio.run(run())
+        self.assertIs(mcp_server._client, client)
+
+    def test_failed_login_backs_off(self):
+        mcp_server._build_client.side_effect = RuntimeError("auth down")
+
+        async def run():
+            with self.assertRaisesRegex(RuntimeError, "auth down"):
+                await mcp_server._ensure_client()
+            with self.assertRaisesRegex(RuntimeError, "retry in 5s"):
+                await mcp_server._ensure_client()
+
+        asyncio.run(run())
+        self.assertEqual(mcp_server._build_client.call_count, 1)
+
+        # After the backoff a new attempt is made
+        mcp_server._login_retry_at = time.monotonic() - 1
+        mcp_server._build_client.side_effect = None
+        mcp_server._build_client.return_value = MagicMock()
+        client = asyncio.run(mcp_server._ensure_client())
+        self.assertIs(client, mcp_server._build_client.return_value)
+        self.assertEqual(mcp_server._login_failures, 0)
+
+    def test_forced_login_replaces_client(self):
+        async def run():
+            first = await mcp_server._ensure_client()
+            second = await mcp_server._ensure_client(force=True)
+            return first, second
+
+        first, second = asyncio.run(run())
+        self.assertIsNot(first, second)
+        first.logout.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
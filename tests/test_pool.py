@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import patch
+
+from comdirect_api.pool import ComdirectClientPool
+
+
+def _creds(name):
+    return {"client_id": "cid", "client_secret": "csec", "username": name, "password": "pwd"}
+
+
+TAN_HANDLERS = {"photo_tan_cb": None, "sms_tan_cb": None, "push_tan_cb": None}
+
+
+class TestComdirectClientPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = ComdirectClientPool(max_tenants=2, auto_refresh=False)
+        self.addCleanup(self.pool.close)
+
+    def test_clients_share_transport_but_not_state(self):
+        a = self.pool.get("a", _creds("a"), TAN_HANDLERS)
+        b = self.pool.get("b", _creds("b"), TAN_HANDLERS)
+
+        self.assertIs(a._api_client.rest_client, b._api_client.rest_client)
+        self.assertIsNot(a._api_client.configuration, b._api_client.configuration)
+        self.assertIsNot(a._state, b._state)
+        self.assertIs(a._auth._session.pool_manager, self.pool._rest_client.pool_manager)
+        self.assertIs(self.pool.get("a"), a)
+
+    def test_injected_transport_is_not_rebuilt(self):
+        with patch("openapi_client.rest.RESTClientObject") as rest_client:
+            self.pool.get("a", _creds("a"), TAN_HANDLERS)
+        rest_client.assert_not_called()
+
+    def test_tenant_state_is_not_shared(self):
+        for name in ("session_store", "rest_client"):
+            with self.subTest(name):
+                with self.assertRaises(ValueError):
+                    ComdirectClientPool(**{name: object()})
+
+        store_a, store_b = object(), object()
+        pool = ComdirectClientPool(auto_refresh=False, refresh_margin=30)
+        self.addCleanup(pool.close)
+        a = pool.get("a", _creds("a"), TAN_HANDLERS, session_store=store_a)
+        b = pool.get("b", _creds("b"), TAN_HANDLERS, session_store=store_b, refresh_margin=10)
+        self.assertIs(a._session_store, store_a)
+        self.assertIs(b._session_store, store_b)
+        self.assertEqual((a._refresh_margin, b._refresh_margin), (30, 10))
+        self.assertIs(pool.get("a", session_store=store_b), a)
+
+    def test_unknown_tenant_without_credentials(self):
+        with self.assertRaises(KeyError):
+            self.pool.get("nobody")
+
+    def test_lru_eviction_logs_out(self):
+        a = self.pool.get("a", _creds("a"), TAN_HANDLERS)
+        self.pool.get("b", _creds("b"), TAN_HANDLERS)
+        self.pool.get("a")  # a is now most recently used
+
+        with patch.object(self.pool.get("b"), "logout") as logout_b, patch.object(a, "logout") as logout_a:
+            self.pool.get("a")
+            self.pool.get("c", _creds("c"), TAN_HANDLERS)
+            logout_b.assert_called_once()
+            logout_a.assert_not_called()
+
+        self.assertEqual(len(self.pool), 2)
+        self.assertNotIn("b", self.pool)
+        self.assertIn("a", self.pool)
+
+    def test_idle_eviction(self):
+        pool = ComdirectClientPool(idle_timeout=60, auto_refresh=False)
+        self.addCleanup(pool.close)
+        with patch("comdirect_api.pool.time.monotonic", return_value=1000.0):
+            pool.get("a", _creds("a"), TAN_HANDLERS)
+        with patch("comdirect_api.pool.time.monotonic", return_value=1030.0):
+            pool.get("b", _creds("b"), TAN_HANDLERS)
+        with patch("comdirect_api.pool.time.monotonic", return_value=1070.0):
+            self.assertEqual(pool.evict_idle(), 1)
+        self.assertNotIn("a", pool)
+        self.assertIn("b", pool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from comdirect_api.domain.models import AccountHolder, Transaction
+from comdirect_api.search import TransactionIndex
+
+
+def _tx(day, amount, purpose, creditor=None, remitter=None):
+    return Transaction(
+        account_id="acc_1",
+        booking_date=date(2023, 1, day),
+        amount=Decimal(amount),
+        currency="EUR",
+        purpose=purpose,
+        type="TRANSFER",
+        creditor=creditor,
+        remitter=remitter,
+    )
+
+
+class TestTransactionIndex(unittest.TestCase):
+    def setUp(self):
+        self.amazon = AccountHolder(holder_name="Amazon EU S.a.r.l.", iban="DE87 3004 0000 0000 0000 01", bic=None)
+        self.employer = AccountHolder(holder_name="ACME GmbH", iban="DE11222233334444", bic=None)
+        self.txs = [
+            _tx(1, "-19.99", "Order 123 Amazon.de", creditor=self.amazon),
+            _tx(2, "3000.00", "Gehalt Januar", remitter=self.employer),
+            _tx(3, "-250.00", "Amazon Marketplace", creditor=self.amazon),
+            _tx(4, "-4.20", "Bäckerei Müller"),
+        ]
+        self.index = TransactionIndex()
+        self.stream = list(self.index.indexed(iter(self.txs)))
+
+    def test_indexed_passes_stream_through(self):
+        self.assertEqual(self.stream, self.txs)
+        self.assertEqual(len(self.index), 4)
+
+    def test_token_query(self):
+        self.assertEqual(self.index.search("amazon"), [self.txs[2], self.txs[0]])
+        self.assertEqual(self.index.search("acme gehalt"), [self.txs[1]])
+        self.assertEqual(self.index.search("acme amazon"), [])
+
+    def test_prefix_and_unicode(self):
+        self.assertEqual(self.index.search("bäck*"), [self.txs[3]])
+        self.assertEqual(self.index.search("Mül*"), [self.txs[3]])
+
+    def test_prefix_sees_tokens_added_after_a_lookup(self):
+        self.assertEqual(self.index.search("bäck*"), [self.txs[3]])
+        late = _tx(5, "-3.10", "Bäckerei Schmidt Backwaren")
+        self.index.add(late)
+        self.assertEqual(self.index.search("bäck*"), [late, self.txs[3]])
+        self.assertEqual(self.index.search("back*"), [late])
+        self.assertEqual(self.index.search("schm*"), [late])
+
+    def test_iban_lookup(self):
+        self.assertEqual(len(self.index.search("DE87300400000000000001")), 2)
+        self.assertEqual(self.index.search("de1122*"), [self.txs[1]])
+
+    def test_filters(self):
+        self.assertEqual(self.index.search("amazon", max_amount=Decimal("-100")), [self.txs[2]])
+        self.assertEqual(self.index.search("", min_booking_date=date(2023, 1, 4)), [self.txs[3]])
+        self.assertEqual(len(self.index.search(limit=2)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
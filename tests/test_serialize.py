@@ -0,0 +1,66 @@
+import dataclasses
+import json
+import unittest
+from datetime import date
+from decimal import Decimal
+
+from comdirect_api.domain.models import Account, AccountHolder, Transaction
+from comdirect_api.domain.serialize import encoder_for, to_jsonable
+
+
+def _legacy_default(obj):
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return dataclasses.asdict(obj)
+
+
+def _tx(i=0, creditor=True):
+    return Transaction(
+        account_id="acc_1",
+        booking_date=date(2023, 1, 1 + i % 28),
+        amount=Decimal("-12.34"),
+        currency="EUR",
+        purpose=f"Purpose {i}",
+        type="DIRECT_DEBIT",
+        reference=f"ref{i}",
+        valuta_date=date(2023, 1, 2),
+        creditor=AccountHolder("Shop", "DE11 2222", None) if creditor else None,
+    )
+
+
+class TestSerialize(unittest.TestCase):
+    def test_matches_asdict_output(self):
+        payload = {"count": 2, "transactions": [_tx(0), _tx(1, creditor=False)]}
+        expected = json.dumps(payload, default=_legacy_default)
+        self.assertEqual(json.dumps(to_jsonable(payload)), expected)
+
+    def test_large_listing_matches(self):
+        transactions = [_tx(i) for i in range(2000)]
+        self.assertEqual(
+            json.dumps(to_jsonable(transactions)),
+            json.dumps(transactions, default=_legacy_default),
+        )
+
+    def test_compact_omits_nulls(self):
+        data = to_jsonable(_tx(0), compact=True)
+        self.assertNotIn("booking_status", data)
+        self.assertNotIn("remitter", data)
+        self.assertEqual(data["creditor"], {"holder_name": "Shop", "iban": "DE11 2222"})
+        self.assertEqual(data["amount"], "-12.34")
+        self.assertIs(data["new_transaction"], False)
+
+    def test_encoder_is_cached(self):
+        self.assertIs(encoder_for(Account), encoder_for(Account))
+        self.assertEqual(
+            encoder_for(Account)(Account("a", "EUR", Decimal("1.50"), None)),
+            {"id": "a", "currency": "EUR", "balance": "1.50", "available": None},
+        )
+
+    def test_other_values_unchanged(self):
+        self.assertEqual(to_jsonable({"a": (1, "x"), "b": None}), {"a": [1, "x"], "b": None})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import stat
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from comdirect_api.client import ComdirectClient
+from comdirect_api.exceptions import AuthenticationError
+
+try:
+    from comdirect_api.session_store import SessionStore
+
+    SessionStore.generate_key()
+except ImportError:  # pragma: no cover - optional dependency
+    SessionStore = None
+
+
+@unittest.skipIf(SessionStore is None, "cryptography not installed")
+class TestSessionStore(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "session")
+        self.key = SessionStore.generate_key()
+        self.store = SessionStore(self.path, self.key)
+
+    def test_roundtrip_is_encrypted(self):
+        self.store.save("sess", "access", "refresh", 123.0)
+
+        with open(self.path, "rb") as f:
+            self.assertNotIn(b"access", f.read())
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+
+        data = self.store.load()
+        self.assertEqual(data["session_id"], "sess")
+        self.assertEqual(data["refresh_token"], "refresh")
+        self.assertEqual(data["expires_at"], 123.0)
+
+    def test_wrong_key_or_missing_file(self):
+        self.assertIsNone(self.store.load())
+        self.store.save("sess", "access", "refresh", 123.0)
+        self.assertIsNone(SessionStore(self.path, SessionStore.generate_key()).load())
+        self.store.clear()
+        self.assertFalse(os.path.exists(self.path))
+
+
+@unittest.skipIf(SessionStore is None, "cryptography not installed")
+class TestClientSessionCache(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.store = SessionStore(os.path.join(tmpdir.name, "session"), SessionStore.generate_key())
+
+        patcher = patch("comdirect_api.client.Authenticator")
+        self.mock_auth = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.mock_auth.authenticate.return_value = (
+            "session_new",
+            {"access_token": "token_new", "refresh_token": "refresh_new", "expires_in": 599},
+        )
+
+        self.client = ComdirectClient({}, {}, auto_refresh=False, session_store=self.store)
+
+    def test_login_persists_session(self):
+        self.client.login()
+        self.assertEqual(self.store.load()["access_token"], "token_new")
+
+        self.client.logout()
+        self.assertIsNone(self.store.load())
+
+    def test_login_reuses_valid_session(self):
+        self.store.save("session_cached", "token_cached", "refresh_cached", time.time() + 500)
+        self.client.login()
+
+        self.mock_auth.authenticate.assert_not_called()
+        self.assertEqual(self.client._session_id, "session_cached")
+        self.assertEqual(self.client._api_client.configuration.access_token, "token_cached")
+
+    def test_login_refreshes_session_close_to_expiry(self):
+        self.store.save("session_cached", "token_cached", "refresh_cached", time.time() + 10)
+        self.mock_auth.refresh.return_value = {"access_token": "token_refreshed", "expires_in": 599}
+        self.client.login()
+
+        self.mock_auth.authenticate.assert_not_called()
+        self.mock_auth.refresh.assert_called_once_with("refresh_cached")
+        self.assertEqual(self.store.load()["access_token"], "token_refreshed")
+
+    def test_login_falls_back_to_full_flow(self):
+        self.store.save("session_cached", "token_cached", "refresh_cached", time.time() - 10)
+        self.mock_auth.refresh.side_effect = AuthenticationError("expired")
+        self.client.login()
+
+        self.mock_auth.authenticate.assert_called_once()
+        self.assertEqual(self.client._session_id, "session_new")
+        self.assertEqual(self.store.load()["session_id"], "session_new")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from comdirect_api.domain.models import AccountHolder, Transaction
+from comdirect_api.store import TransactionStore
+
+
+def _tx(i, amount, purpose, creditor=None, remitter=None, account_id="acc_1"):
+    return Transaction(
+        account_id=account_id,
+        booking_date=date(2023, 1 + i % 3, 1 + i),
+        amount=Decimal(amount),
+        currency="EUR",
+        purpose=purpose,
+        type="TRANSFER",
+        reference=f"ref{i}",
+        creditor=creditor,
+        remitter=remitter,
+    )
+
+
+class TestTransactionStore(unittest.TestCase):
+    def setUp(self):
+        self.store = TransactionStore()
+        self.addCleanup(self.store.close)
+        self.landlord = AccountHolder(holder_name="Landlord", iban="DE111", bic=None)
+        self.employer = AccountHolder(holder_name="Employer", iban="DE222", bic="BIC")
+        self.txs = [
+            _tx(0, "-800.00", "Miete Januar", creditor=self.landlord),
+            _tx(1, "3000.00", "Gehalt", remitter=self.employer),
+            _tx(2, "-12.50", "Supermarkt Einkauf"),
+            _tx(3, "-800.00", "Miete Februar", creditor=self.landlord),
+        ]
+
+    def test_bulk_insert_is_idempotent(self):
+        self.assertEqual(self.store.add_transactions(self.txs, batch_size=3), 4)
+        self.assertEqual(self.store.add_transactions(self.txs), 0)
+        self.assertEqual(self.store.count("acc_1"), 4)
+
+    def test_roundtrip(self):
+        self.store.add_transactions(self.txs)
+        stored = self.store.query(counterparty_iban="DE222")
+        self.assertEqual(stored, [self.txs[1]])
+
+    def test_filters(self):
+        self.store.add_transactions(self.txs)
+
+        rent = self.store.query(text="miete")
+        self.assertEqual({t.reference for t in rent}, {"ref0", "ref3"})
+
+        small = self.store.query(min_amount=Decimal("-100"), max_amount=Decimal("0"))
+        self.assertEqual([t.reference for t in small], ["ref2"])
+
+        since = self.store.query(account_id="acc_1", min_booking_date=date(2023, 2, 1))
+        self.assertEqual({t.reference for t in since}, {"ref1", "ref2"})
+
+    def test_monthly_totals(self):
+        self.store.add_transactions(self.txs)
+        totals = dict((m, (i, e)) for m, i, e in self.store.monthly_totals("acc_1"))
+        self.assertEqual(totals["2023-01"], (Decimal("0.00"), Decimal("-1600.00")))
+        self.assertEqual(totals["2023-02"], (Decimal("3000.00"), Decimal("0.00")))
+
+    def test_amounts_keep_their_precision(self):
+        amounts = ["0.10", "0.20", "12345678901234.99", "-0.30"]
+        self.store.add_transactions(_tx(i, amount, "x") for i, amount in enumerate(amounts))
+        stored = {t.reference: t.amount for t in self.store.query()}
+        self.assertEqual(stored, {f"ref{i}": Decimal(amount) for i, amount in enumerate(amounts)})
+        self.assertEqual(str(stored["ref0"]), "0.10")
+
+        totals = {m: (i, e) for m, i, e in self.store.monthly_totals()}
+        self.assertEqual(totals["2023-01"], (Decimal("0.10"), Decimal("-0.30")))
+        self.assertEqual(totals["2023-03"], (Decimal("12345678901234.99"), Decimal("0.00")))
+
+        self.assertEqual(
+            [t.reference for t in self.store.query(min_amount=Decimal("0.1"), max_amount=Decimal("0.2"))],
+            ["ref1", "ref0"],
+        )
+        self.assertEqual(self.store.query(min_amount=Decimal("0.101"), max_amount=Decimal("0.199")), [])
+
+    def test_text_is_taken_literally(self):
+        self.store.add_transactions(
+            [
+                _tx(0, "-20.00", "AMAZON-EU Bestellung"),
+                _tx(1, "-5.00", 'Spende "Tierheim" OR NOT 100%_sicher'),
+                _tx(2, "-5.00", "Amazon Prime"),
+            ]
+        )
+        for text, expected in (
+            ("AMAZON-EU", {"ref0"}),
+            ("amazon", {"ref0", "ref2"}),
+            ("amazon bestellung", {"ref0"}),
+            ('"Tierheim"', {"ref1"}),
+            ('spende "tier', set()),
+            ("OR NOT", {"ref1"}),
+            ("*", set()),
+            ("  ", {"ref0", "ref1", "ref2"}),
+        ):
+            with self.subTest(text):
+                self.assertEqual({t.reference for t in self.store.query(text=text)}, expected)
+
+    def test_text_without_fts(self):
+        self.store._has_fts = False
+        self.store.add_transactions([_tx(0, "-5.00", "Spende 100%_sicher"), _tx(1, "-5.00", "100 x sicher")])
+        for text, expected in (("100%_", {"ref0"}), ("SICHER 100", {"ref0", "ref1"}), ("%", {"ref0"})):
+            with self.subTest(text):
+                self.assertEqual({t.reference for t in self.store.query(text=text)}, expected)
+
+    def test_transactions_without_reference_are_deduplicated(self):
+        txs = [replace(tx, reference=None) for tx in self.txs]
+        pending = replace(self.txs[2], reference=None, booking_status="NOTBOOKED", purpose="Vorgemerkt")
+        self.assertEqual(self.store.add_transactions(txs + [pending]), 4)
+        self.assertEqual(self.store.add_transactions(txs + [pending]), 0)
+        self.assertEqual(self.store.add_transactions([replace(txs[2], amount=Decimal("-12.5"))]), 0)
+        self.assertEqual(self.store.add_transactions([replace(txs[2], purpose="Supermarkt")]), 1)
+        self.assertEqual(self.store.query(text="vorgemerkt"), [])
+
+    def test_identical_transactions_without_reference_are_all_kept(self):
+        coffee = replace(self.txs[2], reference=None, purpose="Kartenzahlung Cafe")
+        self.assertEqual(self.store.add_transactions([coffee, self.txs[0], coffee], batch_size=2), 3)
+        self.assertEqual(self.store.add_transactions([coffee, coffee]), 0)
+        # a later sync that sees a third one of the day adds only that one
+        self.assertEqual(self.store.add_transactions([coffee, coffee, coffee]), 1)
+        self.assertEqual(len(self.store.query(text="cafe")), 3)
+
+    def test_sync_resumes_from_latest_booking_date(self):
+        self.store.add_transactions(self.txs[:2])
+        client = MagicMock()
+        client.iter_all_transactions.return_value = iter(self.txs)
+
+        self.assertEqual(self.store.sync(client, "acc_1"), 2)
+        client.iter_all_transactions.assert_called_once_with(account_id="acc_1", min_booking_date="2023-02-02")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,214 @@
+import json
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from pydantic import ValidationError
+from urllib3.exceptions import ProtocolError
+
+from openapi_client import rest
+from openapi_client.exceptions import ApiException
+
+from comdirect_api.client import ComdirectApiClient, ComdirectClient
+from comdirect_api.streaming import iter_list_values
+
+PAGE = {
+    "paging": {"index": 0, "matches": 3},
+    "values": [
+        {"reference": f"R{i}", "bookingStatus": "BOOKED", "amount": {"value": value, "unit": "EUR"}, **extra}
+        for i, value, extra in (
+            (1, "-1.50", {"transactionType": {"key": "DIRECT_DEBIT", "text": "Lastschrift"}}),
+            (2, "20", {"remittanceInfo": "Café über [1,2] {x}", "transactionType": {"key": "TRANSFER"}}),
+            (3, "0.99", {"newTransaction": True, "transactionType": {"key": "CARD"}}),
+        )
+    ],
+    "aggregated": {"account": {"accountId": "acc_1"}, "bookingDateLatestTransaction": "2024-01-31"},
+}
+
+
+def _chunks(data, size):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class _Body:
+    """urllib3 response stand-in that records how many chunks were read."""
+
+    def __init__(self, data, size=16, status=200, content_type="application/json"):
+        self.chunks = _chunks(data, size)
+        self.read_chunks = 0
+        self.status = status
+        self.reason = "OK"
+        self.headers = {"content-type": content_type}
+        self.closed = False
+        self.released = False
+        self.fail_at = None
+
+    def stream(self, amt):
+        for chunk in self.chunks[self.read_chunks :]:
+            if self.read_chunks == self.fail_at:
+                raise ProtocolError("Connection broken")
+            self.read_chunks += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    def release_conn(self):
+        self.released = True
+
+    @property
+    def data(self):
+        remaining = b"".join(self.chunks[self.read_chunks :])
+        self.read_chunks = len(self.chunks)
+        return remaining
+
+
+class TestIterListValues(unittest.TestCase):
+    def test_every_chunk_boundary(self):
+        data = json.dumps(PAGE, indent=1).encode()
+        for size in (1, 2, 3, 7, 64, len(data)):
+            with self.subTest(size=size):
+                fields = {}
+                values = list(iter_list_values(_chunks(data, size), fields))
+                self.assertEqual(values, PAGE["values"])
+                self.assertEqual(fields, {"paging": PAGE["paging"], "aggregated": PAGE["aggregated"]})
+
+    def test_scalars_split_across_chunks(self):
+        data = b'{"paging": {"index": 0}, "matches": 12345, "values": [1234, -5.5e3, true, null, "x"], "n": 678}'
+        fields = {}
+        self.assertEqual(list(iter_list_values(_chunks(data, 2), fields)), [1234, -5500.0, True, None, "x"])
+        self.assertEqual(fields, {"paging": {"index": 0}, "matches": 12345, "n": 678})
+
+    def test_empty_and_missing_values(self):
+        for body, expected in ((b"{}", {}), (b'{"values": []}', {}), (b'{"values": null}', {"values": None})):
+            with self.subTest(body):
+                fields = {}
+                self.assertEqual(list(iter_list_values([body], fields)), [])
+                self.assertEqual(fields, expected)
+
+    def test_items_are_emitted_before_the_body_ends(self):
+        data = json.dumps(PAGE).encode()
+        chunks = iter(_chunks(data, 32))
+        values = iter_list_values(chunks, {})
+        self.assertEqual(next(values)["reference"], "R1")
+        self.assertIsNotNone(next(chunks, None))
+
+    def test_malformed_body(self):
+        for body in (b"", b"[]", b'{"values": [1 2]}', b'{"values": [1,', b"{1: 2}", b'{"values": []} x'):
+            with self.subTest(body):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_list_values(_chunks(body, 3), {}))
+
+
+class TestStreamList(unittest.TestCase):
+    def test_decodes_items_as_they_arrive(self):
+        for engine in ("pydantic", "compiled", "lazy"):
+            with self.subTest(engine):
+                client = ComdirectApiClient(lambda: None, decode_engine=engine)
+                body = _Body(json.dumps(PAGE).encode())
+                fields = {}
+                items = client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", fields)
+                first = next(items)
+                self.assertEqual(first.amount.value, "-1.50")
+                self.assertLess(body.read_chunks, len(body.chunks))
+
+                expected = client.deserialize(json.dumps(PAGE), "ListResourceAccountTransaction", "application/json")
+                self.assertEqual([first, *items], expected.values)
+                self.assertEqual(fields["aggregated"], expected.aggregated)
+
+    def test_stopping_early_reads_the_rest(self):
+        client = ComdirectApiClient(lambda: None)
+        body = _Body(json.dumps(PAGE).encode())
+        items = client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", {})
+        next(items)
+        items.close()
+        self.assertEqual(body.read_chunks, len(body.chunks))
+        self.assertFalse(body.closed)
+
+    def test_stopping_early_closes_a_long_rest(self):
+        client = ComdirectApiClient(lambda: None)
+        body = _Body(json.dumps(PAGE).encode())
+        items = client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", {})
+        next(items)
+        with patch("comdirect_api.client.STREAM_DRAIN_LIMIT", 32):
+            items.close()
+        self.assertLess(body.read_chunks, len(body.chunks))
+        self.assertTrue(body.closed and body.released)
+
+    def test_stopping_early_ignores_errors_of_the_rest(self):
+        client = ComdirectApiClient(lambda: None)
+        body = _Body(json.dumps(PAGE).encode())
+        items = client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", {})
+        next(items)
+        body.fail_at = body.read_chunks + 1
+        items.close()
+        self.assertTrue(body.closed and body.released)
+
+    def test_errors_close_the_connection_without_reading_the_rest(self):
+        client = ComdirectApiClient(lambda: None)
+        data = json.dumps(PAGE).encode()
+        for name, error, body in (
+            ("broken", ProtocolError, _Body(data)),
+            ("invalid", ValidationError, _Body(data.replace(b'"-1.50"', b"[]"))),
+        ):
+            with self.subTest(name):
+                if name == "broken":
+                    body.fail_at = 3
+                with self.assertRaises(error):
+                    list(client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", {}))
+                self.assertLess(body.read_chunks, len(body.chunks))
+                self.assertTrue(body.closed and body.released)
+
+    def test_error_status_raises_api_exception(self):
+        client = ComdirectApiClient(lambda: None)
+        body = _Body(b'{"code": "not found"}', status=404)
+        with self.assertRaises(ApiException) as ctx:
+            list(client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", {}))
+        self.assertEqual(ctx.exception.status, 404)
+
+    def test_invalid_values_are_rejected_by_the_model(self):
+        client = ComdirectApiClient(lambda: None)
+        body = _Body(b'{"values": "nope"}')
+        with self.assertRaises(Exception):
+            list(client.stream_list(rest.RESTResponse(body), "ListResourceAccountTransaction", {}))
+
+
+class TestStreamingClient(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("comdirect_api.client.Authenticator")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = ComdirectClient({}, {}, stream_lists=True)
+
+    def test_iter_all_transactions_streams_pages(self):
+        pages = [_Body(json.dumps(PAGE).encode()), _Body(b'{"paging": {"index": 3}, "values": []}')]
+        with patch.object(self.client, "_request_account_transactions_page") as request:
+            request.side_effect = lambda **params: rest.RESTResponse(pages[request.call_count - 1])
+            transactions = self.client.iter_all_transactions("acc_1")
+            first = next(transactions)
+            self.assertEqual(first.amount, Decimal("-1.50"))
+            self.assertLess(pages[0].read_chunks, len(pages[0].chunks))
+            self.assertEqual([tx.reference for tx in transactions], ["R2", "R3"])
+
+        self.assertEqual([c.kwargs["paging_first"] for c in request.call_args_list], [0, 3])
+
+    def test_get_depot_positions_streams(self):
+        page = {
+            "aggregated": {"depotId": "dep_1", "currentValue": {"value": "1000.00", "unit": "EUR"}},
+            "values": [{"depotId": "dep_1", "wkn": "A0B1C2", "quantity": {"value": "10", "unit": "XXX"}}],
+        }
+        brokerage = MagicMock()
+        brokerage.brokerage_v3_get_depot_positions_without_preload_content.return_value = _Body(
+            json.dumps(page).encode()
+        )
+        self.client._apis["brokerage"] = brokerage
+
+        balance, positions = self.client.get_depot_positions("dep_1")
+
+        self.assertEqual(balance.current_value, Decimal("1000.00"))
+        self.assertEqual([p.quantity for p in positions], [Decimal("10")])
+        brokerage.brokerage_v3_get_depot_positions.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
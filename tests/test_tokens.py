@@ -0,0 +1,59 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from comdirect_api.exceptions import AuthenticationError
+from comdirect_api.tokens import TokenManager
+
+
+class TestTokenManager(unittest.TestCase):
+    def test_set_tokens_and_refresh(self):
+        refresh_fn = MagicMock(return_value={"access_token": "new", "expires_in": 599})
+        on_update = MagicMock()
+        tm = TokenManager(refresh_fn, on_update=on_update)
+
+        tm.set_tokens({"access_token": "old", "refresh_token": "r1", "expires_in": 599})
+        on_update.assert_called_with("old")
+        self.assertAlmostEqual(tm.expires_in, 599, delta=1)
+
+        self.assertEqual(tm.refresh(), "new")
+        refresh_fn.assert_called_once_with("r1")
+        on_update.assert_called_with("new")
+        # Refresh token is kept if the response does not rotate it
+        self.assertEqual(tm.refresh_token, "r1")
+
+    def test_refresh_without_refresh_token(self):
+        tm = TokenManager(MagicMock())
+        tm.set_tokens({"access_token": "a"})
+        self.assertFalse(tm.can_refresh())
+        with self.assertRaises(AuthenticationError):
+            tm.refresh()
+
+    def test_background_refresh_before_expiry(self):
+        refreshed = threading.Event()
+
+        def refresh_fn(token):
+            refreshed.set()
+            return {"access_token": "new", "refresh_token": "r2", "expires_in": 600}
+
+        tm = TokenManager(refresh_fn, refresh_margin=599.9)
+        tm.set_tokens({"access_token": "old", "refresh_token": "r1", "expires_in": 600})
+        tm.start()
+        self.addCleanup(tm.stop)
+
+        self.assertTrue(refreshed.wait(2))
+        tm.stop()
+        self.assertEqual(tm.access_token, "new")
+        self.assertEqual(tm.refresh_token, "r2")
+
+    def test_clear_stops_timer(self):
+        tm = TokenManager(MagicMock())
+        tm.set_tokens({"access_token": "a", "refresh_token": "r", "expires_in": 600})
+        tm.start()
+        tm.clear()
+        self.assertIsNone(tm._timer)
+        self.assertIsNone(tm.access_token)
+
+
+if __name__ == "__main__":
+    unittest.main()
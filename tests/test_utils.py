@@ -0,0 +1,51 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from comdirect_api.utils import RequestIdGenerator, request_info_header, timestamp
+
+
+class TestRequestIdGenerator(unittest.TestCase):
+    def test_format_matches_timestamp(self):
+        request_id = RequestIdGenerator()()
+        self.assertEqual(len(request_id), len(timestamp()))
+        self.assertTrue(request_id.isdigit())
+        self.assertEqual(request_id[:8], timestamp()[:8])
+
+    def test_same_microsecond_is_bumped(self):
+        gen = RequestIdGenerator()
+        with patch("comdirect_api.utils.time.time_ns", return_value=1_700_000_000_999_999_000):
+            ids = [gen() for _ in range(3)]
+        self.assertEqual(ids, ["20231114221320999999", "20231114221321000000", "20231114221321000001"])
+
+    def test_unique_across_threads(self):
+        gen = RequestIdGenerator()
+        ids = []
+
+        def worker():
+            local = [gen() for _ in range(2000)]
+            ids.extend(local)
+            self.assertEqual(local, sorted(local))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(set(ids)), 16000)
+
+
+class TestRequestInfoHeader(unittest.TestCase):
+    def test_same_as_json_dumps(self):
+        header = request_info_header('sess"1')
+        request_id = json.loads(header)["clientRequestId"]["requestId"]
+        expected = json.dumps({"clientRequestId": {"sessionId": 'sess"1', "requestId": request_id}})
+        self.assertEqual(header, expected)
+
+    def test_request_ids_differ(self):
+        self.assertNotEqual(request_info_header("sess"), request_info_header("sess"))
+
+
+if __name__ == "__main__":
+    unittest.main()